@@ -0,0 +1,343 @@
+import gc
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator
+
+import numpy as np
+
+from core import stachowiak
+from core.helper_operations import permutation_graphs
+from core.helper_operations.bit_path import MAX_WIDTH, BitPath
+from core.helper_operations.permutation_graphs import binomial
+from core.steinhaus_johnson_trotter import SteinhausJohnsonTrotter
+from core.type_variations import (
+    stachowiak_list,
+    stachowiak_numpy,
+    verhoeff_list,
+    verhoeff_numpy,
+)
+from core.type_variations.steinhaus_johnson_trotter_list import (
+    SteinhausJohnsonTrotterList,
+)
+from core.type_variations.steinhaus_johnson_trotter_numpy import (
+    SteinhausJohnsonTrotterNumpy,
+)
+from core.verhoeff import HpathNS as _HpathNS
+from core.verhoeff import HpathNS_bit_path
+
+OPERATIONS = ("HpathNS", "lemma11", "stutterPermutations", "sjt_permutations")
+"""The operations that every backend implements (or leaves to the `tuple` backend)."""
+
+AUTO_BIT_PATH_LENGTH = 10000
+"""Binary paths (and stutter permutations) with at least this many permutations are computed with the `bits` backend by `auto`."""
+
+
+class Backend:
+    """
+    A set of implementations of ``OPERATIONS`` that work on one representation of permutations.
+    An operation that is None is not supported by the backend and is computed by the `tuple` backend instead.
+    The results of all backends are converted to lists of tuples, so the backends can be exchanged without changing the callers.
+
+    Args:
+        name (str): The name under which the backend is registered.
+        HpathNS (Callable | None, optional): Computes ``verhoeff.HpathNS(k0, k1)``. Defaults to None.
+        lemma11 (Callable | None, optional): Computes ``stachowiak.lemma11(sig)``. Defaults to None.
+        stutterPermutations (Callable | None, optional): Computes ``stutterPermutations(sig)``. Defaults to None.
+        sjt_permutations (Callable | None, optional): Computes the Steinhaus-Johnson-Trotter permutations of `n` elements. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        HpathNS: Callable | None = None,
+        lemma11: Callable | None = None,
+        stutterPermutations: Callable | None = None,
+        sjt_permutations: Callable | None = None,
+    ) -> None:
+        self.name = name
+        self.HpathNS = HpathNS
+        self.lemma11 = lemma11
+        self.stutterPermutations = stutterPermutations
+        self.sjt_permutations = sjt_permutations
+
+    def __repr__(self) -> str:
+        supported = [op for op in OPERATIONS if getattr(self, op) is not None]
+        return f"Backend({self.name!r}, {supported})"
+
+
+def _as_tuples(perms: list | np.ndarray | BitPath) -> list[tuple[int, ...]]:
+    """
+    Converts the result of a backend to a list of tuples.
+
+    Args:
+        perms (list | np.ndarray | BitPath): A list of tuples or lists, a 2-D array or a `BitPath`.
+
+    Returns:
+        list[tuple[int, ...]]: The permutations as a list of tuples.
+    """
+    if isinstance(perms, list) and (len(perms) == 0 or isinstance(perms[0], tuple)):
+        return perms
+    # the result consists of many new tuples, which would trigger the garbage collector over and over
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        if isinstance(perms, BitPath):
+            return perms.to_list()
+        if isinstance(perms, np.ndarray):
+            perms = perms.tolist()
+        return [tuple(perm) for perm in perms]
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _bits_stutters(sig: tuple[int, ...]) -> BitPath | None:
+    """
+    Computes the stutter permutations with the `bits` backend, which only supports binary signatures.
+
+    Args:
+        sig (tuple[int, ...]): The signature of the permutations.
+
+    Returns:
+        BitPath | None: The stutter permutations, or None if the signature has more than two colors.
+    """
+    return BitPath.stutter_permutations(sig) if len(sig) <= 2 else None
+
+
+def _auto(operation: str, *args) -> Backend:
+    """
+    Selects the fastest backend for a call of `operation`, measured on the paths of this repository.
+    The `bits` backend is fastest for long binary paths, the `tuple` backend for everything else.
+
+    Args:
+        operation (str): One of ``OPERATIONS``.
+        *args: The arguments of the call.
+
+    Returns:
+        Backend: The backend to compute the call with.
+    """
+    if operation == "HpathNS":
+        k0, k1 = args
+        if k0 + k1 <= MAX_WIDTH and binomial(k0, k1) >= AUTO_BIT_PATH_LENGTH:
+            return _BACKENDS["bits"]
+    elif operation == "stutterPermutations":
+        sig = tuple(args[0])
+        if len(sig) <= 2 and sum(sig) <= MAX_WIDTH:
+            halves = binomial(*[n // 2 for n in sig]) if len(sig) == 2 else 1
+            if halves >= AUTO_BIT_PATH_LENGTH:
+                return _BACKENDS["bits"]
+    return _BACKENDS["tuple"]
+
+
+_BACKENDS = {
+    "tuple": Backend(
+        "tuple",
+        _HpathNS,
+        stachowiak.lemma11,
+        permutation_graphs.stutterPermutations,
+        lambda n: SteinhausJohnsonTrotter().get_sjt_permutations(n),
+    ),
+    "list": Backend(
+        "list",
+        verhoeff_list.HpathNS,
+        lambda sig: stachowiak_list.lemma11(tuple(sig)),
+        verhoeff_list.stutterPermutations,
+        lambda n: SteinhausJohnsonTrotterList().get_sjt_permutations(n),
+    ),
+    "numpy": Backend(
+        "numpy",
+        verhoeff_numpy.HpathNS,
+        lambda sig: stachowiak_numpy.lemma11(np.array(sig)),
+        lambda sig: verhoeff_numpy.stutterPermutations(np.array(sig)),
+        lambda n: SteinhausJohnsonTrotterNumpy().get_sjt_permutations(n),
+    ),
+    "bits": Backend("bits", HpathNS_bit_path, None, _bits_stutters, None),
+}
+_current = ContextVar("backend", default=os.environ.get("LEHMER_BACKEND", "tuple"))
+"""
+The name of the selected backend. Every thread (and asyncio task) selects its backend in its own context,
+a new thread starts with the backend of the `LEHMER_BACKEND` environment variable.
+"""
+
+
+def register_backend(backend: Backend) -> None:
+    """
+    Registers a backend, replacing the backend with the same name.
+
+    Args:
+        backend (Backend): The backend to register.
+
+    Returns:
+        None: The backend can be selected by its name from now on.
+
+    Raises:
+        ValueError: If the backend is called `auto`, which is reserved for the automatic selection.
+    """
+    if backend.name == "auto":
+        raise ValueError("The name 'auto' is reserved for the automatic selection")
+    _BACKENDS[backend.name] = backend
+
+
+def available_backends() -> list[str]:
+    """
+    Returns:
+        list[str]: The names of the registered backends, and `auto`.
+    """
+    return list(_BACKENDS) + ["auto"]
+
+
+def _check_name(name: str) -> str:
+    """
+    Checks that a backend with the name `name` is registered.
+
+    Args:
+        name (str): The name of the backend.
+
+    Returns:
+        str: The name of the backend.
+
+    Raises:
+        ValueError: If there is no backend called `name`.
+    """
+    if name != "auto" and name not in _BACKENDS:
+        raise ValueError(
+            f"Unknown backend {name!r}, expected one of {available_backends()}"
+        )
+    return name
+
+
+def use(name: str) -> None:
+    """
+    Selects the backend that computes the operations of this module in the current thread (or context).
+    The backend can also be selected with the `LEHMER_BACKEND` environment variable, the default is `tuple`.
+    With `auto` every call is routed to the fastest backend for its size.
+
+    Args:
+        name (str): The name of the backend, see ``available_backends``.
+
+    Returns:
+        None: The backend is selected until the next call of ``use``.
+
+    Raises:
+        ValueError: If there is no backend called `name`.
+
+    Example:
+        >>> use("bits")
+        >>> HpathNS(2, 2)
+        [(1, 0, 0, 1), (0, 1, 0, 1), (0, 1, 1, 0), (1, 0, 1, 0)]
+        >>> use("tuple")
+    """
+    _current.set(_check_name(name))
+
+
+def current_backend() -> str:
+    """
+    Returns:
+        str: The name of the selected backend.
+    """
+    return _current.get()
+
+
+@contextmanager
+def using(name: str) -> Iterator[None]:
+    """
+    Selects a backend for the duration of a `with` block, see ``use``.
+
+    Args:
+        name (str): The name of the backend.
+
+    Returns:
+        Iterator[None]: Yields once, with the backend selected.
+
+    Raises:
+        ValueError: If there is no backend called `name`.
+    """
+    token = _current.set(_check_name(name))
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def _call(operation: str, backend: str | None, *args) -> list[tuple[int, ...]]:
+    """
+    Computes `operation` with the given (or the selected) backend.
+
+    Args:
+        operation (str): One of ``OPERATIONS``.
+        backend (str | None): The name of the backend, or None for the selected backend.
+        *args: The arguments of the operation.
+
+    Returns:
+        list[tuple[int, ...]]: The result of the operation as a list of tuples.
+
+    Raises:
+        ValueError: If there is no backend called `backend`.
+    """
+    name = _check_name(_current.get() if backend is None else backend)
+    selected = _auto(operation, *args) if name == "auto" else _BACKENDS[name]
+    implementation = getattr(selected, operation)
+    result = None if implementation is None else implementation(*args)
+    if result is None:
+        result = getattr(_BACKENDS["tuple"], operation)(*args)
+    return _as_tuples(result)
+
+
+def HpathNS(k0: int, k1: int, backend: str | None = None) -> list[tuple[int, ...]]:
+    """
+    Computes ``verhoeff.HpathNS`` with the selected backend.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        backend (str | None, optional): The backend to use for this call. Defaults to the backend selected with ``use``.
+
+    Returns:
+        list[tuple[int, ...]]: A Hamiltonian path in the neighbor-swap graph G(0^k_0|1^(k_1)).
+    """
+    return _call("HpathNS", backend, k0, k1)
+
+
+def lemma11(sig: tuple[int, ...], backend: str | None = None) -> list[tuple[int, ...]]:
+    """
+    Computes ``stachowiak.lemma11`` with the selected backend.
+
+    Args:
+        sig (tuple[int, ...]): The signature, with at least two odd numbers.
+        backend (str | None, optional): The backend to use for this call. Defaults to the backend selected with ``use``.
+
+    Returns:
+        list[tuple[int, ...]]: A Hamiltonian cycle on the non-stutter permutations of `sig`.
+    """
+    return _call("lemma11", backend, tuple(sig))
+
+
+def stutterPermutations(
+    sig: tuple[int, ...], backend: str | None = None
+) -> list[tuple[int, ...]]:
+    """
+    Computes ``permutation_graphs.stutterPermutations`` with the selected backend.
+
+    Args:
+        sig (tuple[int, ...]): The signature of the permutations.
+        backend (str | None, optional): The backend to use for this call. Defaults to the backend selected with ``use``.
+
+    Returns:
+        list[tuple[int, ...]]: The stutter permutations of `sig`.
+    """
+    return _call("stutterPermutations", backend, tuple(sig))
+
+
+def sjt_permutations(n: int, backend: str | None = None) -> list[tuple[int, ...]]:
+    """
+    Computes the Steinhaus-Johnson-Trotter listing of the permutations of `n` distinct elements with the selected backend.
+
+    Args:
+        n (int): The number of elements.
+        backend (str | None, optional): The backend to use for this call. Defaults to the backend selected with ``use``.
+
+    Returns:
+        list[tuple[int, ...]]: The permutations in the order of the Steinhaus-Johnson-Trotter algorithm.
+    """
+    return _call("sjt_permutations", backend, n)
@@ -1,11 +1,12 @@
 import argparse
 
 from core.cycle_cover import get_connected_cycle_cover
+from core.helper_operations.parallel import get_workers, using_workers
 from core.helper_operations.path_operations import cycleQ, pathQ
 from core.helper_operations.permutation_graphs import (
     get_perm_signature,
     multinomial,
-    stutterPermutations,
+    stutter_count,
 )
 
 if __name__ == "__main__":
@@ -30,12 +31,20 @@ if __name__ == "__main__":
         action="store_true",
         help="Naively glue the disjoint cycle cover (when the attempted edge is not connected in the subcycle).",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes that compute the sub-cycles",
+    )
     args = parser.parse_args()
     sig = tuple([int(x) for x in args.signature.split(",")])
-    connected_cycle_cover = get_connected_cycle_cover(sig, args.naive_glue)
+    with using_workers(get_workers() if args.jobs is None else args.jobs):
+        connected_cycle_cover = get_connected_cycle_cover(sig, args.naive_glue)
     if args.verbose:
         print(f"Connected cycle cover: {connected_cycle_cover}")
-    stut_count = len(stutterPermutations(sig))
+    stut_count = stutter_count(sig)
     print(
         f"Cycle cover is a cycle {cycleQ(connected_cycle_cover)} and a path {pathQ(connected_cycle_cover)} "
         f"with {len(connected_cycle_cover)}/{multinomial(sig)} (incl {stut_count} stutters is {stut_count+len(connected_cycle_cover)}) permutations from signature {get_perm_signature(connected_cycle_cover[-1])}."
@@ -1,6 +1,11 @@
 import argparse
-from functools import cache
+import gc
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
+
+from core.backends import HpathNS, stutterPermutations
+from core.helper_operations.bounded_cache import bounded_cache
 from core.helper_operations.cycle_cover_connections import (
     connect_single_cycle_cover,
     generate_end_tuple_order,
@@ -13,11 +18,18 @@ from core.helper_operations.cycle_cover_generation import (
     incorporated_odd_2_1_path_a_b,
     waveTopRowOddOddOne,
 )
+from core.helper_operations.parallel import (
+    SharedArray,
+    get_workers,
+    set_workers,
+    using_workers,
+)
 from core.helper_operations.path_operations import (
     adjacent,
     createZigZagPath,
     cutCycle,
     cycleQ,
+    encode_swap_sequence,
     get_first_element,
     get_transformer,
     glue,
@@ -27,20 +39,21 @@ from core.helper_operations.path_operations import (
     transform,
     transform_cycle_cover,
 )
+from core.helper_operations.path_store import stored_path
+from core.helper_operations.perm_path import PermPath
 from core.helper_operations.permutation_graphs import (
     extend,
     extend_cycle_cover,
     get_perm_signature,
     incorporateSpursInZigZag,
     multinomial,
-    nonStutterPermutations,
+    non_stutter_count,
     perm,
     rotate,
-    stutterPermutations,
+    stutter_count,
     swapPair,
 )
 from core.stachowiak import lemma2_extended_path
-from core.verhoeff import HpathNS
 
 
 def add_cycle_in_order(
@@ -90,6 +103,118 @@ def add_cycle_in_order(
     return cycle_cover
 
 
+def _build_sub_cycle(
+    spec: tuple[str, tuple[int, ...], str],
+    offset: int,
+    length: int,
+    sub_sig: tuple[int, ...],
+    tail: tuple[int, ...],
+    naive_glue: bool,
+) -> None:
+    """
+    Computes a connected sub-cycle extended by a tail in a worker process, into a shared array. See ``_connected_sub_cycles``.
+
+    Args:
+        spec (tuple[str, tuple[int, ...], str]): The spec of the shared array with a row for every permutation of all sub-cycles.
+        offset (int): The row of the first permutation of the sub-cycle.
+        length (int): The expected number of permutations of the sub-cycle.
+        sub_sig (tuple[int, ...]): The subsignature of the sub-cycle.
+        tail (tuple[int, ...]): The colors to append to every permutation of the sub-cycle.
+        naive_glue (bool): If the naive gluing method should be used.
+
+    Returns:
+        None: The sub-cycle is written into the shared array.
+
+    Raises:
+        ValueError: If the sub-cycle is not a list of permutations of the expected length.
+    """
+    cycle = get_connected_cycle_cover(sub_sig, naive_glue)
+    if len(cycle) > 0 and not isinstance(cycle[0], tuple):
+        raise ValueError(f"Expected a cycle, got {cycle}")
+    if len(cycle) != length:
+        raise ValueError(
+            f"Expected {length} permutations for signature {sub_sig}, got {len(cycle)}"
+        )
+    if length == 0:
+        return
+    shared = SharedArray.attach(spec)
+    try:
+        rows = shared.array[offset : offset + length]
+        rows[:, : sum(sub_sig)] = cycle.buffer if isinstance(cycle, PermPath) else cycle
+        rows[:, sum(sub_sig) :] = tail
+    finally:
+        shared.close()
+
+
+def _connected_sub_cycles(
+    sub_sigs: list[tuple[int, ...]],
+    tails: list[tuple[int, ...]],
+    naive_glue: bool,
+) -> list[list[tuple[int, ...]]]:
+    """
+    Computes the connected cycles of subsignatures extended by their tails, `extend(get_connected_cycle_cover(sub_sig), tail)`.
+    The sub-cycles are independent until they are glued, so with more than one worker (see ``parallel.set_workers``)
+    they are computed concurrently by worker processes, largest first.
+    The workers write the sub-cycles into one shared array of colors instead of returning them,
+    every sub-cycle starts at the row given by the numbers of non-stutter permutations of the subsignatures before it.
+    The worker processes compute their sub-cycles without worker processes of their own.
+
+    Args:
+        sub_sigs (list[tuple[int, ...]]): The subsignatures, all with the same number of colors and the same length.
+        tails (list[tuple[int, ...]]): The colors to append to the permutations of every sub-cycle, all of the same length.
+        naive_glue (bool): If the naive gluing method should be used.
+
+    Returns:
+        list[list[tuple[int, ...]]]: The extended sub-cycles, in the order of `sub_sigs`.
+
+    Raises:
+        ValueError: If a sub-cycle is not a list of permutations.
+    """
+    workers = min(get_workers(), len(sub_sigs))
+    if workers <= 1:
+        sub_cycles = []
+        for sub_sig, tail in zip(sub_sigs, tails):
+            cycle = get_connected_cycle_cover(sub_sig, naive_glue)
+            if len(cycle) > 0 and not isinstance(cycle[0], tuple):
+                raise ValueError(f"Expected a cycle, got {cycle}")
+            sub_cycles.append(extend(cycle, tail) if len(tail) > 0 else cycle)
+        return sub_cycles
+    lengths = [non_stutter_count(sub_sig) for sub_sig in sub_sigs]
+    offsets = np.cumsum([0] + lengths).tolist()
+    width = sum(sub_sigs[0]) + len(tails[0])
+    # the colors of the subsignatures and the tails are smaller than the number of colors
+    dtype = np.min_scalar_type(len(sub_sigs[0]))
+    with SharedArray((offsets[-1], width), dtype) as shared:
+        with ProcessPoolExecutor(
+            workers, initializer=set_workers, initargs=(1,)
+        ) as pool:
+            jobs = [
+                pool.submit(
+                    _build_sub_cycle,
+                    shared.spec,
+                    offsets[i],
+                    lengths[i],
+                    sub_sigs[i],
+                    tails[i],
+                    naive_glue,
+                )
+                for i in sorted(range(len(sub_sigs)), key=lambda i: -lengths[i])
+            ]
+            for job in jobs:
+                job.result()
+        # the sub-cycles consist of many new tuples, which would trigger the garbage collector over and over
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return [
+                [tuple(row) for row in shared.array[start:stop].tolist()]
+                for start, stop in zip(offsets, offsets[1:])
+            ]
+        finally:
+            if enabled:
+                gc.enable()
+
+
 def generate_all_even_cycle_cover(
     sig: tuple[int, ...], naive_glue: bool = False
 ) -> list[list[tuple[int, ...]]]:
@@ -112,6 +237,7 @@ def generate_all_even_cycle_cover(
     """
     all_sub_cycles = []
     between_cycles = []
+    sub_sigs = {}
     for idx, color in enumerate(sig):
         temp_sig = sig[:idx] + (color - 1,) + sig[idx + 1 :]
         for idx2, second_color in enumerate(temp_sig[idx:], start=idx):
@@ -119,20 +245,32 @@ def generate_all_even_cycle_cover(
             # check if this results an even-1-1 case
             sorted_sub_sig, transformer2 = get_transformer(sub_sig, lambda x: x[0])
             # for the even-1-1 case we need a specific path that has parallel edges
-            even_1_1_sig = False
             if (
                 len(list(sorted_sub_sig)) == 3
                 and sorted_sub_sig[0] % 2 == 0
                 and sorted_sub_sig[1] == 1
                 and sorted_sub_sig[2] == 1
             ):
-                even_1_1_sig = True
-                subcyc = transform(
+                sub_sigs[sub_sig] = transform(
                     Hpath_even_1_1(sorted_sub_sig[0]),
                     transformer2,
                 )
             else:
-                subcyc = get_connected_cycle_cover(sub_sig, naive_glue)
+                sub_sigs[sub_sig] = None
+    # the cycles of the other subsignatures are independent, so they can be computed by worker processes
+    connected = [sub_sig for sub_sig, path in sub_sigs.items() if path is None]
+    sub_sigs.update(
+        zip(
+            connected,
+            _connected_sub_cycles(connected, [()] * len(connected), naive_glue),
+        )
+    )
+    for idx, color in enumerate(sig):
+        temp_sig = sig[:idx] + (color - 1,) + sig[idx + 1 :]
+        for idx2, second_color in enumerate(temp_sig[idx:], start=idx):
+            sub_sig = temp_sig[:idx2] + (second_color - 1,) + temp_sig[idx2 + 1 :]
+            subcyc = sub_sigs[sub_sig]
+            even_1_1_sig = sub_sig not in connected
             if idx != idx2:
                 # this gives a set of cycles that we just need to add in order
                 sub_cycles = []
@@ -179,7 +317,7 @@ def generate_all_even_cycle_cover(
     return all_sub_cycles
 
 
-@cache
+@bounded_cache
 def odd_odd_1_cycle(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     """
     Generates a cycle for the odd-odd-1 case. It uses the waveTopRowOddOddOne function to transform the odd-odd subcase into a cycle.
@@ -191,8 +329,8 @@ def odd_odd_1_cycle(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
         list[tuple[int, ...]]: The cycle for the odd-odd-1 case.
     """
     # easy first; odd-even-1 and even-odd-1
-    even_odd_x = extend(get_connected_cycle_cover((sig[0] - 1, sig[1], 1)), (0,))
-    odd_even_y = extend(get_connected_cycle_cover((sig[0], sig[1] - 1, 1)), (1,))
+    even_odd_x = extend(get_connected_cycle_cover((sig[0] - 1, sig[1], 1), False), (0,))
+    odd_even_y = extend(get_connected_cycle_cover((sig[0], sig[1] - 1, 1), False), (1,))
 
     # now we have the odd-odd part which splits in a few parts with even-even
     even_even_cxy2 = HpathNS(sig[0] - 1, sig[1] - 1)
@@ -265,7 +403,7 @@ def even_2_1_cycle(
     return [cutCycle(p2, swapPair(v, 1))[::-1] + cutCycle(c, swapPair(v, -2))]
 
 
-@cache
+@bounded_cache
 def even_odd_1_cycle(
     sig: tuple[int, ...], distinct_ends: bool = True
 ) -> list[tuple[int, ...]]:
@@ -289,20 +427,22 @@ def even_odd_1_cycle(
                 sig[0] - (1 if sig[0] % 2 == 0 else 0),
                 sig[1] - (1 if sig[1] % 2 == 0 else 0),
                 1,
-            )
+            ),
+            False,
         ),
         (even_idx,),
     )
 
     # even, odd, 1 (appended with both even and odd, since both subtracted by 1; smaller case holds by induction)
     even_odd_x = extend(
-        get_connected_cycle_cover((sig[0] - 1, sig[1] - 1, 1)), (even_idx, odd_idx)
+        get_connected_cycle_cover((sig[0] - 1, sig[1] - 1, 1), False),
+        (even_idx, odd_idx),
     )
 
     # odd-2, even, 1 (appended with odd, odd); so odd, even, 1 (but a smaller case)
     odd_even_y = extend(
         get_connected_cycle_cover(
-            (sig[0] - (sig[0] % 2) * 2, sig[1] - (sig[1] % 2) * 2, 1)
+            (sig[0] - (sig[0] % 2) * 2, sig[1] - (sig[1] % 2) * 2, 1), False
         ),
         (odd_idx, odd_idx),
     )
@@ -417,7 +557,7 @@ def even_odd_1_cycle(
     return c_12_21_11_01_02_0
 
 
-@cache
+@bounded_cache
 def even_1_1_1_cycle(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     """
     Generates a cycle for the even-1-1-1 case. This is a cycle that contains three paths that are glued to one Hamiltonian cycle in two parts.
@@ -431,7 +571,7 @@ def even_1_1_1_cycle(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     """
     # in the odd-1-1-1 we must watch out we don't pick the cross edge xy 0^{k0-1} z 0 ~ yx 0^{k0-1} z 0
     # we use that edge to transform the paths to cycles in this case
-    cycle_cover = extend(get_connected_cycle_cover((sig[0] - 1, 1, 1, 1)), (0,))
+    cycle_cover = extend(get_connected_cycle_cover((sig[0] - 1, 1, 1, 1), False), (0,))
     # get the even-1-1 path
     even11_path = Hpath_even_1_1(sig[0])
     # transform to other colors
@@ -489,7 +629,7 @@ def even_1_1_1_cycle(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     return [cc_c3]
 
 
-@cache
+@bounded_cache
 def even_2_1_1_cycle(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     """
     Generates a Hamiltonian cycle for the (even, 2, 1, 1) signature. This is a cycle has two subgraphs that only have a Hamiltonian path.
@@ -502,8 +642,8 @@ def even_2_1_1_cycle(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     """
     # See master thesis for explanation
     # this list will hold the two subsigs with only one even element
-    odd_2_1_1_c0 = extend(get_connected_cycle_cover((sig[0] - 1, 2, 1, 1)), (0,))
-    even_1_1_1_c1 = extend(get_connected_cycle_cover((sig[0], 1, 1, 1)), (1,))
+    odd_2_1_1_c0 = extend(get_connected_cycle_cover((sig[0] - 1, 2, 1, 1), False), (0,))
+    even_1_1_1_c1 = extend(get_connected_cycle_cover((sig[0], 1, 1, 1), False), (1,))
 
     # now the hard part; even-2-1 and even-2-0-1
     even_2_cycles = HpathNS(sig[0], 2)
@@ -512,7 +652,7 @@ def even_2_1_1_cycle(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
         stutterPermutations((sig[0], 2)),
         [(3, 2), (2, 3)],
     )
-    odd_2_1_c03 = extend(get_connected_cycle_cover((sig[0] - 1, 2, 1)), (0, 3))
+    odd_2_1_c03 = extend(get_connected_cycle_cover((sig[0] - 1, 2, 1), False), (0, 3))
     odd_2_0_1_c02 = transform(odd_2_1_c03, [0, 1, 3, 2])
     if sig[0] == 2:
         # the 2-2-1-1 case
@@ -616,7 +756,39 @@ def even_2_1_1_cycle(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     return [cycle]
 
 
-@cache
+def _is_even_odd_1_subsig(sig: tuple[int, ...]) -> bool:
+    """
+    Checks if a subsignature in ``two_odd_rest_even_cycle_cover`` is even-odd-1 or odd-even-1 with the even color larger than 2 and smaller than the odd color.
+    The cycle of such a subsignature is generated by ``even_odd_1_cycle`` with non-distinct ends instead of ``get_connected_cycle_cover``.
+
+    Args:
+        sig (tuple[int, ...]): The subsignature with three colors, the last color must occur once.
+
+    Returns:
+        bool: If the subsignature is an even-odd-1 or odd-even-1 subsignature.
+    """
+    sorted_sig, _ = get_transformer(sig, lambda x: x[0])
+    return (
+        len(sorted_sig) == 3
+        and sig[2] == 1
+        and (
+            (
+                # even-odd-1
+                sig[0] % 2 == 0
+                and sig[0] > 2
+                and sig[0] < sig[1]
+            )
+            or (
+                # odd-even-1
+                sig[1] % 2 == 0
+                and sig[1] > 2
+                and sig[1] < sig[0]
+            )
+        )
+    )
+
+
+@bounded_cache
 def two_odd_rest_even_cycle_cover(
     sig: tuple[int, ...], naive_glue: bool = False
 ) -> tuple[list[list[tuple[int, ...]]], list[list[tuple[int, ...]]]]:
@@ -670,24 +842,7 @@ def two_odd_rest_even_cycle_cover(
                 sorted_subsub_sig, tran = get_transformer(
                     two_odd_subsubsig, lambda x: [x[0] % 2 == 1, x[0]]
                 )
-                if (
-                    len(sorted_subsub_sig) == 3
-                    and two_odd_subsubsig[2] == 1
-                    and (
-                        (
-                            # even-odd-1
-                            two_odd_subsubsig[0] % 2 == 0
-                            and two_odd_subsubsig[0] > 2
-                            and two_odd_subsubsig[0] < two_odd_subsubsig[1]
-                        )
-                        or (
-                            # odd-even-1
-                            two_odd_subsubsig[1] % 2 == 0
-                            and two_odd_subsubsig[1] > 2
-                            and two_odd_subsubsig[1] < two_odd_subsubsig[0]
-                        )
-                    )
-                ):
+                if _is_even_odd_1_subsig(two_odd_subsubsig):
                     current_subcycle.append(
                         [
                             extend(
@@ -746,7 +901,7 @@ def two_odd_rest_even_cycle_cover(
     return all_sub_cycles, last_odd_cycle
 
 
-@cache
+@bounded_cache
 def two_odd_rest_even_cycle(
     sig: tuple[int, ...], naive_glue: bool = False
 ) -> list[tuple[int, ...]]:
@@ -827,9 +982,9 @@ def two_odd_rest_even_cycle(
     return all_sub_cycles
 
 
-@cache
+@bounded_cache(ignore=("jobs",))
 def generate_cycle_cover(
-    sig: tuple[int, ...], naive_glue: bool = False
+    sig: tuple[int, ...], naive_glue: bool = False, jobs: int | None = None
 ) -> list[list[tuple[int, ...]]]:
     """
     Generates the disjoint cycle cover on the non-stutter permutations for the given signature `sig` according to the Theorem by Verhoeff.\n
@@ -847,9 +1002,15 @@ def generate_cycle_cover(
     - All-even: Forms cycles by fixing the trailing *two* elements.
     - Two-or-more-odd: Stachowiak's theorem gives us a cycle on this graph.
 
+    In the all-but-one-even, three-or-more-odd and all-even cases the sub-cycles are independent until they are connected,
+    so they are computed by worker processes when more than one worker is used, see ``_connected_sub_cycles``.
+
     Args:
         sig (tuple[int, ...]): The signature of the permutations. Must have at least one element.
         naive_glue (bool, optional): Whether to use naive gluing or not. Defaults to False.
+        jobs (int | None, optional):
+            The number of worker processes, see ``parallel.set_workers``. The result does not depend on it,
+            so it is not part of the key of the cache. Defaults to None, which uses the number of workers that is set.
 
     Returns:
         list[list[tuple[int, ...]]]:
@@ -858,12 +1019,16 @@ def generate_cycle_cover(
             The lists do not have a defined depth since they can consist of cycle covers themselves. But the depth is at least 2.
 
     Raises:
-        ValueError: If the signature is empty.
+        ValueError: If the signature is empty or `jobs` is smaller than 1.
 
     References:
         - Tom Verhoeff. The spurs of D. H. Lehmer: Hamiltonian paths in neighbor-swap graphs of permutations. Designs, Codes, and Cryptography, 84(1-2):295-310, 7 2017.
         - Stachowiak G. Hamilton Paths in Graphs of Linear Extensions for Unions of Posets. Technical report, 1992
     """
+    if jobs is not None:
+        # computed without a cache lookup, the result is stored under the key without `jobs` by the caller
+        with using_workers(jobs):
+            return generate_cycle_cover.__wrapped__(sig, naive_glue)
     # sort list in descending order
     if len(list(sig)) == 0:
         return []
@@ -930,17 +1095,20 @@ def generate_cycle_cover(
     # three-or-more-odd case
     elif sum(n % 2 for n in sig) >= 3:
         # use induction on the last element
-        all_sub_cycles = []
+        sub_sigs = []
         # sort the signature to first have the even numbers then the odd numbers
         sorted_sig, transformer = get_transformer(sig, lambda x: [x[0]])
         for idx, color in enumerate(sorted_sig):
             sub_sig = sorted_sig[:idx] + (color - 1,) + sorted_sig[idx + 1 :]
             if any(s < 0 for s in sub_sig):
                 raise ValueError(f"Negative signature {sub_sig}")
-            c = get_connected_cycle_cover(sub_sig, naive_glue)
-            if not isinstance(c[0], tuple):
-                raise ValueError(f"Expected a cycle, got {c}")
-            all_sub_cycles.append([extend(c, (idx,))])
+            sub_sigs.append(sub_sig)
+        all_sub_cycles = [
+            [c]
+            for c in _connected_sub_cycles(
+                sub_sigs, [(idx,) for idx in range(len(sub_sigs))], naive_glue
+            )
+        ]
         # connect the cycles
         single_cycle = connect_single_cycle_cover(
             all_sub_cycles, generate_end_tuple_order(sig), naive_glue
@@ -949,19 +1117,22 @@ def generate_cycle_cover(
         return [transform(single_cycle, transformer)]
     # all-but-one even case
     elif sum(n % 2 for n in sig) == 1:
-        all_sub_cycles = []
-        for idx, color in enumerate(sig):
-            sub_sig = sig[:idx] + (color - 1,) + sig[idx + 1 :]
-            c = [extend(get_connected_cycle_cover(sub_sig, naive_glue), (idx,))]
-            all_sub_cycles.append(c)
-        return all_sub_cycles
+        sub_sigs = [
+            sig[:idx] + (color - 1,) + sig[idx + 1 :] for idx, color in enumerate(sig)
+        ]
+        return [
+            [c]
+            for c in _connected_sub_cycles(
+                sub_sigs, [(idx,) for idx in range(len(sig))], naive_glue
+            )
+        ]
     # all-even case
     else:
         all_sub_cycles = generate_all_even_cycle_cover(sig, naive_glue)
         return all_sub_cycles
 
 
-@cache
+@bounded_cache
 def get_subsigs_and_cross_edges(
     sig: tuple[int, ...], naive_glue: bool = False
 ) -> tuple[
@@ -1005,10 +1176,10 @@ def get_subsigs_and_cross_edges(
         return [(sig[0], sig[1])], [], []
 
 
-@cache
+@bounded_cache
 def get_connected_cycle_cover(
-    sig: tuple[int, ...], naive_glue: bool = False
-) -> list[tuple[int, ...]]:
+    sig: tuple[int, ...], naive_glue: bool = False, swap_encoding: bool = False
+) -> list[tuple[int, ...]] | tuple[tuple[int, ...] | None, np.ndarray]:
     """
     Computes the a cycle on the non-stutter permutations for a given signature.
     If the signature is odd-2-1, the connected cycle cover is computed using lemma 11 by Stachowiak.
@@ -1017,9 +1188,14 @@ def get_connected_cycle_cover(
     Args:
         sig (tuple[int, ...]): The signature for which the cycle on non-stutter permutations needs to be computed.
         naive_glue (bool, optional): If the naive gluing method should be used. Defaults to False.
+        swap_encoding (bool, optional):
+            If the cycle should be returned as its first permutation and swap indices, see ``encode_swap_sequence``.
+            Defaults to False.
 
     Returns:
-        list[tuple[int, ...]]: The connected cycle cover as a list of tuples, where each tuple represents a permutation.
+        list[tuple[int, ...]] | tuple[tuple[int, ...] | None, np.ndarray]:
+            The connected cycle cover as a list of tuples, where each tuple represents a permutation.
+            Or the swap encoding of that cycle if `swap_encoding` is True.
 
     Raises:
         AssertionError: If the generated cycle cover by Verhoeff's theorem is empty.
@@ -1028,6 +1204,8 @@ def get_connected_cycle_cover(
         - Tom Verhoeff. The spurs of D. H. Lehmer: Hamiltonian paths in neighbor-swap graphs of permutations. Designs, Codes, and Cryptography, 84(1-2):295-310, 7 2017.
         - Stachowiak G. Hamilton Paths in Graphs of Linear Extensions for Unions of Posets. Technical report, 1992
     """
+    if swap_encoding:
+        return encode_swap_sequence(get_connected_cycle_cover(sig, naive_glue))
     sorted_sig, transformer = get_transformer(sig, lambda x: x[0])
     if len(list(sig)) <= 1:
         return []
@@ -1039,20 +1217,44 @@ def get_connected_cycle_cover(
     elif len(list(sig)) < 3:
         return HpathNS(sig[0], sig[1])
     else:
-        cover = generate_cycle_cover(sig, naive_glue)
-        assert len(cover) > 0
-        if len(cover) == 1:
-            return cover[0]
-        elif isinstance(cover[0][0], int):
-            return cover
-        # If there is less than two odd occurring colors, we can connect the cycles using the recursive connection method
-        # Loop over the cycles in the cover and connect the cycle at index `i` ends with an element of color `i`
-        # while the depth of the list is more than 2, we need to connect the previous cycles
-        print(f"naive_glue: {naive_glue}")
-        connected_cover = connect_single_cycle_cover(
-            cover, generate_end_tuple_order(sig), naive_glue
+        return stored_path(
+            "connected_cycle_cover_naive" if naive_glue else "connected_cycle_cover",
+            sig,
+            lambda: _connect_generated_cycle_cover(sig, naive_glue),
         )
-        return connected_cover
+
+
+def _connect_generated_cycle_cover(
+    sig: tuple[int, ...], naive_glue: bool
+) -> list[tuple[int, ...]]:
+    """
+    Generates the cycle cover of a sorted signature with at least three colors and connects it into one cycle,
+    see ``get_connected_cycle_cover``.
+
+    Args:
+        sig (tuple[int, ...]): The sorted signature with at least three colors.
+        naive_glue (bool): If the naive gluing method should be used.
+
+    Returns:
+        list[tuple[int, ...]]: The cycle on the non-stutter permutations of `sig`.
+
+    Raises:
+        AssertionError: If the generated cycle cover by Verhoeff's theorem is empty.
+    """
+    cover = generate_cycle_cover(sig, naive_glue)
+    assert len(cover) > 0
+    if len(cover) == 1:
+        return cover[0]
+    elif isinstance(cover[0][0], int):
+        return cover
+    # If there is less than two odd occurring colors, we can connect the cycles using the recursive connection method
+    # Loop over the cycles in the cover and connect the cycle at index `i` ends with an element of color `i`
+    # while the depth of the list is more than 2, we need to connect the previous cycles
+    print(f"naive_glue: {naive_glue}")
+    connected_cover = connect_single_cycle_cover(
+        cover, generate_end_tuple_order(sig), naive_glue
+    )
+    return connected_cover
 
 
 if __name__ == "__main__":
@@ -1071,24 +1273,30 @@ if __name__ == "__main__":
         action="store_true",
         help="Enable verbose mode (prints all permutations in order)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes that compute the sub-cycles",
+    )
 
     args = parser.parse_args()
     s = tuple([int(x) for x in args.signature.split(",")])
     if len(list(s)) > 1:
-        perms = generate_cycle_cover(s)
+        perms = generate_cycle_cover(s, jobs=args.jobs)
         if args.verbose:
             print(f"Resulting path {perms}")
         for p in perms:
             first = get_first_element(p)
             print(f"last number: {first[-2:]}")
-        stut_count = len(stutterPermutations(s))
+        stut_count = stutter_count(s)
         try:
             total_perms = recursive_cycle_check(perms)
             print(
                 f"Verhoeff's result for signature {s}: {total_perms}/{multinomial(s)} "
                 f"(incl {stut_count} stutters {stut_count+total_perms}) is a list of cycles."
             )
-            non_stutters = nonStutterPermutations(s)
         except AssertionError as e:
             print(f"List of cycles is not a valid cycle cover: {e}")
             print(
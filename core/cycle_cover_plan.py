@@ -0,0 +1,446 @@
+import argparse
+import sys
+from collections import Counter, namedtuple
+from typing import Callable
+
+from core.cycle_cover import (
+    _is_even_odd_1_subsig,
+    even_1_1_1_cycle,
+    even_2_1_1_cycle,
+    even_odd_1_cycle,
+    generate_cycle_cover,
+    get_connected_cycle_cover,
+    odd_odd_1_cycle,
+    two_odd_rest_even_cycle,
+    two_odd_rest_even_cycle_cover,
+)
+from core.helper_operations.path_operations import get_transformer
+from core.helper_operations.permutation_graphs import non_stutter_count
+
+PlanNode = namedtuple("PlanNode", ["sig", "naive_glue"])
+"""A subproblem of a plan: the connected cycle of a sorted signature with at least two colors, glued naively or not."""
+
+# the cached functions whose results are computed for a single node, they are called with the signature of the node
+_NODE_FUNCTIONS = (
+    even_odd_1_cycle,
+    odd_odd_1_cycle,
+    even_1_1_1_cycle,
+    even_2_1_1_cycle,
+)
+_NODE_GLUE_FUNCTIONS = (
+    get_connected_cycle_cover,
+    generate_cycle_cover,
+    two_odd_rest_even_cycle,
+    two_odd_rest_even_cycle_cover,
+)
+
+
+def _canonical(sig: tuple[int, ...]) -> tuple[int, ...]:
+    """
+    Args:
+        sig (tuple[int, ...]): A signature.
+
+    Returns:
+        tuple[int, ...]: The signature sorted in descending order without the colors that do not occur.
+    """
+    return get_transformer(sig, lambda x: x[0])[0]
+
+
+def _decrement(sig: tuple[int, ...], idx: int) -> tuple[int, ...]:
+    """
+    Args:
+        sig (tuple[int, ...]): A signature.
+        idx (int): The color to remove one occurrence of.
+
+    Returns:
+        tuple[int, ...]: The signature with color `idx` occurring once less.
+    """
+    return sig[:idx] + (sig[idx] - 1,) + sig[idx + 1 :]
+
+
+def _even_odd_1_calls(sig: tuple[int, ...]) -> list[tuple[Callable, tuple]]:
+    """
+    Lists the connected cycles that ``cycle_cover.even_odd_1_cycle`` uses.
+
+    Args:
+        sig (tuple[int, ...]): The even-odd-1 or odd-even-1 signature.
+
+    Returns:
+        list[tuple[Callable, tuple]]: The cached functions and the arguments they are called with.
+    """
+    return [
+        (
+            get_connected_cycle_cover,
+            (
+                (
+                    sig[0] - (1 if sig[0] % 2 == 0 else 0),
+                    sig[1] - (1 if sig[1] % 2 == 0 else 0),
+                    1,
+                ),
+                False,
+            ),
+        ),
+        (get_connected_cycle_cover, ((sig[0] - 1, sig[1] - 1, 1), False)),
+        (
+            get_connected_cycle_cover,
+            ((sig[0] - (sig[0] % 2) * 2, sig[1] - (sig[1] % 2) * 2, 1), False),
+        ),
+    ]
+
+
+def _two_odd_calls(
+    sig: tuple[int, ...], naive_glue: bool
+) -> list[tuple[Callable, tuple]]:
+    """
+    Lists the connected cycles and even-odd-1 cycles that ``cycle_cover.two_odd_rest_even_cycle_cover`` uses.
+
+    Args:
+        sig (tuple[int, ...]): The sorted signature with two odd colors.
+        naive_glue (bool): If the naive gluing method is used.
+
+    Returns:
+        list[tuple[Callable, tuple]]: The cached functions and the arguments they are called with.
+    """
+    calls = []
+    two_odd_subsig_added = False
+    even_indices = [i for i, v in enumerate(sig) if v % 2 == 0]
+    for idx in range(len(sig)):
+        sub_sig = _decrement(sig, idx)
+        if sum(n % 2 for n in sub_sig) != 1:
+            calls.append((get_connected_cycle_cover, (sub_sig, naive_glue)))
+            continue
+        if sub_sig[idx] > 1:
+            calls.append(
+                (get_connected_cycle_cover, (_decrement(sub_sig, idx), naive_glue))
+            )
+        for i in even_indices:
+            two_odd_subsubsig = _decrement(sub_sig, i)
+            if _is_even_odd_1_subsig(two_odd_subsubsig):
+                sorted_subsub_sig, _ = get_transformer(
+                    two_odd_subsubsig, lambda x: [x[0] % 2 == 1, x[0]]
+                )
+                calls.append(
+                    (
+                        even_odd_1_cycle,
+                        ((sorted_subsub_sig[0], sorted_subsub_sig[2], 1), False),
+                    )
+                )
+            else:
+                calls.append(
+                    (get_connected_cycle_cover, (two_odd_subsubsig, naive_glue))
+                )
+        if not two_odd_subsig_added:
+            two_odd_subsig_added = True
+            odd_idx = next(i for i, v in enumerate(sub_sig) if v % 2 == 1)
+            calls.append(
+                (get_connected_cycle_cover, (_decrement(sub_sig, odd_idx), naive_glue))
+            )
+    return calls
+
+
+def cycle_cover_calls(
+    sig: tuple[int, ...], naive_glue: bool = False
+) -> list[tuple[Callable, tuple]]:
+    """
+    Lists the cached results that ``cycle_cover.generate_cycle_cover`` uses to generate the cycle cover of a sorted signature,
+    following the same cases. These are connected cycles of subsignatures (``get_connected_cycle_cover``)
+    and the even-odd-1 cycles with non-distinct ends of the two-odd case (``even_odd_1_cycle``).
+    The results that are only computed for `sig` itself, such as ``odd_odd_1_cycle(sig)``, are not listed.
+
+    Args:
+        sig (tuple[int, ...]): The signature sorted in descending order, with at least three colors.
+        naive_glue (bool, optional): If the naive gluing method is used. Defaults to False.
+
+    Returns:
+        list[tuple[Callable, tuple]]: The cached functions and the arguments they are called with, in the order of the calls.
+
+    Example:
+        >>> [args for _, args in cycle_cover_calls((3, 1, 1, 1))]
+        [((2, 1, 1, 1), False), ((3, 0, 1, 1), False), ((3, 1, 0, 1), False), ((3, 1, 1, 0), False)]
+    """
+    k = sig[0]
+    odd_count = sum(n % 2 for n in sig)
+    # odd-1-1, even-1-1, even-2-1 and odd-2-1 are generated directly
+    if len(sig) == 3 and sig[1] <= 2 and sig[2] == 1:
+        return []
+    # even-odd-1
+    elif len(sig) == 3 and k % 2 != sig[1] % 2 and sig[2] == 1:
+        return _even_odd_1_calls(sig)
+    # odd-odd-1
+    elif len(sig) == 3 and k % 2 == 1 and sig[1] % 2 == 1 and sig[2] == 1:
+        return [
+            (get_connected_cycle_cover, ((k - 1, sig[1], 1), False)),
+            (get_connected_cycle_cover, ((k, sig[1] - 1, 1), False)),
+        ]
+    # even-2-1-1
+    elif len(sig) == 4 and k % 2 == 0 and sig[1:] == (2, 1, 1):
+        return [
+            (get_connected_cycle_cover, ((k - 1, 2, 1, 1), False)),
+            (get_connected_cycle_cover, ((k, 1, 1, 1), False)),
+            (get_connected_cycle_cover, ((k - 1, 2, 1), False)),
+        ]
+    elif odd_count == 2:
+        return _two_odd_calls(sig, naive_glue)
+    # even-1-1-1
+    elif len(sig) == 4 and k % 2 == 0 and sig[1:] == (1, 1, 1):
+        return [(get_connected_cycle_cover, ((k - 1, 1, 1, 1), False))]
+    # three-or-more-odd and all-but-one-even
+    elif odd_count >= 1:
+        return [
+            (get_connected_cycle_cover, (_decrement(sig, idx), naive_glue))
+            for idx in range(len(sig))
+        ]
+    # all-even, see ``generate_all_even_cycle_cover``
+    calls = []
+    for idx in range(len(sig)):
+        for idx2 in range(idx, len(sig)):
+            sub_sig = _decrement(_decrement(sig, idx), idx2)
+            sorted_sub_sig = _canonical(sub_sig)
+            # the even-1-1 path is generated directly
+            if not (
+                len(sorted_sub_sig) == 3
+                and sorted_sub_sig[0] % 2 == 0
+                and sorted_sub_sig[1:] == (1, 1)
+            ):
+                calls.append((get_connected_cycle_cover, (sub_sig, naive_glue)))
+    return calls
+
+
+class CycleCoverPlan:
+    """
+    Schedules the computation of ``cycle_cover.generate_cycle_cover`` bottom-up.
+    The recursion of ``generate_cycle_cover`` and ``get_connected_cycle_cover`` works top-down through overlapping subsignatures,
+    so which subproblems are computed again and which stay in memory depends on the state of the caches.
+    A plan expands the signature up front into the graph of all subproblems (the connected cycles of the sorted subsignatures with at least two colors),
+    so its size can be inspected before anything is computed.
+    ``run`` computes the subproblems in topological order, smallest first, so every subproblem is computed once
+    and its dependencies are found in the caches. A subproblem is removed from the caches as soon as the last subproblem that uses it is computed.
+    The binary subsignatures are the leaves of the graph, their paths are also kept by the cache of ``verhoeff.HpathNS``.
+
+    Args:
+        sig (tuple[int, ...]): The signature of the permutations.
+        naive_glue (bool, optional): If the naive gluing method is used. Defaults to False.
+
+    Raises:
+        ValueError: If the signature contains negative numbers.
+
+    Example:
+        >>> plan = CycleCoverPlan((3, 3, 2))
+        >>> len(plan), [node.sig for node in plan.order]
+        (5, [(3, 2, 1), (2, 2), (2, 2, 2), (3, 3, 1), (3, 3, 2)])
+        >>> [node.sig for node in plan.dependencies[plan.root]]
+        [(3, 2, 1), (2, 2, 2), (3, 3, 1)]
+    """
+
+    def __init__(self, sig: tuple[int, ...], naive_glue: bool = False) -> None:
+        self.sig = tuple(sig)
+        self.naive_glue = naive_glue
+        self.root = PlanNode(_canonical(self.sig), naive_glue)
+        self.dependencies: dict[PlanNode, list[PlanNode]] = {}
+        """The subproblems that every subproblem uses directly, in the order of their first use."""
+        # the arguments with which the connected cycle of a subproblem is requested, and the even-odd-1 cycles of a subproblem
+        self._requests: dict[PlanNode, set[tuple]] = {}
+        self._helpers: dict[PlanNode, set[tuple]] = {}
+        self.order = self._expand()
+        """All subproblems in topological order, every subproblem after the subproblems it uses. The root is last."""
+
+    def _expand(self) -> list[PlanNode]:
+        """
+        Expands the root into the graph of its subproblems with an iterative depth-first search.
+
+        Returns:
+            list[PlanNode]: The subproblems in post-order.
+        """
+        order = []
+        stack = [(self.root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                order.append(node)
+                continue
+            if node in self.dependencies:
+                continue
+            calls = cycle_cover_calls(*node) if len(node.sig) >= 3 else []
+            children = {}
+            self._helpers[node] = set()
+            while calls:
+                function, args = calls.pop(0)
+                if function is even_odd_1_cycle:
+                    # computed within this subproblem, from the connected cycles it uses
+                    self._helpers[node].add(args)
+                    calls.extend(_even_odd_1_calls(args[0]))
+                    continue
+                child = PlanNode(_canonical(args[0]), args[1])
+                if len(child.sig) >= 2:
+                    children[child] = None
+                    self._requests.setdefault(child, set()).add(args)
+            self.dependencies[node] = list(children)
+            stack.append((node, True))
+            for child in reversed(self.dependencies[node]):
+                if child not in self.dependencies:
+                    stack.append((child, False))
+        return order
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of subproblems of the plan, including the root.
+        """
+        return len(self.order)
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: The signature, the number of subproblems and the estimated sizes of the plan.
+        """
+        return (
+            f"CycleCoverPlan({self.sig}, nodes={len(self)}, nbytes={self.nbytes()}, "
+            f"peak_nbytes={self.peak_nbytes()})"
+        )
+
+    @staticmethod
+    def node_nbytes(node: PlanNode) -> int:
+        """
+        Estimates the size of the connected cycle of a subproblem in the same way as ``bounded_cache.estimate_size``.
+
+        Args:
+            node (PlanNode): The subproblem.
+
+        Returns:
+            int: The estimated number of bytes of the cycle of non-stutter permutations of the subproblem.
+        """
+        length = non_stutter_count(node.sig)
+        return sys.getsizeof([]) + length * (8 + sys.getsizeof((0,) * sum(node.sig)))
+
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: The estimated number of bytes of the cycles of all subproblems together.
+        """
+        return sum(self.node_nbytes(node) for node in self.order)
+
+    def peak_nbytes(self) -> int:
+        """
+        Estimates the largest number of bytes of cycles that are held at the same time by ``run``.
+
+        Returns:
+            int: The estimated peak number of bytes.
+        """
+        remaining = Counter(
+            child for node in self.order for child in self.dependencies[node]
+        )
+        live = peak = 0
+        for node in self.order:
+            live += self.node_nbytes(node)
+            peak = max(peak, live)
+            for child in self.dependencies[node]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    live -= self.node_nbytes(child)
+        return peak
+
+    def _release(self, node: PlanNode) -> None:
+        """
+        Removes the results of a subproblem from the caches.
+
+        Args:
+            node (PlanNode): The subproblem.
+
+        Returns:
+            None: The results of the subproblem are computed again if they are used after all.
+        """
+        for function in _NODE_GLUE_FUNCTIONS:
+            function.cache_discard(*node)
+        for function in _NODE_FUNCTIONS:
+            function.cache_discard(node.sig)
+        for args in self._requests[node]:
+            get_connected_cycle_cover.cache_discard(*args)
+
+    def run(self) -> list[list[tuple[int, ...]]]:
+        """
+        Computes all subproblems bottom-up and returns the cycle cover of the signature.
+
+        Returns:
+            list[list[tuple[int, ...]]]: The cycle cover, equal to ``generate_cycle_cover(sig, naive_glue)``.
+        """
+        remaining = Counter(
+            child for node in self.order for child in self.dependencies[node]
+        )
+        helpers = Counter(args for node in self.order for args in self._helpers[node])
+        for node in self.order[:-1]:
+            get_connected_cycle_cover(*node)
+            self._done(node, remaining, helpers)
+        cover = generate_cycle_cover(self.sig, self.naive_glue)
+        self._done(self.root, remaining, helpers)
+        return cover
+
+    def _done(self, node: PlanNode, remaining: Counter, helpers: Counter) -> None:
+        """
+        Releases the subproblems and even-odd-1 cycles that are no longer used once `node` is computed.
+
+        Args:
+            node (PlanNode): The computed subproblem.
+            remaining (Counter): The number of subproblems that still use every subproblem.
+            helpers (Counter): The number of subproblems that still use every even-odd-1 cycle.
+
+        Returns:
+            None: `remaining` and `helpers` are updated in place.
+        """
+        for child in self.dependencies[node]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                self._release(child)
+        for args in self._helpers[node]:
+            helpers[args] -= 1
+            if helpers[args] == 0:
+                even_odd_1_cycle.cache_discard(*args)
+
+
+def plan_cycle_cover(sig: tuple[int, ...], naive_glue: bool = False) -> CycleCoverPlan:
+    """
+    Plans the bottom-up computation of the cycle cover of `sig`, see ``CycleCoverPlan``.
+
+    Args:
+        sig (tuple[int, ...]): The signature of the permutations.
+        naive_glue (bool, optional): If the naive gluing method is used. Defaults to False.
+
+    Returns:
+        CycleCoverPlan: The plan, run it with ``CycleCoverPlan.run``.
+    """
+    return CycleCoverPlan(sig, naive_glue)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Plans the bottom-up computation of the cycle cover of a permutation signature."
+    )
+    parser.add_argument(
+        "-s",
+        "--signature",
+        type=str,
+        help="Input permutation signature (comma separated)",
+    )
+    parser.add_argument(
+        "-n",
+        "--naive-glue",
+        action="store_true",
+        help="Naively glue the disjoint cycle cover",
+    )
+    parser.add_argument(
+        "-r",
+        "--run",
+        action="store_true",
+        help="Compute the cycle cover after printing the plan",
+    )
+    args = parser.parse_args()
+    s = tuple(int(x) for x in args.signature.split(","))
+    plan = plan_cycle_cover(s, args.naive_glue)
+    for node in plan.order:
+        print(
+            f"{node.sig}: {non_stutter_count(node.sig)} permutations, {plan.node_nbytes(node)} bytes, "
+            f"uses {[child.sig for child in plan.dependencies[node]]}"
+        )
+    print(plan)
+    if args.run:
+        cover = plan.run()
+        print(f"Cycle cover of {s} with {len(cover)} cycles")
@@ -21,11 +21,13 @@ def swap_elements(a_list: list, i: int, j: int) -> None:
 
 class SetPerm(Iterator, ABC):
     """
-    This file is directly copied from the original source code of the article:
+    This class is directly copied from the original source code of the article:
     "Multiset permutation generation by transpositions" by Rivertz
     The original source code is available at: https://doi.org/10.48550/arXiv.2309.11781
 
-    Therefore we also did not test or document this file as it is not part of our codebase.
+    Therefore we also did not test or document this class as it is not part of our codebase.
+    ``rivertz_iterative.iter_rivertz_swaps`` and ``rivertz_iterative.iter_rivertz_permutations`` generate the same permutations
+    iteratively, without copying them.
 
     References:
         - Hans Jakob Rivertz. Multiset permutation generation by transpositions. 9 2023
@@ -0,0 +1,130 @@
+import argparse
+import contextlib
+import io
+import itertools
+import time
+from typing import Callable, Iterable
+
+from core.figure_generation_files.rivertz import SetPerm
+from core.figure_generation_files.rivertz_iterative import (
+    iter_rivertz_permutations,
+    iter_rivertz_swaps,
+)
+from core.stachowiak import lemma11, lemma11_segments
+from core.verhoeff import HpathNS, iter_HpathNS
+
+DEFAULT_SIGNATURES = [(9, 9), (11, 7), (3, 3, 4), (3, 3, 2, 2), (3, 3, 2, 2, 1)]
+"""The signatures that are compared when no signatures are given, binary ones (Verhoeff) and multi-color ones (Stachowiak)."""
+
+
+def vertex_throughput(
+    generate: Callable[[], Iterable], repeat: int = 3
+) -> tuple[int, float]:
+    """
+    Measures how many vertices per second a generator of a path produces, taking the fastest of `repeat` runs.
+    Output printed while generating (such as the banner of ``lemma11``) is discarded.
+
+    Args:
+        generate (Callable[[], Iterable]): Creates the iterable of vertices (or transpositions) to consume.
+        repeat (int, optional): The number of runs. Defaults to 3.
+
+    Returns:
+        tuple[int, float]: The number of generated vertices and the number of vertices per second.
+    """
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            count = sum(1 for _ in generate())
+            best = min(best, time.perf_counter() - start)
+    return count, count / best if best > 0 else float("inf")
+
+
+def kernels(sig: tuple[int, ...]) -> dict[str, Callable[[], Iterable]]:
+    """
+    Selects the generators to compare for a signature.
+    Rivertz's algorithm lists all permutations by (not necessarily adjacent) transpositions.
+    The binary signatures are compared with Verhoeff's paths and the signatures with at least two odd numbers with Stachowiak's cycles,
+    which only contain the non-stutter permutations and only use adjacent swaps.
+
+    Args:
+        sig (tuple[int, ...]): The signature.
+
+    Returns:
+        dict[str, Callable[[], Iterable]]: The label and the generator of every kernel.
+    """
+    multiplicity = list(sig)
+    result = {
+        "Rivertz SetPerm (copies)": lambda: SetPerm(multiplicity),
+        "Rivertz iterative (views)": lambda: iter_rivertz_permutations(multiplicity),
+        "Rivertz iterative (swaps)": lambda: iter_rivertz_swaps(multiplicity),
+    }
+    if len(sig) == 2:
+        result["Verhoeff HpathNS"] = lambda: HpathNS.__wrapped__(*sig)
+        result["Verhoeff iter_HpathNS"] = lambda: iter_HpathNS(*sig)
+    elif sum(1 for n in sig if n % 2 == 1) >= 2:
+        result["Stachowiak lemma11"] = lambda: lemma11.__wrapped__(sig)
+        result["Stachowiak lemma11_segments"] = lambda: itertools.chain.from_iterable(
+            lemma11_segments(sig)
+        )
+    return result
+
+
+def benchmark(sig: tuple[int, ...], repeat: int = 3) -> dict[str, tuple[int, float]]:
+    """
+    Compares the vertex throughput of Rivertz's algorithm with the paths of Verhoeff or Stachowiak for a signature.
+
+    Args:
+        sig (tuple[int, ...]): The signature.
+        repeat (int, optional): The number of runs of every kernel. Defaults to 3.
+
+    Returns:
+        dict[str, tuple[int, float]]: The number of vertices and the vertices per second of every kernel.
+    """
+    return {
+        label: vertex_throughput(generate, repeat)
+        for label, generate in kernels(sig).items()
+    }
+
+
+def main():
+    """
+    Compares the vertex throughput of Rivertz's multiset permutation generator with the Verhoeff and Stachowiak paths.
+
+    Args:
+        -s, --signature: A signature to compare (comma separated), can be given multiple times
+        -r, --repeat: The number of runs of every generator, the fastest run is reported
+    Returns:
+        Prints the number of vertices and the vertices per second of every generator for every signature.
+    """
+    parser = argparse.ArgumentParser(
+        description="Compares the vertex throughput of Rivertz's algorithm with the Verhoeff and Stachowiak paths"
+    )
+    parser.add_argument(
+        "-s",
+        "--signature",
+        type=str,
+        action="append",
+        help="Input permutation signature (comma separated), can be given multiple times",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="The number of runs of every generator",
+    )
+    args = parser.parse_args()
+    if args.signature:
+        signatures = [tuple(int(x) for x in s.split(",")) for s in args.signature]
+    else:
+        signatures = DEFAULT_SIGNATURES
+    for sig in signatures:
+        print(f"Signature {sig}")
+        for label, (count, throughput) in benchmark(sig, args.repeat).items():
+            print(f"  {label:<32} {count:>10} vertices {throughput:>14,.0f} vertices/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from typing import Iterator
+
+
+def iter_rivertz_swaps(multiplicity: list[int]) -> Iterator[tuple[int, int]]:
+    """
+    Iterative version of ``rivertz.SetPerm``: generates the transpositions of Rivertz's algorithm instead of copies of the permutations.
+    The recursion of ``rivertz.SetPerm.one_step`` into the next element (or the next type) is replaced by a loop,
+    and the state of the algorithm is kept in local variables between the transpositions.
+
+    Args:
+        multiplicity (list[int]): The number of times every type `1, 2, ..., k` occurs in the permutations.
+
+    Returns:
+        Iterator[tuple[int, int]]:
+            The positions `(i, j)` of every transposition, starting from the sorted permutation.
+            The transpositions are not necessarily between neighbors.
+
+    Example:
+        >>> list(iter_rivertz_swaps([2, 1]))
+        [(1, 2), (0, 1)]
+
+    References:
+        - Hans Jakob Rivertz. Multiset permutation generation by transpositions. 9 2023
+    """
+    k = len(multiplicity)
+    P = [t + 1 for t in range(k) for _ in range(multiplicity[t])]
+    n = len(P)
+    D = [1] * n
+    # the active type and the number of positions in which its next element is searched
+    T = 1
+    end = n
+    while True:
+        d = end - 1
+        while d > -1 and P[d] != T:
+            d -= 1
+        if d == -1:
+            # no elements of type T can move, so continue with the next type
+            T += 1
+            if T >= k:
+                return
+            end = n
+            continue
+        df = D[d]
+        j = d + df
+        while -1 < j < n and P[j] == T and D[j] == df:
+            j += df
+        if -1 < j < n and P[j] > T:
+            P[d], P[j] = P[j], P[d]
+            D[d], D[j] = D[j], D[d]
+            for i in range(d + df, j, df):
+                D[i] = 1
+            yield d, j
+            T = 1
+            end = n
+        else:
+            # the element can not move, so it changes direction and the previous element of type T is tried
+            D[d] = -df
+            end = d
+
+
+def iter_rivertz_permutations(multiplicity: list[int]) -> Iterator[list[int]]:
+    """
+    Generates the permutations of ``rivertz.SetPerm`` by applying the transpositions of ``iter_rivertz_swaps`` to a single list.
+    Every permutation is a view: the same list is yielded every time and changed in place afterwards,
+    so it has to be copied if it is kept.
+
+    Args:
+        multiplicity (list[int]): The number of times every type `1, 2, ..., k` occurs in the permutations.
+
+    Returns:
+        Iterator[list[int]]: The permutation, in the order of ``rivertz.SetPerm``.
+
+    Example:
+        >>> [tuple(perm) for perm in iter_rivertz_permutations([2, 1])]
+        [(1, 1, 2), (1, 2, 1), (2, 1, 1)]
+    """
+    perm = [t + 1 for t in range(len(multiplicity)) for _ in range(multiplicity[t])]
+    yield perm
+    for i, j in iter_rivertz_swaps(multiplicity):
+        perm[i], perm[j] = perm[j], perm[i]
+        yield perm
@@ -0,0 +1,592 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+import numpy as np
+
+from core.helper_operations.perm_path import PermPath
+
+MAX_WIDTH = 64
+"""int: Longest binary permutation that fits in the `uint64` words of a `BitPath`."""
+
+_ONE = np.uint64(1)
+_THREE = np.uint64(3)
+
+
+def _check_width(width: int) -> int:
+    """
+    Checks that binary permutations of length `width` fit in a `uint64` word.
+
+    Args:
+        width (int): The length of the permutations.
+
+    Returns:
+        int: The length of the permutations.
+
+    Raises:
+        ValueError: If the permutations are longer than ``MAX_WIDTH``.
+    """
+    if width > MAX_WIDTH:
+        raise ValueError(
+            f"Binary permutations of length {width} do not fit in {MAX_WIDTH} bits"
+        )
+    return width
+
+
+def _to_word(vertex: tuple[int, ...]) -> int:
+    """
+    Packs a binary permutation into an integer, the first element is the most significant bit.
+
+    Args:
+        vertex (tuple[int, ...]): The permutation of 0s and 1s.
+
+    Returns:
+        int: The permutation as an integer.
+
+    Raises:
+        ValueError: If the permutation contains an element other than 0 and 1.
+
+    Example:
+        >>> _to_word((1, 0, 1, 1))
+        11
+    """
+    word = 0
+    for element in vertex:
+        if element not in (0, 1):
+            raise ValueError(f"Permutation {tuple(vertex)} is not binary")
+        word = (word << 1) | int(element)
+    return word
+
+
+def _to_words(vertices: list[tuple[int, ...]]) -> np.ndarray:
+    """
+    Packs many permutations of the same length with ``_to_word``.
+
+    Args:
+        vertices (list[tuple[int, ...]]): The permutations of 0s and 1s.
+
+    Returns:
+        np.ndarray: The permutations as `uint64` words.
+    """
+    return np.array([_to_word(vertex) for vertex in vertices], dtype=np.uint64)
+
+
+def _combinations(width: int, ones: int) -> Iterator[int]:
+    """
+    Generates all integers of `width` bits with exactly `ones` bits set, in increasing order (Gosper's hack).
+    These are the binary permutations with `ones` 1s in lexicographic order.
+
+    Args:
+        width (int): The number of bits.
+        ones (int): The number of bits that are set.
+
+    Returns:
+        Iterator[int]: The integers in increasing order.
+
+    Example:
+        >>> list(_combinations(4, 2))
+        [3, 5, 6, 9, 10, 12]
+    """
+    if ones > width:
+        return
+    word = (1 << ones) - 1
+    while word < 1 << width:
+        yield word
+        if word == 0:
+            return
+        lowest = word & -word
+        ripple = word + lowest
+        word = (((ripple ^ word) >> 2) // lowest) | ripple
+
+
+class BitPath:
+    """
+    A path (or cycle) of binary permutations stored as a 1-D `uint64` NumPy buffer with one word per permutation.
+    The element at position `i` of a permutation of length `width` is bit `width - 1 - i` of its word,
+    so the words sort like the permutations and swapping the differing elements at positions `i` and `i + 1`
+    is an XOR with `0b11 << (width - 2 - i)`. A vertex takes 8 bytes, instead of a row of `width` bytes in a `PermPath`.
+    Behaves like the list of tuples used throughout the repository, in the same way as `PermPath`:
+    the path operations (``extend``, ``rotate``, ``cutCycle``, ``transform``, ``createZigZagPath``, ``createSquareTube``,
+    ``incorporateSpursInZigZag``, ...) dispatch to the methods of this class.
+
+    Args:
+        buffer (np.ndarray | list): The permutations as integers.
+        width (int): Length of the permutations.
+
+    Raises:
+        ValueError: If the buffer is not 1-dimensional.
+        ValueError: If the permutations are longer than ``MAX_WIDTH``.
+
+    Example:
+        >>> path = BitPath.from_list([(0, 1, 1), (1, 0, 1)])
+        >>> path.buffer
+        array([3, 5], dtype=uint64)
+        >>> path[1]
+        (1, 0, 1)
+    """
+
+    __slots__ = ("buffer", "width")
+
+    def __init__(self, buffer: np.ndarray | list, width: int) -> None:
+        buffer = np.asarray(buffer, dtype=np.uint64)
+        if buffer.ndim != 1:
+            raise ValueError(
+                f"BitPath buffer must be 1-dimensional, got shape {buffer.shape}"
+            )
+        self.buffer = buffer
+        self.width = _check_width(width)
+
+    @classmethod
+    def from_list(
+        cls: type[BitPath], path: list[tuple[int, ...]] | BitPath, width: int = 0
+    ) -> BitPath:
+        """
+        Creates a `BitPath` from a list of binary permutations (tuples).
+
+        Args:
+            cls (type[BitPath]): The class of the path.
+            path (list[tuple[int, ...]] | BitPath): The path as a list of tuples.
+            width (int, optional): Length of the permutations, only used if `path` is empty. Defaults to 0.
+
+        Returns:
+            BitPath: The path backed by a `uint64` buffer.
+
+        Raises:
+            ValueError: If a permutation is not binary or is longer than ``MAX_WIDTH``.
+        """
+        if isinstance(path, BitPath):
+            return path
+        if len(path) == 0:
+            return cls(np.zeros(0, dtype=np.uint64), width)
+        width = _check_width(len(path[0]))
+        return cls(_to_words(path), width)
+
+    @classmethod
+    def stutter_permutations(cls: type[BitPath], sig: tuple[int, ...]) -> BitPath:
+        """
+        Generates the stutter permutations of a binary signature, in the same order as ``stutterPermutations``.
+        The halved permutations are generated as integers in increasing order and every bit is doubled, without creating tuples.
+
+        Args:
+            cls (type[BitPath]): The class of the path.
+            sig (tuple[int, ...]): The signature with at most two colors.
+
+        Returns:
+            BitPath: The stutter permutations.
+
+        Raises:
+            ValueError: If the signature has more than two colors.
+
+        Example:
+            >>> BitPath.stutter_permutations((2, 3)).to_list()
+            [(0, 0, 1, 1, 1), (1, 1, 0, 0, 1)]
+        """
+        sig = tuple(sig)
+        if len(sig) > 2:
+            raise ValueError(f"Signature {sig} is not binary")
+        width = _check_width(sum(sig))
+        odds = [color for color, count in enumerate(sig) if count % 2 == 1]
+        if len(odds) >= 2 or len(sig) == 0 or sig == (0,):
+            return cls(np.zeros(0, dtype=np.uint64), width)
+        ones = sig[1] // 2 if len(sig) == 2 else 0
+        halves = np.fromiter(_combinations(width // 2, ones), dtype=np.uint64)
+        # every bit `b` of a half becomes the bits `2b` and `2b + 1` of the stutter permutation
+        words = np.zeros_like(halves)
+        for bit in range(width // 2):
+            words |= ((halves >> np.uint64(bit)) & _ONE) * _THREE << np.uint64(2 * bit)
+        if odds:
+            words = (words << _ONE) | np.uint64(odds[0])
+        return cls(words, width)
+
+    @classmethod
+    def from_rows(cls: type[BitPath], rows: np.ndarray) -> BitPath:
+        """
+        Packs a 2-D array of binary permutations, like the buffer of a `PermPath`.
+
+        Args:
+            cls (type[BitPath]): The class of the path.
+            rows (np.ndarray): A 2-D array of 0s and 1s with one permutation per row.
+
+        Returns:
+            BitPath: The path backed by a `uint64` buffer.
+
+        Raises:
+            ValueError: If an element is not 0 or 1.
+        """
+        rows = np.asarray(rows)
+        width = _check_width(rows.shape[1])
+        if rows.size and int(rows.max()) > 1:
+            raise ValueError("Permutations are not binary")
+        shifts = np.arange(width - 1, -1, -1, dtype=np.uint64)
+        words = np.bitwise_or.reduce(
+            rows.astype(np.uint64) << shifts, axis=1, dtype=np.uint64
+        )
+        return cls(words, width)
+
+    def to_rows(self) -> np.ndarray:
+        """
+        Unpacks the path to a 2-D `uint8` array with one permutation per row, like the buffer of a `PermPath`.
+
+        Returns:
+            np.ndarray: The unpacked permutations.
+        """
+        shifts = np.arange(self.width - 1, -1, -1, dtype=np.uint64)
+        return ((self.buffer[:, None] >> shifts) & _ONE).astype(np.uint8)
+
+    def to_list(self) -> list[tuple[int, ...]]:
+        """
+        Converts the path back to a list of tuples.
+
+        Returns:
+            list[tuple[int, ...]]: The path as a list of tuples.
+        """
+        return [tuple(row) for row in self.to_rows().tolist()]
+
+    def _word(self, vertex: tuple[int, ...]) -> int:
+        """
+        Packs a vertex to compare it with the words of the path.
+
+        Args:
+            vertex (tuple[int, ...]): The vertex.
+
+        Returns:
+            int: The vertex as an integer, or -1 if it is not a binary permutation of the length of the path.
+        """
+        if len(vertex) != self.width or any(
+            element not in (0, 1) for element in vertex
+        ):
+            return -1
+        return _to_word(vertex)
+
+    def _new(self, buffer: np.ndarray, width: int | None = None) -> BitPath:
+        """
+        Creates a path with a new buffer, of permutations of the same length by default.
+
+        Args:
+            buffer (np.ndarray): The `uint64` words of the new path.
+            width (int | None, optional): Length of the permutations. Defaults to the length of the permutations of this path.
+
+        Returns:
+            BitPath: The new path.
+        """
+        return BitPath(buffer, self.width if width is None else width)
+
+    def __len__(self) -> int:
+        return self.buffer.shape[0]
+
+    def __iter__(self) -> Iterator[tuple[int, ...]]:
+        return iter(self.to_list())
+
+    def __getitem__(self, key: int | slice) -> tuple[int, ...] | BitPath:
+        if isinstance(key, slice):
+            return self._new(self.buffer[key])
+        word = int(self.buffer[key])
+        return tuple((word >> shift) & 1 for shift in range(self.width - 1, -1, -1))
+
+    def __add__(self, other: BitPath | list[tuple[int, ...]]) -> BitPath:
+        other = BitPath.from_list(other, self.width)
+        if other.width != self.width and len(other) and len(self):
+            raise ValueError(
+                f"Cannot concatenate permutations of length {self.width} and {other.width}"
+            )
+        return self._new(np.concatenate((self.buffer, other.buffer)))
+
+    def __radd__(self, other: list[tuple[int, ...]]) -> BitPath:
+        return BitPath.from_list(other, self.width) + self
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, list):
+            if len(other) != len(self):
+                return False
+            if len(other) == 0:
+                return True
+            if any(self._word(vertex) < 0 for vertex in other[:1]):
+                return False
+            other = BitPath.from_list(other, self.width)
+        if isinstance(other, PermPath):
+            return other.width == self.width and np.array_equal(
+                self.to_rows(), other.buffer
+            )
+        if not isinstance(other, BitPath):
+            return NotImplemented
+        return other.width == self.width and np.array_equal(self.buffer, other.buffer)
+
+    __hash__ = None
+
+    def __contains__(self, vertex: tuple[int, ...]) -> bool:
+        word = self._word(vertex)
+        return word >= 0 and bool(np.any(self.buffer == np.uint64(word)))
+
+    def __repr__(self) -> str:
+        return f"BitPath({self.to_list()})"
+
+    def index(self, vertex: tuple[int, ...]) -> int:
+        """
+        Returns the index of the first occurrence of `vertex` in the path, like ``list.index``.
+
+        Args:
+            vertex (tuple[int, ...]): The vertex to look for.
+
+        Returns:
+            int: The index of `vertex` in the path.
+
+        Raises:
+            ValueError: If `vertex` is not in the path.
+        """
+        word = self._word(vertex)
+        if word >= 0:
+            matches = np.flatnonzero(self.buffer == np.uint64(word))
+            if matches.size > 0:
+                return int(matches[0])
+        raise ValueError(f"{vertex} is not in BitPath")
+
+    def reverse(self) -> None:
+        """
+        Reverses the path in place, like ``list.reverse``. Only the view on the buffer is changed.
+
+        Returns:
+            None: The path is reversed in place.
+        """
+        self.buffer = self.buffer[::-1]
+
+    def _positions(self, words: np.ndarray) -> np.ndarray:
+        """
+        Looks up the index of many words at once by sorting the words of the path.
+
+        Args:
+            words (np.ndarray): The `uint64` words to look for.
+
+        Returns:
+            np.ndarray: The index of every word in the path, or -1 if the word is not in the path.
+        """
+        if len(words) == 0 or len(self) == 0:
+            return np.full(len(words), -1, dtype=np.int64)
+        order = np.argsort(self.buffer, kind="stable")
+        sorted_words = self.buffer[order]
+        found = np.minimum(np.searchsorted(sorted_words, words), len(self) - 1)
+        return np.where(sorted_words[found] == words, order[found], -1)
+
+    def positions(self, vertices: BitPath | list[tuple[int, ...]]) -> np.ndarray:
+        """
+        Looks up the index of many vertices at once. See ``PermPath.positions``.
+
+        Args:
+            vertices (BitPath | list[tuple[int, ...]]): The vertices to look for.
+
+        Returns:
+            np.ndarray: The index of every vertex in the path, or -1 if the vertex is not in the path.
+        """
+        return self._positions(BitPath.from_list(vertices, self.width).buffer)
+
+    def is_path(self, cyclic: bool = False) -> bool:
+        """
+        Checks whether consecutive permutations differ by a swap of two adjacent (distinct) elements.
+        Two words are adjacent if their XOR is `0b11` shifted to the left. Same semantics as ``PermPath.is_path``.
+
+        Args:
+            cyclic (bool, optional): Whether the last permutation must also be adjacent to the first one. Defaults to False.
+
+        Returns:
+            bool: True if the permutations form a path (or a cycle), False otherwise.
+        """
+        if cyclic and len(self) <= 2:
+            return False
+        if len(self) == 0:
+            return False
+        if len(self) == 1:
+            return True
+        following = np.roll(self.buffer, -1) if cyclic else self.buffer[1:]
+        diff = (self.buffer if cyclic else self.buffer[:-1]) ^ following
+        lowest = diff & (~diff + _ONE)
+        return bool(np.all((diff != 0) & (diff == lowest * _THREE)))
+
+    def extend(self, suffix: tuple[int, ...]) -> BitPath:
+        """
+        Appends `suffix` to every permutation in the path. See ``extend``.
+
+        Args:
+            suffix (tuple[int, ...]): The binary suffix to append.
+
+        Returns:
+            BitPath: The extended path.
+        """
+        width = _check_width(self.width + len(suffix))
+        shifted = self.buffer << np.uint64(len(suffix))
+        return self._new(shifted | np.uint64(_to_word(suffix)), width)
+
+    def rotate(self, n: int) -> BitPath:
+        """
+        Rotates the path `n` positions to the left. See ``rotate``.
+
+        Args:
+            n (int): The number of positions to rotate.
+
+        Returns:
+            BitPath: The rotated path.
+        """
+        if len(self) <= 1:
+            return self
+        return self._new(np.roll(self.buffer, -(n % len(self))))
+
+    def cut_cycle(self, vertex: tuple[int, ...]) -> BitPath:
+        """
+        Rotates the cycle such that `vertex` appears first. See ``cutCycle``.
+
+        Args:
+            vertex (tuple[int, ...]): The vertex to start the path with.
+
+        Returns:
+            BitPath: The rotated cycle.
+
+        Raises:
+            ValueError: If `vertex` is not in the cycle.
+        """
+        return self.rotate(self.index(vertex))
+
+    def transform(self, tr: list[int]) -> BitPath:
+        """
+        Renames every element `i` in the path to `tr[i]`. See ``transform``.
+        Swapping the colors (`tr = [1, 0]`) is an XOR with a mask of `width` ones.
+
+        Args:
+            tr (list[int]): Transformation list, int at index `i` is the new name for `i`.
+
+        Returns:
+            BitPath: The transformed path.
+
+        Raises:
+            ValueError: If the path contains an element that has no index in the transformation list.
+            ValueError: If the transformed permutations are not binary.
+        """
+        if len(self) > 0 and self.width > 0:
+            largest = 1 if np.any(self.buffer) else 0
+            if largest >= len(tr):
+                raise ValueError(
+                    f"Index {largest} is larger than the length of the transformation list {tr}"
+                )
+        if any(color not in (0, 1) for color in tr[:2]):
+            raise ValueError(f"Transformation {tr} does not map to binary permutations")
+        mask = np.uint64((1 << self.width) - 1)
+        ones = self.buffer if len(tr) > 1 and tr[1] == 1 else np.zeros_like(self.buffer)
+        zeros = ~self.buffer & mask if tr[0] == 1 else np.zeros_like(self.buffer)
+        return self._new(ones | zeros)
+
+    def zigzag(self, u: tuple[int, ...], v: tuple[int, ...]) -> BitPath:
+        """
+        Combines two "parallel" copies of the path into a zigzag path. See ``createZigZagPath``.
+
+        Args:
+            u (tuple[int, ...]): Tuple to append.
+            v (tuple[int, ...]): Tuple to append.
+
+        Returns:
+            BitPath: The zigzag path, twice as long as this path.
+        """
+        return self._repeat_with_modules(2, [u, v, v, u], [u, v, v, u])
+
+    def square_tube(self, u: tuple[int, ...], v: tuple[int, ...]) -> BitPath:
+        """
+        Creates a square tube from the path. See ``createSquareTube``.
+
+        Args:
+            u (tuple[int, ...]): Tuple to append.
+            v (tuple[int, ...]): Tuple adjacent to `u` to append.
+
+        Returns:
+            BitPath: The square tube, four times as long as this path.
+        """
+        uu, uv, vu, vv = u + u, u + v, v + u, v + v
+        return self._repeat_with_modules(
+            4, [uu, uv, vv, vu, vu, vv, uv, uu], [uu, uv, vv, vu, vu, uu, uv, vv]
+        )
+
+    def _repeat_with_modules(
+        self,
+        copies: int,
+        module: list[tuple[int, ...]],
+        last_module: list[tuple[int, ...]],
+    ) -> BitPath:
+        """
+        Repeats every word `copies` times and appends the suffixes of `module` cyclically.
+        The last `len(last_module)` words get the suffixes of `last_module` instead.
+
+        Args:
+            copies (int): How often every word is repeated.
+            module (list[tuple[int, ...]]): The suffixes that are appended cyclically.
+            last_module (list[tuple[int, ...]]): The suffixes of the last words.
+
+        Returns:
+            BitPath: The path with repeated words and suffixes.
+        """
+        suffix_width = len(module[0])
+        width = _check_width(self.width + suffix_width)
+        words = np.repeat(self.buffer, copies) << np.uint64(suffix_width)
+        suffixes = np.resize(_to_words(module), len(words))
+        if len(words) >= len(last_module):
+            suffixes[len(words) - len(last_module) :] = _to_words(last_module)
+        return self._new(words | suffixes, width)
+
+    def incorporate_spurs(
+        self,
+        vertices: BitPath | list[tuple[int, ...]],
+        spur_suffixes: list[tuple[int, ...]],
+        skip: int = 0,
+    ) -> BitPath:
+        """
+        Incorporates all spurs in a zigzag path at once. See ``incorporateSpursInZigZag``.
+        The last pair of distinct adjacent elements before the skipped part is the lowest set bit of `prefix ^ (prefix >> 1)`.
+
+        Args:
+            vertices (BitPath | list[tuple[int, ...]]): The stutters to incorporate.
+            spur_suffixes (list[tuple[int, ...]]): The two spur suffixes for the vertices.
+            skip (int, optional): Number of elements to skip before the suffixes when finding the swap index. Defaults to 0.
+
+        Returns:
+            BitPath: The zigzag path with the spurs incorporated.
+
+        Raises:
+            ValueError: If a spur has no base in the path.
+            ValueError: If the bases of a spur are not adjacent in the path, or already hold another spur.
+        """
+        vertices = BitPath.from_list(vertices)
+        if len(vertices) == 0:
+            return self
+        suffix_width = len(spur_suffixes[0])
+        suffixes = _to_words(spur_suffixes)
+        spurs = (
+            np.repeat(vertices.buffer, len(suffixes)) << np.uint64(suffix_width)
+        ) | np.tile(suffixes, len(vertices))
+        first, second = spurs[0::2], spurs[1::2]
+        shift = np.uint64(skip + suffix_width)
+        prefix_width = self.width - skip - suffix_width
+        prefix = first >> shift
+        distinct = (prefix ^ (prefix >> _ONE)) & np.uint64(
+            (1 << max(prefix_width - 1, 0)) - 1
+        )
+        if not np.all(distinct):
+            raise ValueError(
+                f"No distinct adjacent elements found in the spurs {self._new(spurs).to_list()}"
+            )
+        swap = ((distinct & (~distinct + _ONE)) * _THREE) << shift
+        p, q = first ^ swap, second ^ swap
+        i, j = self._positions(p), self._positions(q)
+        if np.any(i < 0) or np.any(j < 0):
+            missing = p[np.argmax(i < 0)] if np.any(i < 0) else q[np.argmax(j < 0)]
+            raise ValueError(
+                f"Path does not contain permutation {self._new(np.array([missing]))[0]}"
+            )
+        after = j == i + 1
+        # like in ``incorporateSpursInZigZag``, only one spur fits between two adjacent vertices
+        first_base = np.zeros(len(i), dtype=bool)
+        first_base[np.unique(np.minimum(i, j), return_index=True)[1]] = True
+        adjacent = (after | (j == i - 1)) & first_base
+        if not np.all(adjacent):
+            index = np.argmax(~adjacent)
+            raise ValueError(
+                f"Permutations {self._new(p)[index]} and {self._new(q)[index]} are not adjacent in path."
+            )
+        # the spur goes between its base i and j, in the orientation of the path
+        insert = np.empty(2 * len(first), dtype=np.uint64)
+        insert[0::2] = np.where(after, first, second)
+        insert[1::2] = np.where(after, second, first)
+        return self._new(np.insert(self.buffer, np.repeat(np.maximum(i, j), 2), insert))
@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import inspect
+import os
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+from functools import update_wrapper
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "currsize", "nbytes"]
+)
+"""Statistics of a single function cached with ``bounded_cache``."""
+
+DEFAULT_CACHE_BUDGET = 1 << 30
+"""The default number of bytes shared by all caches, can be overridden with the `LEHMER_CACHE_BUDGET` environment variable."""
+
+_lock = threading.RLock()
+# the results of all cached functions, from least to most recently used, as `(function, key) -> (result, size)`
+_entries: OrderedDict[tuple[Any, Any], tuple[Any, int]] = OrderedDict()
+_functions: list[_BoundedCache] = []
+_budget = int(os.environ.get("LEHMER_CACHE_BUDGET", DEFAULT_CACHE_BUDGET))
+_nbytes = 0
+_KWARGS_MARK = object()
+
+
+def estimate_size(result: Any) -> int:
+    """
+    Estimates the number of bytes used by a result of a cached function.
+    Paths are lists of permutations of the same length, so their size is estimated from the first permutation
+    as the length of the path times the size of one permutation, instead of visiting every permutation.
+    Containers of paths (cycle covers, tuples of results) are summed over their elements.
+
+    Args:
+        result (Any): The result to estimate the size of.
+
+    Returns:
+        int: The estimated number of bytes of `result`.
+
+    Example:
+        >>> estimate_size([(0, 1), (1, 0)]) == sys.getsizeof([]) + 2 * 8 + 2 * sys.getsizeof((0, 1))
+        True
+    """
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(getattr(type(result), "nbytes", None), property):
+        # paths know their size, a lazily decoded path without being decoded
+        return result.nbytes
+    if hasattr(result, "buffer") and isinstance(result.buffer, np.ndarray):
+        return result.buffer.nbytes
+    if isinstance(result, list):
+        size = sys.getsizeof([]) + 8 * len(result)
+        if len(result) == 0:
+            return size
+        if isinstance(result[0], (tuple, int, np.integer)):
+            return size + len(result) * estimate_size(result[0])
+        return size + sum(estimate_size(item) for item in result)
+    if isinstance(result, tuple):
+        if all(isinstance(item, (int, np.integer)) for item in result):
+            return sys.getsizeof(result)
+        return sys.getsizeof(result) + sum(estimate_size(item) for item in result)
+    return sys.getsizeof(result)
+
+
+class _BoundedCache:
+    """
+    The wrapper around a function cached with ``bounded_cache``.
+    The results of all wrapped functions share one least-recently-used order and one byte budget,
+    only the statistics are kept per function.
+    """
+
+    def __init__(self, function: Callable, ignore: Iterable[str] = ()) -> None:
+        self.function = function
+        self.ignore = frozenset(ignore)
+        # the positions of the ignored arguments when they are passed positionally
+        self._ignored_positions = {
+            i
+            for i, name in enumerate(inspect.signature(function).parameters)
+            if name in self.ignore
+        }
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.currsize = 0
+        self.nbytes = 0
+        update_wrapper(self, function)
+        with _lock:
+            _functions.append(self)
+
+    def _key(self, args: tuple, kwargs: dict) -> tuple[Any, Any]:
+        """
+        Args:
+            args (tuple): The positional arguments of a call.
+            kwargs (dict): The keyword arguments of a call.
+
+        Returns:
+            tuple[Any, Any]: The key under which the result of the call is stored.
+        """
+        if self.ignore:
+            args = tuple(
+                arg for i, arg in enumerate(args) if i not in self._ignored_positions
+            )
+            kwargs = {k: v for k, v in kwargs.items() if k not in self.ignore}
+        return (
+            self,
+            args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args,
+        )
+
+    def __call__(self, *args, **kwargs) -> Any:
+        key = self._key(args, kwargs)
+        with _lock:
+            entry = _entries.get(key)
+            if entry is not None:
+                _entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        # computed outside of the lock, the wrapped functions are recursive and may be computed by several threads
+        result = self.function(*args, **kwargs)
+        _store(key, result, estimate_size(result))
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns:
+            CacheInfo: The hits, misses, evictions, number of stored results and their estimated number of bytes.
+        """
+        with _lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, self.currsize, self.nbytes
+            )
+
+    def cache_contains(self, *args, **kwargs) -> bool:
+        """
+        Checks whether the result of a call is stored, without calling the function or counting a hit or a miss.
+        The arguments must be passed in the same way as in the call, `f(x)` and `f(x=x)` are stored separately.
+
+        Returns:
+            bool: Whether a result is stored for these arguments.
+        """
+        key = self._key(args, kwargs)
+        with _lock:
+            return key in _entries
+
+    def cache_store(self, result: Any, /, *args, **kwargs) -> None:
+        """
+        Stores the result of a call that was computed without calling the function,
+        e.g. when the results for smaller arguments are computed together bottom-up.
+        The arguments must be passed in the same way as in the call, `f(x)` and `f(x=x)` are stored separately.
+
+        Args:
+            result (Any): The result of the function for these arguments.
+
+        Returns:
+            None: The result is stored unless a result is already stored for these arguments or it is larger than the budget.
+        """
+        _store(self._key(args, kwargs), result, estimate_size(result))
+
+    def cache_discard(self, *args, **kwargs) -> bool:
+        """
+        Removes the stored result of one call, so it is freed once the caller no longer references it.
+        The arguments must be passed in the same way as in the call, `f(x)` and `f(x=x)` are stored separately.
+
+        Returns:
+            bool: Whether a result was stored for these arguments.
+        """
+        key = self._key(args, kwargs)
+        with _lock:
+            if key not in _entries:
+                return False
+            _remove(key)
+            return True
+
+    def cache_clear(self) -> None:
+        """
+        Removes the stored results of this function and resets its statistics.
+
+        Returns:
+            None: The results are removed from the shared cache.
+        """
+        with _lock:
+            for key in [key for key in _entries if key[0] is self]:
+                _remove(key)
+            self.hits = self.misses = self.evictions = 0
+
+
+def bounded_cache(
+    function: Callable | None = None, ignore: Iterable[str] = ()
+) -> Callable:
+    """
+    Caches the results of `function` like `functools.cache`, but within a byte budget shared by all functions cached this way.
+    When storing a result would exceed the budget, the least recently used results (of any cached function) are evicted.
+    A result that is larger than the whole budget is returned without being stored.
+    As with `functools.cache` the cached results are shared between calls and must not be modified.
+    Used as `@bounded_cache(ignore=...)` without a function, it returns the decorator.
+
+    Args:
+        function (Callable | None, optional): The function to cache. Its arguments must be hashable. Defaults to None.
+        ignore (Iterable[str], optional):
+            The names of the arguments that do not change the result, such as the number of worker processes.
+            They are passed to `function` but left out of the key (also when passed positionally),
+            so all calls that only differ in them share one result.
+            Defaults to ().
+
+    Returns:
+        Callable: The cached function, with `cache_info()`, `cache_contains(*args, **kwargs)`,
+            `cache_store(result, *args, **kwargs)`, `cache_discard(*args, **kwargs)` and `cache_clear()` methods.
+
+    Example:
+        >>> @bounded_cache
+        ... def double(x):
+        ...     return 2 * x
+        >>> double(2), double(2)
+        (4, 4)
+        >>> double.cache_info().hits
+        1
+    """
+    if function is None:
+        return lambda function: _BoundedCache(function, ignore)
+    return _BoundedCache(function, ignore)
+
+
+def _store(key: tuple[Any, Any], result: Any, size: int) -> None:
+    """
+    Stores a result in the cache, evicting the least recently used results until it fits in the budget.
+
+    Args:
+        key (tuple[Any, Any]): The cached function and the key of its arguments.
+        result (Any): The result to store.
+        size (int): The estimated number of bytes of `result`.
+
+    Returns:
+        None: The result is stored unless it is already stored or larger than the budget.
+    """
+    global _nbytes
+    with _lock:
+        if key in _entries or size > _budget:
+            return
+        _evict(_budget - size)
+        _entries[key] = (result, size)
+        _nbytes += size
+        key[0].currsize += 1
+        key[0].nbytes += size
+
+
+def _remove(key: tuple[Any, Any]) -> None:
+    """
+    Removes a stored result from the cache.
+
+    Args:
+        key (tuple[Any, Any]): The cached function and the key of its arguments.
+
+    Returns:
+        None: The result and its size are removed from the cache.
+    """
+    global _nbytes
+    _, size = _entries.pop(key)
+    _nbytes -= size
+    key[0].currsize -= 1
+    key[0].nbytes -= size
+
+
+def _evict(limit: int) -> None:
+    """
+    Evicts the least recently used results until at most `limit` bytes are stored.
+
+    Args:
+        limit (int): The number of bytes that may remain stored.
+
+    Returns:
+        None: The evicted results are counted in the statistics of their functions.
+    """
+    while _entries and _nbytes > limit:
+        key = next(iter(_entries))
+        _remove(key)
+        key[0].evictions += 1
+
+
+def clear_caches() -> None:
+    """
+    Removes the stored results of all functions cached with ``bounded_cache`` and resets their statistics.
+
+    Returns:
+        None: All caches are empty afterwards.
+    """
+    with _lock:
+        for function in _functions:
+            function.cache_clear()
+
+
+def cache_stats() -> dict[str, CacheInfo]:
+    """
+    Collects the statistics of all functions cached with ``bounded_cache``.
+
+    Returns:
+        dict[str, CacheInfo]: The statistics per function, keyed by the qualified name of its module and function.
+
+    Example:
+        >>> from core.verhoeff import HpathNS
+        >>> _ = HpathNS(2, 2)
+        >>> cache_stats()["core.verhoeff.HpathNS"].currsize >= 1
+        True
+    """
+    with _lock:
+        return {
+            f"{function.__module__}.{function.__qualname__}": function.cache_info()
+            for function in _functions
+        }
+
+
+def cache_nbytes() -> int:
+    """
+    Returns:
+        int: The estimated number of bytes stored by all functions cached with ``bounded_cache``.
+    """
+    return _nbytes
+
+
+def get_cache_budget() -> int:
+    """
+    Returns:
+        int: The number of bytes that all functions cached with ``bounded_cache`` may store together.
+    """
+    return _budget
+
+
+def set_cache_budget(nbytes: int) -> None:
+    """
+    Sets the number of bytes that all functions cached with ``bounded_cache`` may store together.
+    Lowering the budget immediately evicts the least recently used results that no longer fit.
+
+    Args:
+        nbytes (int): The new budget in bytes.
+
+    Returns:
+        None: The budget is changed for all cached functions.
+
+    Raises:
+        ValueError: If the budget is negative.
+    """
+    global _budget
+    if nbytes < 0:
+        raise ValueError("The cache budget cannot be negative")
+    with _lock:
+        _budget = nbytes
+        _evict(_budget)
@@ -6,12 +6,12 @@ from core.helper_operations.cycle_cover_cross_edges import (
     generate_two_odd_cross_edges,
     get_all_even_cross_edges,
 )
+from core.helper_operations.cycle_rope import CycleRope
 from core.helper_operations.naive_parallel_edges import find_cross_edges
 from core.helper_operations.path_operations import (
     find_last_distinct_adjacent_index,
     get_first_element,
     get_transformer,
-    glue,
     transform,
 )
 from core.helper_operations.permutation_graphs import get_perm_signature, swapPair
@@ -134,19 +134,19 @@ def get_two_odd_rest_even_cycle(
         list[tuple[int, ...]]: The connected cycle cover as a list of tuples, where each tuple represents a permutation.
     """
     # the 2 odd case is different because we connect all individual cycles to the last one
-    last_cycle = single_cycle_cover[-1][0]
+    last_cycle = CycleRope(single_cycle_cover[-1][0])
     for i, cycle in enumerate(single_cycle_cover[:-1]):
         cross_edge = cross_edges[(end_tuple_order[i], swapPair(end_tuple_order[i], 0))][
             0
         ]
         print(f"cross_edge: {cross_edge}")
-        last_cycle = glue(
+        last_cycle.glue(
             cycle[0],
-            last_cycle,
-            cross_edge[0],
             cross_edge[1],
+            cross_edge[0],
+            start_in_cycle=True,
         )
-    return last_cycle
+    return last_cycle.to_list()
 
 
 def get_cross_edges(
@@ -296,7 +296,8 @@ def connect_single_cycle_cover(
         return get_two_odd_rest_even_cycle(
             single_cycle_cover, end_tuple_order, cross_edges, sig
         )
-    result_cycle = single_cycle_cover[0][0]
+    # splice the cycles into a rope and only flatten it at the end
+    result_cycle = CycleRope(single_cycle_cover[0][0])
     for i, tail in enumerate(end_tuple_order):
         next_tail = swapPair(tail, 0)
         if cross_edges.get((tail, next_tail)) is None:
@@ -305,8 +306,7 @@ def connect_single_cycle_cover(
             )
         cross_edge = cross_edges.get((tail, next_tail))[0]
         try:
-            result_cycle = glue(
-                result_cycle,
+            result_cycle.glue(
                 single_cycle_cover[i + 1][0],
                 cross_edge[0],
                 cross_edge[1],
@@ -315,15 +315,14 @@ def connect_single_cycle_cover(
             print(f"Error in cycle {i} with cross edge {cross_edge}")
             if naive_glue:
                 ce = find_cross_edges(
-                    [[result_cycle], single_cycle_cover[i + 1]], [tail], True
+                    [[result_cycle.to_list()], single_cycle_cover[i + 1]], [tail], True
                 )
                 new_cross_edge = ce[(tail, next_tail)][0]
-                result_cycle = glue(
-                    result_cycle,
+                result_cycle.glue(
                     single_cycle_cover[i + 1][0],
                     new_cross_edge[0],
                     new_cross_edge[1],
                 )
             else:
                 raise e
-    return result_cycle
+    return result_cycle.to_list()
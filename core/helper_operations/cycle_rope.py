@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Iterator
+
+from core.helper_operations.path_operations import adjacent
+
+
+class _Segment:
+    """
+    A contiguous part `source[lo : hi + 1]` of one of the cycles in a `CycleRope`.
+    A segment has two ends: end 0 at `source[lo]` and end 1 at `source[hi]`.
+    `links[e]` is the `(segment, end)` that end `e` is connected to in the rope, or None if it is not connected.
+    The links have no direction, so a segment can be traversed either way without being reversed.
+    """
+
+    __slots__ = ("source", "lo", "hi", "links")
+
+    def __init__(self, source: int, lo: int, hi: int) -> None:
+        self.source = source
+        self.lo = lo
+        self.hi = hi
+        self.links: list[tuple[_Segment, int] | None] = [None, None]
+
+
+class CycleRope:
+    """
+    A cycle stored as a ring of segments of the cycles that were glued into it.
+    Gluing another cycle into the rope (see ``glue``) splits at most two segments and relinks four segment ends,
+    instead of rotating, reversing and concatenating the whole cycle like ``glue`` in ``path_operations`` does.
+    The vertices are only copied once, when the rope is flattened with ``to_list`` or streamed with ``iter``.
+    The flattened rope is the same list that repeated calls of ``glue`` on lists would give.
+
+    Args:
+        cycle (list[tuple[int, ...]]): The first cycle of the rope.
+
+    Example:
+        >>> rope = CycleRope([(0, 1, 2), (0, 2, 1), (2, 0, 1), (2, 1, 0), (1, 2, 0), (1, 0, 2)])
+        >>> len(rope)
+        6
+    """
+
+    def __init__(self, cycle: list[tuple[int, ...]]) -> None:
+        # the cycles glued into the rope, the segments refer to them by their index in this list
+        self._sources: list[list[tuple[int, ...]]] = []
+        # the segments of every source, sorted by `lo`, with their `lo` values for bisection
+        self._segments: list[list[_Segment]] = []
+        self._starts: list[list[int]] = []
+        # vertex -> (source, position in source)
+        self._positions: dict[tuple[int, ...], tuple[int, int]] = {}
+        self._length = 0
+        segment = self._add_source(cycle)
+        segment.links = [(segment, 1), (segment, 0)]
+        # the flattened rope starts at this segment end and continues into the segment
+        self._start = (segment, 0)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[tuple[int, ...]]:
+        segment, end = self._start
+        while True:
+            source = self._sources[segment.source]
+            if end == 0:
+                yield from source[segment.lo : segment.hi + 1]
+            else:
+                for i in range(segment.hi, segment.lo - 1, -1):
+                    yield source[i]
+            if segment.links[1 - end] == self._start:
+                return
+            segment, end = segment.links[1 - end]
+
+    def to_list(self) -> list[tuple[int, ...]]:
+        """
+        Flattens the rope to a list of vertices.
+
+        Returns:
+            list[tuple[int, ...]]: The cycle as a list of vertices.
+        """
+        return list(self)
+
+    def _add_source(self, cycle: list[tuple[int, ...]]) -> _Segment:
+        """
+        Adds a cycle as a new source with a single (unlinked) segment.
+
+        Args:
+            cycle (list[tuple[int, ...]]): The cycle to add.
+
+        Returns:
+            _Segment: The segment spanning the whole cycle.
+        """
+        source = len(self._sources)
+        segment = _Segment(source, 0, len(cycle) - 1)
+        self._sources.append(cycle)
+        self._segments.append([segment])
+        self._starts.append([0])
+        self._positions.update((v, (source, i)) for i, v in enumerate(cycle))
+        self._length += len(cycle)
+        return segment
+
+    def _locate(self, vertex: tuple[int, ...]) -> tuple[_Segment, int]:
+        """
+        Finds the segment containing `vertex`.
+
+        Args:
+            vertex (tuple[int, ...]): The vertex to find.
+
+        Returns:
+            tuple[_Segment, int]: The segment and the position of `vertex` in the source of the segment.
+
+        Raises:
+            ValueError: If `vertex` is not in the rope.
+        """
+        try:
+            source, i = self._positions[vertex]
+        except KeyError:
+            raise ValueError(f"Vertex {vertex} not in the rope")
+        return self._segments[source][bisect_right(self._starts[source], i) - 1], i
+
+    def _vertex(self, segment: _Segment, end: int) -> tuple[int, ...]:
+        """
+        Args:
+            segment (_Segment): The segment of the rope.
+            end (int): The end of the segment, 0 or 1.
+
+        Returns:
+            tuple[int, ...]: The vertex at end `end` of `segment`.
+        """
+        return self._sources[segment.source][segment.hi if end else segment.lo]
+
+    def _find_edge(self, a: tuple[int, ...], b: tuple[int, ...]) -> tuple:
+        """
+        Finds the edge between `a` and `b` in the rope without changing the rope.
+
+        Args:
+            a (tuple[int, ...]): The first vertex of the edge.
+            b (tuple[int, ...]): The second vertex of the edge.
+
+        Returns:
+            tuple: Either `(segment, i)` if the edge is between position `i` and `i + 1` inside a segment,
+            or `((segment_a, end_a), (segment_b, end_b))` if it links the ends of two segments.
+
+        Raises:
+            ValueError: If `a` and `b` are not adjacent in the rope.
+        """
+        segment_a, i = self._locate(a)
+        segment_b, j = self._locate(b)
+        if segment_a is segment_b and abs(i - j) == 1:
+            return segment_a, min(i, j)
+        for end in (0, 1):
+            link = segment_a.links[end]
+            if (
+                self._vertex(segment_a, end) == a
+                and link is not None
+                and link[0] is segment_b
+                and self._vertex(*link) == b
+            ):
+                return (segment_a, end), link
+        raise ValueError(f"The vertices {(a, b)} are not adjacent in the rope.")
+
+    def _split(self, segment: _Segment, i: int) -> _Segment:
+        """
+        Splits `segment` between position `i` and `i + 1` of its source and unlinks the two parts.
+
+        Args:
+            segment (_Segment): The segment to split, it keeps the part up to position `i`.
+            i (int): The last position of the first part.
+
+        Returns:
+            _Segment: The new segment with the part from position `i + 1`.
+        """
+        second = _Segment(segment.source, i + 1, segment.hi)
+        neighbor = segment.links[1]
+        second.links[1] = neighbor
+        if neighbor is not None:
+            neighbor[0].links[neighbor[1]] = (second, 1)
+        if self._start == (segment, 1):
+            self._start = (second, 1)
+        segment.hi = i
+        segment.links[1] = None
+        index = bisect_right(self._starts[segment.source], i)
+        self._starts[segment.source].insert(index, i + 1)
+        self._segments[segment.source].insert(index, second)
+        return second
+
+    def _cut(
+        self, edge: tuple, a: tuple[int, ...]
+    ) -> tuple[tuple[_Segment, int], tuple[_Segment, int]]:
+        """
+        Removes an edge found by ``_find_edge`` from the rope.
+
+        Args:
+            edge (tuple): The edge as returned by ``_find_edge``.
+            a (tuple[int, ...]): The first vertex of the edge.
+
+        Returns:
+            tuple[tuple[_Segment, int], tuple[_Segment, int]]: The now unlinked segment ends of the two vertices.
+        """
+        if isinstance(edge[0], _Segment):
+            segment, i = edge
+            second = self._split(segment, i)
+            ends = (segment, 1), (second, 0)
+            return ends if self._vertex(*ends[0]) == a else ends[::-1]
+        end_a, end_b = edge
+        end_a[0].links[end_a[1]] = None
+        end_b[0].links[end_b[1]] = None
+        return end_a, end_b
+
+    def glue(
+        self,
+        cycle: list[tuple[int, ...]],
+        rope_pair: tuple[tuple[int, ...], tuple[int, ...]],
+        cycle_pair: tuple[tuple[int, ...], tuple[int, ...]],
+        start_in_cycle: bool = False,
+    ) -> CycleRope:
+        """
+        Glues `cycle` into the rope by replacing the parallel edges `rope_pair` and `cycle_pair` with the cross edges.
+        Same result as ``glue(rope, cycle, rope_pair, cycle_pair)`` (or ``glue(cycle, rope, cycle_pair, rope_pair)``
+        if `start_in_cycle` is True) in ``path_operations``, but the rope is changed in place.
+        If the cycles cannot be glued, the rope is left unchanged.
+
+        Args:
+            cycle (list[tuple[int, ...]]): The cycle to glue into the rope. Its vertices must not be in the rope.
+            rope_pair (tuple[tuple[int, ...], tuple[int, ...]]): The pair of adjacent vertices in the rope.
+            cycle_pair (tuple[tuple[int, ...], tuple[int, ...]]): The pair of adjacent vertices in `cycle`.
+            start_in_cycle (bool, optional):
+                Whether the flattened rope starts at `cycle_pair[0]` instead of `rope_pair[0]`. Defaults to False.
+
+        Returns:
+            CycleRope: The rope itself.
+
+        Raises:
+            ValueError: If the vertices of a pair are not adjacent in their cycle or the cross edges are not edges.
+        """
+        print(f"Gluing parallel edges {rope_pair} and {cycle_pair}")
+        a, b = rope_pair
+        c, d = cycle_pair
+        if adjacent(a, c) and adjacent(b, d):
+            crossed = False
+        elif adjacent(a, d) and adjacent(b, c):
+            crossed = True
+        else:
+            raise ValueError(
+                f"The vertices {rope_pair} and {cycle_pair} are not adjacent."
+            )
+        try:
+            i, j = cycle.index(c), cycle.index(d)
+        except ValueError:
+            raise ValueError(f"The vertices {cycle_pair} are not in the cycle.")
+        if abs(i - j) not in (1, len(cycle) - 1):
+            raise ValueError(
+                f"In the cycle, the vertices {cycle_pair} are not adjacent."
+            )
+        rope_edge = self._find_edge(a, b)
+        # the cycle is added as a closed segment that is cut between c and d
+        segment = self._add_source(cycle)
+        segment.links = [(segment, 1), (segment, 0)]
+        end_c, end_d = self._cut(self._find_edge(c, d), c)
+        end_a, end_b = self._cut(rope_edge, a)
+        self._link(end_a, end_d if crossed else end_c)
+        self._link(end_b, end_c if crossed else end_d)
+        self._start = end_c if start_in_cycle else end_a
+        return self
+
+    @staticmethod
+    def _link(end1: tuple[_Segment, int], end2: tuple[_Segment, int]) -> None:
+        """
+        Connects two segment ends to each other in the rope.
+
+        Args:
+            end1 (tuple[_Segment, int]): The first segment and its end.
+            end2 (tuple[_Segment, int]): The second segment and its end.
+
+        Returns:
+            None: The links of both segments are updated in place.
+        """
+        end1[0].links[end1[1]] = end2
+        end2[0].links[end2[1]] = end1
@@ -0,0 +1,433 @@
+from itertools import chain, islice
+from typing import Callable, Iterator
+
+from core.helper_operations.path_operations import stutterPermutationQ
+
+LazyPath = Callable[[bool], Iterator[tuple[int, ...]]]
+"""
+A path that is generated on demand instead of stored in a list.
+Calling it with `reverse=False` yields the vertices of the path in order, with `reverse=True` in reversed order.
+Every call starts a new pass over the path, so a `LazyPath` can be traversed multiple times.
+"""
+
+
+def lazy_from_list(path: list[tuple[int, ...]]) -> LazyPath:
+    """
+    Wraps a (small) list of permutations as a `LazyPath`.
+
+    Args:
+        path (list[tuple[int, ...]]): The path as a list of tuples.
+
+    Returns:
+        LazyPath: The path as a `LazyPath`.
+    """
+
+    def stream(reverse: bool) -> Iterator[tuple[int, ...]]:
+        """
+        Iterates over the list.
+
+        Args:
+            reverse (bool): Whether to yield the vertices in reversed order.
+
+        Returns:
+            Iterator[tuple[int, ...]]: The vertices of the path.
+        """
+        return reversed(path) if reverse else iter(path)
+
+    return stream
+
+
+def lazy_extend(path: LazyPath, e: tuple[int, ...]) -> LazyPath:
+    """
+    Lazy version of ``extend``. Appends `e` to every vertex of the path.
+
+    Args:
+        path (LazyPath): The path to extend.
+        e (tuple[int, ...]): Tuple to extend every vertex with.
+
+    Returns:
+        LazyPath: The extended path.
+    """
+
+    def stream(reverse: bool) -> Iterator[tuple[int, ...]]:
+        """
+        Appends `e` to every vertex of `path`.
+
+        Args:
+            reverse (bool): Whether to yield the vertices in reversed order.
+
+        Returns:
+            Iterator[tuple[int, ...]]: The vertices of the path.
+        """
+        return (perm + e for perm in path(reverse))
+
+    return stream
+
+
+def lazy_transform(path: LazyPath, tr: list[int]) -> LazyPath:
+    """
+    Lazy version of ``transform``. Renames element `i` to `tr[i]` in every vertex of the path.
+
+    Args:
+        path (LazyPath): The path to transform.
+        tr (list[int]): Transformation list, int at index `i` is the new name for `i`.
+
+    Returns:
+        LazyPath: The transformed path.
+    """
+
+    def stream(reverse: bool) -> Iterator[tuple[int, ...]]:
+        """
+        Renames the elements of every vertex of `path`.
+
+        Args:
+            reverse (bool): Whether to yield the vertices in reversed order.
+
+        Returns:
+            Iterator[tuple[int, ...]]: The vertices of the path.
+        """
+        return (tuple(tr[x] for x in perm) for perm in path(reverse))
+
+    return stream
+
+
+def lazy_reverse(path: LazyPath) -> LazyPath:
+    """
+    Lazy version of `path[::-1]`.
+
+    Args:
+        path (LazyPath): The path to reverse.
+
+    Returns:
+        LazyPath: The reversed path.
+    """
+
+    def stream(reverse: bool) -> Iterator[tuple[int, ...]]:
+        """
+        Iterates over `path` in the opposite direction.
+
+        Args:
+            reverse (bool): Whether to yield the vertices in reversed order.
+
+        Returns:
+            Iterator[tuple[int, ...]]: The vertices of the path.
+        """
+        return path(not reverse)
+
+    return stream
+
+
+def lazy_concat(*paths: LazyPath) -> LazyPath:
+    """
+    Lazy version of `paths[0] + paths[1] + ...`.
+
+    Args:
+        *paths (LazyPath): The paths to concatenate.
+
+    Returns:
+        LazyPath: The concatenated path.
+    """
+
+    def stream(reverse: bool) -> Iterator[tuple[int, ...]]:
+        """
+        Iterates over the paths one after the other.
+
+        Args:
+            reverse (bool): Whether to yield the vertices in reversed order.
+
+        Returns:
+            Iterator[tuple[int, ...]]: The vertices of the path.
+        """
+        order = reversed(paths) if reverse else paths
+        return chain.from_iterable(p(reverse) for p in order)
+
+    return stream
+
+
+def lazy_slice(path: LazyPath, start: int, stop: int, length: int) -> LazyPath:
+    """
+    Lazy version of `path[start:stop]` for `0 <= start <= stop <= length`.
+    A slice close to the end of the path is taken from the reversed path, to avoid generating the skipped part.
+    Then at most `stop - start` vertices are buffered, which is less than the number of skipped vertices.
+
+    Args:
+        path (LazyPath): The path to slice.
+        start (int): The first index of the slice.
+        stop (int): The index after the last index of the slice.
+        length (int): The length of `path`.
+
+    Returns:
+        LazyPath: The slice of the path.
+    """
+
+    def stream(reverse: bool) -> Iterator[tuple[int, ...]]:
+        """
+        Iterates over the vertices of the slice.
+
+        Args:
+            reverse (bool): Whether to yield the vertices in reversed order.
+
+        Returns:
+            Iterator[tuple[int, ...]]: The vertices of the path.
+        """
+        # number of vertices to skip before the slice, in the requested direction
+        skipped = length - stop if reverse else start
+        if stop - start < skipped:
+            yield from reversed(
+                list(
+                    islice(
+                        path(not reverse),
+                        start if reverse else length - stop,
+                        stop if reverse else length - start,
+                    )
+                )
+            )
+        else:
+            yield from islice(path(reverse), skipped, skipped + stop - start)
+
+    return stream
+
+
+def lazy_rotate(path: LazyPath, n: int, length: int) -> LazyPath:
+    """
+    Lazy version of ``rotate``. Rotates the path `n` positions to the **left**.
+    The first `n` vertices are buffered, so `n` should be small.
+
+    Args:
+        path (LazyPath): The path to rotate.
+        n (int): The number of positions to rotate.
+        length (int): The length of `path`.
+
+    Returns:
+        LazyPath: The rotated path.
+    """
+    if length <= 1:
+        return path
+    n = n % length
+
+    def stream(reverse: bool) -> Iterator[tuple[int, ...]]:
+        """
+        Iterates over the rotated path.
+
+        Args:
+            reverse (bool): Whether to yield the vertices in reversed order.
+
+        Returns:
+            Iterator[tuple[int, ...]]: The vertices of the path.
+        """
+        if reverse:
+            # (p[n:] + p[:n])[::-1] == p[:n][::-1] + p[n:][::-1]
+            yield from reversed(list(islice(path(False), n)))
+            yield from islice(path(True), length - n)
+        else:
+            iterator = path(False)
+            head = list(islice(iterator, n))
+            yield from iterator
+            yield from head
+
+    return stream
+
+
+def lazy_cut_cycle(path: LazyPath, a: tuple[int, ...]) -> LazyPath:
+    """
+    Lazy version of ``cutCycle``. Rotates the cycle such that vertex `a` appears first.
+    Takes two passes over the cycle: the first one skips to `a`, the second one generates the part before `a`.
+
+    Args:
+        path (LazyPath): The cycle to cut.
+        a (tuple[int, ...]): The vertex at which to cut the cycle.
+
+    Returns:
+        LazyPath: The rotated cycle.
+
+    Raises:
+        ValueError: If the vertex `a` is not in the cycle (when the path is generated).
+    """
+
+    def stream(reverse: bool) -> Iterator[tuple[int, ...]]:
+        """
+        Iterates over the cycle starting at `a`.
+
+        Args:
+            reverse (bool): Whether to yield the vertices in reversed order.
+
+        Returns:
+            Iterator[tuple[int, ...]]: The vertices of the path.
+        """
+        iterator = path(reverse)
+        skipped = 0
+        for perm in iterator:
+            if perm == a:
+                break
+            skipped += 1
+        else:
+            raise ValueError(f"Vertex {a} not in cycle")
+        if reverse:
+            # (c[A:] + c[:A])[::-1] == c[:A][::-1] + c[A:][::-1]
+            yield from iterator
+            yield from islice(path(True), skipped + 1)
+        else:
+            yield a
+            yield from iterator
+            yield from islice(path(False), skipped)
+
+    return stream
+
+
+def lazy_zigzag(
+    path: LazyPath, u: tuple[int, ...], v: tuple[int, ...], length: int
+) -> LazyPath:
+    """
+    Lazy version of ``createZigZagPath``.
+
+    Args:
+        path (LazyPath): The path to create a zigzag path from.
+        u (tuple[int, ...]): Tuple to append.
+        v (tuple[int, ...]): Tuple to append.
+        length (int): The length of `path`.
+
+    Returns:
+        LazyPath: The zigzag path, twice as long as `path`.
+    """
+    module = [u, v, v, u]
+
+    def stream(reverse: bool) -> Iterator[tuple[int, ...]]:
+        """
+        Iterates over the zigzag path, two vertices per vertex of `path`.
+
+        Args:
+            reverse (bool): Whether to yield the vertices in reversed order.
+
+        Returns:
+            Iterator[tuple[int, ...]]: The vertices of the path.
+        """
+        if reverse:
+            for k, perm in zip(range(length - 1, -1, -1), path(True)):
+                yield perm + module[(2 * k + 1) % 4]
+                yield perm + module[(2 * k) % 4]
+        else:
+            for k, perm in enumerate(path(False)):
+                yield perm + module[(2 * k) % 4]
+                yield perm + module[(2 * k + 1) % 4]
+
+    return stream
+
+
+def lazy_square_tube(
+    path: LazyPath, u: tuple[int, ...], v: tuple[int, ...], length: int
+) -> LazyPath:
+    """
+    Lazy version of ``createSquareTube``.
+
+    Args:
+        path (LazyPath): The path to create a square tube from, of even length.
+        u (tuple[int, ...]): Tuple to append.
+        v (tuple[int, ...]): Tuple adjacent to `u` to append.
+        length (int): The length of `path`.
+
+    Returns:
+        LazyPath: The square tube, four times as long as `path`.
+    """
+    uu, uv, vu, vv = u + u, u + v, v + u, v + v
+    module1 = [uu, uv, vv, vu, vu, vv, uv, uu]
+    module2 = [uu, uv, vv, vu, vu, uu, uv, vv]
+    # the last 8 vertices of the tube use the second module
+    last_module = 4 * length - 8
+
+    def suffix(j: int) -> tuple[int, ...]:
+        """
+        Args:
+            j (int): The index of a vertex in the square tube.
+
+        Returns:
+            tuple[int, ...]: The two tuples appended to vertex `j` of the square tube.
+        """
+        return (module2 if j >= last_module else module1)[j % 8]
+
+    def stream(reverse: bool) -> Iterator[tuple[int, ...]]:
+        """
+        Iterates over the square tube, four vertices per vertex of `path`.
+
+        Args:
+            reverse (bool): Whether to yield the vertices in reversed order.
+
+        Returns:
+            Iterator[tuple[int, ...]]: The vertices of the path.
+        """
+        if reverse:
+            for k, perm in zip(range(length - 1, -1, -1), path(True)):
+                for j in range(4 * k + 3, 4 * k - 1, -1):
+                    yield perm + suffix(j)
+        else:
+            for k, perm in enumerate(path(False)):
+                for j in range(4 * k, 4 * k + 4):
+                    yield perm + suffix(j)
+
+    return stream
+
+
+def _spur_stutter(perm: tuple[int, ...]) -> tuple[int, ...] | None:
+    """
+    Finds the stutter `s` such that `perm` is `s` with its last pair of distinct adjacent elements swapped.
+    These are the stutters that ``incorporateSpursInZigZag`` attaches to the vertices starting with `perm`.
+
+    Args:
+        perm (tuple[int, ...]): The permutation to check.
+
+    Returns:
+        tuple[int, ...] | None: The stutter, or None if `perm` is not of this form.
+    """
+    j = len(perm) - 1
+    while j >= 0 and perm[j] == perm[-1]:
+        j -= 1
+    # perm[j - 1] and perm[j] are swapped in the stutter, perm[j + 1:] is constant
+    if j < 1 or perm[j - 1] != perm[-1]:
+        return None
+    stutter = perm[: j - 1] + (perm[j], perm[j - 1]) + perm[j + 1 :]
+    return stutter if stutterPermutationQ(stutter) else None
+
+
+def lazy_incorporate_spurs(
+    path: LazyPath, skip: int = 0, suffix_length: int = 2
+) -> LazyPath:
+    """
+    Lazy version of ``incorporateSpursInZigZag`` where the spurs are all stutters of the signature.
+    Instead of looking up the base of every spur, the spurs are detected while streaming the zigzag path:
+    two consecutive vertices that only differ in the suffix, and whose prefix is a stutter with its
+    last pair of distinct adjacent elements swapped, get the spur of that stutter in between.
+
+    Args:
+        path (LazyPath): The zigzag path.
+        skip (int, optional): Number of elements between the stutter and the suffix. Defaults to 0.
+        suffix_length (int, optional): Length of the spur suffixes. Defaults to 2.
+
+    Returns:
+        LazyPath: The zigzag path with the spurs incorporated.
+    """
+    tail = suffix_length + skip
+
+    def stream(reverse: bool) -> Iterator[tuple[int, ...]]:
+        """
+        Iterates over the zigzag path and inserts the spurs between their bases.
+
+        Args:
+            reverse (bool): Whether to yield the vertices in reversed order.
+
+        Returns:
+            Iterator[tuple[int, ...]]: The vertices of the path.
+        """
+        previous = None
+        for perm in path(reverse):
+            if (
+                previous is not None
+                and previous[:-suffix_length] == perm[:-suffix_length]
+            ):
+                stutter = _spur_stutter(previous[:-tail])
+                if stutter is not None:
+                    middle = previous[-tail:-suffix_length]
+                    yield stutter + middle + previous[-suffix_length:]
+                    yield stutter + middle + perm[-suffix_length:]
+            yield perm
+            previous = perm
+
+    return stream
@@ -4,13 +4,10 @@ import os
 from ast import literal_eval
 from fractions import Fraction
 
-from tqdm import tqdm
-
 from core.helper_operations.path_operations import adjacent, get_first_element
 from core.helper_operations.permutation_graphs import (
     get_perm_signature,
-    multinomial,
-    stutterPermutations,
+    non_stutter_count,
     swapPair,
 )
 
@@ -157,6 +154,28 @@ def find_parallel_edges_in_cycle_cover(
     return parallel_edges
 
 
+def _tail_neighbors(
+    perm: tuple[int, ...], tail: tuple[int, ...]
+) -> list[tuple[int, ...]]:
+    """
+    Computes the neighbors of a permutation in the neighbor-swap graph that end with `tail`.
+    If the tail of `perm` is `tail` with its first two elements swapped, the only such neighbor swaps them back (the swapped-tail image).
+
+    Args:
+        perm (tuple[int, ...]): The permutation.
+        tail (tuple[int, ...]): The tail of the neighbors, of at least two elements.
+
+    Returns:
+        list[tuple[int, ...]]: The neighbors of `perm` that end with `tail`.
+    """
+    start = len(perm) - len(tail)
+    if perm[start:] == tail:
+        # the neighbors that keep the tail swap two elements before it
+        return [swapPair(perm, i) for i in range(start - 1) if perm[i] != perm[i + 1]]
+    image = swapPair(perm, start)
+    return [image] if image[start:] == tail else []
+
+
 def find_cross_edges(
     cycle_cover: list[list[tuple[int, ...]]],
     end_tuple_order: list[tuple[int, ...]],
@@ -173,6 +192,9 @@ def find_cross_edges(
     """
     Find the cross edges in the cycle cover. These are pairs of parallel edges between cycles that are adjacent.
     The cross edges are used to connect the cycles in the cycle cover.
+    The parallel edges of the second cycle are stored in a dictionary (in both directions), so for every parallel edge of the first cycle
+    only the swapped-tail images of its endpoints are looked up. This takes linear time in the number of parallel edges.
+    When the images of an edge form several parallel edges, the first one in the second cycle is used.
 
     Args:
         cycle_cover (list[list[tuple[int, ...]]]):
@@ -205,26 +227,28 @@ def find_cross_edges(
         tail2 = swapPair(tail1, 0)
         if (tail1, tail2) in cross_edges or (tail2, tail1) in cross_edges:
             continue
-        parallel_edges2 = parallel_edges[tail2]
-        for edge1_index in tqdm(range(len(parallel_edges1))):
-            edge1 = parallel_edges1[edge1_index]
-            cross = None
-            for edge2 in parallel_edges2:
-                if adjacent(edge1[0], edge2[0]) and adjacent(edge1[1], edge2[1]):
-                    cross = (edge1, edge2)
-                elif adjacent(edge1[0], edge2[1]) and adjacent(edge1[1], edge2[0]):
-                    cross = (edge1, edge2[::-1])
-                if cross is not None:
-                    if (tail1, tail2) in cross_edges:
-                        cross_edges[(tail1, tail2)].append(cross)
-                    else:
-                        cross_edges[(tail1, tail2)] = [cross]
-                        if return_first:
-                            return cross_edges
-                    # if an edge is adjacent to one parallel edge, it cannot be adjacent to another from that same cycle
-                    break
-            if cross is not None:
+        # the position of every parallel edge of the second cycle, in both directions
+        positions2 = {}
+        for position, (node1, node2) in enumerate(parallel_edges[tail2]):
+            positions2.setdefault((node1, node2), position)
+            positions2.setdefault((node2, node1), position)
+        for edge1 in parallel_edges1:
+            images = [
+                (image1, image2)
+                for image1 in _tail_neighbors(edge1[0], tail2)
+                for image2 in _tail_neighbors(edge1[1], tail2)
+                if (image1, image2) in positions2
+            ]
+            if len(images) == 0:
                 continue
+            # the edge of the second cycle is directed such that its nodes are adjacent to the nodes of `edge1` in order
+            cross = (edge1, min(images, key=positions2.get))
+            if (tail1, tail2) in cross_edges:
+                cross_edges[(tail1, tail2)].append(cross)
+            else:
+                cross_edges[(tail1, tail2)] = [cross]
+                if return_first:
+                    return cross_edges
         if (tail1, tail2) in cross_edges:
             write_cross_edge_ratio_to_file(cross_edges, tail1, tail2)
     for tail1, tail2 in cross_edges.keys():
@@ -267,7 +291,7 @@ def write_cross_edge_ratio_to_file(
     subsig_from = get_perm_signature(
         cross_edges[(tail1, tail2)][0][0][0][: -len(tail1) + 1]
     )
-    total_edges_from = multinomial(subsig_from) - len(stutterPermutations(subsig_from))
+    total_edges_from = non_stutter_count(subsig_from)
     cross_edges_count = len(cross_edges[(tail1, tail2)])
     fraction_ratio = f"{Fraction(len(cross_edges[(tail1, tail2)]), total_edges_from).numerator}/{Fraction(len(cross_edges[(tail1, tail2)]), total_edges_from).denominator}"
     print(
@@ -333,7 +357,7 @@ def write_cross_edge_ratio_to_file(
             cross_edges[(tail1, tail2)][0][1][0][: -len(tail1) + 1]
         )
         tail_to = cross_edges[(tail1, tail2)][0][1][0][-len(tail1) + 1 :]
-        total_edges_to = multinomial(subsig_to) - len(stutterPermutations(subsig_to))
+        total_edges_to = non_stutter_count(subsig_to)
         tail_from = cross_edges[(tail1, tail2)][0][0][0][-len(tail1) + 1 :]
         chosen_edge = min(cross_edges.get((tail1, tail2)))[0]
         new_line = [
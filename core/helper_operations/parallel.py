@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Iterator
+
+import numpy as np
+
+_workers = int(os.environ.get("LEHMER_WORKERS", 1))
+
+
+def get_workers() -> int:
+    """
+    Returns:
+        int: The number of worker processes used by the parallel constructions, 1 if they run in the current process.
+    """
+    return _workers
+
+
+def set_workers(workers: int | None) -> None:
+    """
+    Sets the number of worker processes used by the parallel constructions.
+    The number can also be set with the `LEHMER_WORKERS` environment variable, the default is 1 (no worker processes).
+
+    Args:
+        workers (int | None): The number of worker processes, or None to use all cores.
+
+    Returns:
+        None: The parallel constructions use `workers` processes from now on.
+
+    Raises:
+        ValueError: If `workers` is smaller than 1.
+    """
+    global _workers
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"The number of workers must be at least 1, got {workers}")
+    _workers = workers
+
+
+@contextmanager
+def using_workers(workers: int | None) -> Iterator[None]:
+    """
+    Sets the number of worker processes for the duration of a `with` block, see ``set_workers``.
+
+    Args:
+        workers (int | None): The number of worker processes, or None to use all cores.
+
+    Returns:
+        Iterator[None]: Yields once, with the number of worker processes set.
+
+    Raises:
+        ValueError: If `workers` is smaller than 1.
+    """
+    previous = _workers
+    set_workers(workers)
+    try:
+        yield
+    finally:
+        set_workers(previous)
+
+
+def split_range(n: int, parts: int) -> list[range]:
+    """
+    Splits `range(n)` into at most `parts` consecutive ranges of (almost) equal length.
+
+    Args:
+        n (int): The length of the range to split.
+        parts (int): The maximum number of ranges.
+
+    Returns:
+        list[range]: The non-empty consecutive ranges that together form `range(n)`.
+
+    Example:
+        >>> split_range(10, 3)
+        [range(0, 3), range(3, 6), range(6, 10)]
+    """
+    if n == 0:
+        return []
+    parts = max(1, min(parts, n))
+    bounds = [n * part // parts for part in range(parts + 1)]
+    return [range(start, stop) for start, stop in zip(bounds, bounds[1:])]
+
+
+class SharedArray:
+    """
+    A NumPy array in a block of shared memory, which worker processes can write into without pickling the results.
+    The process that creates the array owns the block and frees it with ``close``,
+    a worker process attaches to it by the ``spec`` of the array.
+
+    Args:
+        shape (tuple[int, ...]): The shape of the array.
+        dtype (np.dtype | str): The type of the elements of the array.
+        name (str | None, optional): The name of an existing block to attach to. Defaults to None, which creates a new block.
+
+    Example:
+        >>> with SharedArray((2, 3), np.uint8) as shared:
+        ...     shared.array[1] = 7
+        ...     shared.array.tolist()
+        [[0, 0, 0], [7, 7, 7]]
+    """
+
+    def __init__(
+        self, shape: tuple[int, ...], dtype: np.dtype | str, name: str | None = None
+    ) -> None:
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.owner = name is None
+        # a block of 0 bytes cannot be created
+        size = max(1, int(np.prod(self.shape)) * self.dtype.itemsize)
+        # worker processes share the resource tracker of the owner, which frees the block if the owner crashes
+        self._memory = shared_memory.SharedMemory(name, create=self.owner, size=size)
+        self.array = np.ndarray(self.shape, self.dtype, buffer=self._memory.buf)
+
+    @property
+    def spec(self) -> tuple[str, tuple[int, ...], str]:
+        """
+        Returns:
+            tuple[str, tuple[int, ...], str]: The name of the block, the shape and the type of the array, to attach to it with ``attach``.
+        """
+        return self._memory.name, self.shape, self.dtype.str
+
+    @classmethod
+    def attach(
+        cls: type[SharedArray], spec: tuple[str, tuple[int, ...], str]
+    ) -> SharedArray:
+        """
+        Attaches to the shared array of another process.
+
+        Args:
+            cls (type[SharedArray]): The class of the shared array.
+            spec (tuple[str, tuple[int, ...], str]): The ``spec`` of the shared array.
+
+        Returns:
+            SharedArray: The shared array, backed by the same block of memory.
+        """
+        name, shape, dtype = spec
+        return cls(shape, dtype, name)
+
+    def close(self) -> None:
+        """
+        Detaches from the block of memory, and frees it if this process owns it.
+        The ``array`` can not be used afterwards.
+
+        Returns:
+            None: The shared array is closed.
+        """
+        self.array = None
+        self._memory.close()
+        if self.owner:
+            self._memory.unlink()
+
+    def __enter__(self) -> SharedArray:
+        """
+        Returns:
+            SharedArray: The shared array itself, it is closed at the end of the `with` block.
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """
+        Closes the shared array at the end of a `with` block, see ``close``.
+
+        Args:
+            *exc_info: The type, value and traceback of the exception raised in the block, if any.
+
+        Returns:
+            None: The exception (if any) is not suppressed.
+        """
+        self.close()
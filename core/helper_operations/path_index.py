@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+class PathIndex:
+    """
+    Maps every vertex of a path (or cycle) to its position, so that looking up a vertex takes constant time
+    instead of the linear time of `list.index`.
+
+    Args:
+        path (list[tuple[int, ...]]): The path to index. Can also be a numpy array or a `PermPath`.
+
+    Raises:
+        ValueError: If the path contains a vertex more than once.
+
+    Example:
+        >>> index = PathIndex([(0, 1, 1), (1, 0, 1), (1, 1, 0)])
+        >>> index.index((1, 1, 0))
+        2
+        >>> index.get((0, 0, 1))
+        -1
+    """
+
+    __slots__ = ("positions",)
+
+    def __init__(self, path: list[tuple[int, ...]]) -> None:
+        vertices = map(tuple, path) if isinstance(path, np.ndarray) else path
+        self.positions = {vertex: i for i, vertex in enumerate(vertices)}
+        if len(self.positions) != len(path):
+            raise ValueError("Cannot index a path that contains duplicate vertices")
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __contains__(self, vertex: tuple[int, ...]) -> bool:
+        return tuple(vertex) in self.positions
+
+    def __repr__(self) -> str:
+        return f"PathIndex(len={len(self)})"
+
+    def index(self, vertex: tuple[int, ...]) -> int:
+        """
+        Returns the position of `vertex` in the indexed path, like `list.index`.
+
+        Args:
+            vertex (tuple[int, ...]): The vertex to look up.
+
+        Returns:
+            int: The position of `vertex`.
+
+        Raises:
+            ValueError: If `vertex` is not in the path.
+        """
+        try:
+            return self.positions[tuple(vertex)]
+        except KeyError:
+            raise ValueError(f"Vertex {vertex} not in path")
+
+    def get(self, vertex: tuple[int, ...], default: int = -1) -> int:
+        """
+        Returns the position of `vertex` in the indexed path, or `default` if it is not in the path.
+
+        Args:
+            vertex (tuple[int, ...]): The vertex to look up.
+            default (int, optional): The value to return for missing vertices. Defaults to -1.
+
+        Returns:
+            int: The position of `vertex` or `default`.
+        """
+        return self.positions.get(tuple(vertex), default)
@@ -1,5 +1,45 @@
+from itertools import chain
+
 import numpy as np
 
+from core.helper_operations.bit_path import BitPath
+from core.helper_operations.perm_path import PermPath, first_non_adjacent
+
+VECTORIZE_THRESHOLD = 1000
+"""Paths with at least this many vertices are validated with the vectorized ``first_non_adjacent`` kernel."""
+
+
+def _path_rows(p: list[tuple[int, ...]]) -> np.ndarray | None:
+    """
+    Converts a large path to a 2-D array for the vectorized validation kernel.
+    Paths of Python integers are stored as `uint8` to keep the array small.
+
+    Args:
+        p (list[tuple[int, ...]]): List of permutations (vertices).
+
+    Returns:
+        np.ndarray | None: The path with one permutation per row, or None if the path is too short to benefit
+        from vectorization or cannot be stored as a 2-D array (e.g. permutations of different lengths).
+    """
+    if len(p) < VECTORIZE_THRESHOLD:
+        return None
+    if isinstance(p, np.ndarray):
+        return p if p.ndim == 2 else None
+    width = len(p[0])
+    if any(len(v) != width for v in p):
+        return None
+    try:
+        if all(isinstance(x, int) for x in p[0]):
+            # out of range Python integers raise instead of wrapping around
+            rows = np.fromiter(
+                chain.from_iterable(p), dtype=np.uint8, count=len(p) * width
+            )
+        else:
+            rows = np.asarray(p)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    return rows.reshape(len(p), width)
+
 
 def adjacent(s: tuple[int, ...], t: tuple[int, ...]) -> bool:
     """
@@ -44,10 +84,20 @@ def pathQ(p: list[tuple[int, ...]], verbose: bool = True) -> bool:
     Returns:
         bool: True if p is a path, False otherwise.
     """
+    if isinstance(p, (PermPath, BitPath)):
+        return p.is_path()
     if len(p) == 0:
         return False
     elif len(p) == 1:
         return True
+    rows = _path_rows(p)
+    if rows is not None:
+        i = first_non_adjacent(rows)
+        if i >= 0 and verbose:
+            print(
+                f"No path: index {i}->{i+1}. See: {i-1}-{i}-{i+1}; {p[i-1]}-{p[i]}-{p[i+1]}"
+            )
+        return i < 0
     for i, item in enumerate(p):
         if i < len(p) - 1 and not adjacent(item, p[i + 1]):
             if verbose:
@@ -68,8 +118,16 @@ def cycleQ(c: list[tuple[int, ...]]) -> bool:
     Returns:
         bool: True if the list represents a cycle, False otherwise.
     """
+    if isinstance(c, (PermPath, BitPath)):
+        return c.is_path(cyclic=True)
     if len(c) <= 2:
         return False
+    rows = _path_rows(c)
+    if rows is not None:
+        i = first_non_adjacent(rows, cyclic=True)
+        if i >= 0:
+            print(f"not a cycle: {c[i]} and {c[(i + 1) % len(c)]}")
+        return i < 0
     for i, item in enumerate(c):
         if not adjacent(item, c[(i + 1) % len(c)]):
             print(f"not a cycle: {item} and {c[(i + 1) % len(c)]}")
@@ -97,6 +155,72 @@ def pathEdges(
     return [(item, p[i + 1]) for i, item in enumerate(p) if i < len(p) - 1]
 
 
+def encode_swap_sequence(
+    p: list[tuple[int, ...]] | PermPath,
+) -> tuple[tuple[int, ...] | None, np.ndarray]:
+    """
+    Encodes a path in a neighbor-swap graph as its first vertex and the index of every swap (transition sequence).
+    Swap index `i` means that the elements at positions `i` and `i + 1` are swapped to get the next vertex.
+    The swaps are stored as `uint8` (or `uint16` for permutations longer than 256), so a step takes 1 or 2 bytes instead of a tuple.
+
+    Args:
+        p (list[tuple[int, ...]] | PermPath): The path to encode.
+
+    Returns:
+        tuple[tuple[int, ...] | None, np.ndarray]:
+            The encoded path.\n
+            - The first vertex of the path, or None if the path is empty.
+            - The array with `len(p) - 1` swap indices.
+
+    Raises:
+        ValueError: If `p` is not a path in a neighbor-swap graph.
+
+    Example:
+        >>> encode_swap_sequence([(0, 0, 1), (0, 1, 0), (1, 0, 0)])
+        ((0, 0, 1), array([1, 0], dtype=uint8))
+    """
+    buffer = PermPath.from_list(p).buffer
+    dtype = np.uint8 if buffer.shape[1] <= 256 else np.uint16
+    if len(buffer) == 0:
+        return None, np.zeros(0, dtype=dtype)
+    if len(buffer) > 1 and not PermPath(buffer).is_path():
+        raise ValueError(f"Path {p} is not a path.")
+    swaps = np.argmax(buffer[:-1] != buffer[1:], axis=1).astype(dtype)
+    return tuple(buffer[0].tolist()), swaps
+
+
+def decode_swap_sequence(
+    start: tuple[int, ...] | None, swaps: np.ndarray | list[int]
+) -> list[tuple[int, ...]]:
+    """
+    Decodes a path encoded by ``encode_swap_sequence`` back into a list of permutations.
+
+    Args:
+        start (tuple[int, ...] | None): The first vertex of the path, or None for the empty path.
+        swaps (np.ndarray | list[int]): The swap index of every step in the path.
+
+    Returns:
+        list[tuple[int, ...]]: The decoded path.
+
+    Raises:
+        ValueError: If a swap index is out of range or swaps two equal elements.
+
+    Example:
+        >>> decode_swap_sequence((0, 0, 1), [1, 0])
+        [(0, 0, 1), (0, 1, 0), (1, 0, 0)]
+    """
+    if start is None:
+        return []
+    current = list(start)
+    path = [tuple(current)]
+    for i in np.asarray(swaps, dtype=np.int64).tolist():
+        if not 0 <= i < len(current) - 1 or current[i] == current[i + 1]:
+            raise ValueError(f"Invalid swap index {i} for permutation {tuple(current)}")
+        current[i], current[i + 1] = current[i + 1], current[i]
+        path.append(tuple(current))
+    return path
+
+
 def splitPathIn2(
     p: list[tuple[int, ...]], a: tuple[int, ...]
 ) -> tuple[list[tuple[int, ...]], list[tuple[int, ...]]]:
@@ -132,7 +256,7 @@ def cutCycle(c: list[tuple[int, ...]], a: tuple[int, ...]) -> list[tuple[int, ..
     Splits a cycle at vertex `a` and rotates it such that vertex `a` apprears first in the returned path.
 
     Args:
-        c (list[tuple[int, ...]]): The cycle to be split. Can also be a numpy array.
+        c (list[tuple[int, ...]]): The cycle to be split. Can also be a numpy array or a `PermPath`.
         a (tuple[int, ...]): The vertex at which to split the cycle. Must be present in the cycle.
 
     Returns:
@@ -145,6 +269,8 @@ def cutCycle(c: list[tuple[int, ...]], a: tuple[int, ...]) -> list[tuple[int, ..
     """
     if len(c) == 1 and a in c:
         return c
+    if isinstance(c, (PermPath, BitPath)):
+        return c.cut_cycle(a)
     try:
         assert a in c
     except AssertionError as err:
@@ -272,6 +398,8 @@ def createZigZagPath(
     assert adjacent(u, v)
     assert pathQ(p)
     assert len(p) > 0
+    if isinstance(p, (PermPath, BitPath)):
+        return p.zigzag(u, v)
     temp = [item for sublist in zip(p, p) for item in sublist]
     module = [u, v, v, u]
     return [item + module[i % 4] for i, item in enumerate(temp)]
@@ -321,6 +449,8 @@ def createSquareTube(path: list[tuple], u: tuple, v: tuple) -> list[tuple[int, .
     assert adjacent(u, v)
     assert pathQ(path)
     assert len(path) > 0 and len(path) % 2 == 0
+    if isinstance(path, (PermPath, BitPath)):
+        return path.square_tube(u, v)
     # interleave the elements of the four copies of the path list
     temp = [item for sublist in zip(*([path] * 4)) for item in sublist]
     uu = u + u
@@ -414,6 +544,8 @@ def transform(perms: list[tuple[int, ...]], tr: list[int]) -> list[tuple[int, ..
         >>> transform([(0, 1, 2), (1, 0, 2)], [4, 5, 6])
         [(4, 5, 6), (5, 4, 6)]
     """
+    if isinstance(perms, (PermPath, BitPath)):
+        return perms.transform(tr)
     l = []
     for i in perms:
         v = []
@@ -452,10 +584,10 @@ def transform_cycle_cover(
     """
     try:
         assert isinstance(perms3d, list) and len(perms3d) > 0
-        assert isinstance(perms3d[0], list) and len(perms3d[0]) > 0
-        assert (
-            isinstance(perms3d[0][0], list) or isinstance(perms3d[0][0], tuple)
-        ) and len(perms3d[0][0]) > 0
+        assert isinstance(perms3d[0], (list, PermPath, BitPath)) and len(perms3d[0]) > 0
+        assert (isinstance(perms3d[0][0], (list, tuple, PermPath, BitPath))) and len(
+            perms3d[0][0]
+        ) > 0
     except AssertionError:
         raise AssertionError(f"The input could not be parsed: {perms3d}")
     if isinstance(perms3d[0][0][0], int):
@@ -523,7 +655,7 @@ def recursive_cycle_check(cycle: list[list], total_length: int = 0) -> int:
         AssertionError: If the subcycles contain duplicates.
     """
     assert len(cycle) > 0
-    assert isinstance(cycle, list)
+    assert isinstance(cycle, (list, PermPath))
     if isinstance(cycle[0][0], int):
         assert cycleQ(cycle)
         assert len(cycle) == len(set(cycle))
@@ -545,6 +677,8 @@ def get_first_element(nested_list: list, element: int = 0) -> tuple[int, ...]:
     Returns:
         tuple[int, ...]: The first element of the nested list.
     """
+    if isinstance(nested_list, (PermPath, BitPath)):
+        return nested_list[element]
     if isinstance(nested_list, list):
         return get_first_element(nested_list[element])
     else:
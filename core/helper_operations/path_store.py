@@ -0,0 +1,587 @@
+from __future__ import annotations
+
+import gc
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import warnings
+from typing import BinaryIO, Callable, Iterable, Iterator
+
+import numpy as np
+
+from core.helper_operations.path_operations import (
+    decode_swap_sequence,
+    encode_swap_sequence,
+)
+from core.helper_operations.perm_path import PermPath
+from core.helper_operations.permutation_graphs import multinomial
+from core.helper_operations.permutation_ranking import (
+    INT64_MAX,
+    rank_path,
+    rank_permutation,
+    unrank_path,
+    unrank_permutation,
+    unrank_permutations,
+)
+
+ENCODINGS = ("ranks", "swaps")
+"""
+The encodings of a stored path: `ranks` stores the lexicographic rank of every permutation (8 bytes, random access),
+`swaps` stores the first permutation and the index of every swap (1 or 2 bytes per step).
+"""
+
+_CHUNK_SIZE = 65536
+"""
+int: Number of ranks that are decoded at once, which bounds the `int64` temporaries of ``unrank_permutations``.
+"""
+
+
+class StoredPath(PermPath):
+    """
+    A path loaded from a ``PathStore`` that is decoded lazily from its memory-mapped array.
+    The length, single permutations, slices, iteration and lookups of a path stored as ranks are computed from the ranks,
+    the `buffer` with all permutations is only decoded (once) when a path operation needs it.
+    A path stored as swaps is decoded as a whole on first access, since every permutation depends on the ones before it.
+
+    Args:
+        metadata (dict): The metadata of the path, see ``PathStore.load_array``.
+        array (np.ndarray): The memory-mapped array of the path.
+    """
+
+    __slots__ = ("metadata", "array", "_buffer")
+
+    def __init__(self, metadata: dict, array: np.ndarray) -> None:
+        self.metadata = metadata
+        self.array = array
+        self._buffer = None
+
+    @property
+    def sig(self) -> tuple[int, ...]:
+        """
+        Returns:
+            tuple[int, ...]: The signature of the permutations in the path.
+        """
+        return tuple(self.metadata["signature"])
+
+    @property
+    def buffer(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: The 2-D `uint8` array with one permutation per row, decoded on first access.
+        """
+        if self._buffer is None:
+            if len(self) == 0:
+                self._buffer = np.zeros((0, self.width), dtype=np.uint8)
+            elif self.metadata["encoding"] == "ranks":
+                self._buffer = _unrank_rows(self.array, self.sig)
+            else:
+                self._buffer = _decode_swap_rows(self.metadata["start"], self.array)
+        return self._buffer
+
+    @buffer.setter
+    def buffer(self, buffer: np.ndarray) -> None:
+        """
+        Replaces the decoded permutations, for example by ``PermPath.reverse``.
+
+        Args:
+            buffer (np.ndarray): The 2-D `uint8` array with one permutation per row.
+
+        Returns:
+            None: The path uses `buffer` from now on.
+        """
+        self._buffer = buffer
+
+    @property
+    def width(self) -> int:
+        """
+        Returns:
+            int: Length of the permutations in the path.
+        """
+        return sum(self.metadata["signature"])
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: The number of bytes of the decoded buffer, also if the path is not decoded yet.
+        """
+        return len(self) * self.width
+
+    @property
+    def _lazy(self) -> bool:
+        """
+        Returns:
+            bool: Whether the path is stored as ranks and not decoded yet, so it is read from the ranks.
+        """
+        return self._buffer is None and self.metadata["encoding"] == "ranks"
+
+    def __len__(self) -> int:
+        if self._buffer is not None:
+            return self._buffer.shape[0]
+        return self.metadata["length"]
+
+    def __iter__(self) -> Iterator[tuple[int, ...]]:
+        if not self._lazy:
+            return super().__iter__()
+        return (
+            tuple(row)
+            for start in range(0, len(self), _CHUNK_SIZE)
+            for row in unrank_permutations(
+                self.array[start : start + _CHUNK_SIZE], self.sig
+            ).tolist()
+        )
+
+    def __getitem__(self, key: int | slice) -> tuple[int, ...] | PermPath:
+        if not self._lazy:
+            return super().__getitem__(key)
+        if isinstance(key, slice):
+            return PermPath(_unrank_rows(self.array[key], self.sig))
+        return unrank_permutation(int(self.array[key]), self.sig)
+
+    def __contains__(self, vertex: tuple[int, ...]) -> bool:
+        try:
+            self.index(vertex)
+        except ValueError:
+            return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"StoredPath({self.to_list()})"
+
+    def index(self, vertex: tuple[int, ...]) -> int:
+        """
+        Returns the index of the first occurrence of `vertex` in the path, like ``list.index``.
+        A path that is not decoded is searched for the rank of `vertex`.
+
+        Args:
+            vertex (tuple[int, ...]): The vertex to look for.
+
+        Returns:
+            int: The index of `vertex` in the path.
+
+        Raises:
+            ValueError: If `vertex` is not in the path.
+        """
+        if not self._lazy:
+            return super().index(vertex)
+        try:
+            rank = rank_permutation(tuple(vertex), self.sig)
+        except ValueError:
+            raise ValueError(f"{vertex} is not in PermPath") from None
+        matches = np.flatnonzero(self.array == rank)
+        if matches.size == 0:
+            raise ValueError(f"{vertex} is not in PermPath")
+        return int(matches[0])
+
+
+class PathStore:
+    """
+    Stores paths of permutations on disk as `.npy` arrays, so that they are only computed once over all processes.
+    Every path is stored under a name and a signature, in an array file and a metadata file with the encoding,
+    the first permutation and the SHA-256 hash of the array file.
+    Both files are written to a temporary file first and then renamed, so a reader never sees a partially written path.
+    The metadata file is renamed last, so its presence marks the path as complete.
+    Arrays are loaded with `mmap_mode="r"`, so loading only maps the file instead of reading it.
+
+    Args:
+        directory (str): The directory in which the paths are stored. Is created if it does not exist.
+        verify (bool, optional): Whether to check the hash of an array before it is first loaded in this process. Defaults to True.
+
+    Example:
+        >>> import tempfile
+        >>> store = PathStore(tempfile.mkdtemp())
+        >>> store.save("example", (1, 2), [(0, 1, 1), (1, 0, 1), (1, 1, 0)])
+        >>> store.load("example", (1, 2))
+        [(0, 1, 1), (1, 0, 1), (1, 1, 0)]
+    """
+
+    def __init__(self, directory: str, verify: bool = True) -> None:
+        self.directory = directory
+        self.verify = verify
+        # the hashes of the array files that were verified by this process
+        self._verified = set()
+        os.makedirs(directory, exist_ok=True)
+
+    def _file(self, name: str, sig: tuple[int, ...], extension: str) -> str:
+        """
+        Computes the file in which a path is stored.
+
+        Args:
+            name (str): The name of the path.
+            sig (tuple[int, ...]): The signature of the permutations in the path.
+            extension (str): The extension of the file.
+
+        Returns:
+            str: The path of the file.
+        """
+        return os.path.join(
+            self.directory, f"{name}_{'-'.join(map(str, sig))}{extension}"
+        )
+
+    def __contains__(self, key: tuple[str, tuple[int, ...]]) -> bool:
+        return os.path.exists(self._file(*key, ".json"))
+
+    def save(
+        self,
+        name: str,
+        sig: tuple[int, ...],
+        path: list[tuple[int, ...]],
+        encoding: str | None = None,
+    ) -> None:
+        """
+        Stores a path on disk, replacing the path that was stored under the same name and signature.
+
+        Args:
+            name (str): The name of the path, for example the function that computed it.
+            sig (tuple[int, ...]): The signature of the permutations in the path.
+            path (list[tuple[int, ...]]): The path of permutations.
+            encoding (str | None, optional):
+                One of ``ENCODINGS``. Defaults to `ranks` if the ranks fit in an `int64` and `swaps` otherwise.
+
+        Returns:
+            None: The path is written to disk.
+
+        Raises:
+            ValueError: If the encoding is unknown.
+            ValueError: If the path is encoded as swaps and is not a path in the neighbor-swap graph.
+        """
+        sig = tuple(sig)
+        if encoding is None:
+            fits = multinomial(sig) * max(sum(sig), 1) <= INT64_MAX
+            encoding = "ranks" if fits else "swaps"
+        if encoding == "ranks":
+            start, array = None, rank_path(path, sig)
+        elif encoding == "swaps":
+            start, array = encode_swap_sequence(path)
+        else:
+            raise ValueError(
+                f"Unknown encoding {encoding}, expected one of {ENCODINGS}"
+            )
+        array_file = self._file(name, sig, ".npy")
+        digest = _atomic_write(array_file, lambda file: np.save(file, array))
+        self._save_metadata(name, sig, encoding, len(path), start, digest)
+
+    def save_segments(
+        self, name: str, sig: tuple[int, ...], segments: Iterable[list[tuple[int, ...]]]
+    ) -> int:
+        """
+        Stores a path that is given in consecutive segments, for example by ``stachowiak.lemma11_segments``,
+        without holding the whole path in memory. The path is stored as ranks, so it can be loaded like a path stored by ``save``.
+        The ranks are written to a temporary file first and copied behind the `.npy` header once the length of the path is known.
+
+        Args:
+            name (str): The name of the path, for example the function that computed it.
+            sig (tuple[int, ...]): The signature of the permutations in the path.
+            segments (Iterable[list[tuple[int, ...]]]): The consecutive segments of the path.
+
+        Returns:
+            int: The length of the stored path.
+
+        Raises:
+            ValueError: If the ranks of the permutations do not fit in an `int64`.
+        """
+        sig = tuple(sig)
+        if multinomial(sig) * max(sum(sig), 1) > INT64_MAX:
+            raise ValueError(f"The ranks of signature {sig} do not fit in an int64")
+        descriptor, ranks_file = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        length = 0
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                for segment in segments:
+                    file.write(rank_path(segment, sig).astype("<i8").tobytes())
+                    length += len(segment)
+
+            def write(file: BinaryIO) -> None:
+                """
+                Writes the `.npy` header followed by the ranks in the temporary file.
+
+                Args:
+                    file (BinaryIO): The array file to write.
+
+                Returns:
+                    None: The array file is written.
+                """
+                header = {"descr": "<i8", "fortran_order": False, "shape": (length,)}
+                np.lib.format.write_array_header_1_0(file, header)
+                with open(ranks_file, "rb") as ranks:
+                    shutil.copyfileobj(ranks, file, 1 << 20)
+
+            digest = _atomic_write(self._file(name, sig, ".npy"), write)
+        finally:
+            os.remove(ranks_file)
+        self._save_metadata(name, sig, "ranks", length, None, digest)
+        return length
+
+    def _save_metadata(
+        self,
+        name: str,
+        sig: tuple[int, ...],
+        encoding: str,
+        length: int,
+        start: tuple[int, ...] | None,
+        digest: str,
+    ) -> None:
+        """
+        Writes the metadata file of a path, after its array file is written. See ``save``.
+
+        Args:
+            name (str): The name of the path.
+            sig (tuple[int, ...]): The signature of the permutations in the path.
+            encoding (str): One of ``ENCODINGS``.
+            length (int): The length of the path.
+            start (tuple[int, ...] | None): The first permutation of a path encoded as swaps.
+            digest (str): The SHA-256 hash of the array file.
+
+        Returns:
+            None: The path is complete once its metadata file exists.
+        """
+        metadata = {
+            "name": name,
+            "signature": list(sig),
+            "encoding": encoding,
+            "length": length,
+            "start": None if start is None else list(start),
+            "sha256": digest,
+        }
+        _atomic_write(
+            self._file(name, sig, ".json"),
+            lambda file: file.write(json.dumps(metadata).encode()),
+        )
+
+    def load_array(
+        self, name: str, sig: tuple[int, ...]
+    ) -> tuple[dict, np.ndarray] | None:
+        """
+        Maps a stored path into memory without decoding it.
+
+        Args:
+            name (str): The name of the path.
+            sig (tuple[int, ...]): The signature of the permutations in the path.
+
+        Returns:
+            tuple[dict, np.ndarray] | None:
+                The metadata and the read-only memory-mapped array of the path,
+                or None if the path is not stored or the array does not match its hash.
+        """
+        sig = tuple(sig)
+        try:
+            with open(self._file(name, sig, ".json")) as file:
+                metadata = json.load(file)
+        except (OSError, ValueError):
+            return None
+        array_file = self._file(name, sig, ".npy")
+        if self.verify and metadata["sha256"] not in self._verified:
+            try:
+                digest = _file_hash(array_file)
+            except OSError:
+                return None
+            if digest != metadata["sha256"]:
+                warnings.warn(
+                    f"Ignoring stored path {array_file}, its hash does not match"
+                )
+                return None
+            self._verified.add(digest)
+        if metadata["length"] == 0:
+            return metadata, np.zeros(0, dtype=np.int64)
+        return metadata, np.load(array_file, mmap_mode="r")
+
+    def load(self, name: str, sig: tuple[int, ...]) -> list[tuple[int, ...]] | None:
+        """
+        Loads a stored path as a list of permutations.
+
+        Args:
+            name (str): The name of the path.
+            sig (tuple[int, ...]): The signature of the permutations in the path.
+
+        Returns:
+            list[tuple[int, ...]] | None: The stored path, or None if it is not stored (correctly).
+        """
+        stored = self.load_array(name, sig)
+        if stored is None:
+            return None
+        metadata, array = stored
+        # the decoded path consists of millions of new tuples, which would trigger the garbage collector over and over
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            if metadata["encoding"] == "ranks":
+                return unrank_path(array, tuple(sig))
+            start = metadata["start"]
+            return decode_swap_sequence(None if start is None else tuple(start), array)
+        finally:
+            if enabled:
+                gc.enable()
+
+    def load_path(self, name: str, sig: tuple[int, ...]) -> StoredPath | None:
+        """
+        Loads a stored path without decoding it, see ``StoredPath``.
+
+        Args:
+            name (str): The name of the path.
+            sig (tuple[int, ...]): The signature of the permutations in the path.
+
+        Returns:
+            StoredPath | None: The stored path, or None if it is not stored (correctly).
+        """
+        stored = self.load_array(name, sig)
+        if stored is None:
+            return None
+        return StoredPath(*stored)
+
+    def load_or_compute(
+        self,
+        name: str,
+        sig: tuple[int, ...],
+        compute: Callable[[], list[tuple[int, ...]]],
+    ) -> list[tuple[int, ...]] | StoredPath:
+        """
+        Loads a stored path, or computes and stores it if it is not stored yet.
+        A stored path is decoded lazily from its memory-mapped array, see ``StoredPath``.
+
+        Args:
+            name (str): The name of the path.
+            sig (tuple[int, ...]): The signature of the permutations in the path.
+            compute (Callable[[], list[tuple[int, ...]]]): Computes the path if it is not stored.
+
+        Returns:
+            list[tuple[int, ...]] | StoredPath: The computed path, or the stored path.
+        """
+        path = self.load_path(name, sig)
+        if path is None:
+            path = compute()
+            self.save(name, sig, path)
+        return path
+
+
+def _unrank_rows(ranks: np.ndarray, sig: tuple[int, ...]) -> np.ndarray:
+    """
+    Decodes ranks into permutations in chunks of ``_CHUNK_SIZE``, see ``unrank_permutations``.
+
+    Args:
+        ranks (np.ndarray): The ranks of the permutations.
+        sig (tuple[int, ...]): The signature of the permutations.
+
+    Returns:
+        np.ndarray: A 2-D `uint8` array with one permutation per row.
+    """
+    chunks = [
+        unrank_permutations(ranks[start : start + _CHUNK_SIZE], sig)
+        for start in range(0, len(ranks), _CHUNK_SIZE)
+    ]
+    if len(chunks) == 0:
+        return np.zeros((0, sum(sig)), dtype=np.uint8)
+    return np.concatenate(chunks)
+
+
+def _decode_swap_rows(start: list[int], swaps: np.ndarray) -> np.ndarray:
+    """
+    Decodes a path stored as swaps into permutations, like ``decode_swap_sequence`` but without creating tuples.
+
+    Args:
+        start (list[int]): The first permutation of the path.
+        swaps (np.ndarray): The index of every swap, see ``encode_swap_sequence``.
+
+    Returns:
+        np.ndarray: A 2-D `uint8` array with one permutation per row.
+    """
+    current = bytearray(start)
+    rows = bytearray(current)
+    for i in swaps.tolist():
+        current[i], current[i + 1] = current[i + 1], current[i]
+        rows += current
+    return np.frombuffer(rows, dtype=np.uint8).reshape(-1, len(start))
+
+
+def _atomic_write(file_name: str, write: Callable) -> str:
+    """
+    Writes a file by writing a temporary file in the same directory and renaming it, so the file is replaced atomically.
+
+    Args:
+        file_name (str): The file to write.
+        write (Callable): Writes the contents to the binary file object it is given.
+
+    Returns:
+        str: The SHA-256 hash of the written file.
+    """
+    directory = os.path.dirname(file_name) or "."
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            write(file)
+            file.flush()
+            os.fsync(file.fileno())
+        digest = _file_hash(temporary)
+        os.replace(temporary, file_name)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return digest
+
+
+def _file_hash(file_name: str) -> str:
+    """
+    Computes the SHA-256 hash of a file, reading it in blocks.
+
+    Args:
+        file_name (str): The file to hash.
+
+    Returns:
+        str: The hexadecimal hash.
+    """
+    digest = hashlib.sha256()
+    with open(file_name, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+_store = (
+    PathStore(os.environ["LEHMER_PATH_STORE"])
+    if os.environ.get("LEHMER_PATH_STORE")
+    else None
+)
+
+
+def get_path_store() -> PathStore | None:
+    """
+    Returns:
+        PathStore | None: The store used by ``stored_path``, or None if paths are not stored on disk.
+    """
+    return _store
+
+
+def set_path_store(store: PathStore | str | None) -> None:
+    """
+    Sets the store used by ``stored_path``. The store can also be set with the `LEHMER_PATH_STORE` environment variable.
+
+    Args:
+        store (PathStore | str | None): The store, the directory of a new store, or None to stop storing paths on disk.
+
+    Returns:
+        None: Paths are loaded from and stored in `store` from now on.
+    """
+    global _store
+    _store = PathStore(store) if isinstance(store, str) else store
+
+
+def stored_path(
+    name: str, sig: tuple[int, ...], compute: Callable[[], list[tuple[int, ...]]]
+) -> list[tuple[int, ...]] | StoredPath:
+    """
+    Loads a path from the store set with ``set_path_store``, or computes (and stores) it.
+    Without a store the path is only computed.
+
+    Args:
+        name (str): The name of the path.
+        sig (tuple[int, ...]): The signature of the permutations in the path.
+        compute (Callable[[], list[tuple[int, ...]]]): Computes the path if it is not stored.
+
+    Returns:
+        list[tuple[int, ...]] | StoredPath: The computed path, or the lazily decoded stored path.
+    """
+    if _store is None or sum(sig) == 0:
+        return compute()
+    return _store.load_or_compute(name, sig, compute)
@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+import numpy as np
+
+
+def _row_keys(buffer: np.ndarray) -> np.ndarray:
+    """
+    Views every row of a 2-D `uint8` buffer as a single opaque (void) scalar.
+    Void scalars compare and sort by their bytes, so rows can be looked up without building tuples.
+
+    Args:
+        buffer (np.ndarray): The 2-D `uint8` buffer with one permutation per row.
+
+    Returns:
+        np.ndarray: A 1-D array with one void scalar per row.
+    """
+    buffer = np.ascontiguousarray(buffer)
+    return buffer.view(np.dtype((np.void, buffer.shape[1]))).ravel()
+
+
+def first_non_adjacent(rows: np.ndarray, cyclic: bool = False) -> int:
+    """
+    Checks in one vectorized pass whether all consecutive rows of a 2-D array differ by a swap of two adjacent elements.
+    Batch version of ``adjacent`` for a whole path: row `i` is compared with row `i + 1`,
+    and if `cyclic` is True the last row is also compared with the first row.
+
+    Args:
+        rows (np.ndarray): A 2-D array with one permutation per row.
+        cyclic (bool, optional): Whether the last row must also be adjacent to the first row. Defaults to False.
+
+    Returns:
+        int: The first index `i` such that row `i` is not adjacent to the row after it, or -1 if there is no such index.
+
+    Raises:
+        ValueError: If `rows` is not 2-dimensional.
+
+    Example:
+        >>> first_non_adjacent(np.array([(0, 1, 1), (1, 0, 1), (1, 1, 0), (0, 1, 1)]))
+        2
+    """
+    rows = np.asarray(rows)
+    if rows.ndim != 2:
+        raise ValueError(f"Expected a 2-dimensional array, got shape {rows.shape}")
+    if len(rows) < 2:
+        return -1
+    width = rows.shape[1]
+    if width < 2:
+        return 0
+    following = np.roll(rows, -1, axis=0) if cyclic else rows[1:]
+    current = rows if cyclic else rows[:-1]
+    diff = current != following
+    # the two differing elements must be at positions `first` and `first + 1` and be swapped
+    first = np.argmax(diff, axis=1)
+    second = np.minimum(first + 1, width - 1)
+    index = np.arange(len(current))
+    valid = (
+        (diff.sum(axis=1) == 2)
+        & (first + 1 < width)
+        & diff[index, second]
+        & (current[index, first] == following[index, second])
+        & (current[index, second] == following[index, first])
+    )
+    failing = np.flatnonzero(~valid)
+    return int(failing[0]) if failing.size else -1
+
+
+class PermPath:
+    """
+    A path (or cycle) of permutations stored as a 2-D `uint8` NumPy buffer with one permutation per row.
+    Behaves like the list of tuples used throughout the repository: indexing returns a tuple,
+    slicing returns a `PermPath` view and `+` concatenates with other paths or lists of tuples.
+    The path operations (``extend``, ``rotate``, ``cutCycle``, ``glue``, ``transform``, ``createZigZagPath``, ...)
+    dispatch to the methods of this class, which work on the buffer instead of allocating a tuple per vertex.
+
+    Args:
+        buffer (np.ndarray | list): A 2-D array (or nested list) with one permutation per row.
+
+    Raises:
+        ValueError: If the buffer is not 2-dimensional.
+
+    Example:
+        >>> path = PermPath.from_list([(0, 1), (1, 0)])
+        >>> path[1]
+        (1, 0)
+        >>> (path + [(0, 1)]).to_list()
+        [(0, 1), (1, 0), (0, 1)]
+    """
+
+    __slots__ = ("buffer",)
+
+    def __init__(self, buffer: np.ndarray | list) -> None:
+        buffer = np.asarray(buffer, dtype=np.uint8)
+        if buffer.ndim != 2:
+            raise ValueError(
+                f"PermPath buffer must be 2-dimensional, got shape {buffer.shape}"
+            )
+        self.buffer = buffer
+
+    @classmethod
+    def from_list(
+        cls: type[PermPath], path: list[tuple[int, ...]] | PermPath, width: int = 0
+    ) -> PermPath:
+        """
+        Creates a `PermPath` from a list of permutations (tuples).
+
+        Args:
+            cls (type[PermPath]): The class of the path.
+            path (list[tuple[int, ...]] | PermPath): The path as a list of tuples.
+            width (int, optional): Length of the permutations, only used if `path` is empty. Defaults to 0.
+
+        Returns:
+            PermPath: The path backed by a `uint8` buffer.
+        """
+        if isinstance(path, PermPath):
+            return path
+        if len(path) == 0:
+            return cls(np.zeros((0, width), dtype=np.uint8))
+        return cls(np.array(path, dtype=np.uint8).reshape(len(path), -1))
+
+    def to_list(self) -> list[tuple[int, ...]]:
+        """
+        Converts the path back to a list of tuples.
+
+        Returns:
+            list[tuple[int, ...]]: The path as a list of tuples.
+        """
+        return [tuple(row) for row in self.buffer.tolist()]
+
+    @property
+    def width(self) -> int:
+        """
+        Returns:
+            int: Length of the permutations in the path.
+        """
+        return self.buffer.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: The number of bytes of the buffer.
+        """
+        return self.buffer.nbytes
+
+    def __len__(self) -> int:
+        return self.buffer.shape[0]
+
+    def __iter__(self) -> Iterator[tuple[int, ...]]:
+        return (tuple(row) for row in self.buffer.tolist())
+
+    def __getitem__(self, key: int | slice) -> tuple[int, ...] | PermPath:
+        if isinstance(key, slice):
+            return PermPath(self.buffer[key])
+        return tuple(self.buffer[key].tolist())
+
+    def __add__(self, other: PermPath | list[tuple[int, ...]]) -> PermPath:
+        other = PermPath.from_list(other, self.width)
+        return PermPath(np.concatenate((self.buffer, other.buffer)))
+
+    def __radd__(self, other: list[tuple[int, ...]]) -> PermPath:
+        other = PermPath.from_list(other, self.width)
+        return PermPath(np.concatenate((other.buffer, self.buffer)))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, list):
+            if len(other) != len(self):
+                return False
+            other = PermPath.from_list(other, self.width)
+        if not isinstance(other, PermPath):
+            return NotImplemented
+        return np.array_equal(self.buffer, other.buffer)
+
+    __hash__ = None
+
+    def __contains__(self, vertex: tuple[int, ...]) -> bool:
+        return len(vertex) == self.width and bool(
+            np.any(np.all(self.buffer == np.asarray(vertex), axis=1))
+        )
+
+    def __repr__(self) -> str:
+        return f"PermPath({self.to_list()})"
+
+    def index(self, vertex: tuple[int, ...]) -> int:
+        """
+        Returns the index of the first occurrence of `vertex` in the path, like ``list.index``.
+
+        Args:
+            vertex (tuple[int, ...]): The vertex to look for.
+
+        Returns:
+            int: The index of `vertex` in the path.
+
+        Raises:
+            ValueError: If `vertex` is not in the path.
+        """
+        if len(vertex) == self.width:
+            matches = np.flatnonzero(np.all(self.buffer == np.asarray(vertex), axis=1))
+            if matches.size > 0:
+                return int(matches[0])
+        raise ValueError(f"{vertex} is not in PermPath")
+
+    def reverse(self) -> None:
+        """
+        Reverses the path in place, like ``list.reverse``. Only the view on the buffer is changed.
+
+        Returns:
+            None: The path is reversed in place.
+        """
+        self.buffer = self.buffer[::-1]
+
+    def positions(self, vertices: PermPath | list[tuple[int, ...]]) -> np.ndarray:
+        """
+        Looks up the index of many vertices at once by sorting the rows of the path.
+
+        Args:
+            vertices (PermPath | list[tuple[int, ...]]): The vertices to look for.
+
+        Returns:
+            np.ndarray: The index of every vertex in the path, or -1 if the vertex is not in the path.
+        """
+        queries = PermPath.from_list(vertices, self.width).buffer
+        if len(queries) == 0 or len(self) == 0:
+            return np.full(len(queries), -1, dtype=np.int64)
+        keys = _row_keys(self.buffer)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        query_keys = _row_keys(queries)
+        found = np.minimum(np.searchsorted(sorted_keys, query_keys), len(keys) - 1)
+        return np.where(sorted_keys[found] == query_keys, order[found], -1)
+
+    def is_path(self, cyclic: bool = False) -> bool:
+        """
+        Checks whether consecutive rows differ by a swap of two adjacent elements.
+        Same semantics as ``pathQ`` and (for `cyclic=True`) ``cycleQ``.
+
+        Args:
+            cyclic (bool, optional): Whether the last row must also be adjacent to the first row. Defaults to False.
+
+        Returns:
+            bool: True if the rows form a path (or a cycle), False otherwise.
+        """
+        if cyclic and len(self) <= 2:
+            return False
+        if len(self) == 0:
+            return False
+        if len(self) == 1:
+            return True
+        return first_non_adjacent(self.buffer, cyclic) == -1
+
+    def extend(self, suffix: tuple[int, ...]) -> PermPath:
+        """
+        Appends `suffix` to every permutation in the path. See ``extend``.
+
+        Args:
+            suffix (tuple[int, ...]): The suffix to append.
+
+        Returns:
+            PermPath: The extended path.
+        """
+        tail = np.broadcast_to(
+            np.asarray(suffix, dtype=np.uint8), (len(self), len(suffix))
+        )
+        return PermPath(np.concatenate((self.buffer, tail), axis=1))
+
+    def rotate(self, n: int) -> PermPath:
+        """
+        Rotates the path `n` positions to the left. See ``rotate``.
+
+        Args:
+            n (int): The number of positions to rotate.
+
+        Returns:
+            PermPath: The rotated path.
+        """
+        if len(self) <= 1:
+            return self
+        return PermPath(np.roll(self.buffer, -(n % len(self)), axis=0))
+
+    def cut_cycle(self, vertex: tuple[int, ...]) -> PermPath:
+        """
+        Rotates the cycle such that `vertex` appears first. See ``cutCycle``.
+
+        Args:
+            vertex (tuple[int, ...]): The vertex to start the path with.
+
+        Returns:
+            PermPath: The rotated cycle.
+
+        Raises:
+            ValueError: If `vertex` is not in the cycle.
+        """
+        return self.rotate(self.index(vertex))
+
+    def transform(self, tr: list[int]) -> PermPath:
+        """
+        Renames every element `i` in the path to `tr[i]`. See ``transform``.
+
+        Args:
+            tr (list[int]): Transformation list, int at index `i` is the new name for `i`.
+
+        Returns:
+            PermPath: The transformed path.
+
+        Raises:
+            ValueError: If the path contains an element that has no index in the transformation list.
+        """
+        if len(self) > 0 and self.width > 0 and int(self.buffer.max()) >= len(tr):
+            raise ValueError(
+                f"Index {int(self.buffer.max())} is larger than the length of the transformation list {tr}"
+            )
+        return PermPath(np.asarray(tr, dtype=np.uint8)[self.buffer])
+
+    def zigzag(self, u: tuple[int, ...], v: tuple[int, ...]) -> PermPath:
+        """
+        Combines two "parallel" copies of the path into a zigzag path. See ``createZigZagPath``.
+
+        Args:
+            u (tuple[int, ...]): Tuple to append.
+            v (tuple[int, ...]): Tuple to append.
+
+        Returns:
+            PermPath: The zigzag path, twice as long as this path.
+        """
+        return self._repeat_with_modules(2, [u, v, v, u], [u, v, v, u])
+
+    def square_tube(self, u: tuple[int, ...], v: tuple[int, ...]) -> PermPath:
+        """
+        Creates a square tube from the path. See ``createSquareTube``.
+
+        Args:
+            u (tuple[int, ...]): Tuple to append.
+            v (tuple[int, ...]): Tuple adjacent to `u` to append.
+
+        Returns:
+            PermPath: The square tube, four times as long as this path.
+        """
+        uu, uv, vu, vv = u + u, u + v, v + u, v + v
+        return self._repeat_with_modules(
+            4, [uu, uv, vv, vu, vu, vv, uv, uu], [uu, uv, vv, vu, vu, uu, uv, vv]
+        )
+
+    def _repeat_with_modules(
+        self,
+        copies: int,
+        module: list[tuple[int, ...]],
+        last_module: list[tuple[int, ...]],
+    ) -> PermPath:
+        """
+        Repeats every row `copies` times and appends the suffixes of `module` cyclically.
+        The last `len(last_module)` rows get the suffixes of `last_module` instead.
+
+        Args:
+            copies (int): How often every row is repeated.
+            module (list[tuple[int, ...]]): The suffixes that are appended cyclically.
+            last_module (list[tuple[int, ...]]): The suffixes of the last rows.
+
+        Returns:
+            PermPath: The path with repeated rows and suffixes.
+        """
+        rows = np.repeat(self.buffer, copies, axis=0)
+        module = np.array(module, dtype=np.uint8)
+        suffixes = np.resize(module, (len(rows), module.shape[1]))
+        if len(rows) >= len(last_module):
+            suffixes[len(rows) - len(last_module) :] = np.array(
+                last_module, dtype=np.uint8
+            )
+        return PermPath(np.concatenate((rows, suffixes), axis=1))
+
+    def incorporate_spurs(
+        self,
+        vertices: PermPath | list[tuple[int, ...]],
+        spur_suffixes: list[tuple[int, ...]],
+        skip: int = 0,
+    ) -> PermPath:
+        """
+        Incorporates all spurs in a zigzag path at once. See ``incorporateSpursInZigZag``.
+
+        Args:
+            vertices (PermPath | list[tuple[int, ...]]): The stutters to incorporate.
+            spur_suffixes (list[tuple[int, ...]]): The two spur suffixes for the vertices.
+            skip (int, optional): Number of elements to skip before the suffixes when finding the swap index. Defaults to 0.
+
+        Returns:
+            PermPath: The zigzag path with the spurs incorporated.
+
+        Raises:
+            ValueError: If a spur has no base in the path.
+            ValueError: If the bases of a spur are not adjacent in the path, or already hold another spur.
+        """
+        vertices = PermPath.from_list(vertices)
+        if len(vertices) == 0:
+            return self
+        suffixes = np.array(spur_suffixes, dtype=np.uint8)
+        spurs = np.concatenate(
+            (
+                np.repeat(vertices.buffer, len(suffixes), axis=0),
+                np.tile(suffixes, (len(vertices), 1)),
+            ),
+            axis=1,
+        )
+        first, second = spurs[0::2], spurs[1::2]
+        # index of the last pair of distinct adjacent elements before the skipped part
+        prefix = first[:, : first.shape[1] - skip - suffixes.shape[1]]
+        distinct = prefix[:, :-1] != prefix[:, 1:]
+        if not np.all(distinct.any(axis=1)):
+            raise ValueError(
+                f"No distinct adjacent elements found in the spurs {spurs}"
+            )
+        swap = distinct.shape[1] - 1 - np.argmax(distinct[:, ::-1], axis=1)
+        rows = np.arange(len(first))
+        p, q = first.copy(), second.copy()
+        p[rows, swap], p[rows, swap + 1] = first[rows, swap + 1], first[rows, swap]
+        q[rows, swap], q[rows, swap + 1] = second[rows, swap + 1], second[rows, swap]
+        i, j = self.positions(PermPath(p)), self.positions(PermPath(q))
+        if np.any(i < 0) or np.any(j < 0):
+            missing = p[np.argmax(i < 0)] if np.any(i < 0) else q[np.argmax(j < 0)]
+            raise ValueError(
+                f"Path does not contain permutation {tuple(missing.tolist())}"
+            )
+        after = j == i + 1
+        # like in ``incorporateSpursInZigZag``, only one spur fits between two adjacent vertices
+        first_base = np.zeros(len(i), dtype=bool)
+        first_base[np.unique(np.minimum(i, j), return_index=True)[1]] = True
+        adjacent = (after | (j == i - 1)) & first_base
+        if not np.all(adjacent):
+            index = np.argmax(~adjacent)
+            raise ValueError(
+                f"Permutations {tuple(p[index].tolist())} and {tuple(q[index].tolist())} are not adjacent in path."
+            )
+        # the spur goes between its base i and j, in the orientation of the path
+        insert = np.empty((2 * len(first), spurs.shape[1]), dtype=np.uint8)
+        insert[0::2] = np.where(after[:, None], first, second)
+        insert[1::2] = np.where(after[:, None], second, first)
+        return PermPath(
+            np.insert(self.buffer, np.repeat(np.maximum(i, j), 2), insert, axis=0)
+        )
@@ -1,14 +1,18 @@
 from bisect import bisect, insort
 from collections import Counter
 from heapq import heappop, heappush
-from itertools import permutations as itertoolspermutations
+from typing import Iterator
 
+from core.helper_operations.bit_path import BitPath
+from core.helper_operations.path_index import PathIndex
 from core.helper_operations.path_operations import (
     adjacent,
     cycleQ,
     find_last_distinct_adjacent_index,
     pathQ,
+    stutterPermutationQ,
 )
+from core.helper_operations.perm_path import PermPath
 
 
 def binomial(k0: int, k1: int) -> int:
@@ -72,11 +76,42 @@ def perm(sig: tuple[int, ...]) -> list[list[int]]:
     Returns:
         list[list[int]]: List of permutations as lists of integers
     """
-    first_perm = []
-    for index, item in enumerate(sig):
-        first_perm.extend([index] * item)
+    return [list(p) for p in multiset_permutations(sig)]
 
-    return [list(p) for p in set(itertoolspermutations(first_perm))]
+
+def multiset_permutations(sig: tuple[int, ...]) -> Iterator[tuple[int, ...]]:
+    """
+    Generates all permutations with signature `sig` in lexicographic order, each exactly once.
+    Uses the next-permutation algorithm, which takes amortized constant time per permutation.
+    Unlike ``itertools.permutations`` it does not walk all `n!` orderings of the multiset to deduplicate them.
+    See ``permutation_chunks`` for a batched NumPy version.
+
+    Args:
+        sig (tuple[int, ...]): Signature as a tuple of integers
+
+    Returns:
+        Iterator[tuple[int, ...]]: The permutations as tuples of integers, starting with ``multiset(sig)``.
+
+    Example:
+        >>> list(multiset_permutations((2, 1)))
+        [(0, 0, 1), (0, 1, 0), (1, 0, 0)]
+    """
+    current = list(multiset(sig))
+    n = len(current)
+    while True:
+        yield tuple(current)
+        # find the last ascent, the suffix after it is non-increasing
+        i = n - 2
+        while i >= 0 and current[i] >= current[i + 1]:
+            i -= 1
+        if i < 0:
+            return
+        # swap it with the last element in the suffix that is larger and make the suffix increasing
+        j = n - 1
+        while current[j] <= current[i]:
+            j -= 1
+        current[i], current[j] = current[j], current[i]
+        current[i + 1 :] = current[:i:-1]
 
 
 def get_num_of_inversions(permutation: tuple[int, ...]) -> int:
@@ -129,7 +164,7 @@ def count_inversions(sig: tuple[int, ...]) -> dict[tuple, int]:
     """
     if len(list(sig)) == 0:
         return dict()
-    return {tuple(i): get_num_of_inversions(i) for i in perm(sig)}
+    return {p: get_num_of_inversions(p) for p in multiset_permutations(sig)}
 
 
 def defect(sig: tuple[int, ...]) -> int:
@@ -139,6 +174,40 @@ def defect(sig: tuple[int, ...]) -> int:
     This defect is calculated by the difference in nodes between the two partitions of the bipartite graph.
     A bipartite graph can only admit a Hamiltonian cycle if the defect is 0 since it needs to alternate between the two partitions.
 
+    The difference between the number of even and odd permutations is the q-multinomial coefficient of `sig` at `q = -1`.
+    It is the product of the q-binomial coefficients `[n choose k]_q` at `q = -1` for every color, where `k` is the number
+    of occurrences of the color and `n` the number of occurrences of that color and all colors before it.
+    At `q = -1` this q-binomial is 0 if `n` is even and `k` is odd, and `floor(n/2) choose floor(k/2)` otherwise.
+    See `defect_by_inversions` for the version that counts the inversions of every permutation.
+
+    Args:
+        sig (tuple[int, ...]): Signature as a list of integers
+
+    Returns:
+        int: The absolute difference between the number of even and odd permutations.
+
+    Raises:
+        ValueError: If the signature contains negative integers.
+    """
+    if any(k < 0 for k in sig):
+        raise ValueError("Signature must be a list of non-negative integers.")
+    if len(list(sig)) < 2:
+        return 0
+    result = 1
+    n = 0
+    for k in sig:
+        n += k
+        if n % 2 == 0 and k % 2 == 1:
+            return 0
+        result *= binomial(k // 2, n // 2 - k // 2)
+    return result
+
+
+def defect_by_inversions(sig: tuple[int, ...]) -> int:
+    """
+    Compute the defect of a signature by counting the inversions of every permutation of the signature.
+    Slow version of `defect`, used to verify the closed form.
+
     Args:
         sig (tuple[int, ...]): Signature as a list of integers
 
@@ -186,6 +255,7 @@ def incorporateSpursInZigZag(
 ) -> list[tuple[int, ...]]:
     """
     Incorporates a list of spurs in a zigzag path. See ``incorporateSpurInZigZag`` for more details.
+    The bases of all spurs are looked up in a `PathIndex` of the path, and the path is rebuilt once with all spurs.
 
     Args:
         path (list[tuple[int, ...]]): List of vertices, a zigzag path.
@@ -195,39 +265,49 @@ def incorporateSpursInZigZag(
 
     Returns:
         list[tuple[int, ...]]: List of vertices, the zigzag path with the spurs incorporated.
+
+    Raises:
+        ValueError: If the base of a spur is not in the path or the bases of a spur are not adjacent in the path.
     """
+    if isinstance(path, (PermPath, BitPath)):
+        return path.incorporate_spurs(vertices, spur_suffixes, skip)
+    index = PathIndex(path)
     C = [stut + suff for stut in vertices for suff in spur_suffixes]
     skip += len(spur_suffixes[0])
+    # the spur to insert between position `i` and `i + 1` of the path
+    spurs = {}
     for vertex_index in range(0, len(C), 2):
         swapidx = find_last_distinct_adjacent_index(C[vertex_index][:-skip])
         p = swapPair(C[vertex_index], swapidx)
         q = swapPair(C[vertex_index + 1], swapidx)
-        try:
-            i = path.index(p)
-        except ValueError:
+        i = index.get(p)
+        if i < 0:
             raise ValueError(
                 f"Path {path} does not contain permutation {p}; generated from {C[vertex_index]}"
             )
-        try:
-            j = path.index(q)
-        except ValueError:
+        j = index.get(q)
+        if j < 0:
             raise ValueError(
                 f"Path {path} does not contain permutation {q}; generated from {C[vertex_index + 1]}"
             )
         # check whether the index of j is i + 1 or i - 1
-        if j == i + 1:
+        if j == i + 1 and i not in spurs:
             # add the spur after i
-            path = (
-                path[: i + 1] + [C[vertex_index], C[vertex_index + 1]] + path[i + 1 :]
-            )
-        elif j == i - 1:
+            spurs[i] = [C[vertex_index], C[vertex_index + 1]]
+        elif j == i - 1 and j not in spurs:
             # add the spur before i
-            path = path[:i] + [C[vertex_index + 1], C[vertex_index]] + path[i:]
+            spurs[j] = [C[vertex_index + 1], C[vertex_index]]
         else:
             raise ValueError(
                 f"Permutations {p} and {q} are not adjacent in path {path}."
             )
-    return path
+    result = []
+    start = 0
+    for i in sorted(spurs):
+        result += path[start : i + 1]
+        result += spurs[i]
+        start = i + 1
+    return result + path[start:]
 
 
 def generate_adj(p: list[int]) -> list[tuple[int, ...]]:
@@ -281,6 +361,8 @@ def extend(lst: list[tuple[int, ...]], e: tuple[int, ...]) -> list[tuple[int, ..
     Returns:
         list[tuple[int, ...]]: List of tuples with each item extended by `e`.
     """
+    if isinstance(lst, (PermPath, BitPath)):
+        return lst.extend(e)
     return [i + e for i in lst]
 
 
@@ -352,6 +434,8 @@ def rotate(l: list, n: int) -> list:
     Returns:
         list: The rotated list.
     """
+    if isinstance(l, (PermPath, BitPath)):
+        return l.rotate(n)
     if len(l) <= 1:
         return l
     return l[n % len(l) :] + l[: n % len(l)]
@@ -412,9 +496,7 @@ def permutations_from_sig(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
         sig = (sig,)
     if len(list(sig)) == 0:
         return []
-    # for itertools permutations:
-    # Elements are treated as unique based on their position, not on their value.
-    return list(set(itertoolspermutations(multiset(sig))))
+    return list(multiset_permutations(sig))
 
 
 def _selectOdds(sig: tuple[int, ...]) -> tuple[int, ...]:
@@ -469,7 +551,49 @@ def nonStutterPermutations(s: tuple[int, ...]) -> list[tuple[int, ...]]:
     """
     if len(s) == 0 or all(i == 0 for i in s):
         return []
-    return [tuple(p) for p in perm(s) if not tuple(p) in stutterPermutations(s)]
+    return [p for p in multiset_permutations(s) if not stutterPermutationQ(p)]
+
+
+def stutter_count(sig: tuple[int, ...]) -> int:
+    """
+    Returns the number of stutter permutations of signature `sig` without generating them.
+    There are no stutter permutations if more than one color occurs an odd number of times.
+    Otherwise, every stutter permutation is a permutation of the halved signature with every element repeated twice,
+    so their number is the multinomial coefficient of the halved signature.
+    Equal to `len(stutterPermutations(sig))`.
+
+    Args:
+        sig (tuple[int, ...]): Signature of the permutations as a tuple of integers.
+
+    Returns:
+        int: The number of stutter permutations of signature `sig`.
+
+    Raises:
+        ValueError: If the signature contains negative integers.
+    """
+    halved = halve_signature(sig)
+    if len(_selectOdds(sig)) >= 2 or len(sig) == 0 or (len(sig) == 1 and sig[0] == 0):
+        return 0
+    return multinomial(halved)
+
+
+def non_stutter_count(sig: tuple[int, ...]) -> int:
+    """
+    Returns the number of non-stutter permutations of signature `sig` without generating them.
+    Equal to `len(nonStutterPermutations(sig))`.
+
+    Args:
+        sig (tuple[int, ...]): Signature of the permutations as a tuple of integers.
+
+    Returns:
+        int: The number of non-stutter permutations of signature `sig`.
+
+    Raises:
+        ValueError: If the signature contains negative integers.
+    """
+    if len(sig) == 0 or all(i == 0 for i in sig):
+        return 0
+    return multinomial(sig) - stutter_count(sig)
 
 
 def _stutterize(p_list: list[tuple[int, ...]]) -> list[tuple[int, ...]]:
@@ -518,10 +642,11 @@ def HpathQ(per: list[tuple[int, ...]], sig: tuple[int, ...]) -> bool:
         bool: `True` if the path is a Hamiltonian path on the non-stutter permutations of the given signature, `False` otherwise.
     """
     if pathQ(per):
-        all_non_stutters = Counter(per) == Counter(nonStutterPermutations(sig))
+        non_stutters = nonStutterPermutations(sig)
+        all_non_stutters = Counter(per) == Counter(non_stutters)
         if not all_non_stutters:
             # find the missing nodes
-            missing = set(nonStutterPermutations(sig)) - set(per)
+            missing = set(non_stutters) - set(per)
             print(f"Missing nodes: {missing}")
         return all_non_stutters
     return False
@@ -560,14 +685,10 @@ def LargeHpathQ(per: list[tuple[int, ...]], sig: tuple[int, ...]) -> bool:
     Returns:
         bool: `True` if the path is a Hamiltonian path on the non-stutter permutations of the given signature, `False` otherwise.
     """
-    # there are no duplicates, the length is correct, and it is a path
     if len(per) <= 2:
         return False
-    # there are no duplicates, the length is correct, and it is a cycle
-    if sum(1 for n in sig if n % 2 == 1) < 2:
-        expected_length = multinomial(sig) - len(nonStutterPermutations(sig))
-    else:
-        expected_length = multinomial(sig)
+    # there are no duplicates, the length is correct, and it is a path
+    expected_length = non_stutter_count(sig)
     return len(set(per)) == len(per) and len(per) == expected_length and pathQ(per)
 
 
@@ -590,10 +711,7 @@ def LargeHcycleQ(per: list[tuple[int, ...]], sig: tuple[int, ...]) -> bool:
     if len(per) <= 2:
         return False
     # there are no duplicates, the length is correct, and it is a cycle
-    if sum(1 for n in sig if n % 2 == 1) < 2:
-        expected_length = multinomial(sig) - len(nonStutterPermutations(sig))
-    else:
-        expected_length = multinomial(sig)
+    expected_length = non_stutter_count(sig)
     return len(set(per)) == len(per) and len(per) == expected_length and cycleQ(per)
 
 
@@ -0,0 +1,280 @@
+from typing import Iterator
+
+import numpy as np
+
+from core.helper_operations.permutation_graphs import multinomial
+
+INT64_MAX = np.iinfo(np.int64).max
+"""
+int: Largest rank that fits in the `int64` arrays used by the batched ranking functions.
+"""
+
+
+def _check_signature(sig: tuple[int, ...]) -> tuple[int, ...]:
+    """
+    Validates a signature and returns it as a tuple.
+
+    Args:
+        sig (tuple[int, ...]): The signature of the permutations.
+
+    Returns:
+        tuple[int, ...]: The signature as a tuple of integers.
+
+    Raises:
+        ValueError: If the signature contains negative integers.
+    """
+    if isinstance(sig, int):
+        sig = (sig,)
+    sig = tuple(int(n) for n in sig)
+    if any(n < 0 for n in sig):
+        raise ValueError(f"Signature must contain non-negative integers, got {sig}.")
+    return sig
+
+
+def _check_batch_size(sig: tuple[int, ...]) -> None:
+    """
+    Checks whether the ranks of signature `sig` can be computed in `int64` arithmetic.
+    The intermediate products are at most the number of permutations times the length of the permutations.
+
+    Args:
+        sig (tuple[int, ...]): The signature of the permutations.
+
+    Returns:
+        None: Only raises an error if the ranks do not fit.
+
+    Raises:
+        ValueError: If the intermediate products overflow an `int64`.
+    """
+    if multinomial(sig) * max(sum(sig), 1) > INT64_MAX:
+        raise ValueError(
+            f"Signature {sig} has too many permutations for int64 ranks, use `rank_permutation` instead."
+        )
+
+
+def rank_permutation(perm: tuple[int, ...], sig: tuple[int, ...]) -> int:
+    """
+    Computes the lexicographic rank of a permutation among all permutations with signature `sig`.
+    Runs in `O(n*k)` time where `n` is the length of the permutation and `k` the number of colors.
+    The permutation with rank 0 is the lexicographically smallest one, see ``multiset``.
+
+    Args:
+        perm (tuple[int, ...]): The permutation to rank.
+        sig (tuple[int, ...]): The signature of the permutation.
+
+    Returns:
+        int: The rank of `perm`, between 0 and `multinomial(sig) - 1`.
+
+    Raises:
+        ValueError: If `perm` is not a permutation of signature `sig`.
+
+    Example:
+        >>> rank_permutation((0, 1, 1, 0), (2, 2))
+        2
+    """
+    sig = _check_signature(sig)
+    counts = list(sig)
+    remaining = sum(sig)
+    if len(perm) != remaining:
+        raise ValueError(f"Permutation {perm} does not have signature {sig}.")
+    # number of permutations of the elements that are not placed yet
+    total = multinomial(sig)
+    rank = 0
+    for element in perm:
+        if not 0 <= element < len(counts) or counts[element] == 0:
+            raise ValueError(f"Permutation {perm} does not have signature {sig}.")
+        # skip all permutations that have a smaller element at this position
+        for color in range(element):
+            rank += total * counts[color] // remaining
+        total = total * counts[element] // remaining
+        counts[element] -= 1
+        remaining -= 1
+    return rank
+
+
+def unrank_permutation(rank: int, sig: tuple[int, ...]) -> tuple[int, ...]:
+    """
+    Computes the permutation with signature `sig` that has the given lexicographic rank.
+    This is the inverse of ``rank_permutation`` and also runs in `O(n*k)` time.
+
+    Args:
+        rank (int): The rank of the permutation, between 0 and `multinomial(sig) - 1`.
+        sig (tuple[int, ...]): The signature of the permutation.
+
+    Returns:
+        tuple[int, ...]: The permutation with the given rank.
+
+    Raises:
+        ValueError: If the rank is out of range for the signature.
+
+    Example:
+        >>> unrank_permutation(2, (2, 2))
+        (0, 1, 1, 0)
+    """
+    sig = _check_signature(sig)
+    total = multinomial(sig)
+    if not 0 <= rank < total:
+        raise ValueError(f"Rank {rank} out of range for signature {sig}.")
+    counts = list(sig)
+    remaining = sum(sig)
+    perm = []
+    for _ in range(sum(sig)):
+        for color, count in enumerate(counts):
+            if count == 0:
+                continue
+            block = total * count // remaining
+            if rank < block:
+                perm.append(color)
+                total = block
+                counts[color] -= 1
+                break
+            rank -= block
+        remaining -= 1
+    return tuple(perm)
+
+
+def rank_permutations(
+    perms: np.ndarray | list[tuple[int, ...]], sig: tuple[int, ...]
+) -> np.ndarray:
+    """
+    Batched version of ``rank_permutation``. Ranks every row of a 2-D array of permutations at once.
+
+    Args:
+        perms (np.ndarray | list[tuple[int, ...]]): The permutations, one per row, all with signature `sig`.
+        sig (tuple[int, ...]): The signature of the permutations.
+
+    Returns:
+        np.ndarray: An `int64` array with the rank of every permutation.
+
+    Raises:
+        ValueError: If a row is not a permutation of signature `sig`.
+        ValueError: If the ranks of the signature do not fit in `int64` arithmetic.
+    """
+    sig = _check_signature(sig)
+    _check_batch_size(sig)
+    n = sum(sig)
+    perms = np.asarray(perms, dtype=np.int64).reshape(-1, n)
+    rows = np.arange(len(perms))
+    counts = np.tile(np.array(sig, dtype=np.int64), (len(perms), 1))
+    total = np.full(len(perms), multinomial(sig), dtype=np.int64)
+    ranks = np.zeros(len(perms), dtype=np.int64)
+    if np.any((perms < 0) | (perms >= len(sig))):
+        raise ValueError(f"Permutations contain colors outside of signature {sig}.")
+    for i in range(n):
+        remaining = n - i
+        column = perms[:, i]
+        for color in range(len(sig)):
+            smaller = column > color
+            ranks[smaller] += total[smaller] * counts[smaller, color] // remaining
+        chosen = counts[rows, column]
+        if np.any(chosen == 0):
+            raise ValueError(f"Permutations do not all have signature {sig}.")
+        total = total * chosen // remaining
+        counts[rows, column] -= 1
+    return ranks
+
+
+def unrank_permutations(
+    ranks: np.ndarray | list[int], sig: tuple[int, ...]
+) -> np.ndarray:
+    """
+    Batched version of ``unrank_permutation``. Decodes an array of ranks into a 2-D array of permutations.
+
+    Args:
+        ranks (np.ndarray | list[int]): The ranks to decode.
+        sig (tuple[int, ...]): The signature of the permutations.
+
+    Returns:
+        np.ndarray: A 2-D `uint8` array with one permutation per row.
+
+    Raises:
+        ValueError: If a rank is out of range for the signature.
+        ValueError: If the ranks of the signature do not fit in `int64` arithmetic.
+    """
+    sig = _check_signature(sig)
+    _check_batch_size(sig)
+    n = sum(sig)
+    ranks = np.array(ranks, dtype=np.int64).reshape(-1)
+    if np.any((ranks < 0) | (ranks >= multinomial(sig))):
+        raise ValueError(f"Ranks out of range for signature {sig}.")
+    counts = np.tile(np.array(sig, dtype=np.int64), (len(ranks), 1))
+    total = np.full(len(ranks), multinomial(sig), dtype=np.int64)
+    perms = np.zeros((len(ranks), n), dtype=np.uint8)
+    for i in range(n):
+        remaining = n - i
+        undecided = np.ones(len(ranks), dtype=bool)
+        for color in range(len(sig)):
+            block = total * counts[:, color] // remaining
+            chosen = undecided & (ranks < block)
+            perms[chosen, i] = color
+            total[chosen] = block[chosen]
+            counts[chosen, color] -= 1
+            skipped = undecided & ~chosen
+            ranks[skipped] -= block[skipped]
+            undecided = skipped
+    return perms
+
+
+def permutation_chunks(
+    sig: tuple[int, ...], chunk_size: int = 65536
+) -> Iterator[np.ndarray]:
+    """
+    Batched version of ``multiset_permutations``. Generates all permutations with signature `sig`
+    in lexicographic order as 2-D `uint8` arrays of at most `chunk_size` rows, by unranking consecutive ranks.
+    Only one chunk is in memory at a time.
+
+    Args:
+        sig (tuple[int, ...]): The signature of the permutations.
+        chunk_size (int, optional): The maximum number of permutations per chunk. Defaults to 65536.
+
+    Returns:
+        Iterator[np.ndarray]: The chunks of permutations, one permutation per row.
+
+    Raises:
+        ValueError: If the chunk size is not positive.
+        ValueError: If the ranks of the signature do not fit in `int64` arithmetic.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be positive, got {chunk_size}.")
+    sig = _check_signature(sig)
+    _check_batch_size(sig)
+    total = multinomial(sig)
+    for start in range(0, total, chunk_size):
+        yield unrank_permutations(np.arange(start, min(start + chunk_size, total)), sig)
+
+
+def rank_path(path: list[tuple[int, ...]], sig: tuple[int, ...]) -> np.ndarray:
+    """
+    Compresses a path of permutations into an `int64` array of lexicographic ranks.
+    A rank takes 8 bytes, while a tuple of `n` integers takes roughly `56 + 8n` bytes.
+
+    Args:
+        path (list[tuple[int, ...]]): The path (or cycle) of permutations with signature `sig`.
+        sig (tuple[int, ...]): The signature of the permutations.
+
+    Returns:
+        np.ndarray: The ranks of the permutations in the order of the path.
+    """
+    if len(path) == 0:
+        return np.zeros(0, dtype=np.int64)
+    return rank_permutations(path, sig)
+
+
+def unrank_path(
+    ranks: np.ndarray, sig: tuple[int, ...], start: int = 0, stop: int | None = None
+) -> list[tuple[int, ...]]:
+    """
+    Decodes (a slice of) a path stored as ranks by ``rank_path`` back into a list of tuples.
+
+    Args:
+        ranks (np.ndarray): The ranks of the permutations in the path.
+        sig (tuple[int, ...]): The signature of the permutations.
+        start (int, optional): First index of the path to decode. Defaults to 0.
+        stop (int | None, optional): Index after the last index to decode. Defaults to the end of the path.
+
+    Returns:
+        list[tuple[int, ...]]: The permutations at positions `start` up to `stop` of the path.
+    """
+    ranks = np.asarray(ranks)[start:stop]
+    if len(ranks) == 0:
+        return []
+    return [tuple(p) for p in unrank_permutations(ranks, sig).tolist()]
@@ -1,11 +1,19 @@
 import argparse
 
+import numpy as np
+
 from core.connect_cycle_cover import get_connected_cycle_cover
-from core.helper_operations.path_operations import adjacent, cycleQ, pathQ
+from core.helper_operations.path_operations import (
+    adjacent,
+    cycleQ,
+    encode_swap_sequence,
+    pathQ,
+)
 from core.helper_operations.permutation_graphs import (
     HcycleQ,
     HpathQ,
     multinomial,
+    stutter_count,
     stutterPermutations,
 )
 
@@ -35,16 +43,25 @@ def order_path_to_stutter_start(
     return path
 
 
-def incorporate_stutters(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
+def incorporate_stutters(
+    sig: tuple[int, ...], swap_encoding: bool = False
+) -> tuple[list[tuple[int, ...]] | tuple[tuple[int, ...] | None, np.ndarray], str]:
     """
     Creates a cycle/path on the non-stutter permutations and then incorporates the stutters to create a Lehmer cycle/path.
     See the Notes for which signatures result in a path instead of a cycle.
 
     Args:
         sig (tuple[int, ...]): The input signature.
+        swap_encoding (bool, optional):
+            If the cycle/path should be returned as its first permutation and swap indices, see ``encode_swap_sequence``.
+            Defaults to False.
 
     Returns:
-        list[tuple[int, ...]]: The list of tuples representing the valid cycle/path on non-stutter permutations with the stutters incorporated.
+        tuple[list[tuple[int, ...]] | tuple[tuple[int, ...] | None, np.ndarray], str]:
+            A tuple of the path and a message:
+            - The list of tuples representing the valid cycle/path on non-stutter permutations with the stutters incorporated.
+              Or its swap encoding if `swap_encoding` is True.
+            - The message that describes whether the non-stutter permutations form a Hamiltonian cycle or path.
 
     Note:
         Some signatures do not result in a cycle but in a path, the signatures that result in a path are:\n
@@ -62,9 +79,13 @@ def incorporate_stutters(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     elif HpathQ(path, sig):
         # the \033[94m makes the text blue
         non_stutter_cycle = "\033[1m\033[94m A valid Hamiltonian path\033[0m\033[0m"
-    elif len(path) == 0 and len(stutterPermutations(sig)) > 0:
+    elif len(path) == 0 and stutter_count(sig) > 0:
         return (
-            stutterPermutations(sig),
+            (
+                encode_swap_sequence(stutterPermutations(sig))
+                if swap_encoding
+                else stutterPermutations(sig)
+            ),
             "\033[1m\033[91m Only stutter permutations were found\033[0m\033[0m",
         )
     else:
@@ -75,6 +96,8 @@ def incorporate_stutters(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     stutters = stutterPermutations(sig)
     print(f"There were {len(stutters)} stutters. {stutters} with signature {sig}.")
     if not stutters:
+        if swap_encoding:
+            return encode_swap_sequence(path), non_stutter_cycle
         return path, non_stutter_cycle
     path = order_path_to_stutter_start(path, stutters)
     result = []
@@ -89,6 +112,8 @@ def incorporate_stutters(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
                 stutters.remove(stutter)
         if not (adj and i == len(path) - 1):
             result.append(perm)
+    if swap_encoding:
+        return encode_swap_sequence(result), non_stutter_cycle
     return result, non_stutter_cycle
 
 
@@ -126,6 +151,6 @@ if __name__ == "__main__":
     print(f"Input signature: {sig} gave{lehmer_path}")
     print(
         f"There were {len(result)} permutations in the cycle/path. Which results in a defect of "
-        f"{len(result)}-{multinomial(sig)}={len(result)-multinomial(sig)} since there were {len(stutterPermutations(sig))} stutters."
+        f"{len(result)}-{multinomial(sig)}={len(result)-multinomial(sig)} since there were {stutter_count(sig)} stutters."
         f"The non-stutter permutations gave:{without_stutter_cycle}."
     )
@@ -6,10 +6,10 @@ from core.helper_operations.permutation_graphs import (
     count_inversions,
     graph,
     multinomial,
-    nonStutterPermutations,
+    non_stutter_count,
     pathQ,
     perm,
-    stutterPermutations,
+    stutter_count,
     total_path_motion,
 )
 from core.visualization import find_path_colors, plot_graph, visualize
@@ -97,11 +97,9 @@ def main():
         # Compute permutations using Lehmer's algorithm
         if args.lehmer:
             perms = perm(sig)
-            stutter = stutterPermutations(sig)
-            non_stutter = nonStutterPermutations(sig)
             print(
-                f"There are {multinomial(sig)} permutations and computed {len(perms)}, of which {len(stutter)} are "
-                f"stutters and {len(non_stutter)} are non-stutters"
+                f"There are {multinomial(sig)} permutations and computed {len(perms)}, of which {stutter_count(sig)} are "
+                f"stutters and {non_stutter_count(sig)} are non-stutters"
             )
 
         # Compute permutations using Rivertz's algorithm
@@ -1,8 +1,15 @@
 import argparse
+import gc
 import itertools
 import math
-from functools import cache
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, lru_cache
+from typing import Callable, Iterator
 
+import numpy as np
+
+from core.helper_operations.bounded_cache import bounded_cache
+from core.helper_operations.parallel import SharedArray, get_workers, split_range
 from core.helper_operations.path_operations import (
     adjacent,
     cutCycle,
@@ -12,6 +19,7 @@ from core.helper_operations.path_operations import (
     splitPathIn2,
     transform,
 )
+from core.helper_operations.perm_path import PermPath
 from core.helper_operations.permutation_graphs import defect, multinomial
 from core.steinhaus_johnson_trotter import SteinhausJohnsonTrotter
 from core.verhoeff import HpathNS
@@ -152,7 +160,7 @@ def _generate_all_di_prime(chain_p: tuple[int, ...]) -> list[tuple[int, ...]]:
     return d_all
 
 
-@cache
+@bounded_cache
 def lemma2_cycle(
     chain_p: tuple[int, ...], case_2_1: bool = True
 ) -> list[tuple[int, ...]]:
@@ -197,7 +205,7 @@ def lemma2_cycle(
     return cycle
 
 
-@cache
+@bounded_cache
 def lemma2_extended_path(
     chain_p: tuple[int, ...], case_2_1: bool = True
 ) -> list[tuple[int, ...]]:
@@ -304,7 +312,7 @@ def _lemma8_helper(
         return all_q, result
 
 
-@cache
+@bounded_cache
 def _lemma7_constructor(
     sig: tuple[int, ...],
 ) -> tuple[list[tuple[int, ...]], list[tuple[int, ...]]]:
@@ -387,7 +395,7 @@ def _cut_cycle_start_end(
     return cyc_cut
 
 
-@cache
+@bounded_cache
 def _lemma8_g_i_sub_graphs(
     k_q: tuple[int, ...], l_p: tuple[int, ...]
 ) -> list[list[tuple[int, ...]]]:
@@ -566,7 +574,7 @@ def _lemma9_glue_a_edges(
     return g_result_start
 
 
-@cache
+@bounded_cache
 def lemma8(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     """
     The graph `G=GE( ((0|1) k^q) | l^p) )` contains a Hamilton cycle for every `p, q > 0`
@@ -599,7 +607,7 @@ def lemma8(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     return g_result_start
 
 
-@cache
+@bounded_cache
 def lemma9(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     """
     The graph `G=GE( (k^r (0|1) k^s) | l^p) )` contains a Hamilton cycle for every `p, r+s > 0`.
@@ -680,150 +688,366 @@ def lemma9(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
         return cycle
 
 
-def _lemma10_subcycle_cutter(
-    cycle: list[tuple[int, ...]],
-    gi: list[tuple[int, ...]],
-    edge_i: tuple[tuple[int, ...], tuple[int, ...]],
-    edge_j: tuple[tuple[int, ...], tuple[int, ...]],
-) -> tuple[list[tuple[int, ...]], list[tuple[int, ...]]]:
+@bounded_cache
+def _lemma10_template(r: int, s: int, p: int) -> np.ndarray:
     """
-    Cuts the old cycle and gi (to add) to change them for Lemma 10 by Stachowiak.
-    We want to glue the `cycle` and `gi` together at the `edge_i` and `edge_j` nodes.
+    Computes the isomorphism template of the cycle `GE((k^r (0|1) k^s) | l^p)` from lemma 9, see ``_lemma10_gi``.
+    Every `G_i` of lemma 10 with its swap at position `r` is this cycle with its elements renamed.
+    The template holds for every element of the cycle the index of its new name in the vector `K_{2i} K_{2i+1} l`:\n
+    - The `k`-th element other than `l` in a row where 0 comes before 1 is renamed to `K_{2i}[k]`, so its index is `k`.
+    - The `k`-th element other than `l` in the other rows is renamed to `K_{2i+1}[k]`, so its index is `q + k`.
+    - The elements `l` keep their name, so their index is `2q`.
 
     Args:
-        cycle (list[tuple[int, ...]]): The old cycle to cut for lemma 10.
-        gi (list[tuple[int, ...]]): The subgraph to cut for lemma 10, will be added later.
-        edge_i (tuple[tuple[int, ...], tuple[int, ...]]):
-            The edge that should be at the start of gi, i.e. position 0 and 1 in `gi`.
-        edge_j (tuple[tuple[int, ...], tuple[int, ...]]):
-            The edge that should be the point at which the cycle is cut, i.e. position 0 and -1 in `cycle`.
+        r (int): The number of elements before the swap.
+        s (int): The number of elements after the swap.
+        p (int): The number of times the new color `l` occurs.
 
     Returns:
-         tuple[list[tuple[int, ...]], list[tuple[int, ...]]]:
-            The modified cycle and gi.\n
-            - The gi starts with `edge_i[0]` and `edge_i[1]` is the second node.
-            - The cycle starts with `edge_j[0]` and `edge_j[1]` is the last node.
-    """
-    ind_node_i = gi.index(edge_i[0])
-    # preparing gi so that node_i[0] the first and node_i[1] second in list
-    if gi[(ind_node_i + 1) % (len(gi) - 1)] == edge_i[1]:
-        gi = gi[ind_node_i:] + gi[:ind_node_i]
-    else:
-        gi.reverse()
-        ind_node_i = gi.index(edge_i[0])
-        gi = gi[ind_node_i:] + gi[:ind_node_i]
-
-    ind_node_j = cycle.index(edge_j[0])
-    # preparing the cycle (already glued ones) such that node_j[0] first and node_j[1] last in list
-    if ind_node_j + 1 == len(cycle):
-        # if cycle ends with node_j[0] and ends with node_j[1]
-        if cycle[0] == edge_j[1]:
-            cycle.reverse()
-        # if cycle ends with node_j[0] and node_j[1] is the second to last element (since they are always neighbors in the path)
-        else:
-            # move node_j[0] to the start and append the rest of the cycle
-            cycle = [cycle[-1]] + cycle[:-1]
-    elif cycle[ind_node_j + 1] == edge_j[1]:
-        # if node_j[1] is the second element in the cycle
-        # change cycle to start with node_j[1] and then append the part until node_j[0]. Then reverse the whole cycle
-        cycle = cycle[ind_node_j + 1 :] + cycle[: ind_node_j + 1]
-        cycle.reverse()
-    else:
-        # otherwise we have [node_j[1], node_j[0], ...] so we move node_j[0] to the start and append the part until node_j[1]
-        cycle = cycle[ind_node_j:] + cycle[:ind_node_j]
-    return cycle, gi
+        np.ndarray: The read-only template of shape `(len(lemma9((1, 1, r, s, p))), r + s + 2 + p)`.
+    """
+    g = PermPath.from_list(lemma9((1, 1, r, s, p))).buffer
+    q = r + s + 2
+    is_l = g == 3
+    zero_first = np.argmax(g == 0, axis=1) < np.argmax(g == 1, axis=1)
+    offset = np.where(zero_first, 0, q)[:, None]
+    template = np.where(is_l, 2 * q, np.cumsum(~is_l, axis=1) - 1 + offset)
+    template = template.astype(np.min_scalar_type(2 * q))
+    template.flags.writeable = False
+    return template
+
+
+def _lemma10_gi(
+    K: list[tuple[int, ...]] | PermPath, i: int, p: int, new_color: int
+) -> list[tuple[int, ...]] | PermPath:
+    """
+    Constructs the subgraph `G_i = GE(K_{2i} | l^p, K_{2i+1} | l^p)` of lemma 10, see ``_lemma10_helper``.
+    `G_i` is read from the template of the isomorphic cycle from lemma 9 with a single gather, see ``_lemma10_template``.
+
+    Args:
+        K (list[tuple[int, ...]] | PermPath): A Hamiltonian path in `Q` being `[K_1, K_2, ..., K_2n]`.
+        i (int): The index of the subgraph, `0 <= i < n`.
+        p (int): The length of the last part of the signature (`l^p`)
+        new_color (int): The new color to add to the graph (to transform `l^p`)
+
+    Returns:
+        list[tuple[int, ...]] | PermPath: The Hamiltonian cycle of `G_i`, a `PermPath` if `K` is a `PermPath`.
+    """
+    for j, item in enumerate(K[2 * i]):
+        # determining r and s - location of a swap
+        if item != K[2 * i + 1][j]:
+            r = j
+            s = len(K[2 * i]) - r - 2
+            break
+    # G_i is isomorphic to GE( (k^r (0|1) k^s) | l^p )
+    names = np.array(K[2 * i] + K[2 * i + 1] + (new_color,), dtype=np.uint8)
+    g = names[_lemma10_template(r, s, p)]
+    if isinstance(K, PermPath):
+        return PermPath(g)
+    return [tuple(row) for row in g.tolist()]
+
+
+def _lemma10_glue_edges(
+    K: list[tuple[int, ...]] | PermPath, i: int, l_p: tuple[int, ...]
+) -> tuple[tuple[tuple[int, ...], ...], tuple[tuple[int, ...], ...]] | None:
+    """
+    Finds the parallel edges at which `G_i` is glued to `G_{i-1}` in lemma 10, see ``_lemma10_helper``.
+
+    Args:
+        K (list[tuple[int, ...]] | PermPath): A Hamiltonian path in `Q` being `[K_1, K_2, ..., K_2n]`.
+        i (int): The index of the subgraph `G_i`, `0 < i < n`.
+        l_p (tuple[int, ...]): The new color `p` times.
+
+    Returns:
+        tuple[tuple[tuple[int, ...], ...], tuple[tuple[int, ...], ...]] | None:
+            The edge in `G_i` and the parallel edge in `G_{i-1}`, or None if neither the `a` nor the `b` edges are parallel.
+    """
+    # K_j = k_{j,1} k_{j,2} \dots k_{j,q}
+    # a_i = (l^p k_{2i}, l^{p-1} k_{2i,1} l k{2i,2} \dots k_{2i,q})
+    ai = (
+        l_p + K[2 * i],
+        l_p[:-1] + tuple([K[2 * i][0]]) + l_p[-1:] + K[2 * i][1:],
+    )
+    # b_i = (k_{2i} l^p, k_{2i,1} \dots k_{2i,q-1} l k_{2i,q} l^{p-1})
+    bi = (
+        K[2 * i] + l_p,
+        K[2 * i][:-1] + l_p[-1:] + tuple([K[2 * i][-1]]) + l_p[:-1],
+    )
+    # a_j = (l^p k_{2i-1}, l^{p-1} k_{2i-1,1} l k_{2i-1,2} \dots, k_{2i-1,q})
+    aj = (
+        l_p + K[2 * i - 1],
+        l_p[:-1] + tuple([K[2 * i - 1][0]]) + l_p[-1:] + K[2 * i - 1][1:],
+    )
+    # b_j = (k_{2i-1} l^p, k_{2i-1,1} \dots k_{2i-1,q-1} l k_{2i-1,q} l^{p-1})
+    bj = (
+        K[2 * i - 1] + l_p,
+        K[2 * i - 1][:-1] + l_p[-1:] + tuple([K[2 * i - 1][-1]]) + l_p[:-1],
+    )
+    # if K_j and K_{j+1} differ in the first pair of elements, a_j and a_{j+1} are parallel
+    if adjacent(ai[0], aj[0]) and adjacent(ai[1], aj[1]):
+        return ai, aj
+    # if K_j and K_{j+1} don't differ in the first pair of elements, b_j and b_{j+1} are parallel
+    elif adjacent(bi[0], bj[0]) and adjacent(bi[1], bj[1]):
+        return bi, bj
+    return None
 
 
 def _lemma10_helper(
-    K: list[tuple[int, ...]], p: int, new_color: int
-) -> list[tuple[int, ...]]:
+    K: list[tuple[int, ...]] | PermPath, p: int, new_color: int
+) -> list[tuple[int, ...]] | PermPath:
     """
     Helper function for lemma 10, constructs a cycle by adding color `new_color`, which occurs `p` times, to the graph
 
     Args:
-        K (list[tuple[int, ...]]):
+        K (list[tuple[int, ...]] | PermPath):
             A Hamiltonian path in `Q` being `[K_1, K_2, ..., K_2n]`.
+            If `K` is a `PermPath`, the `G_i` and the resulting cycle are `PermPath`s as well.
             Every K_i is isomorphic to some `G_i = G(K_{2i-1} | l^p, K_{2i} | l^p)` for `1 <= i <= n`.
             And every `G_i` is isomorphic to `G_i = G((k^r (0 | 1) k^s) | l^p)`, i.e. the graph from lemma 9.
         p (int): The length of the last part of the signature (`l^p`)
         new_color (int): The new color to add to the graph (to transform `l^p`)
 
     Returns:
-        list[tuple[int, ...]]: Hamiltonian cycle over `GE(Q | l^p)`
+        list[tuple[int, ...]] | PermPath: Hamiltonian cycle over `GE(Q | l^p)`
+
+    Raises:
+        ValueError: If two consecutive `G_i` have no parallel edges to glue them with.
+
+    Notes:
+        - The `G_i` are glued by reading the arcs of ``_lemma10_arcs`` from them with a single gather, in linear time.
+        - If more than one worker is set with ``parallel.set_workers``, the `G_i` are constructed in worker processes, see ``_lemma10_parallel``.
     """
+    workers = get_workers()
+    n = len(K) // 2
+    if workers > 1 and n > 1:
+        return _lemma10_parallel(K, p, new_color, workers)
+    if n == 1:
+        return _lemma10_gi(K, 0, p, new_color)
+    rows = PermPath.from_list(K)
     # G_i = GE(K_{2i-1} | l^p, K_{2i} | l^p) for 0 <= i <= n
-    G = []
+    G = [_lemma10_gi(rows, i, p, new_color) for i in range(n)]
+    arcs = _lemma10_arcs(rows, p, new_color, G.__getitem__)
+    cycle = np.concatenate(
+        [
+            G[i].buffer[_lemma10_arc_positions(len(G[i]), start, stop, step)]
+            for i, start, stop, step in arcs
+        ]
+    )
+    return _lemma10_cycle(K, cycle)
+
+
+def _lemma10_cycle(
+    K: list[tuple[int, ...]] | PermPath, cycle: np.ndarray
+) -> list[tuple[int, ...]] | PermPath:
+    """
+    Converts the cycle of ``_lemma10_helper`` to the type of `K`.
+
+    Args:
+        K (list[tuple[int, ...]] | PermPath): The Hamiltonian path in `Q` that the cycle was constructed from.
+        cycle (np.ndarray): The vertices of the cycle, one per row.
+
+    Returns:
+        list[tuple[int, ...]] | PermPath: The cycle as a `PermPath` if `K` is a `PermPath`, otherwise as a list of tuples.
+    """
+    if isinstance(K, PermPath):
+        return PermPath(cycle)
+    # the cycle consists of many new tuples, which would trigger the garbage collector over and over
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return [tuple(row) for row in cycle.tolist()]
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _lemma10_arc_positions(length: int, start: int, stop: int, step: int) -> np.ndarray:
+    """
+    Computes the positions of the part of a cycle from position `start` up to and including `stop`, walking in direction `step`.
+
+    Args:
+        length (int): The length of the cycle.
+        start (int): The position of the first vertex.
+        stop (int): The position of the last vertex.
+        step (int): 1 to walk forward through the cycle, -1 to walk backward.
+
+    Returns:
+        np.ndarray: The positions from `start` to `stop`.
+    """
+    count = ((stop - start) * step) % length + 1
+    return (start + step * np.arange(count)) % length
+
+
+def _lemma10_arcs(
+    K: PermPath, p: int, new_color: int, subgraph: Callable[[int], PermPath]
+) -> Iterator[tuple[int, int, int, int]]:
+    """
+    Computes the order in which the cycle of ``_lemma10_helper`` visits the subgraphs `G_i`, in linear time.
+
+    Gluing `G_i` to `G_{i-1}` replaces the edge `edge_j` of `G_{i-1}` and the edge `edge_i` of `G_i` by two cross edges,
+    so the cycle of ``_lemma10_helper`` walks from `G_{n-1}` down to `G_0` and back up again.
+    On the way down, every `G_i` is left at an end of its `edge_i` and only the positions of the rest of `G_i` are kept.
+    On the way up, those rests are visited in reverse order.
+
+    Args:
+        K (PermPath): A Hamiltonian path in `Q` being `[K_1, K_2, ..., K_2n]`, with `n > 1`.
+        p (int): The length of the last part of the signature (`l^p`)
+        new_color (int): The new color to add to the graph (to transform `l^p`)
+        subgraph (Callable[[int], PermPath]): Returns the cycle `G_i` for `i`, see ``_lemma10_gi``.
+
+    Returns:
+        Iterator[tuple[int, int, int, int]]:
+            The consecutive arcs of the cycle as `(i, start, stop, step)`,
+            the part of `G_i` from position `start` up to and including `stop` in direction `step`.
+
+    Raises:
+        ValueError: If two consecutive `G_i` have no parallel edges to glue them with.
+    """
+    n = len(K) // 2
     l_p = tuple([new_color] * p)
-    for i in range(len(K) // 2):
-        # Constructing cycles Ci taking graphs 'including' vertices on 2*i and 2*i+1 position
-        for j, item in enumerate(K[2 * i]):
-            # determining r and s - location of a swap
-            if item != K[2 * i + 1][j]:
-                r = j
-                s = len(K[2 * i]) - r - 2
-                break
-        # G_i is isomorphic to GE( (k^r (0|1) k^s) | l^p )
-        g = lemma9((1, 1, r, s, p))
-
-        g_modified = []
-        remove_color = 3
-        for item in g:
-            new_item = list(item)  # Convert item to a list
-            # smartly renaming permutations -> isomorphism, depending on order of 01/10 -
-            # tells us either to use 2*2 or 2*i+1
-            if new_item.index(0) < new_item.index(1):
-                k = 0
-                for j, it in enumerate(new_item):
-                    if it != remove_color:
-                        new_item[j] = K[2 * i][k]
-                        k += 1
-                    if it == remove_color:
-                        new_item[j] = new_color
-            else:
-                k = 0
-                for j, it in enumerate(new_item):
-                    if it != remove_color:
-                        new_item[j] = K[2 * i + 1][k]
-                        k += 1
-                    if it == remove_color:
-                        new_item[j] = new_color
-            g_modified.append(tuple(new_item))  # Convert item back to a tuple
-        G.append(g_modified)  # adding cycle to the list of G_i's
-
-    cycle = G[0]
-    # K_j = k_{j,1} k_{j,2} \dots k_{j,q}
-    for i, gi in enumerate(G[1:], start=1):
-        # a_i = (l^p k_{2i}, l^{p-1} k_{2i,1} l k{2i,2} \dots k_{2i,q})
-        ai = (
-            l_p + K[2 * i],
-            l_p[:-1] + tuple([K[2 * i][0]]) + l_p[-1:] + K[2 * i][1:],
-        )
-        # b_i = (k_{2i} l^p, k_{2i,1} \dots k_{2i,q-1} l k_{2i,q} l^{p-1})
-        bi = (
-            K[2 * i] + l_p,
-            K[2 * i][:-1] + l_p[-1:] + tuple([K[2 * i][-1]]) + l_p[:-1],
-        )
-        # a_j = (l^p k_{2i-1}, l^{p-1} k_{2i-1,1} l k_{2i-1,2} \dots, k_{2i-1,q})
-        aj = (
-            l_p + K[2 * i - 1],
-            l_p[:-1] + tuple([K[2 * i - 1][0]]) + l_p[-1:] + K[2 * i - 1][1:],
-        )
-        # b_j = (k_{2i-1} l^p, k_{2i-1,1} \dots k_{2i-1,q-1} l k_{2i-1,q} l^{p-1})
-        bj = (
-            K[2 * i - 1] + l_p,
-            K[2 * i - 1][:-1] + l_p[-1:] + tuple([K[2 * i - 1][-1]]) + l_p[:-1],
+    glue = _lemma10_glue_edges(K, n - 1, l_p)
+    # the cycle starts in G_{n-1} and continues in G_{n-2} at the end of its glue edge
+    first = subgraph(n - 1).index(glue[0][0])
+    yield n - 1, first, first, 1
+    # the vertex at which the next G_i is entered and its neighbor in the removed edge
+    entry = glue[1]
+    rests = []
+    for i in range(n - 2, -1, -1):
+        gi = subgraph(i)
+        glue = _lemma10_glue_edges(K, i, l_p) if i > 0 else None
+        if i > 0 and glue is None:
+            raise ValueError(f"G_{i} and G_{i - 1} have no parallel edges")
+        edges = list(entry) + ([] if glue is None else list(glue[0]))
+        positions = gi.positions(edges).tolist()
+        # walk through gi away from the other end of the edge at which gi was entered
+        enter, other = positions[:2]
+        step = 1 if other == (enter - 1) % len(gi) else -1
+        if glue is None:
+            yield i, enter, other, step
+            break
+        # leave gi at the end of its glue edge that comes first
+        distances = [((q - enter) * step) % len(gi) for q in positions[2:]]
+        leave = 0 if distances[0] < distances[1] else 1
+        yield i, enter, positions[2 + leave], step
+        rests.append((positions[3 - leave], other, step))
+        entry = (glue[1][leave], glue[1][1 - leave])
+    # walk back up through the rests of the G_i and end in G_{n-1}
+    for i, (start, stop, step) in zip(range(1, n - 1), reversed(rests)):
+        yield i, start, stop, step
+    gi = subgraph(n - 1)
+    glue = _lemma10_glue_edges(K, n - 1, l_p)
+    enter, other = gi.positions([glue[0][1], glue[0][0]]).tolist()
+    step = 1 if other == (enter - 1) % len(gi) else -1
+    yield n - 1, enter, (other - step) % len(gi), step
+
+
+def _lemma10_helper_segments(
+    K: list[tuple[int, ...]] | PermPath, p: int, new_color: int
+) -> Iterator[list[tuple[int, ...]]]:
+    """
+    Generator form of ``_lemma10_helper``: yields the same cycle in segments, holding only one `G_i` at a time.
+    The segments are the arcs of ``_lemma10_arcs``, the `G_i` that are visited twice are constructed twice.
+
+    Args:
+        K (list[tuple[int, ...]] | PermPath): A Hamiltonian path in `Q` being `[K_1, K_2, ..., K_2n]`.
+        p (int): The length of the last part of the signature (`l^p`)
+        new_color (int): The new color to add to the graph (to transform `l^p`)
+
+    Returns:
+        Iterator[list[tuple[int, ...]]]: The consecutive segments of the Hamiltonian cycle over `GE(Q | l^p)`.
+
+    Raises:
+        ValueError: If two consecutive `G_i` have no parallel edges to glue them with.
+    """
+    if len(K) // 2 == 1:
+        yield list(_lemma10_gi(K, 0, p, new_color))
+        return
+    K = PermPath.from_list(K)
+    # keep the last constructed G_i, which is used by _lemma10_arcs and then read here
+    subgraph = lru_cache(maxsize=1)(lambda i: _lemma10_gi(K, i, p, new_color))
+    for i, start, stop, step in _lemma10_arcs(K, p, new_color, subgraph):
+        gi = subgraph(i)
+        positions = _lemma10_arc_positions(len(gi), start, stop, step)
+        yield [tuple(row) for row in gi.buffer[positions].tolist()]
+
+
+def _lemma10_build_subgraphs(
+    spec: tuple[str, tuple[int, ...], str],
+    start: int,
+    K: np.ndarray,
+    p: int,
+    new_color: int,
+) -> None:
+    """
+    Constructs consecutive subgraphs `G_i` of lemma 10 in a worker process, into a shared array. See ``_lemma10_parallel``.
+
+    Args:
+        spec (tuple[str, tuple[int, ...], str]): The spec of the shared array of shape `(n, len(G_i), q + p)`.
+        start (int): The index `i` of the first subgraph to construct.
+        K (np.ndarray): The rows `K_{2i}` and `K_{2i+1}` of the subgraphs to construct.
+        p (int): The length of the last part of the signature (`l^p`)
+        new_color (int): The new color to add to the graph (to transform `l^p`)
+
+    Returns:
+        None: The subgraphs are written into the shared array.
+    """
+    shared = SharedArray.attach(spec)
+    try:
+        for i in range(len(K) // 2):
+            pair = PermPath(K[2 * i : 2 * i + 2])
+            shared.array[start + i] = _lemma10_gi(pair, 0, p, new_color).buffer
+    finally:
+        shared.close()
+
+
+def _lemma10_parallel(
+    K: list[tuple[int, ...]] | PermPath, p: int, new_color: int, workers: int
+) -> list[tuple[int, ...]] | PermPath:
+    """
+    Computes ``_lemma10_helper`` with the subgraphs `G_i` constructed concurrently by `workers` processes.
+    Every `G_i` has `2 * (q + p choose p)` vertices, so the workers write them into one shared array instead of returning them.
+    The `G_i` are then glued by reading the arcs of ``_lemma10_arcs`` from the shared array with a single gather.
+
+    Args:
+        K (list[tuple[int, ...]] | PermPath): A Hamiltonian path in `Q` being `[K_1, K_2, ..., K_2n]`, with `n > 1`.
+        p (int): The length of the last part of the signature (`l^p`)
+        new_color (int): The new color to add to the graph (to transform `l^p`)
+        workers (int): The number of worker processes.
+
+    Returns:
+        list[tuple[int, ...]] | PermPath: The Hamiltonian cycle of ``_lemma10_helper``.
+    """
+    rows = PermPath.from_list(K)
+    n = len(K) // 2
+    width = rows.width + p
+    size = 2 * math.comb(width, p)
+    with SharedArray((n, size, width), np.uint8) as shared:
+        with ProcessPoolExecutor(workers) as pool:
+            jobs = [
+                pool.submit(
+                    _lemma10_build_subgraphs,
+                    shared.spec,
+                    part.start,
+                    rows.buffer[2 * part.start : 2 * part.stop],
+                    p,
+                    new_color,
+                )
+                for part in split_range(n, workers)
+            ]
+            for job in jobs:
+                job.result()
+        arcs = _lemma10_arcs(rows, p, new_color, lambda i: PermPath(shared.array[i]))
+        positions = np.concatenate(
+            [
+                i * size + _lemma10_arc_positions(size, start, stop, step)
+                for i, start, stop, step in arcs
+            ]
         )
-        # if K_j and K_{j+1} differ in the first pair of elements, a_j and a_{j+1} are parallel
-        if adjacent(ai[0], aj[0]) and adjacent(ai[1], aj[1]):
-            cycle, gi = _lemma10_subcycle_cutter(cycle, gi, ai, aj)
-        # if K_j and K_{j+1} don't differ in the first pair of elements, b_j and b_{j+1} are parallel
-        elif adjacent(bi[0], bj[0]) and adjacent(bi[1], bj[1]):
-            cycle, gi = _lemma10_subcycle_cutter(cycle, gi, bi, bj)
-        cycle = [gi[0]] + cycle + gi[1:]
-    return cycle
+        cycle = shared.array.reshape(-1, width)[positions]
+    return _lemma10_cycle(K, cycle)
 
 
-@cache
+@bounded_cache
 def lemma10(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     """
     Computes Lemma 10 by Stachowiak:
@@ -850,7 +1074,7 @@ def lemma10(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     return cycle
 
 
-@cache
+@bounded_cache
 def lemma11(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     """
     Finds a Hamiltonian cycle in a graph using Lemma 11 from Stachowiak's paper:
@@ -902,8 +1126,28 @@ def lemma11(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
     if sig != sorted_sig:
         # return that solution given by this lemma (transformed, if needed)
         return transform(lemma11(sorted_sig), transformer)
+    path, next_color = _lemma11_start(sig)
+    for ind, new_color in enumerate(sig[next_color:], start=next_color):
+        cycle = _lemma10_helper(path, new_color, ind)
+        path = cycle
+    return path
+
+
+def _lemma11_start(sig: tuple[int, ...]) -> tuple[list[tuple[int, ...]], int]:
+    """
+    Finds the Hamiltonian path `K` on the first colors of a well-ordered signature, to which lemma 11 adds the other colors.
+
+    Args:
+        sig (tuple[int, ...]): A signature of which the first two elements are the largest odd numbers, see ``lemma11``.
+
+    Returns:
+        tuple[list[tuple[int, ...]], int]: The Hamiltonian path and the first color that is not in it.
+
+    Raises:
+        ValueError: There are no elements that can form a Hamiltonian path.
+    """
     # if the first two elements in the signature can form a cycle (so more than two permutations)
-    elif sum(sig[:2]) > 2:
+    if sum(sig[:2]) > 2:
         # Verhoeff's Theorem to find this cycle (or path if one of the elements is 1)
         path = HpathNS(sig[0], sig[1])  # K in the paper
         next_color = 2
@@ -914,9 +1158,8 @@ def lemma11(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
             next_color = sig.index(next(x for x in sig if x != 1))
         except StopIteration:
             next_color = len(list(sig))  # all elements are 1
-        path = SteinhausJohnsonTrotter.get_sjt_permutations(
-            SteinhausJohnsonTrotter(), next_color
-        )
+        sjt = SteinhausJohnsonTrotter().get_sjt_array(next_color)
+        path = [tuple(perm) for perm in sjt.tolist()]
     elif sig[2] != 0:
         # use Stachowiak's lemma 2 to find a Hamiltonian path in GE(Q|P[1])
         path = lemma2_extended_path(tuple([2] * sig[2]))
@@ -925,10 +1168,69 @@ def lemma11(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
         raise ValueError(
             "q = |Q| > 2 and GE(Q) has an even number of vertices is required for Lemma 11"
         )
-    for ind, new_color in enumerate(sig[next_color:], start=next_color):
-        cycle = _lemma10_helper(path, new_color, ind)
-        path = cycle
-    return path
+    return path, next_color
+
+
+def lemma10_segments(sig: tuple[int, ...]) -> Iterator[list[tuple[int, ...]]]:
+    """
+    Generator form of ``lemma10``: yields the same Hamiltonian cycle in consecutive segments.
+    Only one subgraph `G_i` of the cycle is in memory at a time, see ``_lemma10_helper_segments``.
+
+    Args:
+        sig (tuple[int, ...]): The signature of the graph, see ``lemma10``.
+
+    Returns:
+        Iterator[list[tuple[int, ...]]]: The consecutive segments of the Hamiltonian cycle of ``lemma10``.
+
+    Raises:
+        AssertionError: If the signature is not well-formed, see ``lemma10``.
+    """
+    assert sig[0] + sig[1] > 2 and sig[0] % 2 == 1 and sig[1] % 2 == 1
+    yield from _lemma10_helper_segments(HpathNS(sig[0], sig[1]), sig[2], 2)
+
+
+def lemma11_segments(sig: tuple[int, ...]) -> Iterator[list[tuple[int, ...]]]:
+    """
+    Generator form of ``lemma11``: yields the same Hamiltonian cycle in consecutive segments.
+    The cycle on all but the last color is constructed as by ``lemma11``,
+    the last color is added with ``_lemma10_helper_segments`` which holds only one subgraph `G_i` at a time.
+    This makes it possible to write the cycles of large signatures to disk without constructing them in memory,
+    for example with ``PathStore.save_segments``.
+
+    Args:
+        sig (tuple[int, ...]): A signature with at least two odd numbers, see ``lemma11``.
+
+    Returns:
+        Iterator[list[tuple[int, ...]]]: The consecutive segments of the Hamiltonian cycle of ``lemma11``.
+
+    Raises:
+        ValueError: If the signature is empty.
+        ValueError: There are no elements that can form a Hamiltonian path.
+
+    Example:
+        >>> [len(segment) for segment in lemma11_segments((1, 1, 3))]
+        [1, 10, 9]
+    """
+    sig = tuple(sig)
+    if len(sig) < 3 or sum(1 for n in sig if n % 2 == 1) < 2:
+        # there is no color to add, the errors are raised by lemma 11
+        cycle = lemma11(sig)
+        if len(cycle) > 0:
+            yield cycle
+        return
+    sorted_sig, transformer = get_transformer(sig, lambda x: [x[0] % 2, x[0]])
+    if sig != sorted_sig:
+        for segment in lemma11_segments(sorted_sig):
+            yield transform(segment, transformer)
+        return
+    path, next_color = _lemma11_start(sig)
+    colors = list(enumerate(sig[next_color:], start=next_color))
+    if len(colors) == 0:
+        yield path
+        return
+    for ind, new_color in colors[:-1]:
+        path = _lemma10_helper(path, new_color, ind)
+    yield from _lemma10_helper_segments(path, colors[-1][1], colors[-1][0])
 
 
 if __name__ == "__main__":
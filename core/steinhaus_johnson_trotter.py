@@ -1,4 +1,7 @@
 import math
+from typing import Iterator
+
+import numpy as np
 
 
 class SteinhausJohnsonTrotter:
@@ -91,27 +94,107 @@ class SteinhausJohnsonTrotter:
         print(
             f"\033[1m\033[92mSTEINHAUS-JOHNSON-TROTTER USED FOR SIGNATURE {(1,) * n} \033[0m\033[0m"
         )
-        perms = []
-        a = [i for i in range(n)]
-        perms.append(tuple(a.copy()))
-        dir = [self.RIGHT_TO_LEFT for i in range(n)]
-
-        for i in range(1, math.factorial(n)):
-            mobile = self.getMobile(a, dir, n)
-            pos = self.searchArr(a, n, mobile)
-
-            if dir[a[pos - 1] - 1] == self.RIGHT_TO_LEFT:
-                a[pos - 1], a[pos - 2] = a[pos - 2], a[pos - 1]
-
-            elif dir[a[pos - 1] - 1] == self.LEFT_TO_RIGHT:
-                a[pos], a[pos - 1] = a[pos - 1], a[pos]
-
-            for i in range(n):
-                if a[i] > mobile:
-                    if dir[a[i] - 1] == self.LEFT_TO_RIGHT:
-                        dir[a[i] - 1] = self.RIGHT_TO_LEFT
-                    elif dir[a[i] - 1] == self.RIGHT_TO_LEFT:
-                        dir[a[i] - 1] = self.LEFT_TO_RIGHT
-
-            perms.append(tuple(a.copy()))
-        return perms
+        return list(self.iter_sjt_permutations(n))
+
+    def iter_sjt_swaps(self, n: int) -> Iterator[int]:
+        """
+        Generates the adjacent swaps of the Steinhaus-Johnson-Trotter algorithm, using Even's speedup.
+        Every element has a direction, and the position of every element is kept in an inverse array,
+        so the largest mobile element is found without searching the permutation.
+        The largest element moves in all but one of every `n` steps, so a permutation takes O(1) amortized time.
+
+        Args:
+            n (int): The number of elements in the permutation.
+
+        Returns:
+            Iterator[int]: The index `i` of every swap of the elements at positions `i` and `i + 1`, `n! - 1` swaps in total.
+
+        References:
+            - Shimon Even. Algorithmic Combinatorics. Macmillan, 1973.
+        """
+        a = list(range(n))
+        position = list(range(n))
+        # the direction in which every element moves, 0 if it is not mobile
+        direction = [0] + [-1] * (n - 1)
+        while True:
+            # the largest mobile element
+            mobile = n - 1
+            while mobile >= 0 and direction[mobile] == 0:
+                mobile -= 1
+            if mobile < 0:
+                return
+            i = position[mobile]
+            j = i + direction[mobile]
+            other = a[j]
+            a[i], a[j] = other, mobile
+            position[mobile], position[other] = j, i
+            yield min(i, j)
+            # the element stops at the end of the permutation, or in front of a larger element
+            k = j + direction[mobile]
+            if k < 0 or k == n or a[k] > mobile:
+                direction[mobile] = 0
+            # all larger elements move towards the element that moved
+            for larger in range(mobile + 1, n):
+                direction[larger] = 1 if position[larger] < j else -1
+
+    def iter_sjt_permutations(self, n: int) -> Iterator[tuple[int, ...]]:
+        """
+        Generates the permutations of the Steinhaus-Johnson-Trotter algorithm one at a time, see ``iter_sjt_swaps``.
+
+        Args:
+            n (int): The number of elements in the permutation.
+
+        Returns:
+            Iterator[tuple[int, ...]]: The permutations in the same order as ``get_sjt_permutations``.
+
+        Example:
+            >>> list(SteinhausJohnsonTrotter().iter_sjt_permutations(3))
+            [(0, 1, 2), (0, 2, 1), (2, 0, 1), (2, 1, 0), (1, 2, 0), (1, 0, 2)]
+        """
+        a = list(range(n))
+        yield tuple(a)
+        for i in self.iter_sjt_swaps(n):
+            a[i], a[i + 1] = a[i + 1], a[i]
+            yield tuple(a)
+
+    def get_sjt_array(self, n: int, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Computes all permutations of the Steinhaus-Johnson-Trotter algorithm at once, as the rows of an array.
+        The permutations of `m + 1` elements are the permutations of `m` elements with `m` inserted at every position,
+        from right to left for the even and from left to right for the odd permutations of `m` elements.
+        Every insertion position is filled for all permutations at once.
+
+        Args:
+            n (int): The number of elements in the permutation.
+            out (np.ndarray | None, optional): A preallocated array of shape `(n!, n)` to fill. Defaults to a new `uint8` array.
+
+        Returns:
+            np.ndarray: The permutations in the same order as ``get_sjt_permutations``.
+
+        Raises:
+            ValueError: If `out` is not a contiguous array of shape `(n!, n)`.
+
+        Example:
+            >>> SteinhausJohnsonTrotter().get_sjt_array(3).tolist()
+            [[0, 1, 2], [0, 2, 1], [2, 0, 1], [2, 1, 0], [1, 2, 0], [1, 0, 2]]
+        """
+        shape = (math.factorial(n), n)
+        if out is None:
+            out = np.empty(shape, dtype=np.uint8)
+        elif out.shape != shape or not out.flags.c_contiguous:
+            raise ValueError(f"Expected a contiguous array of shape {shape}")
+        perms = np.zeros((1, 0), dtype=out.dtype)
+        for m in range(n):
+            extended = (
+                out.reshape(len(perms), m + 1, m + 1)
+                if m == n - 1
+                else np.empty((len(perms), m + 1, m + 1), dtype=out.dtype)
+            )
+            for k in range(m + 1):
+                # the position of m in the k-th extension of the even and the odd permutations
+                for rows, t in ((slice(0, None, 2), m - k), (slice(1, None, 2), k)):
+                    extended[rows, k, :t] = perms[rows, :t]
+                    extended[rows, k, t] = m
+                    extended[rows, k, t + 1 :] = perms[rows, t:]
+            perms = extended.reshape(-1, m + 1)
+        return out
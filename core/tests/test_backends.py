@@ -0,0 +1,105 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core import backends
+from core.backends import (
+    Backend,
+    HpathNS,
+    available_backends,
+    current_backend,
+    lemma11,
+    register_backend,
+    sjt_permutations,
+    stutterPermutations,
+    use,
+    using,
+)
+from core.cycle_cover import generate_cycle_cover
+from core.helper_operations.permutation_graphs import (
+    stutterPermutations as tuple_stutterPermutations,
+)
+from core.stachowiak import lemma11 as tuple_lemma11
+from core.steinhaus_johnson_trotter import SteinhausJohnsonTrotter
+from core.verhoeff import HpathNS as tuple_HpathNS
+
+BACKENDS = ["tuple", "list", "numpy", "bits", "auto"]
+
+
+class TestBackends:
+    # Class that tests the backend registry of core.backends
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @pytest.mark.parametrize("k", [(0, 0), (1, 4), (3, 3), (4, 4), (6, 5), (5, 6)])
+    def test_HpathNS(self, backend, k):
+        path = HpathNS(*k, backend=backend)
+        assert path == tuple_HpathNS(*k)
+        assert all(isinstance(perm, tuple) for perm in path)
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @pytest.mark.parametrize("sig", [(1, 1, 2), (3, 3, 2), (1, 3, 2)])
+    def test_lemma11(self, backend, sig):
+        assert lemma11(sig, backend=backend) == tuple_lemma11(sig)
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @pytest.mark.parametrize("sig", [(4, 6), (3, 4), (2, 2, 2), (3, 4, 2), (5,)])
+    def test_stutterPermutations(self, backend, sig):
+        assert stutterPermutations(sig, backend=backend) == tuple_stutterPermutations(
+            sig
+        )
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @pytest.mark.parametrize("n", [1, 3, 5])
+    def test_sjt_permutations(self, backend, n):
+        expected = SteinhausJohnsonTrotter().get_sjt_permutations(n)
+        assert sjt_permutations(n, backend=backend) == expected
+
+    def test_use(self):
+        assert current_backend() == "tuple"
+        with using("numpy"):
+            assert current_backend() == "numpy"
+            assert HpathNS(4, 3) == tuple_HpathNS(4, 3)
+        assert current_backend() == "tuple"
+        with pytest.raises(ValueError):
+            use("fortran")
+        with pytest.raises(ValueError):
+            HpathNS(4, 3, backend="fortran")
+        assert current_backend() == "tuple"
+
+    def test_use_per_thread(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with using("numpy"):
+                # a new thread starts with the default backend, not the one of this thread
+                assert executor.submit(current_backend).result() == "tuple"
+            executor.submit(use, "list").result()
+            assert executor.submit(current_backend).result() == "list"
+        assert current_backend() == "tuple"
+
+    def test_auto(self):
+        assert backends._auto("HpathNS", 3, 3).name == "tuple"
+        assert backends._auto("HpathNS", 10, 10).name == "bits"
+        assert backends._auto("HpathNS", 40, 40).name == "tuple"
+        assert backends._auto("stutterPermutations", (30, 30)).name == "bits"
+        assert backends._auto("stutterPermutations", (30, 30, 2)).name == "tuple"
+        assert backends._auto("lemma11", (3, 3, 2)).name == "tuple"
+
+    def test_register_backend(self):
+        calls = []
+
+        def hpath(k0, k1):
+            calls.append((k0, k1))
+            return [list(perm) for perm in tuple_HpathNS(k0, k1)]
+
+        register_backend(Backend("custom", HpathNS=hpath))
+        assert "custom" in available_backends()
+        assert HpathNS(3, 2, backend="custom") == tuple_HpathNS(3, 2)
+        # the custom backend does not implement lemma11, so the tuple backend computes it
+        assert lemma11((1, 1, 2), backend="custom") == tuple_lemma11((1, 1, 2))
+        assert calls == [(3, 2)]
+        with pytest.raises(ValueError):
+            register_backend(Backend("auto"))
+
+    @pytest.mark.parametrize("backend", ["list", "auto"])
+    def test_cycle_cover(self, backend):
+        expected = generate_cycle_cover.__wrapped__((4, 3, 2))
+        with using(backend):
+            assert generate_cycle_cover.__wrapped__((4, 3, 2)) == expected
@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+
+from core.helper_operations.bit_path import BitPath
+from core.helper_operations.path_operations import (
+    createSquareTube,
+    createZigZagPath,
+    cutCycle,
+    cycleQ,
+    pathQ,
+    transform,
+)
+from core.helper_operations.perm_path import PermPath
+from core.helper_operations.permutation_graphs import (
+    extend,
+    incorporateSpursInZigZag,
+    rotate,
+    stutterPermutations,
+)
+from core.verhoeff import HpathNS, HpathNS_bit_path
+
+
+class TestBitPath:
+    # Class that tests the helper_operations.bit_path module
+    path = [(0, 0, 1, 1), (0, 1, 0, 1), (1, 0, 0, 1), (1, 0, 1, 0)]
+
+    def test_round_trip(self):
+        bit_path = BitPath.from_list(self.path)
+        assert bit_path.buffer.dtype == np.uint64
+        assert bit_path.buffer.tolist() == [3, 5, 9, 10]
+        assert bit_path.to_list() == self.path
+        assert list(bit_path) == self.path
+        rows = PermPath.from_list(self.path).buffer
+        assert BitPath.from_rows(rows) == self.path
+        assert np.array_equal(bit_path.to_rows(), rows)
+
+    def test_empty(self):
+        bit_path = BitPath.from_list([], 3)
+        assert len(bit_path) == 0
+        assert bit_path.width == 3
+        assert bit_path.to_list() == []
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            BitPath(np.zeros((3, 2)), 2)
+        with pytest.raises(ValueError):
+            BitPath.from_list([(0, 1, 2)])
+        with pytest.raises(ValueError):
+            BitPath.from_list([(0, 1) * 33])
+
+    def test_getitem(self):
+        bit_path = BitPath.from_list(self.path)
+        assert bit_path[1] == (0, 1, 0, 1)
+        assert bit_path[-1] == (1, 0, 1, 0)
+        assert isinstance(bit_path[1:], BitPath)
+        assert bit_path[::-1] == self.path[::-1]
+
+    def test_concatenate(self):
+        bit_path = BitPath.from_list(self.path)
+        assert (bit_path[:2] + bit_path[2:]) == self.path
+        assert (bit_path + [(1, 1, 0, 0)]) == self.path + [(1, 1, 0, 0)]
+        assert ([(1, 1, 0, 0)] + bit_path) == [(1, 1, 0, 0)] + self.path
+
+    def test_equality(self):
+        bit_path = BitPath.from_list(self.path)
+        assert bit_path == self.path
+        assert self.path == bit_path
+        assert bit_path != self.path[1:]
+        assert bit_path != self.path[::-1]
+        assert bit_path != [(0, 1, 2, 3)] * 4
+
+    def test_index_and_contains(self):
+        bit_path = BitPath.from_list(self.path)
+        assert bit_path.index((1, 0, 0, 1)) == 2
+        assert (1, 0, 0, 1) in bit_path
+        assert (1, 1, 0, 0) not in bit_path
+        assert (1, 0, 2, 1) not in bit_path
+        with pytest.raises(ValueError):
+            bit_path.index((1, 1, 0, 0))
+        assert bit_path.positions(
+            [(1, 0, 1, 0), (1, 1, 0, 0), (0, 0, 1, 1)]
+        ).tolist() == [3, -1, 0]
+
+    def test_path_and_cycle_check(self):
+        assert pathQ(BitPath.from_list(self.path))
+        assert not pathQ(BitPath.from_list(self.path[::2]), verbose=False)
+        assert not pathQ(BitPath.from_list([(0, 1, 1), (1, 1, 0)]))
+        assert not pathQ(BitPath.from_list([(0, 1, 1), (0, 1, 1)]))
+        assert cycleQ(BitPath.from_list(HpathNS(4, 4)))
+        assert not cycleQ(BitPath.from_list(self.path))
+
+    @pytest.mark.parametrize("n", [0, 1, 3, 4])
+    def test_rotate(self, n):
+        assert rotate(BitPath.from_list(self.path), n) == rotate(self.path, n)
+
+    def test_extend(self):
+        assert extend(BitPath.from_list(self.path), (1, 0)) == extend(self.path, (1, 0))
+
+    @pytest.mark.parametrize("tr", [[1, 0], [0, 1], [1, 1]])
+    def test_transform(self, tr):
+        assert transform(BitPath.from_list(self.path), tr) == transform(self.path, tr)
+        with pytest.raises(ValueError):
+            transform(BitPath.from_list(self.path), [4, 5])
+
+    def test_cut_cycle(self):
+        cycle = HpathNS(4, 2)
+        assert cutCycle(BitPath.from_list(cycle), cycle[5]) == cutCycle(cycle, cycle[5])
+
+    def test_zigzag(self):
+        expected = createZigZagPath(self.path, (0, 1), (1, 0))
+        assert (
+            createZigZagPath(BitPath.from_list(self.path), (0, 1), (1, 0)) == expected
+        )
+
+    def test_square_tube(self):
+        expected = createSquareTube(self.path, (0, 1), (1, 0))
+        assert (
+            createSquareTube(BitPath.from_list(self.path), (0, 1), (1, 0)) == expected
+        )
+
+    def test_incorporate_spurs(self):
+        # the spurs of the odd-odd case of HpathNS(5, 5)
+        ext_path = extend(cutCycle(HpathNS(4, 2), (0, 0, 0, 1, 1, 0)), (1, 1))
+        path = rotate(createZigZagPath(ext_path, (1, 0), (0, 1)), 1)
+        stutters = extend(stutterPermutations((4, 2)), (1, 1))
+        expected = incorporateSpursInZigZag(path, stutters, [(0, 1), (1, 0)], 2)
+        result = incorporateSpursInZigZag(
+            BitPath.from_list(path), stutters, [(0, 1), (1, 0)], 2
+        )
+        assert isinstance(result, BitPath)
+        assert result == expected
+
+    def test_incorporate_spurs_missing_base(self):
+        path = BitPath.from_list(self.path)
+        with pytest.raises(ValueError):
+            incorporateSpursInZigZag(path, [(1, 1)], [(0, 1), (1, 0)])
+
+    @pytest.mark.parametrize("k0", range(0, 9))
+    @pytest.mark.parametrize("k1", range(0, 9))
+    def test_stutter_permutations(self, k0, k1):
+        assert BitPath.stutter_permutations((k0, k1)) == stutterPermutations((k0, k1))
+        assert BitPath.stutter_permutations((k0,)) == stutterPermutations((k0,))
+
+
+class TestHpathNSBitPath:
+    # Class that tests the BitPath version of Verhoeff's construction
+    @pytest.mark.parametrize("k0", range(0, 11))
+    @pytest.mark.parametrize("k1", range(0, 11))
+    def test_same_as_hpath_ns(self, k0, k1):
+        bit_path = HpathNS_bit_path(k0, k1)
+        assert isinstance(bit_path, BitPath)
+        assert bit_path.to_list() == HpathNS(k0, k1)
+
+    def test_too_wide(self):
+        with pytest.raises(ValueError):
+            HpathNS_bit_path(33, 32)
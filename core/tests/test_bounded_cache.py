@@ -0,0 +1,150 @@
+import sys
+
+import numpy as np
+import pytest
+
+from core.cycle_cover import generate_cycle_cover, get_connected_cycle_cover
+from core.helper_operations.bounded_cache import (
+    bounded_cache,
+    cache_nbytes,
+    cache_stats,
+    clear_caches,
+    estimate_size,
+    get_cache_budget,
+    set_cache_budget,
+)
+from core.stachowiak import lemma11
+from core.verhoeff import HpathNS
+
+
+@pytest.fixture
+def budget():
+    # restores the global budget after a test changes it
+    previous = get_cache_budget()
+    yield
+    set_cache_budget(previous)
+
+
+class TestBoundedCache:
+    # Class that tests the helper_operations.bounded_cache module
+    def test_estimate_path(self):
+        path = list(HpathNS(3, 3))
+        assert estimate_size(path) == sys.getsizeof([]) + len(path) * (
+            8 + sys.getsizeof(path[0])
+        )
+        assert estimate_size([]) == sys.getsizeof([])
+
+    def test_estimate_cycle_cover(self):
+        cover = generate_cycle_cover((2, 2, 2))
+        assert estimate_size(cover) > sum(estimate_size(cycle) for cycle in cover)
+
+    def test_estimate_array(self):
+        assert estimate_size(np.zeros((10, 4), dtype=np.int8)) == 40
+
+    def test_hits_and_misses(self):
+        calls = []
+
+        @bounded_cache
+        def square(x):
+            calls.append(x)
+            return [(x, x)]
+
+        assert square(3) is square(3)
+        assert square(x=3) == [(3, 3)]
+        assert calls == [3, 3]
+        info = square.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+        assert info.nbytes == 2 * estimate_size([(3, 3)])
+        square.cache_clear()
+        assert square.cache_info() == (0, 0, 0, 0, 0)
+
+    def test_cache_discard(self):
+        @bounded_cache
+        def square(x):
+            return [(x, x)]
+
+        square(3)
+        square(x=4)
+        assert not square.cache_discard(4)
+        assert square.cache_discard(x=4)
+        assert square.cache_discard(3)
+        assert not square.cache_discard(3)
+        info = square.cache_info()
+        assert (info.currsize, info.nbytes, info.evictions) == (0, 0, 0)
+
+    def test_cache_store(self):
+        calls = []
+
+        @bounded_cache
+        def square(x):
+            calls.append(x)
+            return [(x, x)]
+
+        assert not square.cache_contains(3)
+        square.cache_store([(3, 3)], 3)
+        assert square.cache_contains(3)
+        assert not square.cache_contains(x=3)
+        assert square(3) == [(3, 3)]
+        assert calls == []
+        info = square.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 0, 1)
+
+    def test_ignore(self):
+        calls = []
+
+        @bounded_cache(ignore=("verbose",))
+        def square(x, verbose=False):
+            calls.append(verbose)
+            return [(x, x)]
+
+        assert square(3, verbose=True) is square(3) is square(3, False)
+        assert calls == [True]
+        assert square.cache_discard(3, verbose=True)
+        assert square.cache_info().currsize == 0
+
+    def test_lru_eviction(self, budget):
+        @bounded_cache
+        def path(n):
+            return [(n,)] * 100
+
+        clear_caches()
+        size = estimate_size(path(0))
+        set_cache_budget(2 * size)
+        path(1)
+        path(0)
+        path(2)
+        # 1 is the least recently used result, so it is evicted to make room for 2
+        info = path.cache_info()
+        assert (info.currsize, info.evictions) == (2, 1)
+        path(0)
+        path(1)
+        assert path.cache_info().misses == 4
+
+    def test_result_larger_than_budget(self, budget):
+        @bounded_cache
+        def path(n):
+            return [(0,) * n] * n
+
+        set_cache_budget(estimate_size(path(1)))
+        assert path(100) == [(0,) * 100] * 100
+        assert path.cache_info().currsize <= 1
+        assert cache_nbytes() <= get_cache_budget()
+
+    def test_budget_shared_between_functions(self, budget):
+        HpathNS(4, 4)
+        lemma11((2, 1, 1))
+        set_cache_budget(0)
+        assert cache_nbytes() == 0
+        assert cache_stats()["core.verhoeff.HpathNS"].currsize == 0
+        assert cache_stats()["core.stachowiak.lemma11"].evictions > 0
+        with pytest.raises(ValueError):
+            set_cache_budget(-1)
+
+    def test_clear_caches(self):
+        expected = get_connected_cycle_cover((2, 2, 1))
+        assert cache_stats()["core.cycle_cover.get_connected_cycle_cover"].currsize > 0
+        clear_caches()
+        assert cache_nbytes() == 0
+        assert all(info.currsize == 0 for info in cache_stats().values())
+        assert get_connected_cycle_cover((2, 2, 1)) == expected
+        assert cache_stats()["core.cycle_cover.get_connected_cycle_cover"].misses > 0
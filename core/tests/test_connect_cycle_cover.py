@@ -2,7 +2,12 @@ import pytest
 
 from core.cycle_cover import generate_cycle_cover, get_connected_cycle_cover
 from core.helper_operations.cycle_cover_connections import generate_end_tuple_order
-from core.helper_operations.path_operations import cycleQ, get_first_element, pathQ
+from core.helper_operations.path_operations import (
+    cycleQ,
+    decode_swap_sequence,
+    get_first_element,
+    pathQ,
+)
 from core.helper_operations.permutation_graphs import multinomial, stutterPermutations
 
 
@@ -678,3 +683,23 @@ class Test_ConnectCycleCoverAllButOneEven:
         )
         assert len(result_4_3_2) == len(set(result_4_3_2))
         assert cycleQ(result_4_3_2)
+
+    def test_connect_cycle_cover_swap_encoding_4_3_2(self):
+        sig_4_3_2 = (4, 3, 2)
+        start, swaps = get_connected_cycle_cover(sig_4_3_2, swap_encoding=True)
+        assert len(swaps) == len(get_connected_cycle_cover(sig_4_3_2)) - 1
+        assert decode_swap_sequence(start, swaps) == get_connected_cycle_cover(
+            sig_4_3_2
+        )
+
+    def test_connect_cycle_cover_swap_encoding_cached(self):
+        cycle = get_connected_cycle_cover((3, 3, 2), False)
+        hits = get_connected_cycle_cover.cache_info().hits
+        start, swaps = get_connected_cycle_cover((3, 3, 2), False, True)
+        # the cycle is looked up in the cache instead of being computed again
+        assert get_connected_cycle_cover.cache_info().hits == hits + 1
+        assert decode_swap_sequence(start, swaps) == cycle
+
+    def test_connect_cycle_cover_swap_encoding_binary(self):
+        start, swaps = get_connected_cycle_cover((4, 3), swap_encoding=True)
+        assert decode_swap_sequence(start, swaps) == get_connected_cycle_cover((4, 3))
@@ -1,7 +1,9 @@
 import pytest
 
-from core.cycle_cover import generate_cycle_cover
+from core.cycle_cover import _connected_sub_cycles, generate_cycle_cover
+from core.helper_operations.bounded_cache import clear_caches
 from core.helper_operations.cycle_cover_generation import incorporated_odd_2_1_path_a_b
+from core.helper_operations.parallel import get_workers, using_workers
 from core.helper_operations.path_operations import cycleQ, pathQ, recursive_cycle_check
 from core.helper_operations.permutation_graphs import multinomial, stutterPermutations
 from core.verhoeff import HpathNS
@@ -484,3 +486,39 @@ class Test_HpathCycleCover_Odd_Odd_1:
         cycles = generate_cycle_cover(signature)
         assert len(cycles) == 1
         assert recursive_cycle_check(cycles) == multinomial(signature)
+
+
+class Test_HpathCycleCover_Jobs:
+    # the all-but-one-even, three-or-more-odd and all-even cases compute their sub-cycles in worker processes
+    @pytest.mark.parametrize("naive_glue", [False, True])
+    @pytest.mark.parametrize(
+        "signature", [(4, 3, 2), (3, 2, 2, 1), (3, 3, 3), (4, 2, 2), (2, 2, 2, 2)]
+    )
+    def test_HpathCycleCover_Jobs(self, signature, naive_glue):
+        expected = generate_cycle_cover.__wrapped__(signature, naive_glue)
+        clear_caches()
+        assert generate_cycle_cover(signature, naive_glue, jobs=2) == expected
+        assert get_workers() == 1
+        # the number of workers is not part of the key of the cache
+        misses = generate_cycle_cover.cache_info().misses
+        assert generate_cycle_cover(signature, naive_glue, jobs=3) is (
+            generate_cycle_cover(signature, naive_glue)
+        )
+        assert generate_cycle_cover.cache_info().misses == misses
+
+    def test_HpathCycleCover_Jobs_Invalid(self):
+        with pytest.raises(ValueError):
+            generate_cycle_cover((4, 3, 2), jobs=0)
+
+    def test_connected_sub_cycles(self):
+        sub_sigs = [(3, 1, 2), (4, 0, 2), (4, 1, 1)]
+        tails = [(0,), (1,), (2,)]
+        expected = _connected_sub_cycles(sub_sigs, tails, False)
+        assert [len(cycle) for cycle in expected] == [60, len(HpathNS(4, 2)), 30]
+        assert all(
+            perm[-1] == tail[0]
+            for cycle, tail in zip(expected, tails)
+            for perm in cycle
+        )
+        with using_workers(3):
+            assert _connected_sub_cycles(sub_sigs, tails, False) == expected
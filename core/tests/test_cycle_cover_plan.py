@@ -0,0 +1,149 @@
+import pytest
+
+from core import cycle_cover
+from core.cycle_cover import (
+    even_odd_1_cycle,
+    generate_cycle_cover,
+    get_connected_cycle_cover,
+)
+from core.cycle_cover_plan import (
+    CycleCoverPlan,
+    PlanNode,
+    cycle_cover_calls,
+    plan_cycle_cover,
+)
+from core.helper_operations import bounded_cache, path_store
+from core.helper_operations.bounded_cache import clear_caches, estimate_size
+from core.helper_operations.path_operations import get_transformer
+
+SIGNATURES = [
+    (2, 2, 2),
+    (3, 3, 2),
+    (4, 3, 2),
+    (3, 3, 3),
+    (2, 2, 2, 2),
+    (3, 3, 1, 1),
+    (5, 4, 1),
+    (4, 2, 1, 1),
+    (3, 2, 2, 1),
+    (2, 3, 2),
+]
+
+
+@pytest.fixture
+def no_path_store(monkeypatch):
+    # a stored connected cycle is loaded without requesting its subproblems
+    monkeypatch.setattr(path_store, "_store", None)
+
+
+def requested_nodes() -> set[PlanNode]:
+    """
+    Returns:
+        set[PlanNode]: The subproblems of which ``get_connected_cycle_cover`` holds a connected cycle.
+    """
+    nodes = set()
+    for function, args in list(bounded_cache._entries):
+        if function is not get_connected_cycle_cover:
+            continue
+        sig = get_transformer(args[0], lambda x: x[0])[0]
+        if len(sig) >= 2:
+            nodes.add(PlanNode(sig, args[1] if len(args) > 1 else False))
+    return nodes
+
+
+class Test_CycleCoverPlan:
+    # Class that tests the core.cycle_cover_plan module
+    @pytest.mark.parametrize("naive_glue", [False, True])
+    @pytest.mark.parametrize("sig", SIGNATURES)
+    def test_nodes_match_recursion(self, sig, naive_glue, no_path_store):
+        clear_caches()
+        generate_cycle_cover(sig, naive_glue)
+        plan = CycleCoverPlan(sig, naive_glue)
+        assert set(plan.order) - {plan.root} == requested_nodes()
+
+    @pytest.mark.parametrize("naive_glue", [False, True])
+    @pytest.mark.parametrize("sig", SIGNATURES)
+    def test_nodes_match_traced_calls(
+        self, sig, naive_glue, monkeypatch, no_path_store
+    ):
+        calls = []
+        for function in (get_connected_cycle_cover, even_odd_1_cycle):
+
+            def trace(*args, function=function):
+                calls.append((function, args))
+                return function(*args)
+
+            monkeypatch.setattr(cycle_cover, function.__name__, trace)
+        clear_caches()
+        generate_cycle_cover(sig, naive_glue)
+        plan = CycleCoverPlan(sig, naive_glue)
+        nodes = {
+            PlanNode(get_transformer(args[0], lambda x: x[0])[0], args[1])
+            for function, args in calls
+            if function is get_connected_cycle_cover
+        }
+        assert {node for node in nodes if len(node.sig) >= 2} == set(plan.order) - {
+            plan.root
+        }
+        # the even-odd-1 cycles with non-distinct ends, the other calls compute the cycle of a node itself
+        helpers = {
+            args
+            for function, args in calls
+            if function is even_odd_1_cycle and len(args) == 2
+        }
+        assert helpers == {
+            args for node_helpers in plan._helpers.values() for args in node_helpers
+        }
+
+    @pytest.mark.parametrize("naive_glue", [False, True])
+    @pytest.mark.parametrize("sig", SIGNATURES)
+    def test_run(self, sig, naive_glue):
+        expected = generate_cycle_cover.__wrapped__(sig, naive_glue)
+        clear_caches()
+        assert plan_cycle_cover(sig, naive_glue).run() == expected
+        # every intermediate connected cycle is released
+        assert get_connected_cycle_cover.cache_info().currsize == 0
+
+    def test_order(self):
+        plan = CycleCoverPlan((4, 3, 3))
+        assert plan.order[-1] == plan.root == PlanNode((4, 3, 3), False)
+        assert len(plan.order) == len(set(plan.order)) == len(plan)
+        position = {node: i for i, node in enumerate(plan.order)}
+        for node in plan.order:
+            assert all(
+                position[child] < position[node] for child in plan.dependencies[node]
+            )
+            assert all(len(child.sig) >= 2 for child in plan.dependencies[node])
+
+    def test_sizes(self):
+        plan = CycleCoverPlan((3, 3, 2))
+        assert plan.nbytes() == sum(plan.node_nbytes(node) for node in plan.order)
+        assert plan.node_nbytes(plan.root) < plan.peak_nbytes() <= plan.nbytes()
+        assert plan.node_nbytes(PlanNode((2, 2), False)) > plan.node_nbytes(
+            PlanNode((2, 1), False)
+        )
+        assert plan.node_nbytes(plan.root) == estimate_size(
+            list(get_connected_cycle_cover((3, 3, 2)))
+        )
+        assert "nodes=5" in repr(plan)
+
+    def test_edge_cases(self):
+        assert len(CycleCoverPlan(())) == 1
+        assert CycleCoverPlan(()).run() == []
+        assert CycleCoverPlan((4, 4)).dependencies[PlanNode((4, 4), False)] == []
+        assert CycleCoverPlan((1, 2, 1)).run() == generate_cycle_cover((1, 2, 1))
+        with pytest.raises(ValueError):
+            CycleCoverPlan((2, -1, 1))
+
+    def test_cycle_cover_calls(self):
+        assert cycle_cover_calls((3, 1, 1)) == []
+        assert [args for _, args in cycle_cover_calls((3, 3, 1))] == [
+            ((2, 3, 1), False),
+            ((3, 2, 1), False),
+        ]
+        # the all-even case decrements pairs of colors, except for the even-1-1 subsignatures
+        assert [args[0] for _, args in cycle_cover_calls((2, 2, 2), True)] == [
+            (0, 2, 2),
+            (2, 0, 2),
+            (2, 2, 0),
+        ]
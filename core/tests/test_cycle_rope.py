@@ -0,0 +1,76 @@
+import pytest
+
+from core.cycle_cover import generate_cycle_cover, generate_end_tuple_order
+from core.helper_operations.cycle_cover_connections import get_cross_edges
+from core.helper_operations.cycle_rope import CycleRope
+from core.helper_operations.path_operations import cycleQ, glue
+from core.helper_operations.permutation_graphs import extend, rotate, swapPair
+from core.verhoeff import HpathNS
+
+
+class TestCycleRope:
+    # Class that tests the helper_operations.cycle_rope module
+    cycle1 = extend(HpathNS(2, 2), (2, 1))
+    cycle2 = rotate(extend(HpathNS(2, 2), (1, 2)), 2)
+
+    def test_single_cycle(self):
+        rope = CycleRope(self.cycle1)
+        assert len(rope) == len(self.cycle1)
+        assert rope.to_list() == self.cycle1
+        assert list(rope) == self.cycle1
+
+    @pytest.mark.parametrize("k", range(4))
+    def test_glue(self, k):
+        pair1 = (self.cycle1[k], self.cycle1[(k + 1) % 4])
+        pair2 = (self.cycle2[(k + 2) % 4], self.cycle2[(k + 3) % 4])
+        rope = CycleRope(self.cycle1).glue(self.cycle2, pair1, pair2)
+        assert len(rope) == 8
+        assert rope.to_list() == glue(self.cycle1, self.cycle2, pair1, pair2)
+
+    def test_glue_reversed_pairs(self):
+        pair1 = (self.cycle1[1], self.cycle1[0])
+        pair2 = (self.cycle2[3], self.cycle2[2])
+        rope = CycleRope(self.cycle1).glue(self.cycle2, pair1, pair2)
+        assert rope.to_list() == glue(self.cycle1, self.cycle2, pair1, pair2)
+
+    def test_glue_start_in_cycle(self):
+        pair1 = (self.cycle1[0], self.cycle1[1])
+        pair2 = (self.cycle2[2], self.cycle2[3])
+        rope = CycleRope(self.cycle1).glue(
+            self.cycle2, pair1, pair2, start_in_cycle=True
+        )
+        assert rope.to_list() == glue(self.cycle2, self.cycle1, pair2, pair1)
+
+    def test_glue_not_adjacent(self):
+        rope = CycleRope(self.cycle1)
+        # the vertices of the first pair are not adjacent in the rope
+        with pytest.raises(ValueError):
+            rope.glue(
+                self.cycle2,
+                (self.cycle1[0], self.cycle1[2]),
+                (self.cycle2[2], self.cycle2[0]),
+            )
+        # the cross edges are not edges
+        with pytest.raises(ValueError):
+            rope.glue(
+                self.cycle2,
+                (self.cycle1[0], self.cycle1[1]),
+                (self.cycle2[0], self.cycle2[1]),
+            )
+        # a failed glue leaves the rope unchanged
+        assert rope.to_list() == self.cycle1
+
+    @pytest.mark.parametrize("sig", [(2, 2, 2), (4, 2, 2), (2, 2, 3), (3, 2, 2, 2)])
+    def test_same_as_list_glue(self, sig):
+        cover = generate_cycle_cover(sig)
+        end_tuple_order = generate_end_tuple_order(sig)
+        cross_edges = get_cross_edges(sig, end_tuple_order)
+        expected = cover[0][0]
+        rope = CycleRope(cover[0][0])
+        for i, tail in enumerate(end_tuple_order):
+            cross_edge = cross_edges[(tail, swapPair(tail, 0))][0]
+            expected = glue(expected, cover[i + 1][0], cross_edge[0], cross_edge[1])
+            rope.glue(cover[i + 1][0], cross_edge[0], cross_edge[1])
+        assert len(rope) == len(expected)
+        assert rope.to_list() == expected
+        assert cycleQ(rope.to_list())
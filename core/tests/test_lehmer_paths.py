@@ -3,6 +3,7 @@ import pytest
 from core.connect_cycle_cover import get_connected_cycle_cover
 from core.helper_operations.path_operations import (
     adjacent,
+    decode_swap_sequence,
     non_stutter_cycleQ,
     pathQ,
     stutterPermutationQ,
@@ -280,3 +281,14 @@ class TestLehmerPaths:
             if stutterPermutationQ(result[0][0]) or stutterPermutationQ(result[0][-1])
             else 0
         )
+
+    def test_incorporate_stutters_swap_encoding_2_3(self):
+        sig = (2, 3)
+        (start, swaps), message = incorporate_stutters(sig, swap_encoding=True)
+        assert message == "\033[1m\033[94m A valid Hamiltonian path\033[0m\033[0m"
+        assert decode_swap_sequence(start, swaps) == incorporate_stutters(sig)[0]
+
+    def test_incorporate_stutters_swap_encoding_2_2_2(self):
+        sig = (2, 2, 2)
+        (start, swaps), _ = incorporate_stutters(sig, swap_encoding=True)
+        assert decode_swap_sequence(start, swaps) == incorporate_stutters(sig)[0]
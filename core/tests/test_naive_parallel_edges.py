@@ -1,11 +1,15 @@
 import pytest
 
+from core.cycle_cover import generate_cycle_cover
+from core.helper_operations.cycle_cover_connections import generate_end_tuple_order
 from core.helper_operations.naive_parallel_edges import (
+    _tail_neighbors,
     filter_adjacent_edges_by_tail,
     find_cross_edges,
     find_end_tuple_order,
     find_parallel_edges_in_cycle_cover,
 )
+from core.helper_operations.path_operations import adjacent
 
 
 class Test_Find_Tails_Order:
@@ -316,3 +320,43 @@ class Test_Find_Cross_Edges:
                 ),
             ],
         }
+
+    def test_tail_neighbors(self):
+        assert _tail_neighbors((2, 1, 1, 0), (0, 1)) == [(2, 1, 0, 1)]
+        assert _tail_neighbors((2, 1, 1, 0), (1, 2)) == []
+        # with equal leading colors in the tail, the neighbors with the same tail swap elements before it
+        assert _tail_neighbors((2, 1, 0, 0, 1, 1), (1, 1)) == [
+            (1, 2, 0, 0, 1, 1),
+            (2, 0, 1, 0, 1, 1),
+        ]
+
+    @pytest.mark.parametrize("sig", [(3, 2, 2), (4, 3, 2), (2, 2, 2, 1), (6, 3, 2)])
+    def test_cross_edges_of_cycle_cover(self, sig):
+        cover = generate_cycle_cover.__wrapped__(sig)
+        end_tuple_order = generate_end_tuple_order(sig)
+        parallel_edges = find_parallel_edges_in_cycle_cover(cover, end_tuple_order)
+        res = find_cross_edges(cover, end_tuple_order)
+        for tail1, tail2 in res:
+            # every parallel edge with an adjacent parallel edge in the other cycle is a cross edge
+            expected = [
+                edge1
+                for edge1 in parallel_edges[tail1]
+                if any(
+                    adjacent(edge1[0], edge2[0])
+                    and adjacent(edge1[1], edge2[1])
+                    or adjacent(edge1[0], edge2[1])
+                    and adjacent(edge1[1], edge2[0])
+                    for edge2 in parallel_edges[tail2]
+                )
+            ]
+            assert [edge1 for edge1, _ in res[(tail1, tail2)]] == expected
+            for edge1, edge2 in res[(tail1, tail2)]:
+                assert adjacent(edge1[0], edge2[0]) and adjacent(edge1[1], edge2[1])
+                assert (
+                    edge2 in parallel_edges[tail2]
+                    or edge2[::-1] in parallel_edges[tail2]
+                )
+        first = find_cross_edges(cover, end_tuple_order, True)
+        assert len(first) == 1
+        key = next(iter(first))
+        assert first[key] == res[key][:1]
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from core.helper_operations.parallel import (
+    SharedArray,
+    get_workers,
+    set_workers,
+    split_range,
+    using_workers,
+)
+
+
+@pytest.fixture
+def restore_workers():
+    # restores the number of workers after a test
+    previous = get_workers()
+    yield
+    set_workers(previous)
+
+
+class TestParallel:
+    # Class that tests the helper_operations.parallel module
+    def test_set_workers(self, restore_workers):
+        set_workers(3)
+        assert get_workers() == 3
+        set_workers(None)
+        assert get_workers() >= 1
+        with pytest.raises(ValueError):
+            set_workers(0)
+
+    def test_using_workers(self, restore_workers):
+        set_workers(2)
+        with using_workers(5):
+            assert get_workers() == 5
+        assert get_workers() == 2
+        with pytest.raises(ValueError):
+            with using_workers(0):
+                pass
+        assert get_workers() == 2
+
+    @pytest.mark.parametrize("n", [0, 1, 5, 10, 11])
+    @pytest.mark.parametrize("parts", [1, 3, 20])
+    def test_split_range(self, n, parts):
+        ranges = split_range(n, parts)
+        assert len(ranges) == min(n, parts)
+        assert [i for part in ranges for i in part] == list(range(n))
+        assert all(len(part) > 0 for part in ranges)
+
+    def test_shared_array(self):
+        with SharedArray((3, 2), np.uint16) as shared:
+            attached = SharedArray.attach(shared.spec)
+            attached.array[1] = 500
+            attached.close()
+            assert shared.array.tolist() == [[0, 0], [500, 500], [0, 0]]
+            assert shared.spec[1:] == ((3, 2), np.dtype(np.uint16).str)
+
+    def test_empty_shared_array(self):
+        with SharedArray((0, 4), np.uint8) as shared:
+            assert shared.array.shape == (0, 4)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from core.helper_operations.path_index import PathIndex
+from core.helper_operations.path_operations import createZigZagPath, cutCycle
+from core.helper_operations.permutation_graphs import (
+    extend,
+    incorporateSpursInZigZag,
+    rotate,
+    stutterPermutations,
+)
+from core.verhoeff import HpathNS
+
+
+class TestPathIndex:
+    # Class that tests the helper_operations.path_index module
+    cycle = HpathNS(4, 2)
+
+    def check_index(self, index, path):
+        assert len(index) == len(path)
+        assert all(index.index(v) == i for i, v in enumerate(path))
+
+    def test_index(self):
+        index = PathIndex(self.cycle)
+        self.check_index(index, self.cycle)
+        assert self.cycle[3] in index
+        assert (1, 1, 1, 1, 1, 1) not in index
+        assert index.get((1, 1, 1, 1, 1, 1)) == -1
+        with pytest.raises(ValueError):
+            index.index((1, 1, 1, 1, 1, 1))
+
+    def test_numpy_path(self):
+        index = PathIndex(np.array(self.cycle))
+        self.check_index(index, self.cycle)
+
+    def test_duplicates(self):
+        with pytest.raises(ValueError):
+            PathIndex([(0, 1), (1, 0), (0, 1)])
+
+    def test_incorporate_spurs_shared_base(self):
+        ext_path = extend(cutCycle(HpathNS(4, 2), (0, 0, 0, 1, 1, 0)), (1, 1))
+        path = rotate(createZigZagPath(ext_path, (1, 0), (0, 1)), 1)
+        stutters = extend(stutterPermutations((4, 2)), (1, 1))
+        # the same spur cannot be inserted between the same two vertices twice
+        with pytest.raises(ValueError, match="not adjacent"):
+            incorporateSpursInZigZag(path, stutters + stutters[:1], [(0, 1), (1, 0)], 2)
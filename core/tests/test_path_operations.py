@@ -1,11 +1,15 @@
+import numpy as np
 import pytest
 
+import core.helper_operations.path_operations as path_operations
 from core.helper_operations.path_operations import (
     adjacent,
     createSquareTube,
     createZigZagPath,
     cutCycle,
     cycleQ,
+    decode_swap_sequence,
+    encode_swap_sequence,
     get_transformer,
     incorporateSpurInZigZag,
     mul,
@@ -19,6 +23,8 @@ from core.helper_operations.path_operations import (
     transform,
     transform_cycle_cover,
 )
+from core.helper_operations.perm_path import first_non_adjacent
+from core.verhoeff import HpathNS
 
 
 class TestPathOperations:
@@ -90,6 +96,54 @@ class TestPathOperations:
         cycle = [(0, 1, 2), (0, 2, 1), (2, 0, 1), (2, 1, 0), (1, 0, 2), (1, 2, 0)]
         assert cycleQ(cycle) == False
 
+    @pytest.mark.parametrize(
+        "s, t",
+        [
+            ((1, 2), (2, 1)),
+            ((1, 2), (1, 2)),
+            ((0, 1, 2, 3, 5), (0, 2, 1, 4, 5)),
+            ((0, 1, 2, 3, 5), (0, 2, 1, 5, 3)),
+            ((0, 1, 2, 3, 5), (0, 1, 2, 5, 3)),
+            ((0, 1, 2, 3, 4), (4, 1, 2, 3, 0)),
+            ((0, 1, 2), (1, 2, 2)),
+        ],
+    )
+    def test_first_non_adjacent_same_as_adjacent(self, s, t):
+        assert (first_non_adjacent(np.array([s, t])) == -1) == adjacent(s, t)
+
+    def test_first_non_adjacent_index(self):
+        path = [(0, 0, 0, 1), (0, 0, 1, 0), (0, 1, 0, 0), (0, 0, 0, 1), (0, 0, 1, 0)]
+        assert first_non_adjacent(np.array(path)) == 2
+        assert first_non_adjacent(np.array(path[:3])) == -1
+        assert first_non_adjacent(np.array(path[:3]), cyclic=True) == 2
+        assert first_non_adjacent(np.zeros((1, 4))) == -1
+
+    def test_first_non_adjacent_wrong_dimension(self):
+        with pytest.raises(ValueError):
+            first_non_adjacent(np.zeros(4))
+
+    def test_pathQ_cycleQ_large(self):
+        # HpathNS(7, 6) has more vertices than the vectorization threshold
+        path = HpathNS(7, 6)
+        assert len(path) >= path_operations.VECTORIZE_THRESHOLD
+        assert pathQ(path)
+        assert not cycleQ(path)
+        broken = path[:1000] + path[1001:]
+        assert not pathQ(broken)
+        assert not pathQ([p + (0,) for p in path[:-1]] + [path[-1]])
+
+    @pytest.mark.parametrize("k", [(4, 2), (3, 3), (5, 2)])
+    def test_pathQ_cycleQ_vectorized(self, monkeypatch, k):
+        path = HpathNS(*k)
+        expected = (pathQ(path), cycleQ(path), pathQ(path[::2]), cycleQ(path[1:]))
+        monkeypatch.setattr(path_operations, "VECTORIZE_THRESHOLD", 2)
+        assert (
+            pathQ(path),
+            cycleQ(path),
+            pathQ(path[::2]),
+            cycleQ(path[1:]),
+        ) == expected
+
     def test_pathEdges_empty(self):
         with pytest.raises(ValueError):
             pathEdges([])
@@ -757,3 +811,42 @@ class TestPathOperations:
         assert stutterPermutationQ((1, 0, 1, 0, 1)) == False
         assert stutterPermutationQ((1, 0, 1, 1, 1)) == False
         assert stutterPermutationQ((3, 3, 10, 11, 11)) == False
+
+    def test_encode_swap_sequence(self):
+        start, swaps = encode_swap_sequence([(0, 0, 1), (0, 1, 0), (1, 0, 0)])
+        assert start == (0, 0, 1)
+        assert swaps.dtype == np.uint8
+        assert swaps.tolist() == [1, 0]
+
+    def test_encode_swap_sequence_empty(self):
+        start, swaps = encode_swap_sequence([])
+        assert start is None
+        assert len(swaps) == 0
+        assert decode_swap_sequence(start, swaps) == []
+
+    def test_encode_swap_sequence_one_element(self):
+        start, swaps = encode_swap_sequence([(0, 1)])
+        assert start == (0, 1)
+        assert len(swaps) == 0
+        assert decode_swap_sequence(start, swaps) == [(0, 1)]
+
+    def test_encode_swap_sequence_no_path(self):
+        with pytest.raises(ValueError):
+            encode_swap_sequence([(0, 0, 1), (1, 0, 0)])
+
+    def test_encode_swap_sequence_long_permutations(self):
+        path = [(0,) * 300 + (1,), (0,) * 299 + (1, 0)]
+        start, swaps = encode_swap_sequence(path)
+        assert swaps.dtype == np.uint16
+        assert swaps.tolist() == [299]
+        assert decode_swap_sequence(start, swaps) == path
+
+    def test_decode_swap_sequence_round_trip(self):
+        path = [(0, 1, 2), (1, 0, 2), (1, 2, 0), (2, 1, 0), (2, 0, 1), (0, 2, 1)]
+        assert decode_swap_sequence(*encode_swap_sequence(path)) == path
+
+    def test_decode_swap_sequence_invalid_swap(self):
+        with pytest.raises(ValueError):
+            decode_swap_sequence((0, 0, 1), [0])
+        with pytest.raises(ValueError):
+            decode_swap_sequence((0, 0, 1), [2])
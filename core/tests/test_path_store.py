@@ -0,0 +1,137 @@
+import os
+
+import numpy as np
+import pytest
+
+from core.cycle_cover import get_connected_cycle_cover
+from core.helper_operations.bounded_cache import estimate_size
+from core.helper_operations.path_store import (
+    PathStore,
+    StoredPath,
+    get_path_store,
+    set_path_store,
+    stored_path,
+)
+from core.stachowiak import lemma11, lemma11_segments
+from core.verhoeff import HpathNS
+
+
+@pytest.fixture
+def store(tmp_path):
+    # stores paths in a temporary directory for the duration of a test
+    previous = get_path_store()
+    store = PathStore(str(tmp_path))
+    set_path_store(store)
+    yield store
+    set_path_store(previous)
+
+
+class TestPathStore:
+    # Class that tests the helper_operations.path_store module
+    path = HpathNS(3, 4)
+
+    @pytest.mark.parametrize("encoding", ["ranks", "swaps", None])
+    def test_save_and_load(self, store, encoding):
+        store.save("HpathNS", (3, 4), self.path, encoding)
+        assert ("HpathNS", (3, 4)) in store
+        assert ("HpathNS", (4, 3)) not in store
+        assert store.load("HpathNS", (3, 4)) == self.path
+        metadata, array = store.load_array("HpathNS", (3, 4))
+        assert isinstance(array, np.memmap)
+        assert metadata["length"] == len(self.path)
+
+    def test_empty_path(self, store):
+        for encoding in ["ranks", "swaps"]:
+            store.save(f"empty_{encoding}", (1, 1), [], encoding)
+            assert store.load(f"empty_{encoding}", (1, 1)) == []
+
+    def test_unknown_encoding(self, store):
+        with pytest.raises(ValueError):
+            store.save("HpathNS", (3, 4), self.path, "tuples")
+
+    def test_missing(self, store):
+        assert store.load("HpathNS", (5, 5)) is None
+        assert store.load_array("HpathNS", (5, 5)) is None
+
+    def test_corrupted(self, tmp_path):
+        PathStore(str(tmp_path)).save("HpathNS", (3, 4), self.path)
+        with open(tmp_path / "HpathNS_3-4.npy", "r+b") as file:
+            file.seek(-1, 2)
+            file.write(b"\xff")
+        with pytest.warns(UserWarning):
+            assert PathStore(str(tmp_path)).load("HpathNS", (3, 4)) is None
+        unverified = PathStore(str(tmp_path), verify=False)
+        assert unverified.load_array("HpathNS", (3, 4)) is not None
+
+    def test_load_or_compute(self, store):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return self.path
+
+        assert store.load_or_compute("path", (3, 4), compute) == self.path
+        assert store.load_or_compute("path", (3, 4), compute) == self.path
+        assert len(calls) == 1
+        # a new process (store) loads the path from disk
+        assert PathStore(store.directory).load_or_compute("path", (3, 4), compute)
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("encoding", ["ranks", "swaps"])
+    def test_stored_path_is_lazy(self, store, encoding):
+        store.save("HpathNS", (3, 4), self.path, encoding)
+        path = store.load_or_compute("HpathNS", (3, 4), lambda: [])
+        assert isinstance(path, StoredPath)
+        assert path._buffer is None
+        assert len(path) == len(self.path) and path.width == 7
+        assert estimate_size(path) == len(self.path) * 7
+        if encoding == "ranks":
+            # single permutations, slices, iteration and lookups read the ranks
+            assert path[5] == self.path[5] and path[-1] == self.path[-1]
+            assert path[3:10:2] == self.path[3:10:2]
+            assert list(path) == self.path
+            assert path.index(self.path[7]) == 7
+            assert self.path[4] in path and (0,) * 7 not in path
+            assert path._buffer is None
+        assert path == self.path
+        assert path._buffer is not None
+        path.reverse()
+        assert path.to_list() == self.path[::-1]
+        with pytest.raises(ValueError):
+            path.index((2,) * 7)
+
+    def test_no_temporary_files(self, store, tmp_path):
+        store.save("HpathNS", (3, 4), self.path)
+        assert sorted(file.name for file in tmp_path.iterdir()) == [
+            "HpathNS_3-4.json",
+            "HpathNS_3-4.npy",
+        ]
+
+    def test_stored_path(self, store):
+        assert stored_path("path", (3, 4), lambda: self.path) == self.path
+        assert stored_path("path", (3, 4), lambda: []) == self.path
+        set_path_store(None)
+        assert stored_path("path", (3, 4), lambda: []) == []
+
+    def test_HpathNS(self, store):
+        assert HpathNS.__wrapped__(4, 3) == HpathNS(4, 3)
+        assert ("HpathNS", (4, 3)) in store
+        assert HpathNS.__wrapped__(4, 3) == HpathNS(4, 3)
+
+    @pytest.mark.parametrize("naive_glue", [False, True])
+    def test_connected_cycle_cover(self, store, naive_glue):
+        cycle = get_connected_cycle_cover.__wrapped__((2, 2, 1), naive_glue)
+        name = "connected_cycle_cover_naive" if naive_glue else "connected_cycle_cover"
+        assert (name, (2, 2, 1)) in store
+        assert get_connected_cycle_cover.__wrapped__((2, 2, 1), naive_glue) == cycle
+        assert get_connected_cycle_cover((2, 2, 1), naive_glue) == cycle
+
+    def test_save_segments(self, store):
+        length = store.save_segments("lemma11", (3, 3, 2), lemma11_segments((3, 3, 2)))
+        assert length == len(lemma11((3, 3, 2)))
+        assert store.load("lemma11", (3, 3, 2)) == lemma11((3, 3, 2))
+        assert store.save_segments("empty", (1, 1), iter([])) == 0
+        assert store.load("empty", (1, 1)) == []
+        with pytest.raises(ValueError):
+            store.save_segments("lemma11", (30, 30, 30), iter([]))
+        assert not any(file.endswith(".tmp") for file in os.listdir(store.directory))
@@ -0,0 +1,187 @@
+import numpy as np
+import pytest
+
+from core.helper_operations.path_operations import (
+    createSquareTube,
+    createZigZagPath,
+    cutCycle,
+    cycleQ,
+    get_first_element,
+    glue,
+    pathQ,
+    transform,
+    transform_cycle_cover,
+)
+from core.helper_operations.perm_path import PermPath
+from core.helper_operations.permutation_graphs import (
+    extend,
+    extend_cycle_cover,
+    incorporateSpursInZigZag,
+    rotate,
+    stutterPermutations,
+)
+from core.stachowiak import _lemma10_helper
+from core.verhoeff import HpathNS, HpathNS_perm_path
+
+
+class TestPermPath:
+    # Class that tests the helper_operations.perm_path module
+    path = [(0, 0, 1, 1), (0, 1, 0, 1), (1, 0, 0, 1), (1, 0, 1, 0)]
+
+    def test_round_trip(self):
+        perm_path = PermPath.from_list(self.path)
+        assert perm_path.buffer.dtype == np.uint8
+        assert perm_path.to_list() == self.path
+        assert list(perm_path) == self.path
+
+    def test_empty(self):
+        perm_path = PermPath.from_list([], 3)
+        assert len(perm_path) == 0
+        assert perm_path.width == 3
+        assert perm_path.to_list() == []
+
+    def test_wrong_dimension(self):
+        with pytest.raises(ValueError):
+            PermPath(np.zeros(3))
+
+    def test_getitem(self):
+        perm_path = PermPath.from_list(self.path)
+        assert perm_path[1] == (0, 1, 0, 1)
+        assert perm_path[-1] == (1, 0, 1, 0)
+        assert isinstance(perm_path[1:], PermPath)
+        assert perm_path[::-1] == self.path[::-1]
+
+    def test_concatenate(self):
+        perm_path = PermPath.from_list(self.path)
+        assert (perm_path[:2] + perm_path[2:]) == self.path
+        assert (perm_path + [(1, 1, 0, 0)]) == self.path + [(1, 1, 0, 0)]
+        assert ([(1, 1, 0, 0)] + perm_path) == [(1, 1, 0, 0)] + self.path
+
+    def test_equality(self):
+        perm_path = PermPath.from_list(self.path)
+        assert perm_path == self.path
+        assert self.path == perm_path
+        assert perm_path != self.path[1:]
+        assert perm_path != self.path[::-1]
+
+    def test_index_and_contains(self):
+        perm_path = PermPath.from_list(self.path)
+        assert perm_path.index((1, 0, 0, 1)) == 2
+        assert (1, 0, 0, 1) in perm_path
+        assert (1, 1, 0, 0) not in perm_path
+        with pytest.raises(ValueError):
+            perm_path.index((1, 1, 0, 0))
+
+    def test_positions(self):
+        perm_path = PermPath.from_list(self.path)
+        assert perm_path.positions(
+            [(1, 0, 1, 0), (1, 1, 0, 0), (0, 0, 1, 1)]
+        ).tolist() == [3, -1, 0]
+
+    def test_reverse(self):
+        perm_path = PermPath.from_list(self.path)
+        perm_path.reverse()
+        assert perm_path == self.path[::-1]
+
+    def test_path_and_cycle_check(self):
+        assert pathQ(PermPath.from_list(self.path))
+        assert not pathQ(PermPath.from_list(self.path[::2]), verbose=False)
+        assert not pathQ(PermPath.from_list([(0, 1, 1), (1, 1, 0)]))
+        assert cycleQ(
+            PermPath.from_list(
+                [(0, 1, 2), (1, 0, 2), (1, 2, 0), (2, 1, 0), (2, 0, 1), (0, 2, 1)]
+            )
+        )
+        assert not cycleQ(PermPath.from_list(self.path))
+
+    @pytest.mark.parametrize("n", [0, 1, 3, 4])
+    def test_rotate(self, n):
+        assert rotate(PermPath.from_list(self.path), n) == rotate(self.path, n)
+
+    def test_extend(self):
+        assert extend(PermPath.from_list(self.path), (2, 3)) == extend(
+            self.path, (2, 3)
+        )
+
+    def test_transform(self):
+        assert transform(PermPath.from_list(self.path), [4, 5]) == transform(
+            self.path, [4, 5]
+        )
+        with pytest.raises(ValueError):
+            transform(PermPath.from_list(self.path), [4])
+
+    def test_cut_cycle(self):
+        cycle = HpathNS(4, 2)
+        assert cutCycle(PermPath.from_list(cycle), cycle[5]) == cutCycle(
+            cycle, cycle[5]
+        )
+
+    def test_zigzag(self):
+        expected = createZigZagPath(self.path, (0, 1), (1, 0))
+        assert (
+            createZigZagPath(PermPath.from_list(self.path), (0, 1), (1, 0)) == expected
+        )
+
+    def test_square_tube(self):
+        expected = createSquareTube(self.path, (0, 1), (1, 0))
+        assert (
+            createSquareTube(PermPath.from_list(self.path), (0, 1), (1, 0)) == expected
+        )
+
+    def test_incorporate_spurs(self):
+        # the spurs of the odd-odd case of HpathNS(5, 5)
+        ext_path = extend(cutCycle(HpathNS(4, 2), (0, 0, 0, 1, 1, 0)), (1, 1))
+        path = rotate(createZigZagPath(ext_path, (1, 0), (0, 1)), 1)
+        stutters = extend(stutterPermutations((4, 2)), (1, 1))
+        expected = incorporateSpursInZigZag(path, stutters, [(0, 1), (1, 0)], 2)
+        result = incorporateSpursInZigZag(
+            PermPath.from_list(path), stutters, [(0, 1), (1, 0)], 2
+        )
+        assert isinstance(result, PermPath)
+        assert result == expected
+
+    def test_incorporate_spurs_missing_base(self):
+        path = PermPath.from_list(self.path)
+        with pytest.raises(ValueError):
+            incorporateSpursInZigZag(path, [(1, 1)], [(0, 1), (1, 0)])
+
+    def test_glue(self):
+        cycle1 = extend(HpathNS(2, 2), (2, 1))
+        cycle2 = extend(HpathNS(2, 2), (1, 2))
+        pair1, pair2 = (cycle1[0], cycle1[1]), (cycle2[0], cycle2[1])
+        expected = glue(cycle1, rotate(cycle2, 2), pair1, pair2)
+        result = glue(
+            PermPath.from_list(cycle1),
+            PermPath.from_list(rotate(cycle2, 2)),
+            pair1,
+            pair2,
+        )
+        assert isinstance(result, PermPath)
+        assert cycleQ(result)
+        assert result == expected
+
+    def test_cycle_cover_helpers(self):
+        cover = [[PermPath.from_list(self.path)], [PermPath.from_list(self.path[::-1])]]
+        assert get_first_element(cover) == self.path[0]
+        assert transform_cycle_cover(cover, [1, 0])[1][0] == transform(
+            self.path[::-1], [1, 0]
+        )
+        assert extend_cycle_cover(cover, (2,))[0][0] == extend(self.path, (2,))
+
+
+class TestHpathNSPermPath:
+    # Class that tests the PermPath version of Verhoeff's construction
+    @pytest.mark.parametrize("k0", range(0, 9))
+    @pytest.mark.parametrize("k1", range(0, 9))
+    def test_same_as_hpath_ns(self, k0, k1):
+        perm_path = HpathNS_perm_path(k0, k1)
+        assert isinstance(perm_path, PermPath)
+        assert perm_path.to_list() == HpathNS(k0, k1)
+
+    @pytest.mark.parametrize("k", [(3, 3), (5, 3), (3, 5), (1, 3)])
+    @pytest.mark.parametrize("p", [1, 2])
+    def test_lemma10_helper(self, k, p):
+        cycle = _lemma10_helper(HpathNS_perm_path(*k), p, 2)
+        assert isinstance(cycle, PermPath)
+        assert cycleQ(cycle)
+        assert cycle == _lemma10_helper(HpathNS(*k), p, 2)
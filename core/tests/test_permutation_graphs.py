@@ -12,11 +12,13 @@ from core.helper_operations.permutation_graphs import (
     binomial,
     count_inversions,
     defect,
+    defect_by_inversions,
     generate_adj,
     get_num_of_inversions,
     get_perm_signature,
     graph,
     multinomial,
+    multiset_permutations,
     perm,
 )
 
@@ -144,6 +146,18 @@ class TestPermutationGraphs:
         result = perm(s)
         self.check_permutations(s, result)
 
+    @pytest.mark.parametrize("s", [(2, 2), (3, 1, 2), (1, 1, 1, 1), (2, 0, 3)])
+    def test_multiset_permutations(self, s):
+        result = list(multiset_permutations(s))
+        # lexicographic order without duplicates
+        assert result == sorted(set(result))
+        assert len(result) == multinomial(s)
+        assert all(get_perm_signature(p) == s for p in result)
+
+    def test_multiset_permutations_empty(self):
+        assert list(multiset_permutations(tuple())) == [tuple()]
+        assert list(multiset_permutations((0, 0))) == [tuple()]
+
     def test_get_number_of_inversions_empty(self):
         p = []
         result = get_num_of_inversions(p)
@@ -261,6 +275,21 @@ class TestPermutationGraphs:
         result = defect(s)
         assert result == 6
 
+    @pytest.mark.parametrize(
+        "s",
+        [(0, 0), (3, 2), (2, 3), (4, 4), (3, 3, 2), (2, 2, 1, 1), (4, 2, 2), (1, 2, 3)],
+    )
+    def test_defect_closed_form(self, s):
+        assert defect(s) == defect_by_inversions(s)
+
+    def test_defect_large(self):
+        # (20, 20, 20) has about 5.8e26 permutations
+        assert defect((20, 20, 20)) == multinomial((10, 10, 10))
+
+    def test_defect_negative(self):
+        with pytest.raises(ValueError):
+            defect((2, -1))
+
     def test_generate_adj_empty(self):
         p = []
         result = generate_adj(p)
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from core.helper_operations.permutation_graphs import multinomial, permutations_from_sig
+from core.helper_operations.permutation_ranking import (
+    permutation_chunks,
+    rank_path,
+    rank_permutation,
+    rank_permutations,
+    unrank_path,
+    unrank_permutation,
+    unrank_permutations,
+)
+from core.verhoeff import HpathNS
+
+
+class TestPermutationRanking:
+    # Class that tests the helper_operations.permutation_ranking module
+    def test_rank_smallest(self):
+        assert rank_permutation((0, 0, 1, 1), (2, 2)) == 0
+
+    def test_rank_largest(self):
+        assert rank_permutation((1, 1, 0, 0), (2, 2)) == 5
+
+    def test_rank_0_1_1_0(self):
+        assert rank_permutation((0, 1, 1, 0), (2, 2)) == 2
+
+    def test_rank_empty(self):
+        assert rank_permutation(tuple(), tuple()) == 0
+
+    def test_rank_wrong_signature(self):
+        with pytest.raises(ValueError):
+            rank_permutation((0, 0, 1), (1, 2))
+        with pytest.raises(ValueError):
+            rank_permutation((0, 1), (1, 2))
+        with pytest.raises(ValueError):
+            rank_permutation((0, 3), (1, 1))
+
+    def test_rank_negative_signature(self):
+        with pytest.raises(ValueError):
+            rank_permutation((0,), (1, -1))
+
+    @pytest.mark.parametrize("sig", [(2, 2), (3, 2, 1), (1, 1, 1, 1), (2, 0, 3), (4,)])
+    def test_rank_lexicographic_order(self, sig):
+        perms = sorted(permutations_from_sig(sig))
+        assert [rank_permutation(p, sig) for p in perms] == list(range(len(perms)))
+
+    @pytest.mark.parametrize("sig", [(2, 2), (3, 2, 1), (1, 1, 1, 1), (2, 0, 3)])
+    def test_unrank_inverse(self, sig):
+        for rank in range(multinomial(sig)):
+            assert rank_permutation(unrank_permutation(rank, sig), sig) == rank
+
+    def test_unrank_out_of_range(self):
+        with pytest.raises(ValueError):
+            unrank_permutation(6, (2, 2))
+        with pytest.raises(ValueError):
+            unrank_permutation(-1, (2, 2))
+
+    def test_unrank_large_signature(self):
+        sig = (30, 30, 30)
+        perm = (2,) * 30 + (1,) * 30 + (0,) * 30
+        assert rank_permutation(perm, sig) == multinomial(sig) - 1
+        assert unrank_permutation(multinomial(sig) - 1, sig) == perm
+
+    @pytest.mark.parametrize("sig", [(2, 2), (3, 2, 1), (2, 2, 2)])
+    def test_rank_permutations_batch(self, sig):
+        perms = permutations_from_sig(sig)
+        ranks = rank_permutations(np.array(perms), sig)
+        assert ranks.dtype == np.int64
+        assert ranks.tolist() == [rank_permutation(p, sig) for p in perms]
+
+    def test_rank_permutations_wrong_signature(self):
+        with pytest.raises(ValueError):
+            rank_permutations([(0, 0, 1), (0, 1, 0)], (1, 2))
+
+    def test_rank_permutations_too_large(self):
+        with pytest.raises(ValueError):
+            rank_permutations([(0,) * 40 + (1,) * 40], (40, 40))
+
+    @pytest.mark.parametrize("sig", [(2, 2), (3, 2, 1), (2, 2, 2)])
+    def test_unrank_permutations_batch(self, sig):
+        ranks = np.arange(multinomial(sig))
+        perms = unrank_permutations(ranks, sig)
+        assert perms.dtype == np.uint8
+        assert [tuple(p) for p in perms.tolist()] == [
+            unrank_permutation(r, sig) for r in range(multinomial(sig))
+        ]
+
+    def test_unrank_permutations_out_of_range(self):
+        with pytest.raises(ValueError):
+            unrank_permutations([0, 6], (2, 2))
+
+    def test_rank_path_round_trip(self):
+        path = HpathNS(5, 4)
+        ranks = rank_path(path, (5, 4))
+        assert len(ranks) == len(path)
+        assert unrank_path(ranks, (5, 4)) == path
+
+    def test_unrank_path_slice(self):
+        path = HpathNS(4, 3)
+        ranks = rank_path(path, (4, 3))
+        assert unrank_path(ranks, (4, 3), 3, 7) == path[3:7]
+
+    def test_rank_path_empty(self):
+        assert len(rank_path([], (2, 2))) == 0
+        assert unrank_path(np.zeros(0, dtype=np.int64), (2, 2)) == []
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 60, 1000])
+    def test_permutation_chunks(self, chunk_size):
+        sig = (3, 2, 1)
+        chunks = list(permutation_chunks(sig, chunk_size))
+        assert all(len(chunk) <= chunk_size for chunk in chunks)
+        assert len(chunks) == -(-multinomial(sig) // chunk_size)
+        assert np.array_equal(
+            np.concatenate(chunks), unrank_permutations(np.arange(60), sig)
+        )
+
+    def test_permutation_chunks_invalid_size(self):
+        with pytest.raises(ValueError):
+            list(permutation_chunks((2, 2), 0))
@@ -0,0 +1,41 @@
+import pytest
+
+from core.figure_generation_files.rivertz import SetPerm
+from core.figure_generation_files.rivertz_benchmark import benchmark
+from core.figure_generation_files.rivertz_iterative import (
+    iter_rivertz_permutations,
+    iter_rivertz_swaps,
+)
+from core.helper_operations.permutation_graphs import multinomial
+
+
+class TestRivertz:
+    # Class that tests the iterative versions of figure_generation_files.rivertz
+    @pytest.mark.parametrize(
+        "sig",
+        [(1,), (3,), (1, 1), (2, 1), (3, 3), (2, 2, 2), (1, 1, 1, 1), (2, 3, 1, 2)],
+    )
+    def test_same_as_set_perm(self, sig):
+        perms = [list(perm) for perm in iter_rivertz_permutations(list(sig))]
+        assert perms == list(SetPerm(list(sig)))
+        assert len(perms) == multinomial(sig)
+
+    def test_views(self):
+        perms = list(iter_rivertz_permutations([2, 2]))
+        # the same list is changed in place
+        assert all(perm is perms[0] for perm in perms)
+
+    @pytest.mark.parametrize("sig", [(3, 3), (2, 1, 2)])
+    def test_swaps(self, sig):
+        perm = [t + 1 for t in range(len(sig)) for _ in range(sig[t])]
+        perms = [tuple(perm)]
+        for i, j in iter_rivertz_swaps(list(sig)):
+            perm[i], perm[j] = perm[j], perm[i]
+            perms.append(tuple(perm))
+        assert perms == [tuple(perm) for perm in SetPerm(list(sig))]
+
+    def test_benchmark(self):
+        results = benchmark((3, 3, 2), repeat=1)
+        assert results["Rivertz iterative (views)"][0] == multinomial((3, 3, 2))
+        assert results["Stachowiak lemma11_segments"][0] == 560
+        assert "Verhoeff HpathNS" in benchmark((3, 2), repeat=1)
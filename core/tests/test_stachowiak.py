@@ -7,12 +7,15 @@ This software is made available under the terms of the (To Be Supplied) License.
 """
 
 import copy
+import itertools
 import math
 
 import numpy as np
 import pytest
 
+from core.helper_operations.parallel import get_workers, set_workers
 from core.helper_operations.path_operations import cycleQ, pathQ
+from core.helper_operations.perm_path import PermPath
 from core.helper_operations.permutation_graphs import (
     HcycleQ,
     HpathQ,
@@ -20,12 +23,18 @@ from core.helper_operations.permutation_graphs import (
     multinomial,
 )
 from core.stachowiak import (
+    _lemma10_gi,
     _lemma10_helper,
+    _lemma10_helper_segments,
+    _lemma10_template,
     lemma2_extended_path,
     lemma7,
     lemma8,
     lemma9,
+    lemma10,
+    lemma10_segments,
     lemma11,
+    lemma11_segments,
 )
 
 
@@ -687,6 +696,111 @@ class Test_Lemma10_and_11:
         assert LargeHcycleQ(result, sig)
 
 
+class Test_Lemma10_Template:
+    """
+    Test the isomorphism templates of the lemma 9 cycles, from which the subgraphs `G_i` of lemma 10 are read.
+    """
+
+    def test_template_1_0_1(self):
+        # lemma9((1, 1, 1, 0, 1)) starts with (3, 2, 1, 0), (3, 2, 0, 1), (2, 3, 0, 1)
+        # the indices refer to K_{2i} = 0, 1, 2 and K_{2i+1} = 3, 4, 5 and l = 6
+        template = _lemma10_template(1, 0, 1)
+        assert not template.flags.writeable
+        assert template.shape == (len(lemma9((1, 1, 1, 0, 1))), 4)
+        assert template[:3].tolist() == [[6, 3, 4, 5], [6, 0, 1, 2], [0, 6, 1, 2]]
+
+    @pytest.mark.parametrize("sig", [(3, 3), (3, 1), (5, 3)])
+    @pytest.mark.parametrize("p", [1, 2, 3])
+    def test_gi_renames_lemma9(self, sig, p):
+        K = lemma11(sig + (2,))
+        for i in range(len(K) // 2):
+            r = next(j for j in range(len(K[2 * i])) if K[2 * i][j] != K[2 * i + 1][j])
+            expected = []
+            for item in lemma9((1, 1, r, len(K[2 * i]) - r - 2, p)):
+                k = iter(K[2 * i] if item.index(0) < item.index(1) else K[2 * i + 1])
+                expected.append(tuple(4 if x == 3 else next(k) for x in item))
+            assert _lemma10_gi(K, i, p, 4) == expected
+
+
+class Test_Lemma10_Parallel:
+    """
+    Test the construction of the subgraphs of lemma 10 in worker processes, which should not change the cycles.
+    """
+
+    l11sig_3_3_2 = lemma11((3, 3, 2))
+
+    @pytest.fixture(autouse=True)
+    def restore_workers(self):
+        # restores the number of workers after a test
+        previous = get_workers()
+        yield
+        set_workers(previous)
+
+    @pytest.mark.parametrize("workers", [2, 3, 100])
+    def test_lemma10_helper(self, workers):
+        expected = _lemma10_helper(self.l11sig_3_3_2, 2, 3)
+        set_workers(workers)
+        assert _lemma10_helper(self.l11sig_3_3_2, 2, 3) == expected
+        result = _lemma10_helper(PermPath.from_list(self.l11sig_3_3_2), 2, 3)
+        assert isinstance(result, PermPath)
+        assert result.to_list() == expected
+
+    @pytest.mark.parametrize(
+        "sig", [(1, 1, 2), (1, 1, 1, 2), (3, 1, 2, 2), (4, 2, 3, 1)]
+    )
+    def test_lemma11(self, sig):
+        set_workers(2)
+        assert lemma11.__wrapped__(sig) == lemma11(sig)
+
+
+class Test_Lemma10_and_11_Segments:
+    """
+    Test the generator forms of lemma 10 and 11, which should yield exactly the cycles of lemma 10 and 11 in segments.
+    """
+
+    l11sig_3_3_2 = lemma11((3, 3, 2))
+
+    @pytest.mark.parametrize("sig", [(3, 1, 2), (1, 3, 1), (3, 3, 2), (5, 3, 1)])
+    def test_lemma10_segments(self, sig):
+        segments = list(lemma10_segments(sig))
+        assert len(segments) > 1
+        assert list(itertools.chain.from_iterable(segments)) == lemma10(sig)
+
+    @pytest.mark.parametrize(
+        "sig",
+        [
+            (1, 1, 2),
+            (2, 1, 1),
+            (1, 1, 1, 1),
+            (1, 1, 1, 2),
+            (1, 1, 2, 2),
+            (3, 3, 1, 2),
+            (4, 2, 3, 1),
+            (1, 2, 3, 5),
+            (3, 3, 4),
+            (3, 5),
+            (1, 1),
+            (5,),
+        ],
+    )
+    def test_lemma11_segments(self, sig):
+        assert list(itertools.chain.from_iterable(lemma11_segments(sig))) == lemma11(
+            sig
+        )
+
+    def test_lemma11_segments_not_enough_odd_numbers(self):
+        with pytest.raises(ValueError):
+            list(lemma11_segments(tuple()))
+        with pytest.raises(ValueError):
+            list(lemma11_segments((1, 2, 2)))
+
+    def test_lemma10_helper_segments_3_3_2_2(self):
+        segments = _lemma10_helper_segments(self.l11sig_3_3_2, 2, 3)
+        result = list(itertools.chain.from_iterable(segments))
+        assert result == _lemma10_helper(self.l11sig_3_3_2, 2, 3)
+        assert LargeHcycleQ(result, (3, 3, 2, 2))
+
+
 @pytest.mark.slow
 class Test_Lemma11_Large:
     def test_lemma11_7_7_2(self):
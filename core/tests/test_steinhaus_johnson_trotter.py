@@ -0,0 +1,55 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from core.helper_operations.path_operations import adjacent
+from core.steinhaus_johnson_trotter import SteinhausJohnsonTrotter
+
+
+class TestSteinhausJohnsonTrotter:
+    # Class that tests the steinhaus_johnson_trotter module
+    @pytest.mark.parametrize("n", range(0, 8))
+    def test_iter_sjt_permutations(self, n):
+        perms = list(SteinhausJohnsonTrotter().iter_sjt_permutations(n))
+        assert perms == SteinhausJohnsonTrotter().get_sjt_permutations(n)
+        assert sorted(perms) == list(itertools.permutations(range(n)))
+        assert all(adjacent(a, b) for a, b in zip(perms, perms[1:]))
+
+    def test_sjt_order(self):
+        assert list(SteinhausJohnsonTrotter().iter_sjt_permutations(3)) == [
+            (0, 1, 2),
+            (0, 2, 1),
+            (2, 0, 1),
+            (2, 1, 0),
+            (1, 2, 0),
+            (1, 0, 2),
+        ]
+
+    @pytest.mark.parametrize("n", range(0, 8))
+    def test_iter_sjt_swaps(self, n):
+        perm = list(range(n))
+        perms = [tuple(perm)]
+        for i in SteinhausJohnsonTrotter().iter_sjt_swaps(n):
+            perm[i], perm[i + 1] = perm[i + 1], perm[i]
+            perms.append(tuple(perm))
+        assert perms == list(SteinhausJohnsonTrotter().iter_sjt_permutations(n))
+
+    @pytest.mark.parametrize("n", range(0, 8))
+    def test_get_sjt_array(self, n):
+        array = SteinhausJohnsonTrotter().get_sjt_array(n)
+        assert array.shape == (math.factorial(n), n)
+        assert array.dtype == np.uint8
+        expected = SteinhausJohnsonTrotter().iter_sjt_permutations(n)
+        assert [tuple(row) for row in array.tolist()] == list(expected)
+
+    def test_get_sjt_array_out(self):
+        out = np.zeros((24, 4), dtype=np.int64)
+        assert SteinhausJohnsonTrotter().get_sjt_array(4, out) is out
+        expected = SteinhausJohnsonTrotter().iter_sjt_permutations(4)
+        assert out.tolist() == [list(perm) for perm in expected]
+        with pytest.raises(ValueError):
+            SteinhausJohnsonTrotter().get_sjt_array(4, np.zeros((24, 3)))
+        with pytest.raises(ValueError):
+            SteinhausJohnsonTrotter().get_sjt_array(4, np.zeros((4, 24)).T)
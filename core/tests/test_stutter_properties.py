@@ -3,15 +3,20 @@ import pytest
 from core.helper_operations.permutation_graphs import (
     HcycleQ,
     HpathQ,
+    LargeHcycleQ,
+    LargeHpathQ,
     _stutterize,
     extend_cycle_cover,
     halve_signature,
     multinomial,
     multiset,
+    non_stutter_count,
     nonStutterPermutations,
     permutations_from_sig,
+    stutter_count,
     stutterPermutations,
 )
+from core.verhoeff import HpathNS
 
 
 class TestStutterProperties:
@@ -167,6 +172,34 @@ class TestStutterProperties:
         with pytest.raises(ValueError):
             stutterPermutations(s)
 
+    @pytest.mark.parametrize(
+        "s",
+        [
+            (),
+            (0,),
+            (0, 0),
+            (2,),
+            (3,),
+            (2, 0, 1),
+            (2, 1, 1),
+            (2, 2, 2),
+            (4, 3),
+            (3, 2, 2),
+        ],
+    )
+    def test_stutter_counts(self, s):
+        assert stutter_count(s) == len(stutterPermutations(s))
+        assert non_stutter_count(s) == len(nonStutterPermutations(s))
+
+    def test_stutter_count_large(self):
+        # far too many permutations to enumerate
+        assert stutter_count((20, 10, 10)) == multinomial((10, 5, 5))
+        assert non_stutter_count((21, 11, 10)) == multinomial((21, 11, 10))
+
+    def test_stutter_count_negative(self):
+        with pytest.raises(ValueError):
+            stutter_count((2, -1))
+
     def test_nonStutterPermutations_empty(self):
         s = tuple()
         result = nonStutterPermutations(s)
@@ -511,3 +544,16 @@ class TestStutterProperties:
             )
             == False
         )
+
+    @pytest.mark.parametrize("k", [(3, 3), (4, 3), (5, 2)])
+    def test_LargeHpathQ(self, k):
+        path = HpathNS(*k)
+        assert LargeHpathQ(path, k)
+        assert not LargeHpathQ(path[1:], k)
+        assert not LargeHpathQ(path + [path[0]], k)
+
+    def test_LargeHcycleQ(self):
+        cycle = HpathNS(4, 2)
+        assert LargeHcycleQ(cycle, (4, 2))
+        assert not LargeHcycleQ(HpathNS(3, 3), (3, 3))
+        assert not LargeHcycleQ(cycle[:-1], (4, 2))
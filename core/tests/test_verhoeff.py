@@ -7,17 +7,32 @@ This software is made available under the terms of the (To Be Supplied) License.
 """
 
 import collections
+import sys
 
 import pytest
 
-from core.helper_operations.path_operations import pathQ
+from core import verhoeff
+from core.helper_operations.bounded_cache import clear_caches
+from core.helper_operations.path_operations import adjacent, pathQ
 from core.helper_operations.permutation_graphs import (
     HpathQ,
     LargeHpathQ,
     binomial,
     stutterPermutations,
 )
-from core.verhoeff import HpathNS
+from core.verhoeff import (
+    HpathNS,
+    HpathNS_at,
+    HpathNS_index,
+    HpathNS_length,
+    _HpathNS_dependencies,
+    _HpathNS_ends,
+    _iterative_HpathNS,
+    iter_HpathNS,
+    iter_HpathNS_range,
+    next_in_HpathNS,
+    prev_in_HpathNS,
+)
 
 
 class Test_HpathNS_BaseCases:
@@ -396,3 +411,171 @@ class Test_HpathNS_Large:
         assert len(result) == binomial(4, 12) - len(stutterPermutations([4, 12]))
         # check that there is a hamilton path
         assert pathQ(result)
+
+
+class Test_iter_HpathNS:
+    """
+    Test that the lazy generator yields exactly the same permutations in the same order as HpathNS.
+    """
+
+    @pytest.mark.parametrize("k0", range(0, 9))
+    @pytest.mark.parametrize("k1", range(0, 9))
+    def test_iter_HpathNS_same_order(self, k0, k1):
+        assert list(iter_HpathNS(k0, k1)) == HpathNS(k0, k1)
+
+    @pytest.mark.parametrize("k0", range(0, 9))
+    @pytest.mark.parametrize("k1", range(0, 9))
+    def test_iter_HpathNS_reverse(self, k0, k1):
+        assert list(iter_HpathNS(k0, k1, reverse=True)) == HpathNS(k0, k1)[::-1]
+
+    @pytest.mark.parametrize("k", [(9, 9), (10, 7), (7, 10), (11, 5)])
+    def test_iter_HpathNS_larger(self, k):
+        assert list(iter_HpathNS(*k)) == HpathNS(*k)
+
+    def test_iter_HpathNS_is_lazy(self):
+        generator = iter_HpathNS(11, 11)
+        assert next(generator) == HpathNS(11, 11)[0]
+
+    @pytest.mark.parametrize("k0", range(0, 9))
+    @pytest.mark.parametrize("k1", range(0, 9))
+    def test_HpathNS_length(self, k0, k1):
+        assert HpathNS_length(k0, k1) == len(HpathNS(k0, k1))
+
+
+class Test_iterative_HpathNS:
+    """
+    Test the bottom-up construction of HpathNS over the grid of signatures.
+    """
+
+    @pytest.mark.parametrize(
+        "k", [(0, 0), (1, 4), (4, 4), (7, 4), (4, 7), (9, 5), (7, 7)]
+    )
+    def test_iterative_HpathNS_same_path(self, k):
+        assert _iterative_HpathNS(*k, lambda perms, width: perms) == list(
+            iter_HpathNS(*k)
+        )
+
+    def test_iterative_HpathNS_recursion_limit(self):
+        limit = sys.getrecursionlimit()
+        _iterative_HpathNS(9, 8, lambda perms, width: perms)
+        assert sys.getrecursionlimit() == limit
+
+    @pytest.mark.parametrize("k0", range(0, 9))
+    @pytest.mark.parametrize("k1", range(0, 9))
+    def test_HpathNS_dependencies_smaller(self, k0, k1):
+        for dep in _HpathNS_dependencies(k0, k1):
+            assert sum(dep) < k0 + k1 or (sum(dep) == k0 + k1 and dep[0] > dep[1])
+
+
+class Test_next_in_HpathNS:
+    """
+    Test that the successor and predecessor functions walk the same path as HpathNS.
+    """
+
+    @pytest.mark.parametrize("k0", range(0, 10))
+    @pytest.mark.parametrize("k1", range(0, 10))
+    def test_next_in_HpathNS(self, k0, k1):
+        path = HpathNS(k0, k1)
+        assert [next_in_HpathNS(k0, k1, perm) for perm in path[:-1]] == path[1:]
+        if path:
+            assert next_in_HpathNS(k0, k1, path[-1]) is None
+
+    @pytest.mark.parametrize("k0", range(0, 10))
+    @pytest.mark.parametrize("k1", range(0, 10))
+    def test_prev_in_HpathNS(self, k0, k1):
+        path = HpathNS(k0, k1)
+        assert [prev_in_HpathNS(k0, k1, perm) for perm in path[1:]] == path[:-1]
+        if path:
+            assert prev_in_HpathNS(k0, k1, path[0]) is None
+
+    def test_next_in_HpathNS_large(self):
+        perm = _HpathNS_ends(30, 31)[0]
+        for _ in range(500):
+            neighbor = next_in_HpathNS(30, 31, perm)
+            assert adjacent(perm, neighbor)
+            assert prev_in_HpathNS(30, 31, neighbor) == perm
+            perm = neighbor
+
+    def test_next_in_HpathNS_deep(self):
+        # the case construction has more levels than the recursion limit of Python
+        perm = (0, 1) * 600
+        try:
+            neighbor = next_in_HpathNS(600, 600, perm)
+            assert adjacent(perm, neighbor)
+            assert prev_in_HpathNS(600, 600, neighbor) == perm
+        finally:
+            verhoeff._HpathNS_ends.cache_clear()
+            verhoeff._landmark_step.cache_clear()
+
+    def test_step_tables_bounded(self):
+        # the ends and landmark steps are stored with bounded_cache, so clear_caches frees them
+        path = HpathNS(7, 6)
+        steps = [next_in_HpathNS(7, 6, perm) for perm in path]
+        assert verhoeff._HpathNS_ends.cache_info().currsize > 1
+        assert verhoeff._landmark_step.cache_info().currsize > 0
+        clear_caches()
+        assert verhoeff._HpathNS_ends.cache_info().currsize == 0
+        assert verhoeff._landmark_step.cache_info().currsize == 0
+        assert [next_in_HpathNS(7, 6, perm) for perm in path] == steps
+
+    @pytest.mark.parametrize(
+        "k0, k1, perm",
+        [
+            (2, 2, (0, 0, 1, 1)),
+            (2, 2, (0, 1, 1)),
+            (3, 2, (0, 0, 1, 1, 1)),
+            (2, 0, (0, 0)),
+        ],
+    )
+    def test_next_in_HpathNS_not_on_path(self, k0, k1, perm):
+        with pytest.raises(ValueError):
+            next_in_HpathNS(k0, k1, perm)
+
+
+class Test_HpathNS_random_access:
+    """
+    Test that the random access functions agree with the positions in HpathNS.
+    """
+
+    @pytest.mark.parametrize("k0", range(0, 8))
+    @pytest.mark.parametrize("k1", range(0, 8))
+    def test_HpathNS_at(self, k0, k1):
+        path = HpathNS(k0, k1)
+        assert [HpathNS_at(k0, k1, i) for i in range(len(path))] == path
+
+    @pytest.mark.parametrize("k0", range(0, 8))
+    @pytest.mark.parametrize("k1", range(0, 8))
+    def test_HpathNS_index(self, k0, k1):
+        path = HpathNS(k0, k1)
+        assert [HpathNS_index(k0, k1, perm) for perm in path] == list(range(len(path)))
+
+    @pytest.mark.parametrize("k", [(25, 25), (40, 33), (32, 45)])
+    def test_HpathNS_at_large(self, k):
+        length = HpathNS_length(*k)
+        for i in [0, 1, length // 3, length // 2 + 1, length - 2, length - 1]:
+            perm = HpathNS_at(*k, i)
+            assert HpathNS_index(*k, perm) == i
+            if i + 1 < length:
+                assert next_in_HpathNS(*k, perm) == HpathNS_at(*k, i + 1)
+
+    def test_HpathNS_at_deep(self):
+        # the tables and the case construction have more levels than the recursion limit of Python
+        length = HpathNS_length(300, 300)
+        try:
+            for i in [0, length // 3, length - 1]:
+                perm = HpathNS_at(300, 300, i)
+                assert HpathNS_index(300, 300, perm) == i
+        finally:
+            clear_caches()
+
+    def test_HpathNS_at_negative(self):
+        assert HpathNS_at(5, 3, -1) == HpathNS(5, 3)[-1]
+
+    @pytest.mark.parametrize("i", [56, -57])
+    def test_HpathNS_at_out_of_range(self, i):
+        with pytest.raises(IndexError):
+            HpathNS_at(5, 3, i)
+
+    @pytest.mark.parametrize("start, stop", [(0, 0), (0, 10), (100, 250), (300, 448)])
+    def test_iter_HpathNS_range(self, start, stop):
+        assert list(iter_HpathNS_range(9, 7, start, stop)) == HpathNS(9, 7)[start:stop]
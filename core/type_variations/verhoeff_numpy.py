@@ -1,11 +1,11 @@
 import copy
 import sys
-from itertools import permutations as itertoolspermutations
 
 import numpy as np
 
 from core.helper_operations.path_operations import adjacent, spurBaseIndex
 from core.helper_operations.permutation_graphs import binomial
+from core.helper_operations.permutation_ranking import permutation_chunks
 
 
 def stutterize(perm: np.array) -> np.ndarray:
@@ -23,15 +23,15 @@ def stutterize(perm: np.array) -> np.ndarray:
 
 def selectOdds(sig: np.array) -> np.array:
     """
-    Returns list of numbers with odd occurrence frequencies in the given signature.
+    Returns the numbers (colors) with odd occurrence frequencies in the given signature.
 
     Args:
         sig (np.array): A signature of a permutation.
 
     Returns:
-        np.array: A list of numbers with odd occurrence frequencies.
+        np.array: The numbers with odd occurrence frequencies.
     """
-    return sig[sig % 2 == 1]
+    return np.flatnonzero(sig % 2 == 1)
 
 
 def multiset(freq: np.array) -> np.ndarray:
@@ -57,9 +57,8 @@ def permutations(s: np.array) -> np.ndarray:
     Returns:
         np.ndarray: A list of all possible permutations with the input signature.
     """
-    # for itertools permutations:
-    # Elements are treated as unique based on their position, not on their value.
-    return np.unique(np.array(list(itertoolspermutations(multiset(s)))), axis=0)
+    # the chunks are in lexicographic order, so no sorting or deduplication is needed
+    return np.concatenate(list(permutation_chunks(tuple(s)))).astype(int)
 
 
 def stutterPermutations(s: np.array) -> np.ndarray:
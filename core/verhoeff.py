@@ -1,13 +1,36 @@
-import sys
-from functools import cache
+from functools import partial
+from typing import Callable, Generator, Iterator
 
+from core.helper_operations.bit_path import MAX_WIDTH, BitPath
+from core.helper_operations.bounded_cache import bounded_cache
+from core.helper_operations.lazy_paths import (
+    LazyPath,
+    _spur_stutter,
+    lazy_concat,
+    lazy_cut_cycle,
+    lazy_extend,
+    lazy_from_list,
+    lazy_incorporate_spurs,
+    lazy_reverse,
+    lazy_rotate,
+    lazy_slice,
+    lazy_square_tube,
+    lazy_transform,
+    lazy_zigzag,
+)
 from core.helper_operations.path_operations import (
     createSquareTube,
     createZigZagPath,
     cutCycle,
+    find_last_distinct_adjacent_index,
+    stutterPermutationQ,
+    transform,
 )
+from core.helper_operations.path_store import stored_path
+from core.helper_operations.perm_path import PermPath
 from core.helper_operations.permutation_graphs import (
     HpathQ,
+    binomial,
     extend,
     incorporateSpursInZigZag,
     rotate,
@@ -16,7 +39,7 @@ from core.helper_operations.permutation_graphs import (
 )
 
 
-@cache
+@bounded_cache
 def HpathNS(k0: int, k1: int) -> list[tuple[int, ...]]:
     """
     Computes a Hamiltonian path in the neighbor-swap graph on the non-stutter permutations for the given signature.
@@ -32,84 +55,232 @@ def HpathNS(k0: int, k1: int) -> list[tuple[int, ...]]:
     References:
         - Tom Verhoeff. The spurs of D. H. Lehmer: Hamiltonian paths in neighbor-swap graphs of permutations. Designs, Codes, and Cryptography, 84(1-2):295-310, 7 2017.
     """
+    return stored_path(
+        "HpathNS",
+        (k0, k1),
+        lambda: _iterative_HpathNS(k0, k1, lambda perms, width: perms),
+    )
+
+
+@bounded_cache
+def HpathNS_perm_path(k0: int, k1: int) -> PermPath:
+    """
+    Computes the same Hamiltonian path as ``HpathNS``, but stored in a `PermPath`.
+    All path operations of the construction work on the `uint8` buffers, so no tuple is allocated per vertex.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+
+    Returns:
+        PermPath: A Hamiltonian path in the neighbor-swap graph G(0^k_0|1^(k_1)).
+    """
+    return _iterative_HpathNS(k0, k1, PermPath.from_list)
+
+
+@bounded_cache
+def HpathNS_bit_path(k0: int, k1: int) -> BitPath:
+    """
+    Computes the same Hamiltonian path as ``HpathNS``, but stored in a `BitPath` with one `uint64` word per permutation.
+    All path operations of the construction work on the words with shifts and masks, so no tuple is allocated per vertex.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+
+    Returns:
+        BitPath: A Hamiltonian path in the neighbor-swap graph G(0^k_0|1^(k_1)).
+
+    Raises:
+        ValueError: If the permutations are longer than 64 elements.
+
+    Example:
+        >>> HpathNS_bit_path(2, 2).buffer
+        array([ 9,  5,  6, 10], dtype=uint64)
+    """
+    if k0 + k1 > MAX_WIDTH:
+        raise ValueError(
+            f"Binary permutations of length {k0 + k1} do not fit in {MAX_WIDTH} bits"
+        )
+    return _iterative_HpathNS(k0, k1, BitPath.from_list)
+
+
+def _HpathNS_dependencies(k0: int, k1: int) -> list[tuple[int, int]]:
+    """
+    Lists the smaller signatures whose Hamiltonian paths ``_HpathNS`` uses to construct the path of `(k0, k1)`.
+    A signature occurs once for every time it is used.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+
+    Returns:
+        list[tuple[int, int]]: The signatures `(k0, k1)` of the sub-paths.
+    """
+    if k0 <= 1 or k1 <= 1:
+        return []
+    if k0 < k1:
+        return [(k1, k0)]
+    if k0 % 2 == 0 or k1 % 2 == 0:
+        return [(k0, k1 - 1), (k0 - 1, k1)]
+    if k0 == k1:
+        return [(k0, k1 - 2), (k0 - 1, k1 - 3), (k0 - 2, k1 - 2)]
+    return [
+        (k0, k1 - 2),
+        (k0 - 1, k1 - 3),
+        (k0 - 2, k1 - 2),
+        (k0 - 3, k1 - 1),
+        (k0 - 2, k1),
+    ]
+
+
+def _iterative_HpathNS(
+    k0: int,
+    k1: int,
+    new_path: Callable[
+        [list[tuple[int, ...]], int], list[tuple[int, ...]] | PermPath | BitPath
+    ],
+) -> list[tuple[int, ...]] | PermPath | BitPath:
+    """
+    Computes ``HpathNS`` bottom-up over the grid of signatures, without recursion.
+    First the signatures that are needed are collected with an explicit stack,
+    then their paths are constructed from small to large with ``_HpathNS``.
+    A sub-path is freed as soon as the last path that uses it is constructed.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        new_path (Callable[[list[tuple[int, ...]], int], list[tuple[int, ...]] | PermPath | BitPath]):
+            Converts a list of permutations of the given length to the representation of the paths.
+
+    Returns:
+        list[tuple[int, ...]] | PermPath | BitPath: A Hamiltonian path in the neighbor-swap graph G(0^k_0|1^(k_1)).
+    """
+    # number of paths that still have to use the path of a signature
+    consumers = {(k0, k1): 1}
+    stack = [(k0, k1)]
+    while stack:
+        for dependency in _HpathNS_dependencies(*stack.pop()):
+            if dependency not in consumers:
+                consumers[dependency] = 0
+                stack.append(dependency)
+            consumers[dependency] += 1
+    # every dependency has fewer elements, or the same elements with k0 > k1 when k0 < k1
+    order = sorted(consumers, key=lambda sig: (sig[0] + sig[1], sig[0] < sig[1]))
+    paths = {}
+    for sig in order:
+        paths[sig] = _HpathNS(*sig, lambda a, b: paths[(a, b)], new_path)
+        for dependency in _HpathNS_dependencies(*sig):
+            consumers[dependency] -= 1
+            if consumers[dependency] == 0:
+                del paths[dependency]
+    return paths[(k0, k1)]
+
+
+def _HpathNS(
+    k0: int,
+    k1: int,
+    sub: Callable[[int, int], list[tuple[int, ...]] | PermPath | BitPath],
+    new_path: Callable[
+        [list[tuple[int, ...]], int], list[tuple[int, ...]] | PermPath | BitPath
+    ],
+) -> list[tuple[int, ...]] | PermPath | BitPath:
+    """
+    The construction of ``HpathNS``, independent of the representation of the paths.
+    The Hamiltonian paths of the smaller signatures listed by ``_HpathNS_dependencies`` are taken from `sub`.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        sub (Callable[[int, int], list[tuple[int, ...]] | PermPath | BitPath]):
+            Returns the (already constructed) Hamiltonian path of a smaller signature.
+        new_path (Callable[[list[tuple[int, ...]], int], list[tuple[int, ...]] | PermPath | BitPath]):
+            Converts a list of permutations of the given length to the representation of `sub`.
+
+    Returns:
+        list[tuple[int, ...]] | PermPath | BitPath: A Hamiltonian path in the neighbor-swap graph G(0^k_0|1^(k_1)).
+    """
     odd_perms = []
     tuple_0 = tuple(k0 * [0])
     tuple_1 = tuple(k1 * [1])
-    sys.setrecursionlimit(2500)
     if k0 == 0:
         if k1 % 2 == 0:
-            return []
-        return [tuple_1]
+            return new_path([], k0 + k1)
+        return new_path([tuple_1], k0 + k1)
     elif k1 == 0:
         if k0 % 2 == 0:
-            return []
-        return [tuple_0]
+            return new_path([], k0 + k1)
+        return new_path([tuple_0], k0 + k1)
     elif k1 == 1:
         # path from 1^k1 0 to 0 1^k1, if k0 odd, else from 1^(k1-1) 0 1 to 0 1^k1
         for i in reversed(range(k0 + 1)):
             odd_perms.append(tuple_0[:i] + tuple_1 + tuple_0[i:])
-        return odd_perms if k0 % 2 else odd_perms[1:]
+        return new_path(odd_perms if k0 % 2 else odd_perms[1:], k0 + k1)
     elif k0 == 1:
         # path from 0^k0 1 to 1 0^k0, if k1 odd, else from 0^(k0-1) 1 0 to 1 0^k0
         for i in reversed(range(k1 + 1)):
             odd_perms.append(tuple_1[:i] + tuple_0 + tuple_1[i:])
-        return odd_perms if k1 % 2 else odd_perms[1:]
+        return new_path(odd_perms if k1 % 2 else odd_perms[1:], k0 + k1)
     if k0 < k1:
-        return [tuple(1 if x == 0 else 0 for x in tup) for tup in HpathNS(k1, k0)]
+        return transform(sub(k1, k0), [1, 0])
     if k0 % 2 == 1 and k1 % 2 == 0:
         p1 = extend(
-            HpathNS(k0, k1 - 1), (1,)
+            sub(k0, k1 - 1), (1,)
         )  # A Hamiltonian path from 0^k0 1^k1 to 1^(k1-1) 0^k0 1
         p0 = extend(
-            HpathNS(k0 - 1, k1), (0,)
+            sub(k0 - 1, k1), (0,)
         )  # A Hamiltonian cycle from 1^(k1-1) 0^(k0-1) 1 0
 
         return p1[:-1] + rotate(p0, 1) + [p1[-1]]
 
     elif k0 % 2 == 0 and k1 % 2 == 1:
         p1 = extend(
-            HpathNS(k0, k1 - 1), (1,)
+            sub(k0, k1 - 1), (1,)
         )  # A Hamiltonian cycle containing edge 0^(k0-1) 1^(k1-1) 0 1 ~ 0^(k0-2) 1 0 1^(k1-2) 0 1
         p0 = extend(
-            HpathNS(k0 - 1, k1), (0,)
+            sub(k0 - 1, k1), (0,)
         )  # A Hamiltonian path from 0^(k0-1) 1^k1 0 to 1^k1 0^k1
         v = p0[0]
 
         return [v] + cutCycle(p1[::-1], swapPair(v, -2)) + p0[1:]
     elif k0 % 2 == 0 and k1 % 2 == 0:
         p1 = extend(
-            HpathNS(k0, k1 - 1), (1,)
+            sub(k0, k1 - 1), (1,)
         )  # A Hamiltonian path from 0^(k0-1) 1^(k1-1) 0 1 to 1^(k1-1) 0^k0 1
-        p0 = extend(HpathNS(k0 - 1, k1), (0,))
+        p0 = extend(sub(k0 - 1, k1), (0,))
 
         if k0 == k1:  # p0 is a path from 0^(k0-1) 1^k1 0 to 1^(k1-1) 0^(k0-1) 1 0
             return p1[::-1] + p0[::-1]
         return p1[::-1] + p0
     else:
-        p11 = HpathNS(k0, k1 - 2)
-        p1101 = HpathNS(k0 - 1, k1 - 3)
-        p0101 = HpathNS(k0 - 2, k1 - 2)
+        p11 = sub(k0, k1 - 2)
+        p1101 = sub(k0 - 1, k1 - 3)
+        p0101 = sub(k0 - 2, k1 - 2)
         if k0 == k1:
-            p0001 = [tuple([1 if x == 0 else 0 for x in tup]) for tup in p1101]
-            p00 = [tuple([1 if x == 0 else 0 for x in tup]) for tup in p11]
+            p0001 = transform(p1101, [1, 0])
+            p00 = transform(p11, [1, 0])
         else:
-            p0001 = HpathNS(k0 - 3, k1 - 1)
-            p00 = HpathNS(k0 - 2, k1)
+            p0001 = sub(k0 - 3, k1 - 1)
+            p00 = sub(k0 - 2, k1)
 
-        sp00 = extend(stutterPermutations([k0 - 3, k1 - 1]), (0, 0))
-        sp11 = extend(stutterPermutations([k0 - 1, k1 - 3]), (1, 1))
+        sp00 = extend(
+            new_path(stutterPermutations([k0 - 3, k1 - 1]), k0 + k1 - 4), (0, 0)
+        )
+        sp11 = extend(
+            new_path(stutterPermutations([k0 - 1, k1 - 3]), k0 + k1 - 4), (1, 1)
+        )
         tube = createSquareTube(p0101[::-1], (0, 1), (1, 0))
         tube1, tube2, tube3 = tube[:3], tube[3:-2], tube[-2:]
 
         if len(p1101) == 0:
-            c11xy = [stut + suff for suff in [(0, 1), (1, 0)] for stut in sp11]
+            c11xy = extend(sp11, (0, 1)) + extend(sp11, (1, 0))
         else:
             ext_path = extend(cutCycle(p1101, p0101[0][:-1] + (0,)), (1, 1))
             p11xy = rotate(createZigZagPath(ext_path, (1, 0), (0, 1)), 1)
             c11xy = incorporateSpursInZigZag(p11xy, sp11, [(0, 1), (1, 0)], 2)
 
         if len(p0001) == 0:
-            c00xy = [stut + suff for suff in [(1, 0), (0, 1)] for stut in sp00]
+            c00xy = extend(sp00, (1, 0)) + extend(sp00, (0, 1))
         else:
             ext_path = extend(cutCycle(p0001, p0101[-1][:-1] + (1,)), (0, 0))
             p00xy = rotate(createZigZagPath(ext_path, (0, 1), (1, 0)), 1)
@@ -128,3 +299,1952 @@ def HpathNS(k0: int, k1: int) -> list[tuple[int, ...]]:
             + extend(p00, (0, 0))
         )
         return path_ham
+
+
+def HpathNS_length(k0: int, k1: int) -> int:
+    """
+    Computes the length of the Hamiltonian path ``HpathNS(k0, k1)`` without constructing it.
+    This is the number of non-stutter permutations, except for a single color of odd length which gives one permutation.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+
+    Returns:
+        int: The number of permutations in ``HpathNS(k0, k1)``.
+    """
+    if k0 == 0 or k1 == 0:
+        return (k0 + k1) % 2
+    if k0 % 2 == 1 and k1 % 2 == 1:
+        return binomial(k0, k1)
+    return binomial(k0, k1) - binomial(k0 // 2, k1 // 2)
+
+
+def iter_HpathNS(k0: int, k1: int, reverse: bool = False) -> Iterator[tuple[int, ...]]:
+    """
+    Generates the Hamiltonian path of ``HpathNS`` one permutation at a time, in exactly the same order.
+    Nothing is cached and the memory is proportional to the recursion depth (about `k0 + k1`) instead of the length of the path.
+    Cycles that are cut at a vertex are generated twice (once up to the vertex and once from it), so generating is slower than ``HpathNS``.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        reverse (bool, optional): Whether the path should be generated from its last permutation to its first. Defaults to False.
+
+    Returns:
+        Iterator[tuple[int, ...]]: The permutations of the Hamiltonian path in the neighbor-swap graph G(0^k_0|1^(k_1)).
+
+    Example:
+        >>> list(iter_HpathNS(2, 2)) == HpathNS(2, 2)
+        True
+    """
+    return _lazy_HpathNS(k0, k1)(reverse)
+
+
+def _lazy_HpathNS(k0: int, k1: int) -> LazyPath:
+    """
+    The construction of ``HpathNS`` on lazy paths, see ``core.helper_operations.lazy_paths``.
+    Follows the same case distinction as ``_HpathNS``.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+
+    Returns:
+        LazyPath: The Hamiltonian path in the neighbor-swap graph G(0^k_0|1^(k_1)).
+    """
+    if k0 == 0 or k1 == 0 or k0 == 1 or k1 == 1:
+        # the base cases are linear, so they are generated directly
+        return partial(_iter_HpathNS_base, k0, k1)
+    if k0 < k1:
+        return lazy_transform(_sub_HpathNS(k1, k0), [1, 0])
+    p1 = lazy_extend(_sub_HpathNS(k0, k1 - 1), (1,))
+    p0 = lazy_extend(_sub_HpathNS(k0 - 1, k1), (0,))
+    length_p1, length_p0 = HpathNS_length(k0, k1 - 1), HpathNS_length(k0 - 1, k1)
+    if k0 % 2 == 1 and k1 % 2 == 0:
+        return lazy_concat(
+            lazy_slice(p1, 0, length_p1 - 1, length_p1),
+            lazy_rotate(p0, 1, length_p0),
+            lazy_slice(p1, length_p1 - 1, length_p1, length_p1),
+        )
+    elif k0 % 2 == 0 and k1 % 2 == 1:
+        v = next(p0(False))
+        return lazy_concat(
+            lazy_from_list([v]),
+            lazy_cut_cycle(lazy_reverse(p1), swapPair(v, -2)),
+            lazy_slice(p0, 1, length_p0, length_p0),
+        )
+    elif k0 % 2 == 0 and k1 % 2 == 0:
+        if k0 == k1:
+            return lazy_concat(lazy_reverse(p1), lazy_reverse(p0))
+        return lazy_concat(lazy_reverse(p1), p0)
+    p11 = _sub_HpathNS(k0, k1 - 2)
+    p1101 = _sub_HpathNS(k0 - 1, k1 - 3)
+    p0101 = _sub_HpathNS(k0 - 2, k1 - 2)
+    length_p1101 = HpathNS_length(k0 - 1, k1 - 3)
+    length_p0101 = HpathNS_length(k0 - 2, k1 - 2)
+    if k0 == k1:
+        p0001 = lazy_transform(p1101, [1, 0])
+        p00 = lazy_transform(p11, [1, 0])
+    else:
+        p0001 = _sub_HpathNS(k0 - 3, k1 - 1)
+        p00 = _sub_HpathNS(k0 - 2, k1)
+    length_p0001 = HpathNS_length(k0 - 3, k1 - 1)
+
+    length_tube = 4 * length_p0101
+    tube = lazy_square_tube(lazy_reverse(p0101), (0, 1), (1, 0), length_p0101)
+    tube1 = lazy_slice(tube, 0, 3, length_tube)
+    tube2 = lazy_slice(tube, 3, length_tube - 2, length_tube)
+    tube3 = lazy_slice(tube, length_tube - 2, length_tube, length_tube)
+
+    if length_p1101 == 0:
+        sp11 = lazy_from_list(extend(stutterPermutations([k0 - 1, k1 - 3]), (1, 1)))
+        c11xy = lazy_concat(lazy_extend(sp11, (0, 1)), lazy_extend(sp11, (1, 0)))
+    else:
+        vertex = next(p0101(False))[:-1] + (0,)
+        ext_path = lazy_extend(lazy_cut_cycle(p1101, vertex), (1, 1))
+        p11xy = lazy_rotate(
+            lazy_zigzag(ext_path, (1, 0), (0, 1), length_p1101), 1, 2 * length_p1101
+        )
+        c11xy = lazy_incorporate_spurs(p11xy, 2)
+
+    if length_p0001 == 0:
+        sp00 = lazy_from_list(extend(stutterPermutations([k0 - 3, k1 - 1]), (0, 0)))
+        c00xy = lazy_concat(lazy_extend(sp00, (1, 0)), lazy_extend(sp00, (0, 1)))
+    else:
+        vertex = next(p0101(True))[:-1] + (1,)
+        ext_path = lazy_extend(lazy_cut_cycle(p0001, vertex), (0, 0))
+        p00xy = lazy_rotate(
+            lazy_zigzag(ext_path, (0, 1), (1, 0), length_p0001), 1, 2 * length_p0001
+        )
+        c00xy = lazy_incorporate_spurs(p00xy, 2)
+
+    if k0 - 2 < k1:
+        p00 = lazy_reverse(p00)
+
+    return lazy_concat(
+        lazy_extend(p11, (1, 1)),
+        tube1,
+        c00xy,
+        tube2,
+        c11xy,
+        tube3,
+        lazy_extend(p00, (0, 0)),
+    )
+
+
+def _sub_HpathNS(k0: int, k1: int) -> LazyPath:
+    """
+    Returns the lazy Hamiltonian path of a smaller signature, which is only set up when it is traversed.
+    This keeps the setup of the lazy path proportional to the recursion depth.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+
+    Returns:
+        LazyPath: The Hamiltonian path in the neighbor-swap graph G(0^k_0|1^(k_1)).
+    """
+
+    def stream(reverse: bool) -> Iterator[tuple[int, ...]]:
+        """
+        Generates the Hamiltonian path of `(k0, k1)` from scratch.
+
+        Args:
+            reverse (bool): Whether to yield the vertices in reversed order.
+
+        Returns:
+            Iterator[tuple[int, ...]]: The vertices of the path.
+        """
+        return _lazy_HpathNS(k0, k1)(reverse)
+
+    return stream
+
+
+def _iter_HpathNS_base(k0: int, k1: int, reverse: bool) -> Iterator[tuple[int, ...]]:
+    """
+    Generates the base cases of ``HpathNS``, where one of the colors occurs at most once.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        reverse (bool): Whether the path should be generated from its last permutation to its first.
+
+    Returns:
+        Iterator[tuple[int, ...]]: The permutations of the Hamiltonian path.
+    """
+    tuple_0 = tuple(k0 * [0])
+    tuple_1 = tuple(k1 * [1])
+    if k0 == 0 or k1 == 0:
+        if (k0 + k1) % 2 == 1:
+            yield tuple_0 + tuple_1
+    elif k1 == 1:
+        # path from 1^k1 0 to 0 1^k1, if k0 odd, else from 1^(k1-1) 0 1 to 0 1^k1
+        indices = range(k0 if k0 % 2 else k0 - 1, -1, -1)
+        for i in reversed(indices) if reverse else indices:
+            yield tuple_0[:i] + tuple_1 + tuple_0[i:]
+    else:
+        # path from 0^k0 1 to 1 0^k0, if k1 odd, else from 0^(k0-1) 1 0 to 1 0^k0
+        indices = range(k1 if k1 % 2 else k1 - 1, -1, -1)
+        for i in reversed(indices) if reverse else indices:
+            yield tuple_1[:i] + tuple_0 + tuple_1[i:]
+
+
+def next_in_HpathNS(k0: int, k1: int, perm: tuple[int, ...]) -> tuple[int, ...] | None:
+    """
+    Computes the permutation after `perm` on the Hamiltonian path ``HpathNS(k0, k1)``, without generating the path.
+    The neighbor is derived from the case construction of ``HpathNS``: every case only needs the sub-path that contains `perm`,
+    so there are `O(k0 + k1)` recursion levels and only the first and last vertices of the sub-paths are cached.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        perm (tuple[int, ...]): A permutation on the path.
+
+    Returns:
+        tuple[int, ...] | None: The next permutation on the path, or None if `perm` is the last permutation.
+
+    Raises:
+        ValueError: If `perm` is not a permutation on the path.
+
+    Example:
+        >>> HpathNS(3, 2)[:2]
+        [(0, 0, 0, 1, 1), (0, 0, 1, 0, 1)]
+        >>> next_in_HpathNS(3, 2, (0, 0, 0, 1, 1))
+        (0, 0, 1, 0, 1)
+    """
+    perm = _check_HpathNS_vertex(k0, k1, perm)
+    return _step_HpathNS(k0, k1, perm, False)
+
+
+def prev_in_HpathNS(k0: int, k1: int, perm: tuple[int, ...]) -> tuple[int, ...] | None:
+    """
+    Computes the permutation before `perm` on the Hamiltonian path ``HpathNS(k0, k1)``, without generating the path.
+    See ``next_in_HpathNS``.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        perm (tuple[int, ...]): A permutation on the path.
+
+    Returns:
+        tuple[int, ...] | None: The previous permutation on the path, or None if `perm` is the first permutation.
+
+    Raises:
+        ValueError: If `perm` is not a permutation on the path.
+    """
+    perm = _check_HpathNS_vertex(k0, k1, perm)
+    return _step_HpathNS(k0, k1, perm, True)
+
+
+def _check_HpathNS_vertex(k0: int, k1: int, perm: tuple[int, ...]) -> tuple[int, ...]:
+    """
+    Checks that `perm` is a permutation on the Hamiltonian path ``HpathNS(k0, k1)``.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        perm (tuple[int, ...]): The permutation to check.
+
+    Returns:
+        tuple[int, ...]: The permutation as a tuple.
+
+    Raises:
+        ValueError: If `perm` is not a permutation on the path.
+    """
+    perm = tuple(perm)
+    if (
+        len(perm) != k0 + k1
+        or perm.count(1) != k1
+        or perm.count(0) != k0
+        or HpathNS_length(k0, k1) == 0
+        or (k0 > 0 and k1 > 0 and stutterPermutationQ(perm))
+    ):
+        raise ValueError(f"Permutation {perm} is not on the path HpathNS({k0}, {k1})")
+    return perm
+
+
+def _complement(perm: tuple[int, ...]) -> tuple[int, ...]:
+    """
+    Swaps the 0s and 1s of a binary permutation, i.e. `transform(perm, [1, 0])` for a single permutation.
+
+    Args:
+        perm (tuple[int, ...]): A binary permutation.
+
+    Returns:
+        tuple[int, ...]: The complemented permutation.
+    """
+    return tuple(1 - x for x in perm)
+
+
+def _inversion_parity(perm: tuple[int, ...]) -> int:
+    """
+    Computes the parity of the number of inversions of a binary permutation.
+    Neighbors in a neighbor-swap graph have a different parity, so along a path the parity alternates.
+
+    Args:
+        perm (tuple[int, ...]): A binary permutation.
+
+    Returns:
+        int: 0 if the number of inversions is even, 1 if it is odd.
+    """
+    ones = inversions = 0
+    for x in perm:
+        if x:
+            ones += 1
+        else:
+            inversions += ones
+    return inversions % 2
+
+
+def _HpathNS_ends_dependencies(k0: int, k1: int) -> list[tuple[int, int]]:
+    """
+    Lists the smaller signatures whose ends ``_HpathNS_ends_case`` uses to compute the ends of `(k0, k1)`.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+
+    Returns:
+        list[tuple[int, int]]: The signatures `(k0, k1)` of the sub-paths.
+    """
+    if k0 <= 1 or k1 <= 1:
+        return []
+    if k0 < k1:
+        return [(k1, k0)]
+    if k0 % 2 == 1 and k1 % 2 == 0:
+        return [(k0, k1 - 1)]
+    if k0 % 2 == 0 and k1 % 2 == 1:
+        return [(k0 - 1, k1)]
+    if k0 % 2 == 0 and k1 % 2 == 0:
+        return [(k0, k1 - 1), (k0 - 1, k1)]
+    return [(k0, k1 - 2), (k0 - 2, k1)]
+
+
+@bounded_cache
+def _HpathNS_ends(
+    k0: int, k1: int
+) -> tuple[tuple[int, ...] | None, tuple[int, ...] | None]:
+    """
+    Computes the first and last permutation of ``HpathNS(k0, k1)`` from the case construction, see ``_HpathNS_ends_case``.
+    The ends of smaller signatures that are not cached are collected with an explicit stack
+    and computed from small to large, like ``_iterative_HpathNS`` does for the paths, so there is no recursion.
+    They are cached as well, since the steps on the path look up the ends of all sub-paths.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+
+    Returns:
+        tuple[tuple[int, ...] | None, tuple[int, ...] | None]: The first and last permutation, or None if the path is empty.
+    """
+    ends = {}
+    stack = [(k0, k1)]
+    while stack:
+        for dependency in _HpathNS_ends_dependencies(*stack.pop()):
+            if dependency in ends:
+                continue
+            if _HpathNS_ends.cache_contains(*dependency):
+                ends[dependency] = _HpathNS_ends(*dependency)
+            else:
+                ends[dependency] = None
+                stack.append(dependency)
+    missing = [sig for sig, end in ends.items() if end is None]
+    # every dependency has fewer elements, or the same elements with k0 > k1 when k0 < k1
+    for sig in sorted(missing, key=lambda sig: (sig[0] + sig[1], sig[0] < sig[1])):
+        ends[sig] = _HpathNS_ends_case(*sig, lambda a, b: ends[(a, b)])
+        _HpathNS_ends.cache_store(ends[sig], *sig)
+    return _HpathNS_ends_case(k0, k1, lambda a, b: ends[(a, b)])
+
+
+def _HpathNS_ends_case(
+    k0: int,
+    k1: int,
+    sub_ends: Callable[
+        [int, int], tuple[tuple[int, ...] | None, tuple[int, ...] | None]
+    ],
+) -> tuple[tuple[int, ...] | None, tuple[int, ...] | None]:
+    """
+    Computes the first and last permutation of ``HpathNS(k0, k1)`` from the ends of the sub-paths, see ``_HpathNS_ends_dependencies``.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        sub_ends (Callable[[int, int], tuple[tuple[int, ...] | None, tuple[int, ...] | None]]):
+            Returns the first and last permutation of the path of a signature `(k0, k1)` in ``_HpathNS_ends_dependencies``.
+
+    Returns:
+        tuple[tuple[int, ...] | None, tuple[int, ...] | None]: The first and last permutation, or None if the path is empty.
+    """
+    if k0 == 0 or k1 == 0:
+        if (k0 + k1) % 2 == 0:
+            return None, None
+        return (0,) * k0 + (1,) * k1, (0,) * k0 + (1,) * k1
+    if k1 == 1 or k0 == 1:
+        single, other, m = (1, 0, k0) if k1 == 1 else (0, 1, k1)
+        top = m if m % 2 else m - 1
+        return (other,) * top + (single,) + (other,) * (m - top), (single,) + (
+            other,
+        ) * m
+    if k0 < k1:
+        first, last = sub_ends(k1, k0)
+        return _complement(first), _complement(last)
+    if k0 % 2 == 1 and k1 % 2 == 0:
+        first1, last1 = sub_ends(k0, k1 - 1)
+        return first1 + (1,), last1 + (1,)
+    elif k0 % 2 == 0 and k1 % 2 == 1:
+        first0, last0 = sub_ends(k0 - 1, k1)
+        return first0 + (0,), last0 + (0,)
+    elif k0 % 2 == 0 and k1 % 2 == 0:
+        first1, last1 = sub_ends(k0, k1 - 1)
+        first0, last0 = sub_ends(k0 - 1, k1)
+        return last1 + (1,), (first0 if k0 == k1 else last0) + (0,)
+    first11, _ = sub_ends(k0, k1 - 2)
+    first00, last00 = sub_ends(k0 - 2, k1)
+    return first11 + (1, 1), (first00 if k0 == k1 else last00) + (0, 0)
+
+
+@bounded_cache
+def _landmark_step(
+    k0: int, k1: int, perm: tuple[int, ...], reverse: bool
+) -> tuple[int, ...] | None:
+    """
+    Cached ``_step_HpathNS`` for the few fixed permutations (ends and cut points) that the case construction refers to.
+    Without the cache these lookups would branch the steps at every level.
+    Within ``_step_HpathNS`` the frames request the landmarks on its stack instead, which stores them in the same cache.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        perm (tuple[int, ...]): The landmark, a permutation on the path.
+        reverse (bool): Whether to step to the previous permutation instead of the next one.
+
+    Returns:
+        tuple[int, ...] | None: The neighbor of `perm`, or None if `perm` is the end of the path in that direction.
+    """
+    return _step_HpathNS(k0, k1, perm, reverse)
+
+
+def _cycle_step(
+    k0: int, k1: int, perm: tuple[int, ...], reverse: bool
+) -> Generator[tuple, tuple[int, ...] | None, tuple[int, ...]]:
+    """
+    Steps along ``HpathNS(k0, k1)`` as a cycle: the last permutation is followed by the first one.
+    Part of a frame of ``_step_HpathNS``, the step on the path is requested from its stack.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        perm (tuple[int, ...]): A permutation on the path.
+        reverse (bool): Whether to step to the previous permutation instead of the next one.
+
+    Returns:
+        Generator[tuple, tuple[int, ...] | None, tuple[int, ...]]: Requests the step and returns the neighbor of `perm` on the cycle.
+    """
+    neighbor = yield k0, k1, perm, reverse, False
+    if neighbor is None:
+        return _HpathNS_ends(k0, k1)[0 if not reverse else 1]
+    return neighbor
+
+
+def _step_HpathNS(
+    k0: int, k1: int, perm: tuple[int, ...], reverse: bool
+) -> tuple[int, ...] | None:
+    """
+    Steps from `perm` to its neighbor on ``HpathNS(k0, k1)``, following the same case distinction as ``_HpathNS``.
+    Every case only steps on the sub-path that contains `perm` and on a few landmarks (see ``_landmark_step``),
+    so instead of recursing once per level, the cases are kept as frames on an explicit stack, see ``_step_frame``.
+    A frame yields `(k0, k1, perm, reverse, landmark)` to request a step on a sub-path, and is sent the neighbor.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        perm (tuple[int, ...]): A permutation on the path.
+        reverse (bool): Whether to step to the previous permutation instead of the next one.
+
+    Returns:
+        tuple[int, ...] | None: The neighbor of `perm`, or None if `perm` is the end of the path in that direction.
+    """
+    frames = [_step_frame(k0, k1, perm, reverse)]
+    # the landmark whose step a frame computes, to cache its result
+    landmarks = [None]
+    neighbor = None
+    while frames:
+        try:
+            request = frames[-1].send(neighbor)
+        except StopIteration as stop:
+            frames.pop()
+            neighbor = stop.value
+            landmark = landmarks.pop()
+            if landmark is not None:
+                _landmark_step.cache_store(neighbor, *landmark)
+            continue
+        key, landmark = request[:4], request[4]
+        if landmark and _landmark_step.cache_contains(*key):
+            neighbor = _landmark_step(*key)
+            continue
+        frames.append(_step_frame(*key))
+        landmarks.append(key if landmark else None)
+        neighbor = None
+    return neighbor
+
+
+def _step_frame(
+    k0: int, k1: int, perm: tuple[int, ...], reverse: bool
+) -> Generator[tuple, tuple[int, ...] | None, tuple[int, ...] | None]:
+    """
+    A single level of ``_step_HpathNS``: the case of ``_HpathNS`` that contains `perm`.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        perm (tuple[int, ...]): A permutation on the path.
+        reverse (bool): Whether to step to the previous permutation instead of the next one.
+
+    Returns:
+        Generator[tuple, tuple[int, ...] | None, tuple[int, ...] | None]:
+            Requests the steps on the sub-paths and returns the neighbor of `perm`,
+            or None if `perm` is the end of the path in that direction.
+    """
+    if k0 == 0 or k1 == 0:
+        return None
+    if k1 == 1 or k0 == 1:
+        # the single element moves from position `top` down to position 0
+        single, other, m = (1, 0, k0) if k1 == 1 else (0, 1, k1)
+        top = m if m % 2 else m - 1
+        i = perm.index(single) + (1 if reverse else -1)
+        if i < 0 or i > top:
+            return None
+        return (other,) * i + (single,) + (other,) * (m - i)
+    if k0 < k1:
+        neighbor = yield k1, k0, _complement(perm), reverse, False
+        return None if neighbor is None else _complement(neighbor)
+    head, tail = perm[:-1], perm[-1]
+    if k0 % 2 == 1 and k1 % 2 == 0:
+        # p1[:-1] + rotate(p0, 1) + [p1[-1]]
+        first0, last0 = _HpathNS_ends(k0 - 1, k1)
+        last1 = _HpathNS_ends(k0, k1 - 1)[1]
+        if tail == 1:
+            if head == last1:
+                return None if not reverse else first0 + (0,)
+            neighbor = yield k0, k1 - 1, head, reverse, False
+            if neighbor == last1:
+                return (yield k0 - 1, k1, first0, False, True) + (0,)
+            return None if neighbor is None else neighbor + (1,)
+        if head == first0:
+            return last1 + (1,) if not reverse else last0 + (0,)
+        neighbor = yield from _cycle_step(k0 - 1, k1, head, reverse)
+        if neighbor == first0 and reverse:
+            return (yield k0, k1 - 1, last1, True, True) + (1,)
+        return neighbor + (0,)
+    elif k0 % 2 == 0 and k1 % 2 == 1:
+        # [v] + cutCycle(p1[::-1], swapPair(v, -2)) + p0[1:]
+        first0 = _HpathNS_ends(k0 - 1, k1)[0]
+        cut = swapPair(first0 + (0,), -2)[:-1]
+        cut_end = yield k0, k1 - 1, cut, False, True
+        if cut_end is None:
+            cut_end = _HpathNS_ends(k0, k1 - 1)[0]
+        if tail == 1:
+            if not reverse and head == cut_end:
+                return (yield k0 - 1, k1, first0, False, True) + (0,)
+            if reverse and head == cut:
+                return first0 + (0,)
+            return (yield from _cycle_step(k0, k1 - 1, head, not reverse)) + (1,)
+        if head == first0:
+            return None if reverse else cut + (1,)
+        neighbor = yield k0 - 1, k1, head, reverse, False
+        if neighbor == first0:
+            return cut_end + (1,)
+        return None if neighbor is None else neighbor + (0,)
+    elif k0 % 2 == 0 and k1 % 2 == 0:
+        # p1[::-1] + p0, or p1[::-1] + p0[::-1] if k0 == k1
+        flip = k0 == k1
+        if tail == 1:
+            neighbor = yield k0, k1 - 1, head, not reverse, False
+            if neighbor is not None:
+                return neighbor + (1,)
+            if reverse:
+                return None
+            return _HpathNS_ends(k0 - 1, k1)[1 if flip else 0] + (0,)
+        neighbor = yield k0 - 1, k1, head, reverse != flip, False
+        if neighbor is not None:
+            return neighbor + (0,)
+        return _HpathNS_ends(k0, k1 - 1)[0] + (1,) if reverse else None
+    return (yield from _step_HpathNS_odd_odd(k0, k1, perm, reverse))
+
+
+def _step_HpathNS_odd_odd(
+    k0: int, k1: int, perm: tuple[int, ...], reverse: bool
+) -> Generator[tuple, tuple[int, ...] | None, tuple[int, ...] | None]:
+    """
+    ``_step_frame`` for `k0 >= k1` both odd, where the path is
+    `p11 + tube1 + c00xy + tube2 + c11xy + tube3 + p00` (see ``_HpathNS``).
+    The part that contains `perm` is recognized by its last four elements.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        perm (tuple[int, ...]): A permutation on the path.
+        reverse (bool): Whether to step to the previous permutation instead of the next one.
+
+    Returns:
+        Generator[tuple, tuple[int, ...] | None, tuple[int, ...] | None]:
+            Requests the steps on the sub-paths and returns the neighbor of `perm`,
+            or None if `perm` is the end of the path in that direction.
+    """
+    first0101, last0101 = _HpathNS_ends(k0 - 2, k1 - 2)
+    # the tube positions just before and after the other parts, as (vertex of p0101, index within its 4 copies)
+    tube_start, tube_end = (last0101, 0), (first0101, 3)
+    c00_entry, c00_exit = (last0101, 2), (last0101, 3)
+    c11_entry, c11_exit = (first0101, 1), (first0101, 2)
+    c00, c11 = _odd_odd_zigzags(k0, k1)
+    flip00 = k0 == k1
+    if perm[-2:] == (1, 1):
+        neighbor = yield k0, k1 - 2, perm[:-2], reverse, False
+        if neighbor is not None:
+            return neighbor + (1, 1)
+        return None if reverse else (yield from _tube_vertex(k0, k1, *tube_start))
+    if perm[-2:] == (0, 0):
+        neighbor = yield k0 - 2, k1, perm[:-2], reverse != flip00, False
+        if neighbor is not None:
+            return neighbor + (0, 0)
+        return (yield from _tube_vertex(k0, k1, *tube_end)) if reverse else None
+    for part, entry, exit in ((c00, c00_entry, c00_exit), (c11, c11_entry, c11_exit)):
+        if perm[-4:-2] == part[-1]:
+            neighbor = yield from _step_zigzag_with_spurs(*part, perm, reverse)
+            if neighbor is not None:
+                return neighbor
+            return (yield from _tube_vertex(k0, k1, *(entry if reverse else exit)))
+    # a vertex of the square tube
+    yield from _tube_landmark(k0, k1, perm[:-4])
+    position = (perm[:-4], _tube_modules(k0, k1, perm[:-4]).index(perm[-4:]))
+    if not reverse and position == c00_entry:
+        return _zigzag_with_spurs_ends(*c00)[0]
+    if reverse and position == c00_exit:
+        return _zigzag_with_spurs_ends(*c00)[1]
+    if not reverse and position == c11_entry:
+        return _zigzag_with_spurs_ends(*c11)[0]
+    if reverse and position == c11_exit:
+        return _zigzag_with_spurs_ends(*c11)[1]
+    z, r = position
+    r += -1 if reverse else 1
+    if 0 <= r < 4:
+        return (yield from _tube_vertex(k0, k1, z, r))
+    # the tube runs along p0101 reversed, four copies per vertex
+    z = yield k0 - 2, k1 - 2, z, not reverse, False
+    if z is None:
+        if reverse:
+            return _HpathNS_ends(k0, k1 - 2)[1] + (1, 1)
+        return _HpathNS_ends(k0 - 2, k1)[1 if flip00 else 0] + (0, 0)
+    return (yield from _tube_vertex(k0, k1, z, r % 4))
+
+
+def _odd_odd_zigzags(k0: int, k1: int) -> tuple[tuple, tuple]:
+    """
+    Describes `c00xy` and `c11xy` of ``_HpathNS`` for `k0 >= k1` both odd, see ``_step_zigzag_with_spurs``.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+
+    Returns:
+        tuple[tuple, tuple]: For both zigzags the signature `(a, b)` of the cycle, the vertex at which it is cut,
+        the zigzag suffixes `u` and `v` and the extension `e`.
+    """
+    first0101, last0101 = _HpathNS_ends(k0 - 2, k1 - 2)
+    return (k0 - 3, k1 - 1, last0101[:-1] + (1,), (0, 1), (1, 0), (0, 0)), (
+        k0 - 1,
+        k1 - 3,
+        first0101[:-1] + (0,),
+        (1, 0),
+        (0, 1),
+        (1, 1),
+    )
+
+
+# the suffixes of ``createSquareTube`` with u = (0, 1) and v = (1, 0), for all but the last two vertices and for those
+_TUBE_MODULE = [(0, 1, 0, 1), (0, 1, 1, 0), (1, 0, 1, 0), (1, 0, 0, 1)]
+_TUBE_MODULE = _TUBE_MODULE + _TUBE_MODULE[::-1]
+_TUBE_LAST_MODULE = _TUBE_MODULE[:5] + [(0, 1, 0, 1), (0, 1, 1, 0), (1, 0, 1, 0)]
+
+
+def _tube_modules(
+    k0: int, k1: int, z: tuple[int, ...] | None, odd: bool | None = None
+) -> list[tuple[int, ...]]:
+    """
+    Computes the four suffixes that ``createSquareTube(p0101[::-1], (0, 1), (1, 0))`` appends to the copies of `z`, in order.
+    The suffixes depend on the parity of the position of `z`, which is its inversion parity relative to the first vertex of `p0101`,
+    and on whether `z` is one of the last two vertices of the tube.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        z (tuple[int, ...] | None): A vertex of `p0101 = HpathNS(k0 - 2, k1 - 2)`, or None for any but the last two vertices of the tube.
+        odd (bool | None, optional): Whether `z` is at an odd position of the tube, computed from `z` if None. Defaults to None.
+
+    Returns:
+        list[tuple[int, ...]]: The four suffixes of the copies of `z`.
+    """
+    first0101 = _HpathNS_ends(k0 - 2, k1 - 2)[0]
+    if odd is None:
+        odd = _tube_odd(k0, k1, z)
+    if z is not None and (
+        z == first0101 or z == _landmark_step(k0 - 2, k1 - 2, first0101, False)
+    ):
+        module = _TUBE_LAST_MODULE
+    else:
+        module = _TUBE_MODULE
+    return module[4:] if odd else module[:4]
+
+
+def _tube_odd(k0: int, k1: int, z: tuple[int, ...]) -> bool:
+    """
+    Whether vertex `z` of `p0101` is at an odd position of the square tube along `p0101[::-1]`.
+    The path `p0101` has even length, so this is the case for the vertices at an even position of `p0101`,
+    which have the same inversion parity as its first vertex.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        z (tuple[int, ...]): A vertex of `p0101 = HpathNS(k0 - 2, k1 - 2)`.
+
+    Returns:
+        bool: Whether `z` is at an odd position of the tube.
+    """
+    return _inversion_parity(z) == _inversion_parity(_HpathNS_ends(k0 - 2, k1 - 2)[0])
+
+
+def _tube_landmark(
+    k0: int, k1: int, z: tuple[int, ...]
+) -> Generator[tuple, tuple[int, ...] | None, None]:
+    """
+    Requests the landmark that ``_tube_modules`` compares `z` with from the stack of ``_step_HpathNS``,
+    so that it is cached before ``_tube_modules`` is called in a frame.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        z (tuple[int, ...]): A vertex of `p0101 = HpathNS(k0 - 2, k1 - 2)`.
+
+    Returns:
+        Generator[tuple, tuple[int, ...] | None, None]: Requests the landmark if it is compared with `z`.
+    """
+    first0101 = _HpathNS_ends(k0 - 2, k1 - 2)[0]
+    if z != first0101:
+        yield k0 - 2, k1 - 2, first0101, False, True
+
+
+def _tube_vertex(
+    k0: int, k1: int, z: tuple[int, ...], r: int
+) -> Generator[tuple, tuple[int, ...] | None, tuple[int, ...]]:
+    """
+    Computes copy `r` of vertex `z` in the square tube of ``_step_HpathNS_odd_odd``.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        z (tuple[int, ...]): A vertex of `p0101 = HpathNS(k0 - 2, k1 - 2)`.
+        r (int): The index of the copy, `0 <= r < 4`.
+
+    Returns:
+        Generator[tuple, tuple[int, ...] | None, tuple[int, ...]]:
+            Requests the landmark of ``_tube_modules`` and returns `z` with the suffix of copy `r`.
+    """
+    yield from _tube_landmark(k0, k1, z)
+    return z + _tube_modules(k0, k1, z)[r]
+
+
+def _zigzag_with_spurs_ends(
+    a: int,
+    b: int,
+    cut: tuple[int, ...],
+    u: tuple[int, ...],
+    v: tuple[int, ...],
+    e: tuple[int, ...],
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Computes the first and last permutation of `c00xy` or `c11xy` in ``_HpathNS``.
+
+    Args:
+        a (int): Number of 0s in the signature of the cycle.
+        b (int): Number of 1s in the signature of the cycle.
+        cut (tuple[int, ...]): The vertex at which the cycle ``HpathNS(a, b)`` is cut.
+        u (tuple[int, ...]): The first suffix of the zigzag.
+        v (tuple[int, ...]): The second suffix of the zigzag.
+        e (tuple[int, ...]): The extension between the cycle and the zigzag suffixes.
+
+    Returns:
+        tuple[tuple[int, ...], tuple[int, ...]]: The first and last permutation.
+    """
+    if HpathNS_length(a, b) == 0:
+        # only the spurs of the single stutter
+        stutter = (0,) * a + (1,) * b
+        return stutter + e + v, stutter + e + u
+    # the zigzag is rotated by 1, so it starts at the second copy of `cut`
+    return cut + e + v, cut + e + u
+
+
+def _step_zigzag_with_spurs(
+    a: int,
+    b: int,
+    cut: tuple[int, ...],
+    u: tuple[int, ...],
+    v: tuple[int, ...],
+    e: tuple[int, ...],
+    perm: tuple[int, ...],
+    reverse: bool,
+) -> Generator[tuple, tuple[int, ...] | None, tuple[int, ...] | None]:
+    """
+    Steps along `c00xy` or `c11xy` in ``_HpathNS``: the cycle ``HpathNS(a, b)`` cut at `cut` and extended by `e`,
+    made into a zigzag with suffixes `u` and `v`, rotated by 1 and with the spurs of the stutters incorporated.
+    A spur is inserted between the two copies of every vertex that is a stutter with its last pair of distinct adjacent elements swapped.
+
+    Args:
+        a (int): Number of 0s in the signature of the cycle.
+        b (int): Number of 1s in the signature of the cycle.
+        cut (tuple[int, ...]): The vertex at which the cycle is cut.
+        u (tuple[int, ...]): The first suffix of the zigzag.
+        v (tuple[int, ...]): The second suffix of the zigzag.
+        e (tuple[int, ...]): The extension between the cycle and the zigzag suffixes.
+        perm (tuple[int, ...]): A permutation on the zigzag.
+        reverse (bool): Whether to step to the previous permutation instead of the next one.
+
+    Returns:
+        Generator[tuple, tuple[int, ...] | None, tuple[int, ...] | None]:
+            Requests the step on the cycle from the stack of ``_step_HpathNS`` and returns the neighbor of `perm`,
+            or None if `perm` is the end of the zigzag in that direction.
+    """
+    x, t = perm[: -2 - len(e)], perm[-2:]
+    if HpathNS_length(a, b) == 0:
+        # [stutter + e + v, stutter + e + u]
+        if (t == v) == reverse:
+            return None
+        return x + e + (v if reverse else u)
+    on_spur = stutterPermutationQ(x)
+    if on_spur:
+        stutter, x = x, swapPair(x, find_last_distinct_adjacent_index(x))
+    else:
+        stutter = None if x == cut else _spur_stutter(x)
+    # the copies of the vertex at an even position of the cut cycle are in order `u, v`, the others `v, u`
+    first, second = u, v
+    if _inversion_parity(x) != _inversion_parity(cut):
+        first, second = v, u
+    if on_spur:
+        # the spur runs from the first copy of x to the second copy
+        if (t == first) == reverse:
+            return x + e + t
+        return stutter + e + (first if reverse else second)
+    if (t == first) != reverse:
+        # step to the other copy of x, possibly through the spur
+        if x == cut:
+            # the zigzag is rotated by 1, so the copies of `cut` are its ends
+            return None
+        if stutter is not None:
+            return stutter + e + t
+        return x + e + (first if reverse else second)
+    return (yield from _cycle_step(a, b, x, reverse)) + e + t
+
+
+def HpathNS_at(k0: int, k1: int, i: int) -> tuple[int, ...]:
+    """
+    Computes the permutation at position `i` of the Hamiltonian path ``HpathNS(k0, k1)``, without generating the path.
+    The blocks of the case construction (the extended sub-paths, the square tube and the zigzags with spurs) are skipped
+    with precomputed block sizes, so only one block per recursion level is entered.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        i (int): The position on the path. Negative positions count from the end of the path.
+
+    Returns:
+        tuple[int, ...]: The permutation `HpathNS(k0, k1)[i]`.
+
+    Raises:
+        IndexError: If `i` is out of range for the path.
+
+    Example:
+        >>> HpathNS_at(3, 2, 1) == HpathNS(3, 2)[1]
+        True
+    """
+    length = HpathNS_length(k0, k1)
+    if i < 0:
+        i += length
+    if not 0 <= i < length:
+        raise IndexError(f"Position {i} out of range for HpathNS({k0}, {k1})")
+    return _run_frames(_HpathNS_select(k0, k1, _UNIT_WEIGHTS, i))[0]
+
+
+def HpathNS_index(k0: int, k1: int, perm: tuple[int, ...]) -> int:
+    """
+    Computes the position of `perm` on the Hamiltonian path ``HpathNS(k0, k1)``, without generating the path.
+    This is the inverse of ``HpathNS_at``.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        perm (tuple[int, ...]): A permutation on the path.
+
+    Returns:
+        int: The position `i` such that `HpathNS(k0, k1)[i] == perm`.
+
+    Raises:
+        ValueError: If `perm` is not a permutation on the path.
+
+    Example:
+        >>> HpathNS_index(3, 2, (0, 0, 1, 0, 1))
+        1
+    """
+    perm = _check_HpathNS_vertex(k0, k1, perm)
+    return sum(_run_frames(_HpathNS_histogram_before(k0, k1, perm)))
+
+
+def iter_HpathNS_range(
+    k0: int, k1: int, start: int, stop: int
+) -> Iterator[tuple[int, ...]]:
+    """
+    Generates the permutations `HpathNS(k0, k1)[start:stop]` for `0 <= start <= stop <= HpathNS_length(k0, k1)`.
+    The first permutation is computed with ``HpathNS_at`` and the others with ``next_in_HpathNS``,
+    so disjoint ranges of the path can be generated independently, e.g. by different processes.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        start (int): The position of the first permutation.
+        stop (int): The position after the last permutation.
+
+    Returns:
+        Iterator[tuple[int, ...]]: The permutations of the path from position `start` up to `stop`.
+
+    Raises:
+        IndexError: If the range is not within the path.
+    """
+    if not 0 <= start <= stop <= HpathNS_length(k0, k1):
+        raise IndexError(f"Range {start}:{stop} out of range for HpathNS({k0}, {k1})")
+    if start == stop:
+        return
+    perm = HpathNS_at(k0, k1, start)
+    yield perm
+    for _ in range(stop - start - 1):
+        perm = _step_HpathNS(k0, k1, perm, False)
+        yield perm
+
+
+# The random access functions count the vertices of the blocks with histograms over a few states of a permutation.
+# The state combines the inversion parity, which decides the suffixes in the square tube and the zigzags,
+# with the state of an automaton that reads the permutation in pairs and accepts the bases of the spurs
+# (equal pairs, then twice the same unequal pair `(e, d)`, then `(d, d)` pairs; see ``_spur_stutter``).
+# The automaton state is `3 * pairs + pending`, where `pending` is the unpaired last element or 2 if there is none,
+# and `pairs` is 0 for equal pairs, 1 + e after one `(e, d)`, 3 + e after two `(e, d)` and 5 if the permutation is rejected.
+# The state of a permutation is `2 * automaton state + inversion parity`.
+_STATES = 36
+_UNIT_WEIGHTS = (1,) * _STATES
+_STUTTER_STATE = 2 * 2
+_SPUR_BASE_STATES = (2 * 11, 2 * 11 + 1, 2 * 14, 2 * 14 + 1)
+
+
+def _automaton_step(automaton: int, x: int) -> int:
+    """
+    Reads element `x` in the automaton of the states of the random access functions.
+
+    Args:
+        automaton (int): The automaton state before reading `x`.
+        x (int): The element to read.
+
+    Returns:
+        int: The automaton state after reading `x`.
+    """
+    pairs, pending = divmod(automaton, 3)
+    if pending == 2:
+        return 3 * pairs + x
+    if pairs == 0:
+        pairs = 0 if pending == x else 1 + pending
+    elif pairs <= 2:
+        pairs = 2 + pairs if (pending, x) == (pairs - 1, 2 - pairs) else 5
+    elif pairs <= 4:
+        pairs = pairs if pending == x == 4 - pairs else 5
+    return 3 * pairs + 2
+
+
+def _state(perm: tuple[int, ...]) -> int:
+    """
+    Computes the state of a binary permutation, see ``_STATES``.
+
+    Args:
+        perm (tuple[int, ...]): A binary permutation.
+
+    Returns:
+        int: The state of `perm`.
+    """
+    automaton = 2
+    for x in perm:
+        automaton = _automaton_step(automaton, x)
+        if automaton >= 3 * 5:
+            # a rejected permutation stays rejected, only the unpaired last element still changes
+            automaton = 3 * 5 + (2 if len(perm) % 2 == 0 else perm[-1])
+            break
+    return 2 * automaton + _inversion_parity(perm)
+
+
+@bounded_cache
+def _append_map(suffix: tuple[int, ...], ones: int) -> tuple[int, ...]:
+    """
+    Maps the state of a permutation with `ones` 1s (modulo 2) to the state of the permutation extended with `suffix`.
+
+    Args:
+        suffix (tuple[int, ...]): The elements appended to the permutation.
+        ones (int): The parity of the number of 1s in the permutation.
+
+    Returns:
+        tuple[int, ...]: The state after appending `suffix`, for every state.
+    """
+    mapping = []
+    for state in range(_STATES):
+        automaton, parity = divmod(state, 2)
+        count = ones
+        for x in suffix:
+            if x:
+                count += 1
+            else:
+                # every 1 before the new 0 is an inversion
+                parity ^= count % 2
+            automaton = _automaton_step(automaton, x)
+        mapping.append(2 * automaton + parity)
+    return tuple(mapping)
+
+
+@bounded_cache
+def _complement_map(parity: int) -> tuple[int, ...]:
+    """
+    Maps the state of a permutation to the state of its complement (see ``_complement``).
+    A permutation with `k0` 0s and `k1` 1s has `k0 * k1` pairs of distinct elements, which are inversions in either
+    the permutation or its complement.
+
+    Args:
+        parity (int): The parity of `k0 * k1`.
+
+    Returns:
+        tuple[int, ...]: The state of the complement, for every state.
+    """
+    pairs_map, pending_map = (0, 2, 1, 4, 3, 5), (1, 0, 2)
+    mapping = []
+    for state in range(_STATES):
+        automaton, inversions = divmod(state, 2)
+        pairs, pending = divmod(automaton, 3)
+        automaton = 3 * pairs_map[pairs] + pending_map[pending]
+        mapping.append(2 * automaton + (inversions ^ parity))
+    return tuple(mapping)
+
+
+def _histogram(perms: list[tuple[int, ...]]) -> list[int]:
+    """
+    Counts the states of a list of permutations.
+
+    Args:
+        perms (list[tuple[int, ...]]): The permutations.
+
+    Returns:
+        list[int]: The number of permutations for every state.
+    """
+    histogram = [0] * _STATES
+    for perm in perms:
+        histogram[_state(perm)] += 1
+    return histogram
+
+
+def _unit(perm: tuple[int, ...]) -> list[int]:
+    """
+    The histogram of the single permutation `perm`.
+
+    Args:
+        perm (tuple[int, ...]): The permutation.
+
+    Returns:
+        list[int]: 1 for the state of `perm` and 0 for the other states.
+    """
+    return _histogram([perm])
+
+
+def _add(*histograms: list[int]) -> list[int]:
+    """
+    Adds histograms of states.
+
+    Args:
+        *histograms (list[int]): The histograms to add.
+
+    Returns:
+        list[int]: The sum of the histograms for every state.
+    """
+    return [sum(counts) for counts in zip(*histograms)]
+
+
+def _subtract(histogram: list[int], other: list[int]) -> list[int]:
+    """
+    Subtracts histogram `other` from `histogram`.
+
+    Args:
+        histogram (list[int]): The histogram to subtract from.
+        other (list[int]): The histogram to subtract.
+
+    Returns:
+        list[int]: The difference of the histograms for every state.
+    """
+    return [count - other_count for count, other_count in zip(histogram, other)]
+
+
+def _push(histogram: list[int], mapping: tuple[int, ...]) -> list[int]:
+    """
+    Maps a histogram of states with `mapping`, e.g. ``_append_map`` to extend all permutations.
+
+    Args:
+        histogram (list[int]): The histogram of the permutations before the mapping.
+        mapping (tuple[int, ...]): The state after the mapping, for every state.
+
+    Returns:
+        list[int]: The histogram of the mapped permutations.
+    """
+    result = [0] * _STATES
+    for state, count in enumerate(histogram):
+        result[mapping[state]] += count
+    return result
+
+
+def _pull(weights: list[int], mapping: tuple[int, ...]) -> list[int]:
+    """
+    Computes the weights of the states before the mapping, such that ``_dot(_pull(w, m), h) == _dot(w, _push(h, m))``.
+
+    Args:
+        weights (list[int]): The weight of every state after the mapping.
+        mapping (tuple[int, ...]): The state after the mapping, for every state.
+
+    Returns:
+        list[int]: The weight of every state before the mapping.
+    """
+    return [weights[mapped] for mapped in mapping]
+
+
+def _expand(histogram: list[int], group: Callable[[int], list[int]]) -> list[int]:
+    """
+    Replaces every permutation by the group of permutations it is copied to, given as a list of states per state.
+
+    Args:
+        histogram (list[int]): The histogram of the permutations that are copied.
+        group (Callable[[int], list[int]]): The states of the copies of a permutation with the given state.
+
+    Returns:
+        list[int]: The histogram of the copies.
+    """
+    result = [0] * _STATES
+    for state, count in enumerate(histogram):
+        if count:
+            for mapped in group(state):
+                result[mapped] += count
+    return result
+
+
+def _group_weights(weights: list[int], group: Callable[[int], list[int]]) -> list[int]:
+    """
+    Computes the weights of the states before ``_expand``, i.e. the total weight of the group of every state.
+
+    Args:
+        weights (list[int]): The weight of every state of the copies.
+        group (Callable[[int], list[int]]): The states of the copies of a permutation with the given state.
+
+    Returns:
+        list[int]: The total weight of the copies, for every state.
+    """
+    return [sum(weights[mapped] for mapped in group(state)) for state in range(_STATES)]
+
+
+def _dot(weights: list[int], histogram: list[int]) -> int:
+    """
+    Computes the total weight of a histogram of states.
+
+    Args:
+        weights (list[int]): The weight of every state.
+        histogram (list[int]): The number of permutations for every state.
+
+    Returns:
+        int: The sum of the weights of all permutations in the histogram.
+    """
+    return sum(weight * count for weight, count in zip(weights, histogram))
+
+
+def _HpathNS_base(k0: int, k1: int) -> list[tuple[int, ...]]:
+    """
+    The base cases of ``HpathNS``, where one of the colors occurs at most once. These paths have at most `k0 + k1 + 1` permutations.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+
+    Returns:
+        list[tuple[int, ...]]: The Hamiltonian path of the base case.
+    """
+    return _HpathNS(k0, k1, None, lambda perms, width: perms)
+
+
+def _tube_group(k0: int, k1: int, state: int) -> list[int]:
+    """
+    The states of the four copies in the square tube of a vertex of `p0101` with the given state,
+    for all but the last two vertices of the tube.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        state (int): The state of the vertex of `p0101`.
+
+    Returns:
+        list[int]: The states of the four copies, in order.
+    """
+    odd = state % 2 == _inversion_parity(_HpathNS_ends(k0 - 2, k1 - 2)[0])
+    return [
+        _append_map(suffix, (k1 - 2) % 2)[state]
+        for suffix in _tube_modules(k0, k1, None, odd)
+    ]
+
+
+def _tube_histogram(
+    k0: int, k1: int, histogram: list[int], last: list[tuple[int, ...]]
+) -> list[int]:
+    """
+    Expands a histogram of vertices of `p0101` to the histogram of their copies in the square tube.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        histogram (list[int]): The histogram of the vertices of `p0101`.
+        last (list[tuple[int, ...]]): The vertices in `histogram` that are one of the last two vertices of the tube.
+
+    Returns:
+        list[int]: The histogram of the copies in the tube.
+    """
+    result = _expand(histogram, partial(_tube_group, k0, k1))
+    for z in last:
+        generic = _histogram(
+            [z + suffix for suffix in _tube_modules(k0, k1, None, _tube_odd(k0, k1, z))]
+        )
+        result = _add(
+            _subtract(result, generic),
+            _histogram([z + suffix for suffix in _tube_modules(k0, k1, z)]),
+        )
+    return result
+
+
+def _zigzag_group(part: tuple, state: int) -> list[int]:
+    """
+    The states of the copies of a vertex of the cycle in a zigzag with spurs (see ``_step_zigzag_with_spurs``), in order.
+    A spur base gets its spur between its two copies, and the stutter of the spur has the opposite inversion parity.
+
+    Args:
+        part (tuple): The zigzag, see ``_odd_odd_zigzags``.
+        state (int): The state of the vertex of the cycle.
+
+    Returns:
+        list[int]: The states of the two copies, or of the four copies with the spur for a spur base.
+    """
+    a, b, cut, u, v, e = part
+    first, second = (u, v) if state % 2 == _inversion_parity(cut) else (v, u)
+    group = [_append_map(e + first, b % 2)[state]]
+    if state in _SPUR_BASE_STATES:
+        stutter = _STUTTER_STATE + 1 - state % 2
+        group.append(_append_map(e + first, b % 2)[stutter])
+        group.append(_append_map(e + second, b % 2)[stutter])
+    return group + [_append_map(e + second, b % 2)[state]]
+
+
+def _zigzag_group_vertices(part: tuple, x: tuple[int, ...]) -> list[tuple[int, ...]]:
+    """
+    The copies of vertex `x` of the cycle in a zigzag with spurs, in order. See ``_zigzag_group``.
+
+    Args:
+        part (tuple): The zigzag, see ``_odd_odd_zigzags``.
+        x (tuple[int, ...]): A vertex of the cycle.
+
+    Returns:
+        list[tuple[int, ...]]: The two copies of `x`, or the four copies with the spur if `x` is a spur base.
+    """
+    a, b, cut, u, v, e = part
+    first, second = (u, v) if _inversion_parity(x) == _inversion_parity(cut) else (v, u)
+    stutter = None if x == cut else _spur_stutter(x)
+    if stutter is None:
+        return [x + e + first, x + e + second]
+    return [x + e + first, stutter + e + first, stutter + e + second, x + e + second]
+
+
+def _zigzag_histogram(
+    part: tuple, histograms: Callable[[int, int], tuple[int, ...]]
+) -> list[int]:
+    """
+    The histogram of all permutations of a zigzag with spurs.
+
+    Args:
+        part (tuple): The zigzag, see ``_odd_odd_zigzags``.
+        histograms (Callable[[int, int], tuple[int, ...]]): Returns ``_HpathNS_histogram`` of the cycle of the zigzag.
+
+    Returns:
+        list[int]: The number of permutations on the zigzag for every state.
+    """
+    a, b = part[:2]
+    if HpathNS_length(a, b) == 0:
+        return _histogram(list(_zigzag_with_spurs_ends(*part)))
+    return _expand(histograms(a, b), partial(_zigzag_group, part))
+
+
+def _HpathNS_histogram_dependencies(k0: int, k1: int) -> list[tuple[int, int]]:
+    """
+    Lists the smaller signatures whose histograms ``_HpathNS_histogram_case`` uses to compute the histogram of `(k0, k1)`.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+
+    Returns:
+        list[tuple[int, int]]: The signatures `(k0, k1)` of the sub-paths and of the cycles of the zigzags.
+    """
+    if k0 <= 1 or k1 <= 1:
+        return []
+    if k0 < k1:
+        return [(k1, k0)]
+    if k0 % 2 == 0 or k1 % 2 == 0:
+        return [(k0, k1 - 1), (k0 - 1, k1)]
+    return [
+        (k0, k1 - 2),
+        (k0 - 1, k1 - 3),
+        (k0 - 2, k1 - 2),
+        (k0 - 3, k1 - 1),
+        (k0 - 2, k1),
+    ]
+
+
+@bounded_cache
+def _HpathNS_histogram(k0: int, k1: int) -> tuple[int, ...]:
+    """
+    Computes the histogram of the states of all permutations of ``HpathNS(k0, k1)``, see ``_STATES``.
+    The histograms of smaller signatures that are not cached are computed bottom-up, like ``_HpathNS_ends``,
+    and cached as well, together with the blocks of the signatures that are both odd.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+
+    Returns:
+        tuple[int, ...]: The number of permutations on the path for every state.
+    """
+    histograms = {}
+    stack = [(k0, k1)]
+    while stack:
+        for dependency in _HpathNS_histogram_dependencies(*stack.pop()):
+            if dependency in histograms:
+                continue
+            if _HpathNS_histogram.cache_contains(*dependency):
+                histograms[dependency] = _HpathNS_histogram(*dependency)
+            else:
+                histograms[dependency] = None
+                stack.append(dependency)
+    missing = [sig for sig, histogram in histograms.items() if histogram is None]
+    # every dependency has fewer elements, or the same elements with k0 > k1 when k0 < k1
+    for sig in sorted(missing, key=lambda sig: (sig[0] + sig[1], sig[0] < sig[1])):
+        histograms[sig] = _HpathNS_histogram_case(*sig, lambda a, b: histograms[(a, b)])
+        _HpathNS_histogram.cache_store(histograms[sig], *sig)
+    return _HpathNS_histogram_case(k0, k1, lambda a, b: histograms[(a, b)])
+
+
+def _HpathNS_histogram_case(
+    k0: int, k1: int, histograms: Callable[[int, int], tuple[int, ...]]
+) -> tuple[int, ...]:
+    """
+    Computes the histogram of ``HpathNS(k0, k1)`` from the histograms of the sub-paths, see ``_HpathNS_histogram_dependencies``.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        histograms (Callable[[int, int], tuple[int, ...]]):
+            Returns the histogram of a signature `(k0, k1)` in ``_HpathNS_histogram_dependencies``.
+
+    Returns:
+        tuple[int, ...]: The number of permutations on the path for every state.
+    """
+    if k0 <= 1 or k1 <= 1:
+        return tuple(_histogram(_HpathNS_base(k0, k1)))
+    if k0 < k1:
+        return tuple(_push(histograms(k1, k0), _complement_map(k0 * k1 % 2)))
+    if k0 % 2 == 0 or k1 % 2 == 0:
+        return tuple(
+            _add(
+                _push(histograms(k0, k1 - 1), _append_map((1,), (k1 - 1) % 2)),
+                _push(histograms(k0 - 1, k1), _append_map((0,), k1 % 2)),
+            )
+        )
+    blocks = _odd_odd_blocks_case(k0, k1, histograms)
+    _odd_odd_blocks.cache_store(blocks, k0, k1)
+    return tuple(_add(*blocks))
+
+
+@bounded_cache
+def _odd_odd_blocks(k0: int, k1: int) -> tuple[tuple[int, ...], ...]:
+    """
+    The histograms of the blocks `p11, tube1, c00xy, tube2, c11xy, tube3, p00` of ``_HpathNS`` for `k0 >= k1` both odd.
+    They are cached by ``_HpathNS_histogram`` together with the histogram of the path.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+
+    Returns:
+        tuple[tuple[int, ...], ...]: The histograms of the seven blocks, in order.
+    """
+    return _odd_odd_blocks_case(k0, k1, _HpathNS_histogram)
+
+
+def _odd_odd_blocks_case(
+    k0: int, k1: int, histograms: Callable[[int, int], tuple[int, ...]]
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Computes ``_odd_odd_blocks`` from the histograms of the sub-paths and of the cycles of the zigzags.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        histograms (Callable[[int, int], tuple[int, ...]]):
+            Returns the histogram of a signature `(k0, k1)` in ``_HpathNS_histogram_dependencies``.
+
+    Returns:
+        tuple[tuple[int, ...], ...]: The histograms of the seven blocks, in order.
+    """
+    first0101, last0101 = _HpathNS_ends(k0 - 2, k1 - 2)
+    second0101 = _landmark_step(k0 - 2, k1 - 2, first0101, False)
+    c00, c11 = _odd_odd_zigzags(k0, k1)
+    head = _histogram([last0101 + m for m in _tube_modules(k0, k1, last0101)[:3]])
+    tail = _histogram([first0101 + m for m in _tube_modules(k0, k1, first0101)[2:]])
+    tube = _tube_histogram(k0, k1, histograms(k0 - 2, k1 - 2), [first0101, second0101])
+    blocks = [
+        _push(histograms(k0, k1 - 2), _append_map((1, 1), k1 % 2)),
+        head,
+        _zigzag_histogram(c00, histograms),
+        _subtract(_subtract(tube, head), tail),
+        _zigzag_histogram(c11, histograms),
+        tail,
+        _push(histograms(k0 - 2, k1), _append_map((0, 0), k1 % 2)),
+    ]
+    return tuple(tuple(block) for block in blocks)
+
+
+@bounded_cache
+def _landmark_histogram_before(
+    k0: int, k1: int, perm: tuple[int, ...]
+) -> tuple[int, ...]:
+    """
+    Cached ``_HpathNS_histogram_before`` for the vertices at which the construction cuts cycles.
+    Within the frames of the random access functions the landmarks are requested with ``_landmark_histogram_before_frame``,
+    which stores them in the same cache.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        perm (tuple[int, ...]): The vertex at which a cycle is cut, a permutation on the path.
+
+    Returns:
+        tuple[int, ...]: The number of permutations before `perm` for every state.
+    """
+    return tuple(_run_frames(_HpathNS_histogram_before(k0, k1, perm)))
+
+
+def _landmark_histogram_before_frame(
+    k0: int, k1: int, perm: tuple[int, ...]
+) -> Generator[Generator, list[int], list[int]]:
+    """
+    The frame of ``_landmark_histogram_before``: looks up the landmark, or requests ``_HpathNS_histogram_before`` and caches it.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        perm (tuple[int, ...]): The vertex at which a cycle is cut, a permutation on the path.
+
+    Returns:
+        Generator[Generator, list[int], list[int]]: Requests the histogram if it is not cached and returns it.
+    """
+    if _landmark_histogram_before.cache_contains(k0, k1, perm):
+        return list(_landmark_histogram_before(k0, k1, perm))
+    before = yield _HpathNS_histogram_before(k0, k1, perm)
+    _landmark_histogram_before.cache_store(tuple(before), k0, k1, perm)
+    return before
+
+
+def _run_frames(frame: Generator) -> list[int] | tuple[tuple[int, ...], int]:
+    """
+    Runs a frame of the random access functions, like ``_step_HpathNS`` does for the steps.
+    The case construction has a level for every element, which can be more than the recursion limit of Python,
+    so a frame yields the frame of a sub-path instead of calling it, and is sent its result.
+    The frames are kept on an explicit stack.
+
+    Args:
+        frame (Generator): The frame of ``_HpathNS_histogram_before`` or ``_HpathNS_select``.
+
+    Returns:
+        list[int] | tuple[tuple[int, ...], int]: The result of the frame.
+    """
+    frames = [frame]
+    result = None
+    while frames:
+        try:
+            request = frames[-1].send(result)
+        except StopIteration as stop:
+            frames.pop()
+            result = stop.value
+            continue
+        frames.append(request)
+        result = None
+    return result
+
+
+def _cycle_histogram_between(
+    k0: int,
+    k1: int,
+    start: tuple[int, ...],
+    start_before: list[int],
+    perm: tuple[int, ...],
+    perm_before: list[int],
+) -> list[int]:
+    """
+    Computes the histogram of the vertices strictly between `start` and `perm` on the cycle ``HpathNS(k0, k1)``.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        start (tuple[int, ...]): The vertex at which the cycle is cut.
+        start_before (list[int]): The histogram of the vertices before `start` on the path.
+        perm (tuple[int, ...]): A vertex of the cycle, different from `start`.
+        perm_before (list[int]): The histogram of the vertices before `perm` on the path.
+
+    Returns:
+        list[int]: The histogram of the vertices after `start` and before `perm` on the cycle.
+    """
+    between = _subtract(perm_before, _add(start_before, _unit(start)))
+    if sum(perm_before) < sum(start_before):
+        between = _add(between, _HpathNS_histogram(k0, k1))
+    return between
+
+
+def _HpathNS_histogram_before(
+    k0: int, k1: int, perm: tuple[int, ...]
+) -> Generator[Generator, list[int], list[int]]:
+    """
+    Computes the histogram of the states of the permutations before `perm` on ``HpathNS(k0, k1)``.
+    Follows the same case distinction as ``_HpathNS`` and only enters the block that contains `perm`,
+    as a frame of ``_run_frames``.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        perm (tuple[int, ...]): A permutation on the path.
+
+    Returns:
+        Generator[Generator, list[int], list[int]]:
+            Requests the histograms on the sub-paths and returns the number of permutations before `perm` for every state.
+    """
+    if k0 <= 1 or k1 <= 1:
+        path = _HpathNS_base(k0, k1)
+        return _histogram(path[: path.index(perm)])
+    if k0 < k1:
+        before = yield _HpathNS_histogram_before(k1, k0, _complement(perm))
+        return _push(before, _complement_map(k0 * k1 % 2))
+    head, tail = perm[:-1], perm[-1]
+    append1, append0 = _append_map((1,), (k1 - 1) % 2), _append_map((0,), k1 % 2)
+    if k0 % 2 == 1 and k1 % 2 == 0:
+        # p1[:-1] + rotate(p0, 1) + [p1[-1]]
+        first0 = _HpathNS_ends(k0 - 1, k1)[0]
+        last1 = _HpathNS_ends(k0, k1 - 1)[1]
+        if tail == 1 and head == last1:
+            return _subtract(list(_HpathNS_histogram(k0, k1)), _unit(perm))
+        if tail == 1:
+            return _push((yield _HpathNS_histogram_before(k0, k1 - 1, head)), append1)
+        if head == first0:
+            before0 = list(_HpathNS_histogram(k0 - 1, k1))
+        else:
+            before0 = yield _HpathNS_histogram_before(k0 - 1, k1, head)
+        return _add(
+            _push(_subtract(_HpathNS_histogram(k0, k1 - 1), _unit(last1)), append1),
+            _push(_subtract(before0, _unit(first0)), append0),
+        )
+    elif k0 % 2 == 0 and k1 % 2 == 1:
+        # [v] + cutCycle(p1[::-1], swapPair(v, -2)) + p0[1:]
+        first0 = _HpathNS_ends(k0 - 1, k1)[0]
+        cut = swapPair(first0 + (0,), -2)[:-1]
+        if tail == 0 and head == first0:
+            return [0] * _STATES
+        if tail == 0:
+            before0 = _subtract(
+                (yield _HpathNS_histogram_before(k0 - 1, k1, head)), _unit(first0)
+            )
+            return _add(
+                _unit(first0 + (0,)),
+                _push(_HpathNS_histogram(k0, k1 - 1), append1),
+                _push(before0, append0),
+            )
+        # the cycle is traversed backwards from `cut`, so the vertices after `perm` up to `cut` come first
+        if head == cut:
+            before1 = [0] * _STATES
+        else:
+            between = _cycle_histogram_between(
+                k0,
+                k1 - 1,
+                head,
+                (yield _HpathNS_histogram_before(k0, k1 - 1, head)),
+                cut,
+                (yield _landmark_histogram_before_frame(k0, k1 - 1, cut)),
+            )
+            before1 = _add(between, _unit(cut))
+        return _add(_unit(first0 + (0,)), _push(before1, append1))
+    elif k0 % 2 == 0 and k1 % 2 == 0:
+        # p1[::-1] + p0, or p1[::-1] + p0[::-1] if k0 == k1
+        if tail == 1:
+            before1 = yield _HpathNS_histogram_before(k0, k1 - 1, head)
+            after1 = _subtract(
+                _HpathNS_histogram(k0, k1 - 1), _add(before1, _unit(head))
+            )
+            return _push(after1, append1)
+        before0 = yield _HpathNS_histogram_before(k0 - 1, k1, head)
+        if k0 == k1:
+            before0 = _subtract(
+                _HpathNS_histogram(k0 - 1, k1), _add(before0, _unit(head))
+            )
+        return _add(
+            _push(_HpathNS_histogram(k0, k1 - 1), append1), _push(before0, append0)
+        )
+    return (yield from _HpathNS_histogram_before_odd_odd(k0, k1, perm))
+
+
+def _HpathNS_histogram_before_odd_odd(
+    k0: int, k1: int, perm: tuple[int, ...]
+) -> Generator[Generator, list[int], list[int]]:
+    """
+    ``_HpathNS_histogram_before`` for `k0 >= k1` both odd, see ``_step_HpathNS_odd_odd`` for the blocks of the path.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        perm (tuple[int, ...]): A permutation on the path.
+
+    Returns:
+        Generator[Generator, list[int], list[int]]:
+            Requests the histograms on the sub-paths and returns the number of permutations before `perm` for every state.
+    """
+    blocks = _odd_odd_blocks(k0, k1)
+    if perm[-2:] == (1, 1):
+        before = yield _HpathNS_histogram_before(k0, k1 - 2, perm[:-2])
+        return _push(before, _append_map((1, 1), k1 % 2))
+    if perm[-2:] == (0, 0):
+        before = yield _HpathNS_histogram_before(k0 - 2, k1, perm[:-2])
+        if k0 == k1:
+            before = _subtract(
+                _HpathNS_histogram(k0 - 2, k1), _add(before, _unit(perm[:-2]))
+            )
+        return _add(*blocks[:6], _push(before, _append_map((0, 0), k1 % 2)))
+    for index, part in zip((2, 4), _odd_odd_zigzags(k0, k1)):
+        if perm[-4:-2] == part[-1]:
+            return _add(
+                *blocks[:index], (yield from _zigzag_histogram_before(part, perm))
+            )
+    # a vertex of the square tube
+    first0101, last0101 = _HpathNS_ends(k0 - 2, k1 - 2)
+    z = perm[:-4]
+    modules = _tube_modules(k0, k1, z)
+    copies = _histogram([z + suffix for suffix in modules[: modules.index(perm[-4:])]])
+    if z == last0101 and perm[-4:] in modules[:3]:
+        return _add(blocks[0], copies)
+    if z == first0101 and perm[-4:] in modules[2:]:
+        tail = _histogram(
+            [z + suffix for suffix in modules[2 : modules.index(perm[-4:])]]
+        )
+        return _add(*blocks[:5], tail)
+    # the tube runs along p0101 reversed
+    before = yield _HpathNS_histogram_before(k0 - 2, k1 - 2, z)
+    after = _subtract(_HpathNS_histogram(k0 - 2, k1 - 2), _add(before, _unit(z)))
+    second0101 = _landmark_step(k0 - 2, k1 - 2, first0101, False)
+    last = [second0101] if z == first0101 else []
+    return _add(blocks[0], blocks[2], _tube_histogram(k0, k1, after, last), copies)
+
+
+def _zigzag_histogram_before(
+    part: tuple, perm: tuple[int, ...]
+) -> Generator[Generator, list[int], list[int]]:
+    """
+    Computes the histogram of the states of the permutations before `perm` on a zigzag with spurs.
+
+    Args:
+        part (tuple): The zigzag, see ``_odd_odd_zigzags``.
+        perm (tuple[int, ...]): A permutation on the zigzag.
+
+    Returns:
+        Generator[Generator, list[int], list[int]]:
+            Requests the histograms on the sub-paths and returns the number of permutations before `perm` for every state.
+    """
+    a, b, cut, u, v, e = part
+    x = perm[: -2 - len(e)]
+    if HpathNS_length(a, b) == 0:
+        ends = _zigzag_with_spurs_ends(*part)
+        return _histogram(list(ends[: ends.index(perm)]))
+    if stutterPermutationQ(x):
+        x = swapPair(x, find_last_distinct_adjacent_index(x))
+    if x == cut:
+        # the zigzag is rotated by 1, so it starts with the second copy of `cut` and ends with the first one
+        if perm == cut + e + v:
+            return [0] * _STATES
+        return _subtract(_zigzag_histogram(part, _HpathNS_histogram), _unit(perm))
+    between = _cycle_histogram_between(
+        a,
+        b,
+        cut,
+        (yield _landmark_histogram_before_frame(a, b, cut)),
+        x,
+        (yield _HpathNS_histogram_before(a, b, x)),
+    )
+    group = _zigzag_group_vertices(part, x)
+    return _add(
+        _unit(cut + e + v),
+        _expand(between, partial(_zigzag_group, part)),
+        _histogram(group[: group.index(perm)]),
+    )
+
+
+def _select_in(
+    perms: list[tuple[int, ...]], weights: list[int], target: int
+) -> tuple[tuple[int, ...], int]:
+    """
+    Finds the permutation in a short list at which the cumulative weight exceeds `target`, see ``_HpathNS_select``.
+
+    Args:
+        perms (list[tuple[int, ...]]): The permutations, in order.
+        weights (list[int]): The positive weight of every state.
+        target (int): The cumulative weight, at least 0 and less than the total weight of `perms`.
+
+    Returns:
+        tuple[tuple[int, ...], int]: The permutation and `target` minus the total weight of the permutations before it.
+
+    Raises:
+        IndexError: If `target` is at least the total weight of `perms`.
+    """
+    for perm in perms:
+        weight = weights[_state(perm)]
+        if target < weight:
+            return perm, target
+        target -= weight
+    raise IndexError(f"Weight {target} beyond the end of {perms}")
+
+
+def _HpathNS_select_reversed(
+    k0: int, k1: int, weights: list[int], target: int
+) -> Generator[
+    Generator, tuple[tuple[int, ...], int] | list[int], tuple[tuple[int, ...], int]
+]:
+    """
+    ``_HpathNS_select`` on the reversed path `HpathNS(k0, k1)[::-1]`.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        weights (list[int]): The positive weight of every state.
+        target (int): The cumulative weight, at least 0 and less than the total weight of the path.
+
+    Returns:
+        Generator[Generator, tuple[tuple[int, ...], int] | list[int], tuple[tuple[int, ...], int]]:
+            Requests the selections on the sub-paths and returns the permutation and `target` minus the total weight of the permutations before it on the reversed path.
+    """
+    total = _dot(weights, _HpathNS_histogram(k0, k1))
+    perm, offset = yield _HpathNS_select(k0, k1, weights, total - 1 - target)
+    return perm, weights[_state(perm)] - 1 - offset
+
+
+def _HpathNS_select(
+    k0: int, k1: int, weights: list[int], target: int
+) -> Generator[
+    Generator, tuple[tuple[int, ...], int] | list[int], tuple[tuple[int, ...], int]
+]:
+    """
+    Finds the permutation on ``HpathNS(k0, k1)`` at which the cumulative weight of the permutations exceeds `target`.
+    The weight of a permutation is given by its state, see ``_STATES``. With all weights 1 this is the permutation at position `target`.
+    Larger weights are used for the vertices of a cycle that are copied to a zigzag, one unit per copy.
+    Follows the same case distinction as ``_HpathNS`` and only enters the block that contains the permutation,
+    as a frame of ``_run_frames``.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        weights (list[int]): The positive weight of every state.
+        target (int): The cumulative weight, at least 0 and less than the total weight of the path.
+
+    Returns:
+        Generator[Generator, tuple[tuple[int, ...], int] | list[int], tuple[tuple[int, ...], int]]:
+            Requests the selections on the sub-paths and returns the permutation and `target` minus the total weight of the permutations before it.
+    """
+    if k0 <= 1 or k1 <= 1:
+        return _select_in(_HpathNS_base(k0, k1), weights, target)
+    if k0 < k1:
+        complement_weights = _pull(weights, _complement_map(k0 * k1 % 2))
+        perm, offset = yield _HpathNS_select(k1, k0, complement_weights, target)
+        return _complement(perm), offset
+    if k0 % 2 == 1 and k1 % 2 == 1:
+        return (yield from _HpathNS_select_odd_odd(k0, k1, weights, target))
+    weights1 = _pull(weights, _append_map((1,), (k1 - 1) % 2))
+    weights0 = _pull(weights, _append_map((0,), k1 % 2))
+    total1 = _dot(weights1, _HpathNS_histogram(k0, k1 - 1))
+    first0 = _HpathNS_ends(k0 - 1, k1)[0]
+    if k0 % 2 == 1:
+        # p1[:-1] + rotate(p0, 1) + [p1[-1]]
+        last1 = _HpathNS_ends(k0, k1 - 1)[1]
+        total1 -= weights1[_state(last1)]
+        if target < total1:
+            perm, offset = yield _HpathNS_select(k0, k1 - 1, weights1, target)
+            return perm + (1,), offset
+        target -= total1
+        total0 = _dot(weights0, _HpathNS_histogram(k0 - 1, k1))
+        total0 -= weights0[_state(first0)]
+        if target < total0:
+            target += weights0[_state(first0)]
+            perm, offset = yield _HpathNS_select(k0 - 1, k1, weights0, target)
+            return perm + (0,), offset
+        return _select_in([first0 + (0,), last1 + (1,)], weights, target - total0)
+    elif k1 % 2 == 1:
+        # [v] + cutCycle(p1[::-1], swapPair(v, -2)) + p0[1:]
+        if target < weights0[_state(first0)]:
+            return first0 + (0,), target
+        target -= weights0[_state(first0)]
+        if target < total1:
+            cut = swapPair(first0 + (0,), -2)[:-1]
+            up_to_cut = _dot(
+                weights1, (yield _landmark_histogram_before_frame(k0, k1 - 1, cut))
+            )
+            up_to_cut += weights1[_state(cut)]
+            target = (target - up_to_cut) % total1
+            perm, offset = yield _HpathNS_select_reversed(k0, k1 - 1, weights1, target)
+            return perm + (1,), offset
+        target += weights0[_state(first0)] - total1
+        perm, offset = yield _HpathNS_select(k0 - 1, k1, weights0, target)
+        return perm + (0,), offset
+    # p1[::-1] + p0, or p1[::-1] + p0[::-1] if k0 == k1
+    if target < total1:
+        perm, offset = yield _HpathNS_select_reversed(k0, k1 - 1, weights1, target)
+        return perm + (1,), offset
+    select0 = _HpathNS_select_reversed if k0 == k1 else _HpathNS_select
+    perm, offset = yield select0(k0 - 1, k1, weights0, target - total1)
+    return perm + (0,), offset
+
+
+def _HpathNS_select_odd_odd(
+    k0: int, k1: int, weights: list[int], target: int
+) -> Generator[
+    Generator, tuple[tuple[int, ...], int] | list[int], tuple[tuple[int, ...], int]
+]:
+    """
+    ``_HpathNS_select`` for `k0 >= k1` both odd, see ``_step_HpathNS_odd_odd`` for the blocks of the path.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        weights (list[int]): The positive weight of every state.
+        target (int): The cumulative weight, at least 0 and less than the total weight of the path.
+
+    Returns:
+        Generator[Generator, tuple[tuple[int, ...], int] | list[int], tuple[tuple[int, ...], int]]:
+            Requests the selections on the sub-paths and returns the permutation and `target` minus the total weight of the permutations before it.
+    """
+    blocks = _odd_odd_blocks(k0, k1)
+    index = 0
+    while index < 6 and target >= _dot(weights, blocks[index]):
+        target -= _dot(weights, blocks[index])
+        index += 1
+    first0101, last0101 = _HpathNS_ends(k0 - 2, k1 - 2)
+    if index == 0:
+        sub_weights = _pull(weights, _append_map((1, 1), k1 % 2))
+        perm, offset = yield _HpathNS_select(k0, k1 - 2, sub_weights, target)
+        return perm + (1, 1), offset
+    elif index == 1:
+        head = _tube_modules(k0, k1, last0101)[:3]
+        return _select_in([last0101 + suffix for suffix in head], weights, target)
+    elif index == 3:
+        target += _dot(weights, blocks[1])
+        return (yield from _tube_select(k0, k1, weights, target))
+    elif index == 5:
+        tail = _tube_modules(k0, k1, first0101)[2:]
+        return _select_in([first0101 + suffix for suffix in tail], weights, target)
+    elif index == 6:
+        sub_weights = _pull(weights, _append_map((0, 0), k1 % 2))
+        select00 = _HpathNS_select_reversed if k0 == k1 else _HpathNS_select
+        perm, offset = yield select00(k0 - 2, k1, sub_weights, target)
+        return perm + (0, 0), offset
+    part = _odd_odd_zigzags(k0, k1)[index // 2 - 1]
+    return (yield from _zigzag_select(part, weights, target))
+
+
+def _tube_select(
+    k0: int, k1: int, weights: list[int], target: int
+) -> Generator[
+    Generator, tuple[tuple[int, ...], int] | list[int], tuple[tuple[int, ...], int]
+]:
+    """
+    ``_HpathNS_select`` on the whole square tube along `p0101[::-1]` of ``_step_HpathNS_odd_odd``.
+
+    Args:
+        k0 (int): Number of 0s in the signature.
+        k1 (int): Number of 1s in the signature.
+        weights (list[int]): The positive weight of every state.
+        target (int): The cumulative weight, at least 0 and less than the total weight of the tube.
+
+    Returns:
+        Generator[Generator, tuple[tuple[int, ...], int] | list[int], tuple[tuple[int, ...], int]]:
+            Requests the selections on the sub-paths and returns the permutation and `target` minus the total weight of the permutations before it.
+    """
+    first0101 = _HpathNS_ends(k0 - 2, k1 - 2)[0]
+    second0101 = _landmark_step(k0 - 2, k1 - 2, first0101, False)
+    group_weights = _group_weights(weights, partial(_tube_group, k0, k1))
+    # the last two vertices of the tube have different copies, so they are handled separately
+    generic = _dot(group_weights, _HpathNS_histogram(k0 - 2, k1 - 2))
+    generic -= group_weights[_state(first0101)] + group_weights[_state(second0101)]
+    if target < generic:
+        z, offset = yield _HpathNS_select_reversed(
+            k0 - 2, k1 - 2, group_weights, target
+        )
+        copies = [z + suffix for suffix in _tube_modules(k0, k1, z)]
+        return _select_in(copies, weights, offset)
+    copies = [
+        z + suffix
+        for z in (second0101, first0101)
+        for suffix in _tube_modules(k0, k1, z)
+    ]
+    return _select_in(copies, weights, target - generic)
+
+
+def _zigzag_select(
+    part: tuple, weights: list[int], target: int
+) -> Generator[
+    Generator, tuple[tuple[int, ...], int] | list[int], tuple[tuple[int, ...], int]
+]:
+    """
+    ``_HpathNS_select`` on a zigzag with spurs. Every vertex of the cycle gets the total weight of its copies.
+
+    Args:
+        part (tuple): The zigzag, see ``_odd_odd_zigzags``.
+        weights (list[int]): The positive weight of every state.
+        target (int): The cumulative weight, at least 0 and less than the total weight of the zigzag.
+
+    Returns:
+        Generator[Generator, tuple[tuple[int, ...], int] | list[int], tuple[tuple[int, ...], int]]:
+            Requests the selections on the sub-paths and returns the permutation and `target` minus the total weight of the permutations before it.
+    """
+    a, b, cut, u, v, e = part
+    ends = _zigzag_with_spurs_ends(*part)
+    if HpathNS_length(a, b) == 0:
+        return _select_in(list(ends), weights, target)
+    first_weight = weights[_state(ends[0])]
+    if target < first_weight:
+        return ends[0], target
+    target -= first_weight
+    group_weights = _group_weights(weights, partial(_zigzag_group, part))
+    total = _dot(group_weights, _HpathNS_histogram(a, b))
+    # the copies of `cut` are the ends of the zigzag
+    if target >= total - group_weights[_state(cut)]:
+        return ends[1], target - total + group_weights[_state(cut)]
+    up_to_cut = _dot(group_weights, (yield _landmark_histogram_before_frame(a, b, cut)))
+    up_to_cut += group_weights[_state(cut)]
+    x, offset = yield _HpathNS_select(a, b, group_weights, (target + up_to_cut) % total)
+    return _select_in(_zigzag_group_vertices(part, x), weights, offset)
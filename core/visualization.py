@@ -359,10 +359,11 @@ def lehmer_path(
             print(
                 f"Node Tally: {node_tally} which is correct. The path length is {len(interchanges)}"
             )
-        if spur_tally > 0 and spur_tally != defect(signature) + 1:
+        defect_g = defect(signature)
+        if spur_tally > 0 and spur_tally != defect_g + 1:
             print(f"Spur Tally: {spur_tally}")
             print(
-                f"The number of spurs is not optimal. Found {spur_tally} but expected {max(defect(signature) - 1, 0)}"
+                f"The number of spurs is not optimal. Found {spur_tally} but expected {max(defect_g - 1, 0)}"
             )
         else:
             print(f"Spur Tally: {spur_tally} is optimal!")